@@ -41,7 +41,11 @@ def listen_for_course_publish(sender, course_key, **kwargs):  # pylint: disable=
     on_course_publish(course_key)
 
     # Finally call into the course search subsystem
-    # to kick off an indexing action
+    # to kick off an indexing action, unless no blocks were changed
+    changed_block_keys = kwargs.get('changed_block_keys')
+    if changed_block_keys is not None and not changed_block_keys:
+        return
+
     if CoursewareSearchIndexer.indexing_is_enabled():
         # import here, because signal is registered at startup, but items in tasks are not yet able to be loaded
         from contentstore.tasks import update_search_index
@@ -4,6 +4,7 @@ This file contains celery tasks for contentstore views
 from __future__ import absolute_import
 
 import base64
+import hashlib
 import json
 import os
 import shutil
@@ -15,6 +16,7 @@ from celery.task import task
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.exceptions import SuspiciousOperation
 from django.core.files import File
 from django.test import RequestFactory
@@ -51,6 +53,7 @@ from xmodule.modulestore.xml_importer import import_course_from_xml, import_libr
 LOGGER = get_task_logger(__name__)
 FILE_READ_CHUNK = 1024  # bytes
 FULL_COURSE_REINDEX_THRESHOLD = 1
+IMPORT_PROGRESS_TIMEOUT = 24 * 60 * 60  # seconds
 
 
 def clone_instance(instance, field_values):
@@ -359,6 +362,30 @@ class CourseImportTask(UserTask):  # pylint: disable=abstract-method
         return u'Import of {} from {}'.format(key, filename)
 
 
+def get_import_progress_cache_key(task_name):
+    """
+    Get the key of the cache entry holding the progress of the import task with the given name.
+    """
+    return u'contentstore.import_progress.{}'.format(hashlib.sha1(task_name.encode(u'utf-8')).hexdigest())
+
+
+def get_import_progress(task_name):
+    """
+    Get the progress of the Updating step of the import task with the given name, as a dict with
+    the current stage of the import ('static' or 'blocks'), and the number of static files or
+    blocks completed and in total in that stage, or None if unknown.
+    """
+    return cache.get(get_import_progress_cache_key(task_name))
+
+
+def clear_import_progress(task_name):
+    """
+    Clear the progress of the import task with the given name, so that it is not reported for
+    another run of the task with the same name.
+    """
+    cache.delete(get_import_progress_cache_key(task_name))
+
+
 @task(base=CourseImportTask, bind=True)
 def import_olx(self, user_id, course_key_string, archive_path, archive_name, language):
     """
@@ -392,6 +419,7 @@ def import_olx(self, user_id, course_key_string, archive_path, archive_name, lan
     data_root = path(settings.GITHUB_REPO_ROOT)
     subdir = base64.urlsafe_b64encode(repr(courselike_key))
     course_dir = data_root / subdir
+    clear_import_progress(self.status.name)
     try:
         self.status.set_state(u'Unpacking')
 
@@ -499,6 +527,16 @@ def import_olx(self, user_id, course_key_string, archive_path, archive_name, lan
         self.status.set_state(u'Updating')
         self.status.increment_completed_steps()
 
+        def save_progress(stage, completed, total):
+            """
+            Save the progress of the import for the import status API.
+            """
+            cache.set(
+                get_import_progress_cache_key(self.status.name),
+                {u'stage': stage, u'completed': completed, u'total': total},
+                IMPORT_PROGRESS_TIMEOUT,
+            )
+
         with dog_stats_api.timer(
             u'courselike_import.time',
             tags=[u"courselike:{}".format(courselike_key)]
@@ -508,7 +546,9 @@ def import_olx(self, user_id, course_key_string, archive_path, archive_name, lan
                 settings.GITHUB_REPO_ROOT, [dirpath],
                 load_error_modules=False,
                 static_content_store=contentstore(),
-                target_id=courselike_key
+                target_id=courselike_key,
+                static_content_workers=settings.COURSE_IMPORT_STATIC_CONTENT_WORKERS,
+                progress_callback=save_progress,
             )
 
         new_location = courselike_items[0].location
@@ -519,6 +559,7 @@ def import_olx(self, user_id, course_key_string, archive_path, archive_name, lan
         LOGGER.exception(u'error importing course')
         self.status.fail(text_type(exception))
     finally:
+        clear_import_progress(self.status.name)
         if course_dir.isdir():  # pylint: disable=no-value-for-parameter
             shutil.rmtree(course_dir)
             LOGGER.info(u'Course import %s: Temp data cleared', courselike_key)
@@ -27,7 +27,14 @@ from user_tasks.conf import settings as user_tasks_settings
 from user_tasks.models import UserTaskArtifact, UserTaskStatus
 
 from contentstore.storage import course_import_export_storage
-from contentstore.tasks import CourseExportTask, CourseImportTask, create_export_tarball, export_olx, import_olx
+from contentstore.tasks import (
+    CourseExportTask,
+    CourseImportTask,
+    create_export_tarball,
+    export_olx,
+    get_import_progress,
+    import_olx
+)
 from contentstore.utils import reverse_course_url, reverse_library_url
 from edxmako.shortcuts import render_to_response
 from student.auth import has_course_author_access
@@ -241,6 +248,9 @@ def import_status_handler(request, course_key_string, filename=None):
         3 : Updating
         4 : Import successful
 
+    While Updating, the response also includes the progress of the import as ImportProgress, when
+    known: a dict with its current stage ('static' for the static files or 'blocks'), and the number
+    of items completed and in total in that stage.
     """
     course_key = CourseKey.from_string(course_key_string)
     if not has_course_author_access(request.user, course_key):
@@ -267,7 +277,12 @@ def import_status_handler(request, course_key_string, filename=None):
     else:
         status = min(task_status.completed_steps + 1, 3)
 
-    return JsonResponse({"ImportStatus": status})
+    response = {"ImportStatus": status}
+    if status == 3:
+        progress = get_import_progress(name)
+        if progress is not None:
+            response["ImportProgress"] = progress
+    return JsonResponse(response)
 
 
 def send_tarball(tarball, size):
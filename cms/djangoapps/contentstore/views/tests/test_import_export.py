@@ -13,11 +13,14 @@ from uuid import uuid4
 import ddt
 import lxml
 from django.conf import settings
+from django.core.cache import cache
 from django.test.utils import override_settings
 from milestones.tests.utils import MilestonesTestCaseMixin
 from opaque_keys.edx.locator import LibraryLocator
 from path import Path as path
+from user_tasks.models import UserTaskStatus
 
+from contentstore.tasks import CourseImportTask, get_import_progress, get_import_progress_cache_key
 from contentstore.tests.test_libraries import LibraryTestCase
 from contentstore.tests.utils import CourseTestCase
 from contentstore.utils import reverse_course_url
@@ -204,6 +207,47 @@ class ImportTestCase(CourseTestCase):
 
         self.assertEquals(resp.status_code, 200)
 
+    def get_import_task_name(self, archive_name):
+        """
+        Returns the name of the task importing the given archive into the course.
+        """
+        return CourseImportTask.generate_name({
+            u'course_key_string': unicode(self.course.id),
+            u'archive_name': archive_name,
+        })
+
+    def test_import_progress(self):
+        """
+        Check that `import_status` returns the progress of an import in its Updating step.
+        """
+        name = self.get_import_task_name('good.tar.gz')
+        UserTaskStatus.objects.create(
+            user=self.user, task_id=str(uuid4()), task_class='contentstore.tasks.import_olx', name=name,
+            total_steps=3, completed_steps=2,
+        )
+        progress = {u'stage': u'blocks', u'completed': 5, u'total': 10}
+        cache.set(get_import_progress_cache_key(name), progress)
+        self.addCleanup(cache.delete, get_import_progress_cache_key(name))
+
+        resp_status = self.client.get(
+            reverse_course_url('import_status_handler', self.course.id, kwargs={'filename': 'good.tar.gz'})
+        )
+        self.assertEqual(json.loads(resp_status.content), {u'ImportStatus': 3, u'ImportProgress': progress})
+
+    def test_import_progress_cleared(self):
+        """
+        Check that the progress of a previous import is not kept once the import has run.
+        """
+        name = self.get_import_task_name(os.path.split(self.good_tar)[1])
+        cache.set(get_import_progress_cache_key(name), {u'stage': u'blocks', u'completed': 5, u'total': 10})
+
+        with open(self.good_tar) as gtar:
+            args = {"name": self.good_tar, "course-data": [gtar]}
+            resp = self.client.post(self.url, args)
+
+        self.assertEquals(resp.status_code, 200)
+        self.assertIsNone(get_import_progress(name))
+
     def test_import_in_existing_course(self):
         """
         Check that course is imported successfully in existing course and users have their access roles
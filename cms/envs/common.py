@@ -586,6 +586,9 @@ MESSAGE_STORAGE = 'django.contrib.messages.storage.session.SessionStorage'
 
 COURSE_IMPORT_EXPORT_STORAGE = 'django.core.files.storage.FileSystemStorage'
 
+# Number of threads importing the static assets of an uploaded course or library.
+COURSE_IMPORT_STATIC_CONTENT_WORKERS = 4
+
 ##### EMBARGO #####
 EMBARGO_SITE_REDIRECT_URL = None
 
@@ -338,3 +338,6 @@ FEATURES['CUSTOM_COURSES_EDX'] = True
 
 # API access management -- needed for simple-history to run.
 INSTALLED_APPS += ('openedx.core.djangoapps.api_admin',)
+
+# Don't share deserialized block structures across tests.
+BLOCK_STRUCTURES_SETTINGS = dict(BLOCK_STRUCTURES_SETTINGS, IN_PROCESS_CACHE_MAX_BYTES=0)
@@ -9,6 +9,7 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils.translation import ugettext_noop
 
+import request_cache
 from openedx.core.djangoapps.xmodule_django.models import CourseKeyField, NoneToEmptyManager
 from student.models import CourseEnrollment
 from xmodule.modulestore.django import modulestore
@@ -150,6 +151,8 @@ def all_permissions_for_user_in_course(user, course_id):  # pylint: disable=inva
 class ForumsConfig(ConfigurationModel):
     """Config for the connection to the cs_comments_service forums backend."""
 
+    REQUEST_CACHE_NAME = 'django_comment_common.forums_config'
+
     connection_timeout = models.FloatField(
         default=5.0,
         help_text="Seconds to wait when trying to connect to the comment service.",
@@ -160,11 +163,31 @@ class ForumsConfig(ConfigurationModel):
         """The API key used to authenticate to the comments service."""
         return getattr(settings, "COMMENTS_SERVICE_KEY", None)
 
+    @classmethod
+    def current_for_request(cls):
+        """
+        Returns the current configuration, which is only read once per
+        request rather than for each request to the comments service.
+        """
+        cache = request_cache.get_cache(cls.REQUEST_CACHE_NAME)
+        if 'current' not in cache:
+            cache['current'] = cls.current()
+        return cache['current']
+
     def __unicode__(self):
         """Simple representation so the admin screen looks less ugly."""
         return u"ForumsConfig: timeout={}".format(self.connection_timeout)
 
 
+@receiver(post_save, sender=ForumsConfig)
+def clear_forums_config_request_cache(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Makes the requests to the comments service use a new configuration from
+    the moment it is saved.
+    """
+    request_cache.clear_cache(ForumsConfig.REQUEST_CACHE_NAME)
+
+
 class CourseDiscussionSettings(models.Model):
     course_id = CourseKeyField(
         unique=True,
@@ -201,6 +201,44 @@ def add_enrollment(user_id, course_id, mode=None, is_active=True, enrollment_att
     return enrollment
 
 
+def add_enrollments(user_ids, course_id, mode=None):
+    """Enrolls many users in a course at once.
+
+    Enrolls the users who are not enrolled in the course yet, in bulk. Users who are already enrolled keep
+    their enrollment. If the mode is not specified, this will default to `CourseMode.DEFAULT_MODE_SLUG`.
+
+    Arguments:
+        user_ids (list): The users to enroll.
+        course_id (str): The course to enroll the users in.
+        mode (str): Optional argument for the type of enrollment to create. Ex. 'audit', 'honor', 'verified',
+            'professional'. If not specified, this defaults to the default course mode.
+
+    Returns:
+        A serializable list of dictionaries of the enrollments of the users, in order.
+
+    Example:
+        >>> add_enrollments(["Bob", "Alice"], "edX/DemoX/2014T2", mode="audit")
+        [
+            {
+                "created": "2014-10-20T20:18:00Z",
+                "mode": "audit",
+                "is_active": True,
+                "user": "Bob"
+            },
+            {
+                "created": "2014-10-20T20:18:00Z",
+                "mode": "audit",
+                "is_active": True,
+                "user": "Alice"
+            }
+        ]
+    """
+    if mode is None:
+        mode = _default_course_mode(course_id)
+    validate_course_mode(course_id, mode, is_active=True)
+    return _data_api().create_course_enrollments(user_ids, course_id, mode)
+
+
 def update_enrollment(user_id, course_id, mode=None, is_active=None, enrollment_attributes=None, include_expired=False):
     """Updates the course mode for the enrolled user.
 
@@ -135,6 +135,62 @@ def create_course_enrollment(username, course_id, mode, is_active):
         raise CourseEnrollmentExistsError(err.message, enrollment)
 
 
+def create_course_enrollments(usernames, course_id, mode):
+    """Create new course enrollments for many users at once.
+
+    Unlike `create_course_enrollment`, this neither checks whether enrollment in the course is open or
+    full, nor fails for users who are already enrolled, who keep their enrollment as it is. The other
+    users are enrolled, or re-enrolled, in bulk.
+
+    Args:
+        usernames (list): The names of the users to create new course enrollments for.
+        course_id (str): The course to create the course enrollments for.
+        mode (str): The mode for the new enrollments.
+
+    Returns:
+        A serializable list of dictionaries representing the enrollments of the users, in order.
+
+    Raises:
+        CourseNotFoundError
+        UserNotFoundError
+
+    """
+    course_key = CourseKey.from_string(course_id)
+
+    try:
+        CourseOverview.get_from_id(course_key)
+    except CourseOverview.DoesNotExist:
+        msg = u"Requested enrollments in unknown course {course}".format(course=course_id)
+        log.warning(msg)
+        raise CourseNotFoundError(msg)
+
+    users = {user.username: user for user in User.objects.filter(username__in=usernames)}
+    missing_usernames = [username for username in usernames if username not in users]
+    if missing_usernames:
+        msg = u"No users with usernames '{usernames}' found.".format(usernames=u"', '".join(missing_usernames))
+        log.warn(msg)
+        raise UserNotFoundError(msg)
+
+    enrollments = {
+        enrollment.user_id: enrollment
+        for enrollment in CourseEnrollment.objects.filter(user__in=users.values(), course_id=course_key, is_active=True)
+    }
+    new_users = [user for user in users.itervalues() if user.id not in enrollments]
+    for enrollment in CourseEnrollment.bulk_enroll(new_users, course_key, mode=mode):
+        enrollments[enrollment.user_id] = enrollment
+
+    results = []
+    for username in usernames:
+        enrollment = enrollments[users[username].id]
+        results.append({
+            "created": enrollment.created,
+            "mode": enrollment.mode,
+            "is_active": enrollment.is_active,
+            "user": username,
+        })
+    return results
+
+
 def update_course_enrollment(username, course_id, mode=None, is_active=None):
     """Modify a course enrollment for a user.
 
@@ -1046,6 +1046,45 @@ class EnrollmentTest(EnrollmentTestMixin, ModuleStoreTestCase, APITestCase, Ente
         self.assertEqual(enrollment.mode, mode)
         self.assertEqual(enrollment.attributes.get(namespace='order', name='order_number').value, order_number)
 
+    def _bulk_enroll(self, usernames, mode=None, as_server=True):
+        """Enrolls the users with the given usernames in the course with the bulk endpoint."""
+        data = {'users': usernames, 'course_details': {'course_id': unicode(self.course.id)}, 'mode': mode}
+        extra = {'HTTP_X_EDX_API_KEY': self.API_KEY} if as_server else {}
+        url = reverse('courseenrollmentsbulk')
+        return self.client.post(url, json.dumps(data), content_type='application/json', **extra)
+
+    def test_bulk_enroll(self):
+        for mode in [CourseMode.DEFAULT_MODE_SLUG, CourseMode.VERIFIED]:
+            CourseModeFactory.create(course_id=self.course.id, mode_slug=mode, mode_display_name=mode)
+        CourseEnrollment.enroll(self.user, self.course.id, mode=CourseMode.VERIFIED)
+
+        response = self._bulk_enroll([self.OTHER_USERNAME, self.USERNAME])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Users who are already enrolled keep their enrollment.
+        data = json.loads(response.content)
+        self.assertEqual(
+            [(enrollment['user'], enrollment['mode'], enrollment['is_active']) for enrollment in data],
+            [
+                (self.OTHER_USERNAME, CourseMode.DEFAULT_MODE_SLUG, True),
+                (self.USERNAME, CourseMode.VERIFIED, True),
+            ]
+        )
+        self.assertEqual(
+            CourseEnrollment.enrollment_mode_for_user(self.other_user, self.course.id),
+            (CourseMode.DEFAULT_MODE_SLUG, True)
+        )
+
+    def test_bulk_enroll_unknown_user(self):
+        response = self._bulk_enroll([self.OTHER_USERNAME, 'not_a_user'])
+        self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+        self.assertFalse(CourseEnrollment.is_enrolled(self.other_user, self.course.id))
+
+    def test_bulk_enroll_requires_api_key(self):
+        response = self._bulk_enroll([self.OTHER_USERNAME], as_server=False)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(CourseEnrollment.is_enrolled(self.other_user, self.course.id))
+
 
 @unittest.skipUnless(settings.ROOT_URLCONF == 'lms.urls', 'Test only valid in lms')
 class EnrollmentEmbargoTest(EnrollmentTestMixin, UrlResetMixin, ModuleStoreTestCase):
@@ -5,10 +5,11 @@ URLs for the Enrollment API
 from django.conf import settings
 from django.conf.urls import patterns, url
 
-from .views import EnrollmentCourseDetailView, EnrollmentListView, EnrollmentView
+from .views import BulkEnrollmentView, EnrollmentCourseDetailView, EnrollmentListView, EnrollmentView
 
 urlpatterns = patterns(
     'enrollment.views',
+    url(r'^enrollment/bulk$', BulkEnrollmentView.as_view(), name='courseenrollmentsbulk'),
     url(
         r'^enrollment/{username},{course_key}$'.format(
             username=settings.USERNAME_PATTERN, course_key=settings.COURSE_ID_PATTERN
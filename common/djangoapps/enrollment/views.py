@@ -17,7 +17,12 @@ from rest_framework.views import APIView
 
 from course_modes.models import CourseMode
 from enrollment import api
-from enrollment.errors import CourseEnrollmentError, CourseEnrollmentExistsError, CourseModeNotFoundError
+from enrollment.errors import (
+    CourseEnrollmentError,
+    CourseEnrollmentExistsError,
+    CourseModeNotFoundError,
+    UserNotFoundError
+)
 from openedx.core.djangoapps.cors_csrf.authentication import SessionAuthenticationCrossDomainCsrf
 from openedx.core.djangoapps.cors_csrf.decorators import ensure_csrf_cookie_cross_domain
 from openedx.core.djangoapps.embargo import api as embargo_api
@@ -700,3 +705,124 @@ class EnrollmentListView(APIView, ApiKeyPermissionMixIn):
                     actual_activation=current_enrollment['is_active'] if current_enrollment else None,
                     user_id=user.id
                 )
+
+
+class BulkEnrollmentView(APIView):
+    """
+        **Use Case**
+
+            Enroll many users in a course at once, with a server-to-server
+            call.
+
+            Users who are already enrolled in the course keep their
+            enrollment. The other users are enrolled, or re-enrolled, in bulk,
+            without checking whether enrollment in the course is open or full.
+
+        **Example Request**
+
+            POST /api/enrollment/v1/enrollment/bulk {
+
+                "mode": "honor",
+                "course_details":{"course_id": "edX/DemoX/Demo_Course"},
+                "users": ["Bob", "Alice"]
+
+            }
+
+            **POST Parameters**
+
+              A POST request can include the following parameters.
+
+              * users: The usernames of the users to enroll.
+
+              * mode: Optional. The course mode for the enrollments. If not
+                specified, the users are enrolled in the default course mode.
+
+              * course details: A collection that includes the following
+                information.
+
+                  * course_id: The unique identifier for the course.
+
+        **POST Response Values**
+
+            If the course ID or the users are not specified, the specified
+            course does not exist, or the mode is unavailable for the course,
+            the request returns an HTTP 400 "Bad Request" response.
+
+            If any of the specified users does not exist, no user is enrolled
+            and the request returns an HTTP 406 "Not Acceptable" response.
+
+            If the request is successful, an HTTP 200 "OK" response is
+            returned along with the enrollments of the users, in order.
+
+            Each course enrollment contains the following values.
+
+             * created: The date the enrollment was created.
+
+             * is_active: Whether the enrollment is currently active.
+
+             * mode: The enrollment mode of the user in this course.
+
+             * user: The username of the user.
+    """
+    authentication_classes = (JwtAuthentication, OAuth2AuthenticationAllowInactiveUser,
+                              EnrollmentCrossDomainSessionAuth,)
+    permission_classes = ApiKeyHeaderPermission,
+
+    def post(self, request):
+        """Enrolls the given users in a course."""
+        usernames = request.data.get('users')
+        course_id = request.data.get('course_details', {}).get('course_id')
+        mode = request.data.get('mode')
+
+        if not course_id:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"message": u"Course ID must be specified to create new enrollments."}
+            )
+        if not isinstance(usernames, list) or not usernames:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={"message": u"Users must be specified to create new enrollments."}
+            )
+
+        try:
+            course_id = CourseKey.from_string(course_id)
+        except InvalidKeyError:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={
+                    "message": u"No course '{course_id}' found for enrollment".format(course_id=course_id)
+                }
+            )
+
+        try:
+            enrollments = api.add_enrollments(usernames, unicode(course_id), mode=mode)
+        except CourseModeNotFoundError as error:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={
+                    "message": (
+                        u"The [{mode}] course mode is expired or otherwise unavailable for course run [{course_id}]."
+                    ).format(mode=mode, course_id=course_id),
+                    "course_details": error.data
+                })
+        except CourseNotFoundError:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={
+                    "message": u"No course '{course_id}' found for enrollment".format(course_id=course_id)
+                }
+            )
+        except UserNotFoundError as error:
+            return Response(
+                status=status.HTTP_406_NOT_ACCEPTABLE,
+                data={"message": error.message}
+            )
+
+        audit_log(
+            'bulk_enrollment_requested',
+            course_id=unicode(course_id),
+            requested_mode=mode,
+            user_count=len(enrollments),
+        )
+        return Response(enrollments)
@@ -0,0 +1,109 @@
+"""
+Bulk loading, and caching across requests, of the per-enrollment data of
+the learner dashboard.
+
+The per-enrollment sections of the dashboard, e.g. the certificate and
+verification statuses of each course, are assembled by
+student.views.dashboard with a bounded number of queries, whatever the
+number of enrollments of the learner.  They are cached per user for
+DASHBOARD_DATA_CACHE_TIMEOUT seconds, along with a version of the user's
+enrollments and of their courses' overviews, so that enrolling,
+unenrolling, changing modes and publishing the courses make the cached data
+obsolete.  Receivers delete the cached data of a user when one of their
+certificates, grades, course access roles or photo verifications changes.
+
+The sections which depend on the current time, e.g. verification and
+refund deadlines or courses starting, may be out of date for up to the
+cache timeout.  The sections which are not per enrollment, e.g. the order
+history and the verification banners, are computed on each request, as
+are the credit statuses, since credit requests and eligibilities are
+updated outside of the signals above, e.g. by the credit providers.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+
+from certificates.models import GeneratedCertificate, certificate_status
+from openedx.core.djangoapps.theming import helpers as theming_helpers
+
+# Default number of seconds the dashboard data of a user is cached, or 0 not to cache it.
+DEFAULT_CACHE_TIMEOUT = 5 * 60
+
+
+def get_certificate_statuses(user):
+    """
+    Returns the statuses of all of the given user's certificates, by course
+    id, as returned by certificates.models.certificate_status.
+    """
+    return {
+        certificate.course_id: certificate_status(certificate)
+        for certificate in GeneratedCertificate.objects.filter(user=user)
+    }
+
+
+def get_cached_dashboard_data(user, course_enrollments):
+    """
+    Returns the cached dashboard data of the given user, or None if there is
+    none for their current enrollments.
+    """
+    if not _get_cache_timeout():
+        return None
+    cached = cache.get(_cache_key(user.id))
+    if cached is None or cached['version'] != _get_version(course_enrollments):
+        return None
+    return cached['data']
+
+
+def cache_dashboard_data(user, course_enrollments, data):
+    """
+    Caches the given dashboard data of the given user, for their current
+    enrollments.
+    """
+    timeout = _get_cache_timeout()
+    if timeout:
+        cache.set(
+            _cache_key(user.id),
+            {'version': _get_version(course_enrollments), 'data': data},
+            timeout,
+        )
+
+
+def invalidate_dashboard_data(user_id):
+    """
+    Deletes the cached dashboard data of the user with the given id.
+    """
+    cache.delete(_cache_key(user_id))
+
+
+def _get_cache_timeout():
+    """
+    Returns the number of seconds the dashboard data is cached.
+    """
+    return getattr(settings, 'DASHBOARD_DATA_CACHE_TIMEOUT', DEFAULT_CACHE_TIMEOUT)
+
+
+def _cache_key(user_id):
+    """
+    Returns the cache key of the dashboard data of the user with the given id.
+    """
+    return u'student.dashboard_data.{}'.format(user_id)
+
+
+def _get_version(course_enrollments):
+    """
+    Returns a digest of the given enrollments and of the parts of their
+    courses the dashboard data depends on.
+    """
+    version = hashlib.sha1()
+    version.update(repr(theming_helpers.is_request_in_themed_site()))
+    for enrollment in sorted(course_enrollments, key=lambda enrollment: unicode(enrollment.course_id)):
+        course_overview = enrollment.course_overview
+        version.update(repr((
+            unicode(enrollment.course_id),
+            enrollment.mode,
+            enrollment.is_active,
+            course_overview.modified.isoformat() if course_overview.modified else None,
+            course_overview.may_certify(),
+        )))
+    return version.hexdigest()
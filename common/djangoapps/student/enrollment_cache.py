@@ -0,0 +1,159 @@
+"""
+Caching across requests of the enrollment states of users.
+
+The states (mode and whether it is active) of all the enrollments of a user
+are cached together for ENROLLMENT_STATES_CACHE_TIMEOUT seconds, under a
+version of the user's enrollments.  Changing an enrollment of the user
+replaces the version, which makes the cached states obsolete without racing
+with requests that are loading the previous states.  The version is replaced
+again at the end of the request or celery task, once the change is committed,
+so that states read by other processes before the commit are not kept.
+
+The states of many users are read with a single multi-get, so that checking
+the enrollments of a list of users only queries those whose states are not
+cached.
+"""
+import threading
+from uuid import uuid4
+
+from celery.signals import task_postrun
+from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import request_finished
+from django.dispatch import receiver
+
+# Default number of seconds the enrollment states of a user are cached, or 0 not to cache them.
+DEFAULT_CACHE_TIMEOUT = 5 * 60
+
+# Number of users whose enrollment states are read, and loaded, at a time.
+CHUNK_SIZE = 1000
+
+
+def get_enrollment_states(user_ids, load_enrollment_states):
+    """
+    Returns the enrollment states of the users with the given ids, by user
+    id, as dicts of CourseEnrollmentStates by course id string.
+
+    The states of the users whose states are not cached are loaded, and
+    cached, by calling load_enrollment_states with lists of their ids.
+    """
+    user_ids = list(set(user_ids))
+    enrollment_states = {}
+    for start in xrange(0, len(user_ids), CHUNK_SIZE):
+        enrollment_states.update(_get_enrollment_states(user_ids[start:start + CHUNK_SIZE], load_enrollment_states))
+    return enrollment_states
+
+
+def _get_enrollment_states(user_ids, load_enrollment_states):
+    """
+    Returns the enrollment states of the users with the given ids, reading
+    them with a single multi-get.
+    """
+    timeout = _get_cache_timeout()
+    if not timeout:
+        return load_enrollment_states(user_ids)
+
+    data_keys = {_data_key(user_id, version): user_id for user_id, version in _get_versions(user_ids).iteritems()}
+    cached_states = cache.get_many(data_keys.keys())
+    enrollment_states = {data_keys[key]: states for key, states in cached_states.iteritems()}
+
+    missing_user_ids = [user_id for user_id in user_ids if user_id not in enrollment_states]
+    if missing_user_ids:
+        loaded_states = load_enrollment_states(missing_user_ids)
+        cache.set_many(
+            {key: loaded_states[user_id] for key, user_id in data_keys.iteritems() if user_id in loaded_states},
+            timeout,
+        )
+        enrollment_states.update(loaded_states)
+    return enrollment_states
+
+
+def invalidate_enrollment_states(user_id):
+    """
+    Makes the cached enrollment states of the user with the given id obsolete,
+    now and at the end of the current request or celery task.
+    """
+    if _get_cache_timeout():
+        _set_new_versions([user_id])
+        _pending_user_ids.add(user_id)
+
+
+class _PendingUserIds(threading.local):
+    """
+    The ids of the users whose enrollments changed in the current thread.
+    """
+    def __init__(self):
+        super(_PendingUserIds, self).__init__()
+        self.user_ids = set()
+
+    def add(self, user_id):
+        """
+        Adds the id of a user whose enrollments changed.
+        """
+        self.user_ids.add(user_id)
+
+    def pop_all(self):
+        """
+        Returns and forgets the ids of the users whose enrollments changed.
+        """
+        user_ids, self.user_ids = self.user_ids, set()
+        return user_ids
+
+
+_pending_user_ids = _PendingUserIds()  # pylint: disable=invalid-name
+
+
+@receiver(request_finished)
+@task_postrun.connect
+def _invalidate_pending_enrollment_states(**kwargs):  # pylint: disable=unused-argument
+    """
+    Makes the enrollment states cached since the enrollments changed in the
+    current request or celery task obsolete, once the changes are committed.
+    """
+    user_ids = _pending_user_ids.pop_all()
+    if user_ids:
+        _set_new_versions(user_ids)
+
+
+def _set_new_versions(user_ids):
+    """
+    Replaces the versions of the enrollments of the users with the given ids.
+    """
+    cache.set_many({_version_key(user_id): uuid4().hex for user_id in user_ids}, _get_cache_timeout())
+
+
+def _get_cache_timeout():
+    """
+    Returns the number of seconds the enrollment states are cached.
+    """
+    return getattr(settings, 'ENROLLMENT_STATES_CACHE_TIMEOUT', DEFAULT_CACHE_TIMEOUT)
+
+
+def _get_versions(user_ids):
+    """
+    Returns the current versions of the enrollments of the users with the
+    given ids, by user id.
+    """
+    version_keys = {_version_key(user_id): user_id for user_id in user_ids}
+    versions = cache.get_many(version_keys.keys())
+    missing_versions = {key: uuid4().hex for key in version_keys if key not in versions}
+    if missing_versions:
+        cache.set_many(missing_versions, _get_cache_timeout())
+        versions.update(missing_versions)
+    return {version_keys[key]: version for key, version in versions.iteritems()}
+
+
+def _version_key(user_id):
+    """
+    Returns the cache key of the version of the enrollments of the user with
+    the given id.
+    """
+    return u'student.enrollment_states.version.{}'.format(user_id)
+
+
+def _data_key(user_id, version):
+    """
+    Returns the cache key of the enrollment states of the user with the
+    given id, for the given version of their enrollments.
+    """
+    return u'student.enrollment_states.{}.{}'.format(user_id, version)
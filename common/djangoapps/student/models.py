@@ -50,8 +50,11 @@ from course_modes.models import CourseMode
 from enrollment.api import _default_course_mode
 from eventtracking import tracker
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+from openedx.core.djangoapps.signals.signals import COURSE_GRADE_CHANGED
 from openedx.core.djangoapps.site_configuration import helpers as configuration_helpers
 from openedx.core.djangoapps.xmodule_django.models import CourseKeyField, NoneToEmptyManager
+from student.dashboard_data import invalidate_dashboard_data
+from student.enrollment_cache import get_enrollment_states, invalidate_enrollment_states
 from track import contexts
 from util.milestones_helpers import is_entrance_exams_enabled
 from util.model_utils import emit_field_changed_events, get_changed_fields_dict
@@ -59,6 +62,9 @@ from util.query import use_read_replica_if_available
 
 UNENROLL_DONE = Signal(providing_args=["course_enrollment", "skip_refund"])
 ENROLL_STATUS_CHANGE = Signal(providing_args=["event", "user", "course_id", "mode", "cost", "currency"])
+ENROLL_STATUS_CHANGE_BULK = Signal(providing_args=["event", "enrollments", "course_id"])
+# Default number of users enrolled, or audited, at a time by bulk enrollments.
+DEFAULT_BULK_ENROLLMENT_BATCH_SIZE = 500
 log = logging.getLogger(__name__)
 AUDIT_LOG = logging.getLogger("audit")
 SessionStore = import_module(settings.SESSION_ENGINE).SessionStore  # pylint: disable=invalid-name
@@ -1339,6 +1345,66 @@ class CourseEnrollment(models.Model):
                 return None
             raise
 
+    @classmethod
+    def bulk_enroll(cls, users, course_key, mode=None):
+        """
+        Enroll users in a course, as `enroll` does without checking access,
+        handling BULK_ENROLLMENT_BATCH_SIZE users at a time. This saves
+        immediately.
+
+        Returns the CourseEnrollment objects of the users, in order.
+
+        `users` is a list of saved Django User objects.
+
+        `course_key` is our usual course_id string (e.g. "edX/Test101/2013_Fall)
+
+        `mode` is a string specifying what kind of enrollment this is. If it
+               is None, users who are already enrolled keep their mode, and
+               the others are enrolled in the default course mode.
+
+        The existing enrollments of each batch of users are read with a single
+        query, and rather than sending ENROLL_STATUS_CHANGE for each user,
+        ENROLL_STATUS_CHANGE_BULK is sent once per batch, with the batch's
+        enrollments.  Each enrollment is still saved on its own, so that the
+        receivers of its post_save signal (history, forum roles, cohorts and
+        caches) see it.
+        """
+        assert isinstance(course_key, CourseKey)
+        if not users:
+            return []
+        default_mode = _default_course_mode(unicode(course_key)) if mode is None else mode
+        batch_size = getattr(settings, 'BULK_ENROLLMENT_BATCH_SIZE', DEFAULT_BULK_ENROLLMENT_BATCH_SIZE)
+
+        enrollments = []
+        for start in xrange(0, len(users), batch_size):
+            batch = users[start:start + batch_size]
+            existing_enrollments = {
+                enrollment.user_id: enrollment
+                for enrollment in cls.objects.filter(user__in=batch, course_id=course_key)
+            }
+            batch_enrollments = []
+            for user in batch:
+                enrollment = existing_enrollments.get(user.id)
+                if enrollment is None:
+                    enrollment = cls(
+                        user=user, course_id=course_key, mode=CourseMode.DEFAULT_MODE_SLUG, is_active=False
+                    )
+                    existing_enrollments[user.id] = enrollment
+                else:
+                    enrollment.user = user
+                if mode is None and enrollment.is_active:
+                    enrollment_mode = enrollment.mode
+                else:
+                    enrollment_mode = default_mode
+                enrollment.update_enrollment(is_active=True, mode=enrollment_mode)
+                batch_enrollments.append(enrollment)
+
+            ENROLL_STATUS_CHANGE_BULK.send(
+                sender=None, event=EnrollStatusChange.enroll, enrollments=batch_enrollments, course_id=course_key,
+            )
+            enrollments.extend(batch_enrollments)
+        return enrollments
+
     @classmethod
     def unenroll(cls, user, course_id, skip_refund=False):
         """
@@ -1697,11 +1763,10 @@ class CourseEnrollment(models.Model):
         """
         enrollment_state = cls._get_enrollment_in_request_cache(user, course_key)
         if not enrollment_state:
-            try:
-                record = cls.objects.get(user=user, course_id=course_key)
-                enrollment_state = CourseEnrollmentState(record.mode, record.is_active)
-            except cls.DoesNotExist:
-                enrollment_state = CourseEnrollmentState(None, None)
+            enrollment_states = {}
+            if user.id is not None:
+                enrollment_states = get_enrollment_states([user.id], cls._load_enrollment_states)[user.id]
+            enrollment_state = enrollment_states.get(unicode(course_key), CourseEnrollmentState(None, None))
             cls._update_enrollment_in_request_cache(user, course_key, enrollment_state)
         return enrollment_state
 
@@ -1715,11 +1780,30 @@ class CourseEnrollment(models.Model):
         # remove previously cached entries to keep memory usage low.
         request_cache.clear_cache(cls.MODE_CACHE_NAMESPACE)
 
-        records = cls.objects.filter(user__in=users, course_id=course_key).select_related('user__id')
+        if isinstance(users, models.QuerySet):
+            user_ids = users.values_list('id', flat=True)
+        else:
+            user_ids = [user.id for user in users]
+        enrollment_states = get_enrollment_states(user_ids, cls._load_enrollment_states)
         cache = cls._get_mode_active_request_cache()
-        for record in records:
-            enrollment_state = CourseEnrollmentState(record.mode, record.is_active)
-            cls._update_enrollment(cache, record.user.id, course_key, enrollment_state)
+        for user_id, user_enrollment_states in enrollment_states.iteritems():
+            enrollment_state = user_enrollment_states.get(unicode(course_key), CourseEnrollmentState(None, None))
+            cls._update_enrollment(cache, user_id, course_key, enrollment_state)
+
+    @classmethod
+    def _load_enrollment_states(cls, user_ids):
+        """
+        Returns the states of all the enrollments of the users with the
+        given ids, by user id, as dicts of CourseEnrollmentStates by course
+        id string.
+        """
+        enrollment_states = {user_id: {} for user_id in user_ids}
+        records = cls.objects.filter(user_id__in=user_ids).order_by().values_list(
+            'user_id', 'course_id', 'mode', 'is_active',
+        )
+        for user_id, course_id, mode, is_active in records:
+            enrollment_states[user_id][unicode(course_id)] = CourseEnrollmentState(mode, is_active)
+        return enrollment_states
 
     @classmethod
     def _get_mode_active_request_cache(cls):
@@ -1763,6 +1847,36 @@ def invalidate_enrollment_mode_cache(sender, instance, **kwargs):  # pylint: dis
         unicode(instance.course_id)
     )
     cache.delete(cache_key)
+    invalidate_enrollment_states(instance.user_id)
+
+
+@receiver(ENROLL_STATUS_CHANGE)
+def invalidate_enrollment_states_cache(sender, user=None, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate the cached enrollment states of a user whose enrollment status changed. """
+    if getattr(user, 'id', None) is not None:
+        invalidate_enrollment_states(user.id)
+
+
+@receiver(ENROLL_STATUS_CHANGE_BULK)
+def invalidate_bulk_enrollment_states_cache(sender, enrollments=(), **kwargs):  # pylint: disable=unused-argument
+    """Invalidate the cached enrollment states of users whose enrollment status changed in bulk. """
+    for enrollment in enrollments:
+        invalidate_enrollment_states(enrollment.user_id)
+
+
+@receiver(models.signals.post_save, sender=CourseEnrollment)
+@receiver(models.signals.post_delete, sender=CourseEnrollment)
+@receiver(models.signals.post_save, sender=GeneratedCertificate)
+@receiver(models.signals.post_delete, sender=GeneratedCertificate)
+def invalidate_dashboard_data_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate the cached dashboard data of the user of an enrollment or certificate. """
+    invalidate_dashboard_data(instance.user_id)
+
+
+@receiver(COURSE_GRADE_CHANGED)
+def invalidate_dashboard_data_cache_on_grade_change(sender, user, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate the cached dashboard data of a user whose grade changed. """
+    invalidate_dashboard_data(user.id)
 
 
 class ManualEnrollmentAudit(models.Model):
@@ -1789,6 +1903,26 @@ class ManualEnrollmentAudit(models.Model):
             enrollment=enrollment
         )
 
+    @classmethod
+    def bulk_create_manual_enrollment_audits(cls, user, audits, reason):
+        """
+        saves the manual enrollment information of many students at once,
+        given as (email, state_transition, enrollment) tuples
+        """
+        cls.objects.bulk_create(
+            [
+                cls(
+                    enrolled_by=user,
+                    enrolled_email=email,
+                    state_transition=state_transition,
+                    reason=reason,
+                    enrollment=enrollment
+                )
+                for email, state_transition, enrollment in audits
+            ],
+            batch_size=getattr(settings, 'BULK_ENROLLMENT_BATCH_SIZE', DEFAULT_BULK_ENROLLMENT_BATCH_SIZE),
+        )
+
     @classmethod
     def get_manual_enrollment_by_email(cls, email):
         """
@@ -1892,6 +2026,13 @@ class CourseAccessRole(models.Model):
         return "[CourseAccessRole] user: {}   role: {}   org: {}   course: {}".format(self.user.username, self.role, self.org, self.course_id)
 
 
+@receiver(models.signals.post_save, sender=CourseAccessRole)
+@receiver(models.signals.post_delete, sender=CourseAccessRole)
+def invalidate_dashboard_data_cache_on_role_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate the cached dashboard data of a user whose course access roles changed. """
+    invalidate_dashboard_data(instance.user_id)
+
+
 #### Helper methods for use from python manage.py shell and other classes.
 
 
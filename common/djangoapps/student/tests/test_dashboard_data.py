@@ -0,0 +1,133 @@
+"""
+Tests for the bulk loading and caching of the student dashboard's data.
+"""
+import unittest
+
+from django.conf import settings
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.urlresolvers import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from mock import patch
+
+from certificates.models import CertificateStatuses  # pylint: disable=import-error
+from certificates.tests.factories import GeneratedCertificateFactory  # pylint: disable=import-error
+from student.roles import CourseStaffRole
+from student.tests.factories import CourseEnrollmentFactory, UserFactory
+from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
+from xmodule.modulestore.tests.factories import CourseFactory
+
+PASSWORD = 'test'
+
+
+@unittest.skipUnless(settings.ROOT_URLCONF == 'lms.urls', 'Test only valid in lms')
+@override_settings(DASHBOARD_DATA_CACHE_TIMEOUT=300)
+class DashboardDataTest(SharedModuleStoreTestCase):
+    """
+    Tests for the bulk loading and caching of the per-enrollment data of the dashboard.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super(DashboardDataTest, cls).setUpClass()
+        cls.courses = [
+            CourseFactory.create(certificates_display_behavior='early_with_info') for __ in range(3)
+        ]
+
+    def setUp(self):
+        super(DashboardDataTest, self).setUp()
+        self.user = UserFactory(password=PASSWORD)
+        self.client.login(username=self.user.username, password=PASSWORD)
+
+    def enroll(self, course):
+        """
+        Enrolls the user in the given course and generates their certificate.
+        """
+        CourseEnrollmentFactory(user=self.user, course_id=course.id, mode='honor')
+        return GeneratedCertificateFactory(
+            user=self.user,
+            course_id=course.id,
+            mode='honor',
+            status=CertificateStatuses.notpassing,
+        )
+
+    def count_queries(self, table_name):
+        """
+        Loads the dashboard, and returns the number of its queries of the given table.
+        """
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('dashboard'))
+        self.assertEqual(response.status_code, 200)
+        return len([query for query in context.captured_queries if table_name in query['sql']])
+
+    def test_num_queries_do_not_depend_on_enrollments(self):
+        self.enroll(self.courses[0])
+        num_certificate_queries = self.count_queries('certificates_generatedcertificate')
+        num_registration_code_queries = self.count_queries('shoppingcart_courseregistrationcode')
+
+        for course in self.courses[1:]:
+            self.enroll(course)
+        self.assertEqual(self.count_queries('certificates_generatedcertificate'), num_certificate_queries)
+        self.assertEqual(self.count_queries('shoppingcart_courseregistrationcode'), num_registration_code_queries)
+
+    def count_all_queries(self):
+        """
+        Loads the dashboard, and returns the number of all of its queries.
+        """
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('dashboard'))
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_num_cached_queries_do_not_depend_on_enrollments(self):
+        with patch('student.dashboard_data.cache', LocMemCache('dashboard_data', {})):
+            self.enroll(self.courses[0])
+            self.client.get(reverse('dashboard'))
+            num_queries = self.count_all_queries()
+
+            for course in self.courses[1:]:
+                self.enroll(course)
+            self.client.get(reverse('dashboard'))
+            with self.assertNumQueries(num_queries):
+                response = self.client.get(reverse('dashboard'))
+            self.assertEqual(response.status_code, 200)
+
+    def test_dashboard_data_is_cached(self):
+        for course in self.courses:
+            self.enroll(course)
+
+        with patch('student.dashboard_data.cache', LocMemCache('dashboard_data', {})):
+            self.client.get(reverse('dashboard'))
+            with patch('student.views.check_verify_status_by_course', return_value={}) as mock_verify_status:
+                self.client.get(reverse('dashboard'))
+                mock_verify_status.assert_not_called()
+
+                # Changing a course access role of the user invalidates the cached data.
+                CourseStaffRole(self.courses[0].id).add_users(self.user)
+                self.client.get(reverse('dashboard'))
+                self.assertEqual(mock_verify_status.call_count, 1)
+
+    def test_credit_statuses_are_not_cached(self):
+        for course in self.courses:
+            self.enroll(course)
+
+        with patch('student.dashboard_data.cache', LocMemCache('dashboard_data', {})):
+            self.client.get(reverse('dashboard'))
+            with patch('student.views._credit_statuses', return_value={}) as mock_credit_statuses:
+                self.client.get(reverse('dashboard'))
+                self.client.get(reverse('dashboard'))
+                self.assertEqual(mock_credit_statuses.call_count, 2)
+
+    def test_certificate_statuses_are_cached(self):
+        certificates = [self.enroll(course) for course in self.courses]
+
+        with patch('student.dashboard_data.cache', LocMemCache('dashboard_data', {})):
+            self.client.get(reverse('dashboard'))
+            with patch('student.views.cert_info', return_value={}) as mock_cert_info:
+                self.client.get(reverse('dashboard'))
+                mock_cert_info.assert_not_called()
+
+                # Changing a certificate of the user invalidates the cached statuses.
+                certificates[0].status = CertificateStatuses.downloadable
+                certificates[0].save()
+                self.client.get(reverse('dashboard'))
+                self.assertEqual(mock_cert_info.call_count, len(self.courses))
@@ -0,0 +1,92 @@
+"""
+Tests for the caching across requests of the enrollment states of users.
+"""
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import TestCase
+from django.test.utils import override_settings
+from mock import Mock, patch
+from opaque_keys.edx.locator import CourseLocator
+
+import request_cache
+from student.enrollment_cache import (
+    _invalidate_pending_enrollment_states,
+    get_enrollment_states,
+    invalidate_enrollment_states
+)
+from student.models import CourseEnrollment, CourseEnrollmentState
+from student.tests.factories import UserFactory
+
+
+@override_settings(ENROLLMENT_STATES_CACHE_TIMEOUT=300)
+class EnrollmentCacheTest(TestCase):
+    """
+    Tests for the caching across requests of the enrollment states of users.
+    """
+    def setUp(self):
+        super(EnrollmentCacheTest, self).setUp()
+        patcher = patch('student.enrollment_cache.cache', LocMemCache('enrollment_states', {}))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.course_keys = [CourseLocator('edX', 'course{}'.format(i), 'run') for i in range(2)]
+        self.users = [UserFactory() for __ in range(3)]
+        for user in self.users:
+            CourseEnrollment.enroll(user, self.course_keys[0], mode='honor')
+        self.new_request()
+
+    def new_request(self):
+        """
+        Clears the request cache of the enrollment states.
+        """
+        request_cache.clear_cache(CourseEnrollment.MODE_CACHE_NAMESPACE)
+
+    def test_enrollment_states_are_cached(self):
+        user = self.users[0]
+        self.assertTrue(CourseEnrollment.is_enrolled(user, self.course_keys[0]))
+        self.new_request()
+
+        with self.assertNumQueries(0):
+            self.assertTrue(CourseEnrollment.is_enrolled(user, self.course_keys[0]))
+            self.assertFalse(CourseEnrollment.is_enrolled(user, self.course_keys[1]))
+            self.assertEqual(CourseEnrollment.enrollment_mode_for_user(user, self.course_keys[0]), ('honor', True))
+
+    def test_enrollment_changes_invalidate_states(self):
+        user = self.users[0]
+        self.assertFalse(CourseEnrollment.is_enrolled(user, self.course_keys[1]))
+
+        CourseEnrollment.enroll(user, self.course_keys[1], mode='verified')
+        self.new_request()
+        self.assertEqual(CourseEnrollment.enrollment_mode_for_user(user, self.course_keys[1]), ('verified', True))
+
+        CourseEnrollment.unenroll(user, self.course_keys[1])
+        self.new_request()
+        self.assertFalse(CourseEnrollment.is_enrolled(user, self.course_keys[1]))
+
+    def test_bulk_fetch_enrollment_states(self):
+        CourseEnrollment.is_enrolled(self.users[0], self.course_keys[0])
+        self.new_request()
+
+        # The states of the users that are not cached are loaded with one query.
+        with self.assertNumQueries(1):
+            CourseEnrollment.bulk_fetch_enrollment_states(self.users, self.course_keys[0])
+        self.new_request()
+
+        with self.assertNumQueries(0):
+            CourseEnrollment.bulk_fetch_enrollment_states(self.users, self.course_keys[0])
+            for user in self.users:
+                self.assertTrue(CourseEnrollment.is_enrolled(user, self.course_keys[0]))
+
+    def test_states_loaded_before_commit_are_invalidated_at_request_end(self):
+        user_id = self.users[0].id
+        stale_states = {user_id: {unicode(self.course_keys[1]): CourseEnrollmentState(None, None)}}
+        current_states = {user_id: {unicode(self.course_keys[1]): CourseEnrollmentState('honor', True)}}
+
+        # Another process loads the states after the enrollment changed, but before the change is committed.
+        invalidate_enrollment_states(user_id)
+        get_enrollment_states([user_id], Mock(return_value=stale_states))
+
+        # The end of the request invalidates them once the change is committed.
+        _invalidate_pending_enrollment_states()
+        load_enrollment_states = Mock(return_value=current_states)
+        self.assertEqual(get_enrollment_states([user_id], load_enrollment_states), current_states)
+        load_enrollment_states.assert_called_once_with([user_id])
@@ -36,6 +36,8 @@ from openedx.core.djangoapps.programs.tests.mixins import ProgramsApiConfigMixin
 from openedx.core.djangoapps.site_configuration.tests.mixins import SiteMixin
 from openedx.core.djangolib.testing.utils import CacheIsolationTestCase, skip_unless_lms
 from student.models import (
+    ENROLL_STATUS_CHANGE,
+    ENROLL_STATUS_CHANGE_BULK,
     CourseEnrollment,
     LinkedInAddToProfileConfiguration,
     UserAttribute,
@@ -929,6 +931,43 @@ class EnrollInCourseTest(EnrollmentEventTestMixin, CacheIsolationTestCase):
         CourseEnrollment.enroll(user, course_id, "audit")
         self.assert_enrollment_mode_change_event_was_emitted(user, course_id, "audit")
 
+    @override_settings(BULK_ENROLLMENT_BATCH_SIZE=2)
+    def test_bulk_enrollment(self):
+        course_id = SlashSeparatedCourseKey("edX", "Test101", "2013")
+        enrolled_user, unenrolled_user, new_user = [UserFactory() for __ in range(3)]
+        CourseEnrollment.enroll(enrolled_user, course_id, "verified")
+        CourseEnrollment.enroll(unenrolled_user, course_id, "verified")
+        CourseEnrollment.unenroll(unenrolled_user, course_id)
+        self.mock_tracker.reset_mock()
+
+        bulk_receiver = Mock()
+        receiver = Mock()
+        ENROLL_STATUS_CHANGE_BULK.connect(bulk_receiver, weak=False)
+        self.addCleanup(ENROLL_STATUS_CHANGE_BULK.disconnect, bulk_receiver)
+        ENROLL_STATUS_CHANGE.connect(receiver, weak=False)
+        self.addCleanup(ENROLL_STATUS_CHANGE.disconnect, receiver)
+
+        enrollments = CourseEnrollment.bulk_enroll([enrolled_user, unenrolled_user, new_user], course_id)
+
+        # Enrolled users keep their mode, and the others get the default one.
+        self.assertEqual(
+            [(enrollment.user, enrollment.mode, enrollment.is_active) for enrollment in enrollments],
+            [
+                (enrolled_user, "verified", True),
+                (unenrolled_user, CourseMode.DEFAULT_MODE_SLUG, True),
+                (new_user, CourseMode.DEFAULT_MODE_SLUG, True),
+            ]
+        )
+        for user in (enrolled_user, unenrolled_user, new_user):
+            self.assertTrue(CourseEnrollment.is_enrolled(user, course_id))
+
+        # The downstream signal is sent once per batch of users.
+        self.assertFalse(receiver.called)
+        self.assertEqual(
+            [call[1]['enrollments'] for call in bulk_receiver.call_args_list],
+            [enrollments[:2], enrollments[2:]]
+        )
+
 
 @unittest.skipUnless(settings.ROOT_URLCONF == 'lms.urls', 'Test only valid in lms')
 class ChangeEnrollmentViewTest(ModuleStoreTestCase):
@@ -58,6 +58,7 @@ from certificates.api import get_certificate_url, has_html_certificates_enabled
 from certificates.models import (  # pylint: disable=import-error
     CertificateStatuses,
     GeneratedCertificate,
+    certificate_status,
     certificate_status_for_student
 )
 from course_modes.models import CourseMode
@@ -90,6 +91,7 @@ from openedx.features.enterprise_support.api import get_dashboard_consent_notifi
 from shoppingcart.api import order_history
 from shoppingcart.models import CourseRegistrationCode, DonationConfiguration
 from student.cookies import delete_logged_in_cookies, set_logged_in_cookies, set_user_info_cookie
+from student.dashboard_data import cache_dashboard_data, get_cached_dashboard_data, get_certificate_statuses
 from student.forms import AccountCreationForm, PasswordResetFormNoActive, get_registration_extension_form
 from student.helpers import (
     DISABLE_UNENROLL_CERT_STATES,
@@ -220,7 +222,7 @@ def process_survey_link(survey_link, user):
     return survey_link.format(UNIQUE_ID=unique_id_for_user(user))
 
 
-def cert_info(user, course_overview, course_mode):
+def cert_info(user, course_overview, course_mode, certificate_statuses=None):
     """
     Get the certificate info needed to render the dashboard section for the given
     student and course.
@@ -229,6 +231,9 @@ def cert_info(user, course_overview, course_mode):
         user (User): A user.
         course_overview (CourseOverview): A course.
         course_mode (str): The enrollment mode (honor, verified, audit, etc.)
+        certificate_statuses (dict): The statuses of the user's certificates by course id,
+            as returned by get_certificate_statuses, to use instead of fetching the status
+            of the course's certificate.
 
     Returns:
         dict: Empty dict if certificates are disabled or hidden, or a dictionary with keys:
@@ -243,10 +248,14 @@ def cert_info(user, course_overview, course_mode):
     """
     if not course_overview.may_certify():
         return {}
+    if certificate_statuses is not None:
+        cert_status = certificate_statuses.get(course_overview.id) or certificate_status(None)
+    else:
+        cert_status = certificate_status_for_student(user, course_overview.id)
     return _cert_info(
         user,
         course_overview,
-        certificate_status_for_student(user, course_overview.id),
+        cert_status,
         course_mode
     )
 
@@ -725,12 +734,6 @@ def dashboard(request):
         staff_access = True
         errored_courses = modulestore().get_errored_courses()
 
-    show_courseware_links_for = frozenset(
-        enrollment.course_id for enrollment in course_enrollments
-        if has_access(request.user, 'load', enrollment.course_overview)
-        and has_access(request.user, 'view_courseware_with_prerequisites', enrollment.course_overview)
-    )
-
     # Find programs associated with course runs being displayed. This information
     # is passed in the template context to allow rendering of program-related
     # information on the dashboard.
@@ -748,32 +751,9 @@ def dashboard(request):
         for enrollment in course_enrollments
     }
 
-    # Determine the per-course verification status
-    # This is a dictionary in which the keys are course locators
-    # and the values are one of:
-    #
-    # VERIFY_STATUS_NEED_TO_VERIFY
-    # VERIFY_STATUS_SUBMITTED
-    # VERIFY_STATUS_APPROVED
-    # VERIFY_STATUS_MISSED_DEADLINE
-    #
-    # Each of which correspond to a particular message to display
-    # next to the course on the dashboard.
-    #
-    # If a course is not included in this dictionary,
-    # there is no verification messaging to display.
-    verify_status_by_course = check_verify_status_by_course(user, course_enrollments)
-    cert_statuses = {
-        enrollment.course_id: cert_info(request.user, enrollment.course_overview, enrollment.mode)
-        for enrollment in course_enrollments
-    }
-
-    # only show email settings for Mongo course and when bulk email is turned on
-    show_email_settings_for = frozenset(
-        enrollment.course_id for enrollment in course_enrollments if (
-            BulkEmailFlag.feature_enabled(enrollment.course_id)
-        )
-    )
+    # Load the per-enrollment data, e.g. certificate and per-course verification statuses,
+    # which is cached per user.
+    dashboard_data = _get_dashboard_data(request, course_enrollments)
 
     # Verification Attempts
     # Used to generate the "you must reverify for course x" banner
@@ -784,31 +764,6 @@ def dashboard(request):
     statuses = ["approved", "denied", "pending", "must_reverify"]
     reverifications = reverification_info(statuses)
 
-    user_already_has_certs_for = GeneratedCertificate.course_ids_with_certs_for_user(request.user)
-    show_refund_option_for = frozenset(
-        enrollment.course_id for enrollment in course_enrollments
-        if enrollment.refundable(
-            user_already_has_certs_for=user_already_has_certs_for
-        )
-    )
-
-    block_courses = frozenset(
-        enrollment.course_id for enrollment in course_enrollments
-        if is_course_blocked(
-            request,
-            CourseRegistrationCode.objects.filter(
-                course_id=enrollment.course_id,
-                registrationcoderedemption__redeemed_by=request.user
-            ),
-            enrollment.course_id
-        )
-    )
-
-    enrolled_courses_either_paid = frozenset(
-        enrollment.course_id for enrollment in course_enrollments
-        if enrollment.is_paid_course()
-    )
-
     # If there are *any* denied reverifications that have not been toggled off,
     # we'll display the banner
     denied_banner = any(item.display for item in reverifications["denied"])
@@ -816,13 +771,6 @@ def dashboard(request):
     # Populate the Order History for the side-bar.
     order_history_list = order_history(user, course_org_filter=course_org_filter, org_filter_out_set=org_filter_out_set)
 
-    # get list of courses having pre-requisites yet to be completed
-    courses_having_prerequisites = frozenset(
-        enrollment.course_id for enrollment in course_enrollments
-        if enrollment.course_overview.pre_requisite_courses
-    )
-    courses_requirements_not_met = get_pre_requisite_courses_not_completed(user, courses_having_prerequisites)
-
     if 'notlive' in request.GET:
         redirect_message = _("The course you are looking for does not start until {date}.").format(
             date=request.GET['notlive']
@@ -848,26 +796,26 @@ def dashboard(request):
         'sidebar_account_activation_message': sidebar_account_activation_message,
         'staff_access': staff_access,
         'errored_courses': errored_courses,
-        'show_courseware_links_for': show_courseware_links_for,
+        'show_courseware_links_for': dashboard_data['show_courseware_links_for'],
         'all_course_modes': course_mode_info,
-        'cert_statuses': cert_statuses,
+        'cert_statuses': dashboard_data['cert_statuses'],
         'credit_statuses': _credit_statuses(user, course_enrollments),
-        'show_email_settings_for': show_email_settings_for,
+        'show_email_settings_for': dashboard_data['show_email_settings_for'],
         'reverifications': reverifications,
         'verification_status': verification_status,
-        'verification_status_by_course': verify_status_by_course,
+        'verification_status_by_course': dashboard_data['verification_status_by_course'],
         'verification_errors': verification_errors,
-        'show_refund_option_for': show_refund_option_for,
-        'block_courses': block_courses,
+        'show_refund_option_for': dashboard_data['show_refund_option_for'],
+        'block_courses': dashboard_data['block_courses'],
         'denied_banner': denied_banner,
         'billing_email': settings.PAYMENT_SUPPORT_EMAIL,
         'user': user,
         'logout_url': reverse('logout'),
         'platform_name': platform_name,
-        'enrolled_courses_either_paid': enrolled_courses_either_paid,
+        'enrolled_courses_either_paid': dashboard_data['enrolled_courses_either_paid'],
         'provider_states': [],
         'order_history_list': order_history_list,
-        'courses_requirements_not_met': courses_requirements_not_met,
+        'courses_requirements_not_met': dashboard_data['courses_requirements_not_met'],
         'nav_hidden': True,
         'inverted_programs': inverted_programs,
         'show_program_listing': ProgramsApiConfig.is_enabled(),
@@ -909,6 +857,83 @@ def get_verification_error_reasons_for_display(verification_error_codes):
     return verification_errors
 
 
+def _get_dashboard_data(request, course_enrollments):
+    """
+    Returns the per-enrollment data of the dashboard of the request's user, as a
+    dict of the sections of the dashboard's context by name.
+
+    The data is loaded with a bounded number of queries for all of the given
+    enrollments, and cached per user; see student.dashboard_data.
+    """
+    user = request.user
+    dashboard_data = get_cached_dashboard_data(user, course_enrollments)
+    if dashboard_data is not None:
+        return dashboard_data
+
+    certificate_statuses = get_certificate_statuses(user)
+    user_already_has_certs_for = GeneratedCertificate.course_ids_with_certs_for_user(user)
+
+    # Fetch the redeemed registration codes of all courses at once, rather than per course.
+    redeemed_registration_codes = defaultdict(list)
+    for registration_code in CourseRegistrationCode.objects.filter(
+            registrationcoderedemption__redeemed_by=user
+    ).select_related('invoice_item__invoice'):
+        redeemed_registration_codes[registration_code.course_id].append(registration_code)
+
+    # get list of courses having pre-requisites yet to be completed
+    courses_having_prerequisites = frozenset(
+        enrollment.course_id for enrollment in course_enrollments
+        if enrollment.course_overview.pre_requisite_courses
+    )
+
+    dashboard_data = {
+        'show_courseware_links_for': frozenset(
+            enrollment.course_id for enrollment in course_enrollments
+            if has_access(user, 'load', enrollment.course_overview)
+            and has_access(user, 'view_courseware_with_prerequisites', enrollment.course_overview)
+        ),
+        'cert_statuses': {
+            enrollment.course_id: cert_info(user, enrollment.course_overview, enrollment.mode, certificate_statuses)
+            for enrollment in course_enrollments
+        },
+        # Determine the per-course verification status
+        # This is a dictionary in which the keys are course locators
+        # and the values are one of:
+        #
+        # VERIFY_STATUS_NEED_TO_VERIFY
+        # VERIFY_STATUS_SUBMITTED
+        # VERIFY_STATUS_APPROVED
+        # VERIFY_STATUS_MISSED_DEADLINE
+        #
+        # Each of which correspond to a particular message to display
+        # next to the course on the dashboard.
+        #
+        # If a course is not included in this dictionary,
+        # there is no verification messaging to display.
+        'verification_status_by_course': check_verify_status_by_course(user, course_enrollments),
+        # only show email settings for Mongo course and when bulk email is turned on
+        'show_email_settings_for': frozenset(
+            enrollment.course_id for enrollment in course_enrollments
+            if BulkEmailFlag.feature_enabled(enrollment.course_id)
+        ),
+        'show_refund_option_for': frozenset(
+            enrollment.course_id for enrollment in course_enrollments
+            if enrollment.refundable(user_already_has_certs_for=user_already_has_certs_for)
+        ),
+        'block_courses': frozenset(
+            enrollment.course_id for enrollment in course_enrollments
+            if is_course_blocked(request, redeemed_registration_codes[enrollment.course_id], enrollment.course_id)
+        ),
+        'enrolled_courses_either_paid': frozenset(
+            enrollment.course_id for enrollment in course_enrollments
+            if enrollment.is_paid_course()
+        ),
+        'courses_requirements_not_met': get_pre_requisite_courses_not_completed(user, courses_having_prerequisites),
+    }
+    cache_dashboard_data(user, course_enrollments, dashboard_data)
+    return dashboard_data
+
+
 def _create_recent_enrollment_message(course_enrollments, course_modes):  # pylint: disable=invalid-name
     """
     Builds a recent course enrollment message.
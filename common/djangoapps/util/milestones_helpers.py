@@ -345,6 +345,18 @@ def get_course_content_milestones(course_id, content_id, relationship, user_id=N
     if user_id is None:
         return milestones_api.get_course_content_milestones(course_id, content_id, relationship)
 
+    milestones = prefetch_course_content_milestones(course_id, relationship, user_id)
+    return [m for m in milestones if m['content_id'] == unicode(content_id)]
+
+
+def prefetch_course_content_milestones(course_id, relationship, user_id):
+    """
+    Returns all the course content milestones of the user, loading them into
+    the request cache if they are not cached yet.
+    """
+    if not settings.FEATURES.get('MILESTONES_APP'):
+        return []
+
     request_cache_dict = request_cache.get_cache(REQUEST_CACHE_NAME)
     if user_id not in request_cache_dict:
         request_cache_dict[user_id] = {}
@@ -356,7 +368,7 @@ def get_course_content_milestones(course_id, content_id, relationship, user_id=N
             user={"id": user_id}
         )
 
-    return [m for m in request_cache_dict[user_id][relationship] if m['content_id'] == unicode(content_id)]
+    return request_cache_dict[user_id][relationship]
 
 
 def remove_course_content_user_milestones(course_key, content_key, user, relationship):
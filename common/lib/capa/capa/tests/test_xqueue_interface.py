@@ -0,0 +1,98 @@
+"""
+Tests for capa.xqueue_interface
+"""
+import json
+import unittest
+
+from mock import patch
+
+from capa.xqueue_interface import XQueueInterface, make_xheader
+
+
+class FakeXQueueResponse(object):
+    """
+    Minimal stand-in for a `requests` response returned by the fake xqueue.
+    """
+    def __init__(self, return_code, content, status_code=200):
+        self.status_code = status_code
+        self.text = json.dumps({'return_code': return_code, 'content': content})
+
+
+class FakeXQueue(object):
+    """
+    Local fake of the xqueue server, installed in place of the session's `post`.
+
+    Submissions are refused with 'login_required' until a login succeeds,
+    mirroring the cookie-based session handling of the real service.
+    """
+    def __init__(self, accept_login=True):
+        self.accept_login = accept_login
+        self.logged_in = False
+        self.login_count = 0
+        self.submissions = []
+
+    def post(self, url, data=None, files=None, timeout=None):  # pylint: disable=unused-argument
+        """
+        Handle a POST to the fake xqueue.
+        """
+        if url.endswith('/xqueue/login/'):
+            self.login_count += 1
+            self.logged_in = self.accept_login
+            if self.accept_login:
+                return FakeXQueueResponse(0, 'Logged in')
+            return FakeXQueueResponse(1, 'Incorrect login credentials')
+
+        if not self.logged_in:
+            return FakeXQueueResponse(1, 'login_required')
+        self.submissions.append(data)
+        return FakeXQueueResponse(0, 'Queued')
+
+
+class XQueueInterfaceTest(unittest.TestCase):
+    """
+    Tests for submitting to xqueue through XQueueInterface.
+    """
+    def setUp(self):
+        super(XQueueInterfaceTest, self).setUp()
+        self.xqueue = FakeXQueue()
+        self.interface = XQueueInterface(
+            'http://xqueue.example.com',
+            {'username': 'lms', 'password': 'secret'},
+        )
+        patcher = patch.object(self.interface.session, 'post', side_effect=self.xqueue.post)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _submissions(self, count):
+        """
+        Build `count` submissions.
+        """
+        return [
+            (make_xheader('http://lms/callback/{}'.format(i), 'key{}'.format(i), 'test-queue'), 'body')
+            for i in range(count)
+        ]
+
+    def test_send_to_queue(self):
+        header, body = self._submissions(1)[0]
+        self.assertEqual(self.interface.send_to_queue(header, body), (0, 'Queued'))
+        self.assertEqual(self.xqueue.login_count, 1)
+        self.assertEqual(len(self.xqueue.submissions), 1)
+
+    def test_session_is_reused(self):
+        for header, body in self._submissions(3):
+            self.assertEqual(self.interface.send_to_queue(header, body), (0, 'Queued'))
+        self.assertEqual(self.xqueue.login_count, 1)
+        self.assertEqual(
+            [json.loads(data['xqueue_header'])['lms_key'] for data in self.xqueue.submissions],
+            ['key0', 'key1', 'key2'],
+        )
+
+    def test_login_failure(self):
+        self.xqueue.accept_login = False
+        header, body = self._submissions(1)[0]
+        self.assertEqual(self.interface.send_to_queue(header, body), (1, 'Incorrect login credentials'))
+        self.assertEqual(self.xqueue.submissions, [])
+
+    def test_connection_pool_is_mounted(self):
+        adapter = self.interface.session.get_adapter('http://xqueue.example.com')
+        self.assertEqual(adapter._pool_maxsize, 10)  # pylint: disable=protected-access
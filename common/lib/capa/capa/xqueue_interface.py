@@ -6,6 +6,7 @@ import json
 import logging
 
 import requests
+from requests.adapters import HTTPAdapter
 
 import dogstats_wrapper as dog_stats_api
 
@@ -19,6 +20,9 @@ XQUEUE_TIMEOUT = 35  # seconds
 CONNECT_TIMEOUT = 3.05  # seconds
 READ_TIMEOUT = 10  # seconds
 
+# Number of keep-alive connections to the xqueue server kept in the session pool.
+XQUEUE_POOL_SIZE = 10
+
 
 def make_hashkey(seed):
     """
@@ -70,11 +74,16 @@ class XQueueInterface(object):
     Interface to the external grading system
     """
 
-    def __init__(self, url, django_auth, requests_auth=None):
+    def __init__(self, url, django_auth, requests_auth=None, pool_size=XQUEUE_POOL_SIZE):
         self.url = unicode(url)
         self.auth = django_auth
         self.session = requests.Session()
         self.session.auth = requests_auth
+        # Keep a pool of persistent connections so that concurrent submissions
+        # from the same worker reuse sockets instead of reconnecting each time.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
 
     def send_to_queue(self, header, body, files_to_upload=None):
         """
@@ -89,7 +98,6 @@ class XQueueInterface(object):
 
         Returns (error_code, msg) where error_code != 0 indicates an error
         """
-
         # log the send to xqueue
         header_info = json.loads(header)
         queue_name = header_info.get('queue_name', u'')
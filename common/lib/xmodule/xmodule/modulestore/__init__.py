@@ -122,8 +122,20 @@ class BulkOpsRecord(object):
     def __init__(self):
         self._active_count = 0
         self.has_publish_item = False
+        # The keys of the blocks published within this bulk write, or None if they are not all known.
+        self.published_block_keys = set()
         self.has_library_updated_item = False
 
+    def add_published_block_keys(self, block_keys):
+        """
+        Record that the given blocks were published, or that unknown blocks were if block_keys is None.
+        """
+        self.has_publish_item = True
+        if block_keys is None:
+            self.published_block_keys = None
+        elif self.published_block_keys is not None:
+            self.published_block_keys.update(block_keys)
+
     @property
     def active(self):
         """
@@ -318,9 +330,15 @@ class BulkOperationsMixin(object):
         Sends out the signal that items have been published from within this course.
         """
         if self.signal_handler and bulk_ops_record.has_publish_item:
+            published_block_keys = bulk_ops_record.published_block_keys
             # We remove the branch, because publishing always means copying from draft to published
-            self.signal_handler.send("course_published", course_key=course_id.for_branch(None))
+            self.signal_handler.send(
+                "course_published",
+                course_key=course_id.for_branch(None),
+                changed_block_keys=list(published_block_keys) if published_block_keys is not None else None,
+            )
             bulk_ops_record.has_publish_item = False
+            bulk_ops_record.published_block_keys = set()
 
     def send_bulk_library_updated_signal(self, bulk_ops_record, library_id):
         """
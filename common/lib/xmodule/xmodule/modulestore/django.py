@@ -167,12 +167,16 @@ class SignalHandler(object):
     5. The thing that listens for the signal lives in process, but should do
        almost no work. Its main job is to kick off the celery task that will
        do the actual work.
+    6. course_published also provides changed_block_keys, the usage keys of
+       the blocks added, changed or deleted by the publish, or None if the
+       modulestore does not know them. Listeners may use it to skip or limit
+       their work, but must handle None by updating the whole course.
     """
 
     # If you add a new signal, please don't forget to add it to the _mapping
     # as well.
     pre_publish = SwitchedSignal("pre_publish", providing_args=["course_key"])
-    course_published = SwitchedSignal("course_published", providing_args=["course_key"])
+    course_published = SwitchedSignal("course_published", providing_args=["course_key", "changed_block_keys"])
     course_deleted = SwitchedSignal("course_deleted", providing_args=["course_key"])
     library_updated = SwitchedSignal("library_updated", providing_args=["library_key"])
     item_deleted = SwitchedSignal("item_deleted", providing_args=["usage_key", "user_id"])
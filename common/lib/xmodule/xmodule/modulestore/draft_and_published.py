@@ -121,7 +121,7 @@ class ModuleStoreDraftAndPublished(BranchSettingMixin, BulkOperationsMixin):
         """
         raise NotImplementedError
 
-    def _flag_publish_event(self, course_key):
+    def _flag_publish_event(self, course_key, changed_block_keys=None):
         """
         Wrapper around calls to fire the course_published signal
         Unless we're nested in an active bulk operation, this simply fires the signal
@@ -129,14 +129,20 @@ class ModuleStoreDraftAndPublished(BranchSettingMixin, BulkOperationsMixin):
 
         Arguments:
             course_key - course_key to which the signal applies
+            changed_block_keys - usage keys of the blocks changed by the publish,
+                or None if they are not known
         """
         if self.signal_handler:
             bulk_record = self._get_bulk_ops_record(course_key) if isinstance(self, BulkOperationsMixin) else None
             if bulk_record and bulk_record.active:
-                bulk_record.has_publish_item = True
+                bulk_record.add_published_block_keys(changed_block_keys)
             else:
                 # We remove the branch, because publishing always means copying from draft to published
-                self.signal_handler.send("course_published", course_key=course_key.for_branch(None))
+                self.signal_handler.send(
+                    "course_published",
+                    course_key=course_key.for_branch(None),
+                    changed_block_keys=list(changed_block_keys) if changed_block_keys is not None else None,
+                )
 
     def update_item_parent(self, item_location, new_parent_location, old_parent_location, user_id, insert_at=None):
         """
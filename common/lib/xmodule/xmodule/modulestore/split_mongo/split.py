@@ -116,6 +116,9 @@ log = logging.getLogger(__name__)
 # When blacklists are this, all children should be excluded
 EXCLUDE_ALL = '*'
 
+# Maximum number of new definitions inserted at once at the end of a bulk operation.
+DEFINITION_INSERT_BATCH_SIZE = 500
+
 
 new_contract('BlockUsageLocator', BlockUsageLocator)
 new_contract('BlockKey', BlockKey)
@@ -256,16 +259,32 @@ class SplitBulkWriteMixin(BulkOperationsMixin):
                 # append only, so if it's already been written, we can just keep going.
                 log.debug("Attempted to insert duplicate structure %s", _id)
 
-        for _id in bulk_write_record.definitions.viewkeys() - bulk_write_record.definitions_in_db:
+        new_definitions = [
+            bulk_write_record.definitions[_id]
+            for _id in bulk_write_record.definitions.viewkeys() - bulk_write_record.definitions_in_db
+        ]
+        if new_definitions:
             dirty = True
 
+        if len(new_definitions) == 1:
             try:
-                self.db_connection.insert_definition(bulk_write_record.definitions[_id], bulk_write_record.course_key)
+                self.db_connection.insert_definition(new_definitions[0], bulk_write_record.course_key)
             except DuplicateKeyError:
                 # We may not have looked up this definition inside this bulk operation, and thus
                 # didn't realize that it was already in the database. That's OK, the store is
                 # append only, so if it's already been written, we can just keep going.
-                log.debug("Attempted to insert duplicate definition %s", _id)
+                log.debug("Attempted to insert duplicate definition %s", new_definitions[0]['_id'])
+        else:
+            # Large bulk operations such as course imports create a definition for nearly every block,
+            # so insert them in batches rather than one at a time.
+            for start in xrange(0, len(new_definitions), DEFINITION_INSERT_BATCH_SIZE):
+                batch = new_definitions[start:start + DEFINITION_INSERT_BATCH_SIZE]
+                try:
+                    self.db_connection.insert_definitions(batch, bulk_write_record.course_key)
+                except DuplicateKeyError:
+                    # As above, the definitions already in the database are skipped, and the rest
+                    # of the batch is still inserted.
+                    log.debug("Attempted to insert duplicate definitions in a batch of %d", len(batch))
 
         if bulk_write_record.index is not None and bulk_write_record.index != bulk_write_record.initial_index:
             dirty = True
@@ -2320,6 +2339,11 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         :param blacklist: a list of usage keys to not change in the destination: i.e., don't add
         if not there, don't update if there.
 
+        Blocks which are the same in source and destination are left as they are in the destination,
+        so that only the blocks which actually differ get a new version.
+
+        Returns the set of the BlockKeys of the blocks added to, changed in or deleted from the destination.
+
         Raises:
             ItemNotFoundError: if it cannot find the course. if the request is to publish a
                 subtree but the ancestors up to and including the course root are not published.
@@ -2353,6 +2377,7 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                 blacklist = [BlockKey.from_usage_key(shunned) for shunned in blacklist or []]
             # iterate over subtree list filtering out blacklist.
             orphans = set()
+            changed_blocks = set()
             destination_blocks = destination_structure['blocks']
             for subtree_root in subtree_list:
                 if BlockKey.from_usage_key(subtree_root) != source_structure['root']:
@@ -2364,6 +2389,7 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                         # in the course export. Continue and only throw an exception if *no* parents are found.
                         if parent in destination_blocks:
                             parent_found = True
+                            previous_children = list(destination_blocks[parent].fields['children'])
                             orphans.update(
                                 self._sync_children(
                                     source_structure['blocks'][parent],
@@ -2371,6 +2397,8 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                                     BlockKey.from_usage_key(subtree_root)
                                 )
                             )
+                            if destination_blocks[parent].fields['children'] != previous_children:
+                                changed_blocks.add(parent)
                     if len(parents) and not parent_found:
                         raise ItemNotFoundError(parents)
                 # update/create the subtree and its children in destination (skipping blacklist)
@@ -2380,17 +2408,21 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                         BlockKey.from_usage_key(subtree_root),
                         source_structure['blocks'],
                         destination_blocks,
-                        blacklist
+                        blacklist,
+                        changed_blocks
                     )
                 )
             # remove any remaining orphans
+            remaining_blocks = set(destination_blocks)
             for orphan in orphans:
                 # orphans will include moved as well as deleted xblocks. Only delete the deleted ones.
                 self._delete_if_true_orphan(orphan, destination_structure)
+            changed_blocks.update(remaining_blocks.difference(destination_blocks))
 
             # update the db
             self.update_structure(destination_course, destination_structure)
             self._update_head(destination_course, index_entry, destination_course.branch, destination_structure['_id'])
+            return changed_blocks
 
     @contract(source_keys="list(BlockUsageLocator)", dest_usage=BlockUsageLocator)
     def copy_from_template(self, source_keys, dest_usage, user_id, head_validation=True):
@@ -3157,10 +3189,14 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         destination_blocks="dict(BlockKey: *)",
         blacklist="list(BlockKey) | str",
     )
-    def _copy_subdag(self, user_id, destination_version, block_key, source_blocks, destination_blocks, blacklist):
+    def _copy_subdag(
+            self, user_id, destination_version, block_key, source_blocks, destination_blocks, blacklist,
+            changed_blocks=None
+    ):
         """
         Update destination_blocks for the sub-dag rooted at block_key to be like the one in
-        source_blocks excluding blacklist.
+        source_blocks excluding blacklist. Blocks which are already the same in destination_blocks
+        are left untouched; the keys of the others are added to changed_blocks, if given.
 
         Return any newly discovered orphans (as a set)
         """
@@ -3184,15 +3220,21 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                 for index, child in enumerate(source_children):
                     if child not in blacklist:
                         destination_reordered[index] = child
-            # the history of the published leaps between publications and only points to
-            # previously published versions.
-            previous_version = destination_block.edit_info.update_version
-            destination_block = copy.deepcopy(new_block)
-            destination_block.fields['children'] = destination_reordered.compact_list()
-            destination_block.edit_info.previous_version = previous_version
-            destination_block.edit_info.update_version = destination_version
-            destination_block.edit_info.edited_by = user_id
-            destination_block.edit_info.edited_on = datetime.datetime.now(UTC)
+            destination_children = destination_reordered.compact_list()
+            # blocks which are already the same in destination keep their version; only their
+            # descendants may still need to be copied.
+            if self._is_copy_changed(new_block, destination_block, destination_children):
+                # the history of the published leaps between publications and only points to
+                # previously published versions.
+                previous_version = destination_block.edit_info.update_version
+                destination_block = copy.deepcopy(new_block)
+                destination_block.fields['children'] = destination_children
+                destination_block.edit_info.previous_version = previous_version
+                destination_block.edit_info.update_version = destination_version
+                destination_block.edit_info.edited_by = user_id
+                destination_block.edit_info.edited_on = datetime.datetime.now(UTC)
+                if changed_blocks is not None:
+                    changed_blocks.add(block_key)
         else:
             destination_block = self._new_block(
                 user_id, new_block.block_type,
@@ -3207,6 +3249,8 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             for key, val in new_block.edit_info.to_storable().iteritems():
                 if getattr(destination_block.edit_info, key) is None:
                     setattr(destination_block.edit_info, key, val)
+            if changed_blocks is not None:
+                changed_blocks.add(block_key)
 
         # If the block we are copying from was itself a copy, then just
         # reference the original source, rather than the copy.
@@ -3219,12 +3263,30 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                 if child not in blacklist:
                     orphans.update(
                         self._copy_subdag(
-                            user_id, destination_version, BlockKey(*child), source_blocks, destination_blocks, blacklist
+                            user_id, destination_version, BlockKey(*child), source_blocks, destination_blocks,
+                            blacklist, changed_blocks
                         )
                     )
         destination_blocks[block_key] = destination_block
         return orphans
 
+    def _is_copy_changed(self, source_block, destination_block, destination_children):
+        """
+        Return whether copying source_block over destination_block, with the given children, would
+        change destination_block.
+        """
+        # If the block we are copying from was itself a copy, then the destination references the original.
+        source_version = source_block.edit_info.source_version or source_block.edit_info.update_version
+        source_fields = dict(source_block.fields, children=destination_children)
+        return (
+            destination_block.edit_info.source_version != source_version or
+            destination_block.block_type != source_block.block_type or
+            destination_block.definition != source_block.definition or
+            destination_block.fields != source_fields or
+            destination_block.defaults != source_block.defaults or
+            destination_block.get_asides() != source_block.get_asides()
+        )
+
     @contract(blacklist='list(BlockKey) | str')
     def _filter_blacklist(self, fields, blacklist):
         """
@@ -369,7 +369,7 @@ class DraftVersioningModuleStore(SplitMongoModuleStore, ModuleStoreDraftAndPubli
         Publishes the subtree under location from the draft branch to the published branch
         Returns the newly published item.
         """
-        super(DraftVersioningModuleStore, self).copy(
+        changed_blocks = super(DraftVersioningModuleStore, self).copy(
             user_id,
             # Directly using the replace function rather than the for_branch function
             # because for_branch obliterates the version_guid and will lead to missed version conflicts.
@@ -382,7 +382,11 @@ class DraftVersioningModuleStore(SplitMongoModuleStore, ModuleStoreDraftAndPubli
             blacklist=blacklist
         )
 
-        self._flag_publish_event(location.course_key)
+        course_key = location.course_key.for_branch(None)
+        self._flag_publish_event(
+            location.course_key,
+            [course_key.make_usage_key(block_key.type, block_key.id) for block_key in changed_blocks]
+        )
 
         return self.get_item(location.for_branch(ModuleStoreEnum.BranchName.published), **kwargs)
 
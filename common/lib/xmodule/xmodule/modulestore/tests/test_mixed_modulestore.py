@@ -9,7 +9,7 @@ import itertools
 import mimetypes
 from uuid import uuid4
 from contextlib import contextmanager
-from mock import patch, Mock, call
+from mock import ANY, patch, Mock, call
 
 # Mixed modulestore depends on django, so we'll manually configure some django settings
 # before importing the module
@@ -2497,7 +2497,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
 
                 # Course creation and publication should fire the signal
                 course = self.store.create_course('org_x', 'course_y', 'run_z', self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                signal_handler.send.assert_called_with('course_published', course_key=course.id, changed_block_keys=ANY)
                 signal_handler.reset_mock()
 
                 course_key = course.id
@@ -2507,7 +2507,9 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
                     Check if the signal has been fired.
                     The course_published signal fires before the _clear_bulk_ops_record.
                     """
-                    signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                    signal_handler.send.assert_called_with(
+                        'course_published', course_key=course.id, changed_block_keys=ANY
+                    )
 
                 with patch.object(
                     self.store.thread_cache.default_store, '_clear_bulk_ops_record', wraps=_clear_bulk_ops_record
@@ -2521,7 +2523,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
 
                     self.assertEqual(mock_clear_bulk_ops_record.call_count, 1)
 
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                signal_handler.send.assert_called_with('course_published', course_key=course.id, changed_block_keys=ANY)
 
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
     def test_course_publish_signal_direct_firing(self, default):
@@ -2543,7 +2545,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
 
                 # Course creation and publication should fire the signal
                 course = self.store.create_course('org_x', 'course_y', 'run_z', self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                signal_handler.send.assert_called_with('course_published', course_key=course.id, changed_block_keys=ANY)
 
                 course_key = course.id
 
@@ -2553,16 +2555,22 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
                     log.debug('Testing with block type %s', block_type)
                     signal_handler.reset_mock()
                     block = self.store.create_item(self.user_id, course_key, block_type)
-                    signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                    signal_handler.send.assert_called_with(
+                        'course_published', course_key=course.id, changed_block_keys=ANY
+                    )
 
                     signal_handler.reset_mock()
                     block.display_name = block_type
                     self.store.update_item(block, self.user_id)
-                    signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                    signal_handler.send.assert_called_with(
+                        'course_published', course_key=course.id, changed_block_keys=ANY
+                    )
 
                     signal_handler.reset_mock()
                     self.store.publish(block.location, self.user_id)
-                    signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                    signal_handler.send.assert_called_with(
+                        'course_published', course_key=course.id, changed_block_keys=ANY
+                    )
 
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
     def test_course_publish_signal_rerun_firing(self, default):
@@ -2584,7 +2592,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
 
                 # Course creation and publication should fire the signal
                 course = self.store.create_course('org_x', 'course_y', 'run_z', self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                signal_handler.send.assert_called_with('course_published', course_key=course.id, changed_block_keys=ANY)
 
                 course_key = course.id
 
@@ -2592,7 +2600,9 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
                 signal_handler.reset_mock()
                 dest_course_id = self.store.make_course_key("org.other", "course.other", "run.other")
                 self.store.clone_course(course_key, dest_course_id, self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=dest_course_id)
+                signal_handler.send.assert_called_with(
+                    'course_published', course_key=dest_course_id, changed_block_keys=ANY
+                )
 
     @patch('xmodule.tabs.CourseTab.from_json', side_effect=mock_tab_from_json)
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
@@ -2621,11 +2631,12 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
                     static_content_store=contentstore,
                     create_if_not_present=True,
                 )
+                toy_course_key = self.store.make_course_key('edX', 'toy', '2012_Fall')
                 signal_handler.send.assert_has_calls([
-                    call('pre_publish', course_key=self.store.make_course_key('edX', 'toy', '2012_Fall')),
-                    call('course_published', course_key=self.store.make_course_key('edX', 'toy', '2012_Fall')),
-                    call('pre_publish', course_key=self.store.make_course_key('edX', 'toy', '2012_Fall')),
-                    call('course_published', course_key=self.store.make_course_key('edX', 'toy', '2012_Fall')),
+                    call('pre_publish', course_key=toy_course_key),
+                    call('course_published', course_key=toy_course_key, changed_block_keys=ANY),
+                    call('pre_publish', course_key=toy_course_key),
+                    call('course_published', course_key=toy_course_key, changed_block_keys=ANY),
                 ])
 
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
@@ -2648,18 +2659,18 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
 
                 # Course creation and publication should fire the signal
                 course = self.store.create_course('org_x', 'course_y', 'run_z', self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                signal_handler.send.assert_called_with('course_published', course_key=course.id, changed_block_keys=ANY)
 
                 # Test a draftable block type, which needs to be explicitly published, and nest it within the
                 # normal structure - this is important because some implementors change the parent when adding a
                 # non-published child; if parent is in DIRECT_ONLY_CATEGORIES then this should not fire the event
                 signal_handler.reset_mock()
                 section = self.store.create_item(self.user_id, course.id, 'chapter')
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                signal_handler.send.assert_called_with('course_published', course_key=course.id, changed_block_keys=ANY)
 
                 signal_handler.reset_mock()
                 subsection = self.store.create_child(self.user_id, section.location, 'sequential')
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                signal_handler.send.assert_called_with('course_published', course_key=course.id, changed_block_keys=ANY)
 
                 # 'units' and 'blocks' are draftable types
                 signal_handler.reset_mock()
@@ -2674,15 +2685,81 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
 
                 signal_handler.reset_mock()
                 self.store.publish(unit.location, self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                signal_handler.send.assert_called_with('course_published', course_key=course.id, changed_block_keys=ANY)
 
                 signal_handler.reset_mock()
                 self.store.unpublish(unit.location, self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                signal_handler.send.assert_called_with('course_published', course_key=course.id, changed_block_keys=ANY)
 
                 signal_handler.reset_mock()
                 self.store.delete_item(unit.location, self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                signal_handler.send.assert_called_with('course_published', course_key=course.id, changed_block_keys=ANY)
+
+    def test_course_publish_signal_changed_blocks(self):
+        with MongoContentstoreBuilder().build() as contentstore:
+            signal_handler = Mock(name='signal_handler')
+            self.store = MixedModuleStore(
+                contentstore=contentstore,
+                create_modulestore_instance=create_modulestore_instance,
+                mappings={},
+                signal_handler=signal_handler,
+                **self.OPTIONS
+            )
+            self.addCleanup(self.store.close_all_connections)
+
+            with self.store.default_store(ModuleStoreEnum.Type.split):
+                course = self.store.create_course('org_x', 'course_y', 'run_z', self.user_id)
+                section = self.store.create_item(self.user_id, course.id, 'chapter')
+                subsection = self.store.create_child(self.user_id, section.location, 'sequential')
+                unit = self.store.create_child(self.user_id, subsection.location, 'vertical')
+                problem = self.store.create_child(self.user_id, unit.location, 'problem')
+                html = self.store.create_child(self.user_id, unit.location, 'html')
+
+                def published_block_keys():
+                    """
+                    Returns the changed blocks of the last course_published signal.
+                    """
+                    signal_name, kwargs = signal_handler.send.call_args[0][0], signal_handler.send.call_args[1]
+                    self.assertEqual(signal_name, 'course_published')
+                    return set(kwargs['changed_block_keys'])
+
+                # The first publish of the unit adds it and its children, and changes its parent.
+                signal_handler.reset_mock()
+                self.store.publish(unit.location, self.user_id)
+                self.assertEqual(
+                    published_block_keys(),
+                    {block.location.for_branch(None) for block in (subsection, unit, problem, html)},
+                )
+                published_problem = self.store.get_item(
+                    problem.location, revision=ModuleStoreEnum.RevisionOption.published_only
+                )
+
+                # Publishing the unchanged unit again changes nothing.
+                signal_handler.reset_mock()
+                self.store.publish(unit.location, self.user_id)
+                self.assertEqual(published_block_keys(), set())
+                self.assertEqual(
+                    self.store.get_item(
+                        problem.location, revision=ModuleStoreEnum.RevisionOption.published_only
+                    ).published_on,
+                    published_problem.published_on,
+                )
+
+                # Only the edited block is published again.
+                html.display_name = 'changed'
+                self.store.update_item(html, self.user_id)
+                signal_handler.reset_mock()
+                self.store.publish(unit.location, self.user_id)
+                self.assertEqual(published_block_keys(), {html.location.for_branch(None)})
+                self.assertFalse(self.store.has_changes(self.store.get_item(unit.location)))
+
+                # Deleted blocks are reported as changed as well.
+                self.store.delete_item(problem.location, self.user_id)
+                signal_handler.reset_mock()
+                self.store.publish(unit.location, self.user_id)
+                self.assertEqual(
+                    published_block_keys(), {block.location.for_branch(None) for block in (unit, problem)}
+                )
 
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
     def test_bulk_course_publish_signal_direct_firing(self, default):
@@ -2704,7 +2781,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
 
                 # Course creation and publication should fire the signal
                 course = self.store.create_course('org_x', 'course_y', 'run_z', self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                signal_handler.send.assert_called_with('course_published', course_key=course.id, changed_block_keys=ANY)
 
                 course_key = course.id
 
@@ -2724,7 +2801,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
                         self.store.publish(block.location, self.user_id)
                         signal_handler.send.assert_not_called()
 
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                signal_handler.send.assert_called_with('course_published', course_key=course.id, changed_block_keys=ANY)
 
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
     def test_bulk_course_publish_signal_publish_firing(self, default):
@@ -2746,7 +2823,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
 
                 # Course creation and publication should fire the signal
                 course = self.store.create_course('org_x', 'course_y', 'run_z', self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                signal_handler.send.assert_called_with('course_published', course_key=course.id, changed_block_keys=ANY)
 
                 course_key = course.id
 
@@ -2780,7 +2857,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
                     self.store.delete_item(unit.location, self.user_id)
                     signal_handler.send.assert_not_called()
 
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                signal_handler.send.assert_called_with('course_published', course_key=course.id, changed_block_keys=ANY)
 
                 # Test editing draftable block type without publish
                 signal_handler.reset_mock()
@@ -2791,7 +2868,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
                     signal_handler.send.assert_not_called()
                     self.store.publish(unit.location, self.user_id)
                     signal_handler.send.assert_not_called()
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                signal_handler.send.assert_called_with('course_published', course_key=course.id, changed_block_keys=ANY)
 
                 signal_handler.reset_mock()
                 with self.store.bulk_operations(course_key):
@@ -6,7 +6,7 @@ import copy
 import ddt
 import unittest
 from bson.objectid import ObjectId
-from mock import MagicMock, Mock, call
+from mock import MagicMock, Mock, call, patch
 from xmodule.modulestore.split_mongo.split import SplitBulkWriteMixin
 from xmodule.modulestore.split_mongo.mongo_connection import MongoConnection
 
@@ -34,6 +34,16 @@ class TestBulkWriteMixin(unittest.TestCase):
     def assertCacheNotCleared(self):
         self.assertFalse(self.clear_cache.called)
 
+    def assertInsertedDefinitions(self, definitions):
+        """
+        Assert that the given definitions were inserted in batches, in any order.
+        """
+        inserted = []
+        for (batch, course_key), _ in self.conn.insert_definitions.call_args_list:
+            self.assertEqual(course_key, self.course_key)
+            inserted.extend(batch)
+        self.assertItemsEqual(definitions, inserted)
+
 
 class TestBulkWriteMixinPreviousTransaction(TestBulkWriteMixin):
     """
@@ -190,17 +200,12 @@ class TestBulkWriteMixinClosed(TestBulkWriteMixin):
         self.bulk.update_definition(self.course_key.replace(branch='b'), other_definition)
         self.bulk.insert_course_index(self.course_key, {'versions': {'a': self.definition['_id'], 'b': other_definition['_id']}})
         self.bulk._end_bulk_operation(self.course_key)
-        self.assertItemsEqual(
-            [
-                call.insert_definition(self.definition, self.course_key),
-                call.insert_definition(other_definition, self.course_key),
-                call.update_course_index(
-                    {'versions': {'a': self.definition['_id'], 'b': other_definition['_id']}},
-                    from_index=original_index,
-                    course_context=self.course_key,
-                )
-            ],
-            self.conn.mock_calls
+        self.assertEqual(len(self.conn.mock_calls), 2)
+        self.assertInsertedDefinitions([self.definition, other_definition])
+        self.conn.update_course_index.assert_called_once_with(
+            {'versions': {'a': self.definition['_id'], 'b': other_definition['_id']}},
+            from_index=original_index,
+            course_context=self.course_key,
         )
 
     def test_write_definition_on_close(self):
@@ -221,13 +226,23 @@ class TestBulkWriteMixinClosed(TestBulkWriteMixin):
         self.bulk.update_definition(self.course_key.replace(branch='b'), other_definition)
         self.assertConnCalls()
         self.bulk._end_bulk_operation(self.course_key)
-        self.assertItemsEqual(
-            [
-                call.insert_definition(self.definition, self.course_key),
-                call.insert_definition(other_definition, self.course_key)
-            ],
-            self.conn.mock_calls
+        self.assertEqual(len(self.conn.mock_calls), 1)
+        self.assertInsertedDefinitions([self.definition, other_definition])
+
+    @patch('xmodule.modulestore.split_mongo.split.DEFINITION_INSERT_BATCH_SIZE', 2)
+    def test_write_definitions_in_batches_on_close(self):
+        self.conn.get_course_index.return_value = None
+        self.bulk._begin_bulk_operation(self.course_key)
+        self.conn.reset_mock()
+        definitions = [{'definition': index, '_id': ObjectId()} for index in range(5)]
+        for definition in definitions:
+            self.bulk.update_definition(self.course_key, definition)
+        self.bulk._end_bulk_operation(self.course_key)
+        self.assertEqual(
+            sorted(len(batch) for (batch, _), _ in self.conn.insert_definitions.call_args_list),
+            [1, 2, 2],
         )
+        self.assertInsertedDefinitions(definitions)
 
     def test_write_index_and_structure_on_close(self):
         original_index = {'versions': {}}
@@ -22,6 +22,8 @@ Modulestore virtual   |          XML physical (draft, published)
 """
 import logging
 from abc import abstractmethod
+from functools import partial
+from multiprocessing.pool import ThreadPool
 from opaque_keys.edx.locator import LibraryLocator
 import os
 import mimetypes
@@ -54,13 +56,25 @@ from xmodule.util.misc import escape_invalid_characters
 
 log = logging.getLogger(__name__)
 
+# Stages of an import reported to ImportManager's progress_callback.
+IMPORT_STAGE_STATIC = 'static'
+IMPORT_STAGE_BLOCKS = 'blocks'
+
+# Number of imported static assets or blocks between two reports of the progress of an import.
+IMPORT_PROGRESS_INTERVAL = 100
+
 
 def import_static_content(
         course_data_path, static_content_store,
-        target_id, subpath='static', verbose=False):
-
-    remap_dict = {}
+        target_id, subpath='static', verbose=False, workers=1, progress_callback=None):
+    """
+    Import the static assets under course_data_path/subpath into static_content_store,
+    and return a dict mapping their paths to their asset keys.
 
+    With more than one worker, the assets are read, thumbnailed and saved by a pool of
+    that many threads.  progress_callback, if given, is called with the number of assets
+    imported so far and the total number of assets.
+    """
     # now import all static assets
     static_dir = course_data_path / subpath
     try:
@@ -77,6 +91,7 @@ def import_static_content(
     mimetypes.add_type('application/octet-stream', '.srt')
     mimetypes_list = mimetypes.types_map.values()
 
+    content_paths = []
     for dirname, _, filenames in os.walk(static_dir):
         for filename in filenames:
 
@@ -87,65 +102,111 @@ def import_static_content(
                     log.debug('skipping static content %s...', content_path)
                 continue
 
-            if verbose:
-                log.debug('importing static content %s...', content_path)
-
-            try:
-                with open(content_path, 'rb') as f:
-                    data = f.read()
-            except IOError:
-                if filename.startswith('._'):
-                    # OS X "companion files". See
-                    # http://www.diigo.com/annotated/0c936fda5da4aa1159c189cea227e174
-                    continue
-                # Not a 'hidden file', then re-raise exception
-                raise
+            content_paths.append((content_path, filename))
 
-            # strip away leading path from the name
-            fullname_with_subpath = content_path.replace(static_dir, '')
-            if fullname_with_subpath.startswith('/'):
-                fullname_with_subpath = fullname_with_subpath[1:]
-            asset_key = StaticContent.compute_location(target_id, fullname_with_subpath)
-
-            policy_ele = policy.get(asset_key.path, {})
-
-            # During export display name is used to create files, strip away slashes from name
-            displayname = escape_invalid_characters(
-                name=policy_ele.get('displayname', filename),
-                invalid_char_list=['/', '\\']
-            )
-            locked = policy_ele.get('locked', False)
-            mime_type = policy_ele.get('contentType')
-
-            # Check extracted contentType in list of all valid mimetypes
-            if not mime_type or mime_type not in mimetypes_list:
-                mime_type = mimetypes.guess_type(filename)[0]   # Assign guessed mimetype
-            content = StaticContent(
-                asset_key, displayname, mime_type, data,
-                import_path=fullname_with_subpath, locked=locked
-            )
+    def import_file(content_path_and_filename):
+        """
+        Import a single static asset, and return its path and asset key, or None.
+        """
+        content_path, filename = content_path_and_filename
+        return _import_static_file(
+            content_path, filename, static_dir, static_content_store, target_id, policy, mimetypes_list, verbose
+        )
 
-            # first let's save a thumbnail so we can get back a thumbnail location
-            thumbnail_content, thumbnail_location = static_content_store.generate_thumbnail(content)
+    if workers > 1 and len(content_paths) > 1:
+        pool = ThreadPool(min(workers, len(content_paths)))
+        try:
+            imported = pool.imap_unordered(import_file, content_paths)
+            remap_dict = _collect_static_content(imported, len(content_paths), progress_callback)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        remap_dict = _collect_static_content(
+            (import_file(path_and_name) for path_and_name in content_paths), len(content_paths), progress_callback
+        )
 
-            if thumbnail_content is not None:
-                content.thumbnail_location = thumbnail_location
+    return remap_dict
 
-            # then commit the content
-            try:
-                static_content_store.save(content)
-            except Exception as err:
-                log.exception(u'Error importing {0}, error={1}'.format(
-                    fullname_with_subpath, err
-                ))
 
+def _collect_static_content(imported, total, progress_callback):
+    """
+    Collect the paths and asset keys of the given imported static assets into a remap dict,
+    reporting the progress of the import along the way.
+    """
+    remap_dict = {}
+    for count, result in enumerate(imported, 1):
+        if result is not None:
             # store the remapping information which will be needed
             # to subsitute in the module data
+            fullname_with_subpath, asset_key = result
             remap_dict[fullname_with_subpath] = asset_key
-
+        if progress_callback is not None and (count % IMPORT_PROGRESS_INTERVAL == 0 or count == total):
+            progress_callback(count, total)
     return remap_dict
 
 
+def _import_static_file(
+        content_path, filename, static_dir, static_content_store, target_id, policy, mimetypes_list, verbose):
+    """
+    Import the static asset at content_path, and return its path relative to static_dir and
+    its asset key, or None if it was skipped.
+    """
+    if verbose:
+        log.debug('importing static content %s...', content_path)
+
+    try:
+        with open(content_path, 'rb') as f:
+            data = f.read()
+    except IOError:
+        if filename.startswith('._'):
+            # OS X "companion files". See
+            # http://www.diigo.com/annotated/0c936fda5da4aa1159c189cea227e174
+            return None
+        # Not a 'hidden file', then re-raise exception
+        raise
+
+    # strip away leading path from the name
+    fullname_with_subpath = content_path.replace(static_dir, '')
+    if fullname_with_subpath.startswith('/'):
+        fullname_with_subpath = fullname_with_subpath[1:]
+    asset_key = StaticContent.compute_location(target_id, fullname_with_subpath)
+
+    policy_ele = policy.get(asset_key.path, {})
+
+    # During export display name is used to create files, strip away slashes from name
+    displayname = escape_invalid_characters(
+        name=policy_ele.get('displayname', filename),
+        invalid_char_list=['/', '\\']
+    )
+    locked = policy_ele.get('locked', False)
+    mime_type = policy_ele.get('contentType')
+
+    # Check extracted contentType in list of all valid mimetypes
+    if not mime_type or mime_type not in mimetypes_list:
+        mime_type = mimetypes.guess_type(filename)[0]   # Assign guessed mimetype
+    content = StaticContent(
+        asset_key, displayname, mime_type, data,
+        import_path=fullname_with_subpath, locked=locked
+    )
+
+    # first let's save a thumbnail so we can get back a thumbnail location
+    thumbnail_content, thumbnail_location = static_content_store.generate_thumbnail(content)
+
+    if thumbnail_content is not None:
+        content.thumbnail_location = thumbnail_location
+
+    # then commit the content
+    try:
+        static_content_store.save(content)
+    except Exception as err:
+        log.exception(u'Error importing {0}, error={1}'.format(
+            fullname_with_subpath, err
+        ))
+
+    return fullname_with_subpath, asset_key
+
+
 class ImportManager(object):
     """
     Import xml-based courselikes from data_dir into modulestore.
@@ -178,6 +239,12 @@ class ImportManager(object):
             Otherwise, it throws an InvalidLocationError if the courselike does not exist.
 
         default_class, load_error_modules: are arguments for constructing the XMLModuleStore (see its doc)
+
+        static_content_workers: the number of threads importing the static files into static_content_store.
+
+        progress_callback: if specified, a function called with the stage of the import (IMPORT_STAGE_STATIC
+            or IMPORT_STAGE_BLOCKS), the number of static files or blocks imported so far in that stage, and
+            their total number, every IMPORT_PROGRESS_INTERVAL items.
     """
     store_class = XMLModuleStore
 
@@ -187,7 +254,7 @@ class ImportManager(object):
             load_error_modules=True, static_content_store=None,
             target_id=None, verbose=False,
             do_import_static=True, create_if_not_present=False,
-            raise_on_failure=False
+            raise_on_failure=False, static_content_workers=1, progress_callback=None
     ):
         self.store = store
         self.user_id = user_id
@@ -200,6 +267,8 @@ class ImportManager(object):
         self.do_import_static = do_import_static
         self.create_if_not_present = create_if_not_present
         self.raise_on_failure = raise_on_failure
+        self.static_content_workers = static_content_workers
+        self.progress_callback = progress_callback
         self.xml_module_store = self.store_class(
             data_dir,
             default_class=default_class,
@@ -228,7 +297,9 @@ class ImportManager(object):
             # first pass to find everything in /static/
             import_static_content(
                 data_path, self.static_content_store,
-                dest_id, subpath='static', verbose=self.verbose
+                dest_id, subpath='static', verbose=self.verbose,
+                workers=self.static_content_workers,
+                progress_callback=partial(self.report_progress, IMPORT_STAGE_STATIC),
             )
 
         elif self.verbose and not self.do_import_static:
@@ -251,9 +322,18 @@ class ImportManager(object):
         if os.path.exists(data_path / simport):
             import_static_content(
                 data_path, self.static_content_store,
-                dest_id, subpath=simport, verbose=self.verbose
+                dest_id, subpath=simport, verbose=self.verbose,
+                workers=self.static_content_workers,
+                progress_callback=partial(self.report_progress, IMPORT_STAGE_STATIC),
             )
 
+    def report_progress(self, stage, completed, total):
+        """
+        Report the number of static files or blocks imported so far to the progress_callback, if any.
+        """
+        if self.progress_callback is not None:
+            self.progress_callback(stage, completed, total)
+
     def import_asset_metadata(self, data_dir, course_id):
         """
         Read in assets XML file, parse it, and add all asset metadata to the modulestore.
@@ -379,6 +459,29 @@ class ImportManager(object):
         """
         all_locs = set(self.xml_module_store.modules[courselike_key].keys())
         all_locs.remove(source_courselike.location)
+        total = len(all_locs)
+        imported = [0]
+
+        def import_module(module):
+            """
+            Import a single block, reporting the progress of the import every so often.
+            """
+            if self.verbose:
+                log.debug('importing module location %s', module.location)
+
+            _update_and_import_module(
+                module,
+                self.store,
+                self.user_id,
+                courselike_key,
+                dest_id,
+                do_import_static=self.do_import_static,
+                runtime=courselike.runtime,
+            )
+
+            imported[0] += 1
+            if imported[0] % IMPORT_PROGRESS_INTERVAL == 0:
+                self.report_progress(IMPORT_STAGE_BLOCKS, min(imported[0], total), total)
 
         def depth_first(subtree):
             """
@@ -392,36 +495,16 @@ class ImportManager(object):
                         # tolerate same child occurring under 2 parents such as in
                         # ContentStoreTest.test_image_import
                         pass
-                    if self.verbose:
-                        log.debug('importing module location %s', child.location)
-
-                    _update_and_import_module(
-                        child,
-                        self.store,
-                        self.user_id,
-                        courselike_key,
-                        dest_id,
-                        do_import_static=self.do_import_static,
-                        runtime=courselike.runtime,
-                    )
 
+                    import_module(child)
                     depth_first(child)
 
         depth_first(source_courselike)
 
         for leftover in all_locs:
-            if self.verbose:
-                log.debug('importing module location %s', leftover)
+            import_module(self.xml_module_store.get_item(leftover))
 
-            _update_and_import_module(
-                self.xml_module_store.get_item(leftover),
-                self.store,
-                self.user_id,
-                courselike_key,
-                dest_id,
-                do_import_static=self.do_import_static,
-                runtime=courselike.runtime,
-            )
+        self.report_progress(IMPORT_STAGE_BLOCKS, total, total)
 
     def run_imports(self):
         """
@@ -208,6 +208,23 @@ class ContentTest(unittest.TestCase):
 
         self.assertEqual(total_length, last_byte - first_byte + 1)
 
+    def test_static_content_stream_data_in_range(self):
+        """
+        Test StaticContent stream_data_in_range function,
+        asserts that we get the requested bytes of the in-memory data
+        """
+        static_content = StaticContent('loc', 'name', 'type', SAMPLE_STRING, length=len(SAMPLE_STRING))
+        self.assertEqual(''.join(static_content.stream_data_in_range(100, 1500)), SAMPLE_STRING[100:1501])
+
+    def test_static_content_stream_chunk_size(self):
+        """
+        Test that StaticContentStream streams its data in chunks of the requested size
+        """
+        item = FakeGridFsItem(SAMPLE_STRING)
+        static_content_stream = StaticContentStream('loc', 'name', 'type', item, length=item.length)
+        chunks = list(static_content_stream.stream_data_in_range(0, 1500, chunk_size=500))
+        self.assertEqual([len(chunk) for chunk in chunks], [500, 500, 500, 1])
+
     def test_static_content_write_js(self):
         """
         Test that only one filename starts with 000.
@@ -39,3 +39,24 @@ class IgnoredFilesTestCase(unittest.TestCase):
         self.assertNotIn(".DS_Store", name_val)
         self.assertIn("GREEN", name_val["example.txt"])
         self.assertIn("BLUE", name_val[".example.txt"])
+
+    def test_import_static_files_with_workers(self):
+        """
+        Test that importing the static files with a pool of threads imports the same files
+        and reports the progress of the import.
+        """
+        course_dir = DATA_DIR / "dot-underscore"
+        course_id = SlashSeparatedCourseKey("edX", "dot-underscore", "2014_Fall")
+        content_store = Mock()
+        content_store.generate_thumbnail.return_value = ("content", "location")
+        serial_remap_dict = import_static_content(course_dir, content_store, course_id)
+        serial_names = sorted(call[0][0].name for call in content_store.save.call_args_list)
+
+        content_store.reset_mock()
+        progress_callback = Mock()
+        remap_dict = import_static_content(
+            course_dir, content_store, course_id, workers=4, progress_callback=progress_callback
+        )
+        self.assertEqual(remap_dict, serial_remap_dict)
+        self.assertEqual(sorted(call[0][0].name for call in content_store.save.call_args_list), serial_names)
+        progress_callback.assert_called_once_with(len(serial_names), len(serial_names))
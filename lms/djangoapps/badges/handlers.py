@@ -5,7 +5,7 @@ from django.dispatch import receiver
 
 from lms.djangoapps.badges.events.course_meta import award_enrollment_badge
 from lms.djangoapps.badges.utils import badges_enabled
-from student.models import ENROLL_STATUS_CHANGE, EnrollStatusChange
+from student.models import ENROLL_STATUS_CHANGE, ENROLL_STATUS_CHANGE_BULK, EnrollStatusChange
 
 
 @receiver(ENROLL_STATUS_CHANGE)
@@ -15,3 +15,13 @@ def award_badge_on_enrollment(sender, event=None, user=None, **kwargs):  # pylin
     """
     if badges_enabled and event == EnrollStatusChange.enroll:
         award_enrollment_badge(user)
+
+
+@receiver(ENROLL_STATUS_CHANGE_BULK)
+def award_badges_on_bulk_enrollment(sender, event=None, enrollments=(), **kwargs):  # pylint: disable=unused-argument
+    """
+    Awards enrollment badges to the users of the given new enrollments.
+    """
+    if badges_enabled and event == EnrollStatusChange.enroll:
+        for enrollment in enrollments:
+            award_enrollment_badge(enrollment.user)
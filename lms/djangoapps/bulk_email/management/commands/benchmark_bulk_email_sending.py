@@ -0,0 +1,140 @@
+"""
+Command to measure the throughput of rendering and sending course emails to a local SMTP sink.
+"""
+import asyncore
+import smtpd
+import threading
+from time import time
+
+from django.core.mail import EmailMultiAlternatives
+from django.core.mail.backends.smtp import EmailBackend
+from django.core.management.base import BaseCommand, CommandError
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+
+from bulk_email.models import CourseEmailTemplate
+from bulk_email.tasks import _get_course_email_context
+from courseware.courses import get_course
+
+PLAINTEXT = u'Dear %%USER_FULLNAME%%,\n\nThank you for enrolling in %%COURSE_DISPLAY_NAME%%.\n' + u'Lorem ipsum ' * 200
+HTMLTEXT = u'<p>Dear %%USER_FULLNAME%%,</p><p>Thank you for enrolling in %%COURSE_DISPLAY_NAME%%.</p>' + (
+    u'<p>Lorem ipsum dolor sit amet.</p>\n' * 200
+)
+
+
+class _SinkServer(smtpd.SMTPServer):
+    """
+    SMTP server counting and discarding the messages it receives.
+    """
+    received = 0
+
+    def process_message(self, peer, mailfrom, rcpttos, data):
+        self.received += 1
+
+
+class Command(BaseCommand):
+    """
+    Sends the same number of course emails to a local SMTP sink, rendering
+    each of them with the template and with the compiled template, and
+    opening a connection per email and one for all of them.
+
+    Example usage:
+        $ ./manage.py lms benchmark_bulk_email_sending 'course-v1:edX+DemoX+Demo_Course' --recipients 1000 \
+            --settings=devstack
+    """
+    args = u'<course_id>'
+    help = u'Reports the throughput of rendering and sending course emails to a local SMTP sink.'
+
+    def add_arguments(self, parser):
+        """
+        Entry point for subclassed commands to add custom arguments.
+        """
+        parser.add_argument('course_id', help=u'Course whose email context is used.')
+        parser.add_argument(
+            '--recipients',
+            help=u'Number of emails to send in each run.',
+            default=1000,
+            type=int,
+        )
+        parser.add_argument(
+            '--template',
+            dest='template_name',
+            help=u'Name of the course email template to use, or the default template.',
+        )
+        parser.add_argument(
+            '--port',
+            help=u'Port of the local SMTP sink, or 0 to pick a free port.',
+            default=0,
+            type=int,
+        )
+
+    def handle(self, *args, **options):
+        if options['recipients'] < 1:
+            raise CommandError(u'recipients must be a positive integer.')
+        try:
+            course_key = CourseKey.from_string(options['course_id'])
+        except InvalidKeyError:
+            raise CommandError(u'Invalid course id: {}'.format(options['course_id']))
+
+        template = CourseEmailTemplate.get_template(name=options['template_name'])
+        global_email_context = _get_course_email_context(get_course(course_key))
+        global_email_context['course_id'] = course_key
+
+        sink = _SinkServer(('127.0.0.1', options['port']), None)
+        options['port'] = sink.socket.getsockname()[1]
+        sink_thread = threading.Thread(target=asyncore.loop, kwargs={'timeout': 0.1})
+        sink_thread.daemon = True
+        sink_thread.start()
+
+        try:
+            for compiled in (False, True):
+                for persistent in (False, True):
+                    received = sink.received
+                    elapsed = self._send_emails(template, global_email_context, options, compiled, persistent)
+                    self.stdout.write(
+                        u'compiled={compiled}\tpersistent={persistent}\tsent={sent}\ttime={time:.2f}s\t'
+                        u'emails_per_second={rate:.1f}'.format(
+                            compiled=compiled,
+                            persistent=persistent,
+                            sent=sink.received - received,
+                            time=elapsed,
+                            rate=options['recipients'] / elapsed,
+                        )
+                    )
+        finally:
+            sink.close()
+
+    @staticmethod
+    def _send_emails(template, global_email_context, options, compiled, persistent):
+        """
+        Renders and sends the emails as configured, and returns the number
+        of seconds it took.
+        """
+        connection = EmailBackend(host='127.0.0.1', port=options['port'], username='', password='', use_tls=False)
+        email_context = dict(global_email_context)
+        compiled_email = template.compile(PLAINTEXT, HTMLTEXT)
+
+        start = time()
+        if persistent:
+            connection.open()
+        for recipient_num in xrange(options['recipients']):
+            email = u'learner{}@example.com'.format(recipient_num)
+            email_context.update({
+                'name': u'Learner {}'.format(recipient_num),
+                'email': email,
+                'user_id': recipient_num,
+            })
+            if compiled:
+                plaintext_msg = compiled_email.render_plaintext(email_context)
+                html_msg = compiled_email.render_htmltext(email_context)
+            else:
+                plaintext_msg = template.render_plaintext(PLAINTEXT, email_context)
+                html_msg = template.render_htmltext(HTMLTEXT, dict(email_context))
+            email_msg = EmailMultiAlternatives(
+                u'Benchmark', plaintext_msg, u'benchmark@example.com', [email], connection=connection
+            )
+            email_msg.attach_alternative(html_msg, 'text/html')
+            connection.send_messages([email_msg])
+        if persistent:
+            connection.close()
+        return time() - start
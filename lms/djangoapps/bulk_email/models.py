@@ -2,6 +2,7 @@
 Models for bulk email
 """
 import logging
+from string import Formatter
 
 import markupsafe
 from config_models.models import ConfigurationModel
@@ -366,21 +367,7 @@ class CourseEmailTemplate(models.Model):
         Such encoding is left to the email code, which will use the value
         of settings.DEFAULT_CHARSET to encode the message.
         """
-
-        # Substitute all %%-encoded keywords in the message body
-        if 'user_id' in context and 'course_id' in context:
-            message_body = substitute_keywords_with_data(message_body, context)
-
-        result = format_string.format(**context)
-
-        # Note that the body tag in the template will now have been
-        # "formatted", so we need to do the same to the tag being
-        # searched for.
-        message_body_tag = COURSE_EMAIL_MESSAGE_BODY_TAG.format()
-        result = result.replace(message_body_tag, message_body, 1)
-
-        # finally, return the result, after wrapping long lines and without converting to an encoded byte array.
-        return wrap_message(result)
+        return CompiledMessage(format_string, message_body).render(context)
 
     def render_plaintext(self, plaintext, context):
         """
@@ -404,6 +391,95 @@ class CourseEmailTemplate(models.Model):
                 context[key] = markupsafe.escape(value)
         return CourseEmailTemplate._render(self.html_template, htmltext, context)
 
+    def compile(self, plaintext, htmltext):
+        """
+        Returns a CompiledCourseEmail of the given plain text and HTML bodies
+        in the stored templates, to render them for many recipients.
+        """
+        return CompiledCourseEmail(self, plaintext, htmltext)
+
+
+class CompiledMessage(object):
+    """
+    A template and message body, parsed once to be rendered with the
+    contexts of many recipients.
+    """
+    _formatter = Formatter()
+
+    def __init__(self, format_string, message_body):
+        self.format_string = format_string
+        self.message_body = message_body
+        self.has_keywords = '%%' in message_body
+        self.segments = list(self._formatter.parse(format_string))
+        if any(format_spec and '{' in format_spec for _, _, format_spec, _ in self.segments):
+            # Leave nested replacement fields to format().
+            self.segments = None
+
+    def render(self, context):
+        """
+        Returns the message, as rendered by CourseEmailTemplate._render for
+        the given context.
+        """
+        message_body = self.message_body
+        # Substitute all %%-encoded keywords in the message body
+        if self.has_keywords and 'user_id' in context and 'course_id' in context:
+            message_body = substitute_keywords_with_data(message_body, context)
+
+        result = self._format(context)
+
+        # Note that the body tag in the template will now have been
+        # "formatted", so we need to do the same to the tag being
+        # searched for.
+        message_body_tag = COURSE_EMAIL_MESSAGE_BODY_TAG.format()
+        result = result.replace(message_body_tag, message_body, 1)
+
+        # finally, return the result, after wrapping long lines and without converting to an encoded byte array.
+        return wrap_message(result)
+
+    def _format(self, context):
+        """
+        Returns the template formatted with the given context, as format()
+        would, without parsing it again.
+        """
+        if self.segments is None:
+            return self.format_string.format(**context)
+
+        parts = []
+        for literal_text, field_name, format_spec, conversion in self.segments:
+            parts.append(literal_text)
+            if field_name is not None:
+                value, _ = self._formatter.get_field(field_name, (), context)
+                value = self._formatter.convert_field(value, conversion)
+                parts.append(self._formatter.format_field(value, format_spec))
+        return u''.join(parts)
+
+
+class CompiledCourseEmail(object):
+    """
+    The plain text and HTML bodies of a course email in a course email
+    template, compiled once to be rendered for each recipient.
+    """
+    def __init__(self, template, plaintext, htmltext):
+        self.plaintext = CompiledMessage(template.plain_template, plaintext)
+        self.htmltext = CompiledMessage(template.html_template, htmltext)
+
+    def render_plaintext(self, context):
+        """
+        Returns the plain text message for the given context.
+        """
+        return self.plaintext.render(context)
+
+    def render_htmltext(self, context):
+        """
+        Returns the HTML message for the given context, whose string values
+        are HTML-escaped.  Unlike CourseEmailTemplate.render_htmltext, the
+        given context is left unchanged.
+        """
+        return self.htmltext.render({
+            key: markupsafe.escape(value) if isinstance(value, basestring) else value
+            for key, value in context.iteritems()
+        })
+
 
 class CourseAuthorization(models.Model):
     """
@@ -0,0 +1,71 @@
+"""
+Resolution of the recipients of a bulk email.
+
+Rather than counting and paging through the union of the targets' querysets
+with OFFSET queries, the ids of each target's users are read by ranges of
+primary keys, and deduplicated as they are read.  The recipients' names and
+email addresses are only loaded when the subtask sending to them is queued,
+and are flagged against the course's opt-outs, which are read once.
+"""
+from django.conf import settings
+from django.contrib.auth.models import User
+
+from bulk_email.models import Optout
+from util.query import use_read_replica_if_available
+
+# Default number of user ids read by each query of a target's users.
+DEFAULT_ID_CHUNK_SIZE = 10000
+
+RECIPIENT_FIELDS = ['profile__name', 'email', 'pk']
+
+
+def get_recipient_ids(targets, course_id, user_id=None):
+    """
+    Returns the sorted ids of the distinct users of the given targets.
+    """
+    recipient_ids = set()
+    for target in targets:
+        recipient_ids.update(iter_user_ids(target.get_users(course_id, user_id)))
+    return sorted(recipient_ids)
+
+
+def iter_user_ids(queryset, chunk_size=None):
+    """
+    Yields the distinct ids of the users of the given queryset, in order,
+    reading them by ranges of primary keys rather than with offsets.
+    """
+    chunk_size = chunk_size or getattr(settings, 'BULK_EMAIL_RECIPIENT_ID_CHUNK_SIZE', DEFAULT_ID_CHUNK_SIZE)
+    last_id = 0
+    while True:
+        user_ids = list(
+            queryset.filter(id__gt=last_id).order_by('id').values_list('id', flat=True).distinct()[:chunk_size]
+        )
+        if not user_ids:
+            return
+        for user_id in user_ids:
+            yield user_id
+        last_id = user_ids[-1]
+
+
+def get_optout_ids(course_id):
+    """
+    Returns the set of the ids of the users who opted out of the emails of
+    the given course.
+    """
+    return set(Optout.objects.filter(course_id=course_id).values_list('user_id', flat=True))
+
+
+def get_recipients(user_ids, optout_ids):
+    """
+    Returns the recipients with the given user ids, in order, as dicts of
+    the RECIPIENT_FIELDS of the users and of whether they are among the
+    given opted out users.
+    """
+    recipients = list(
+        use_read_replica_if_available(
+            User.objects.filter(id__in=user_ids).order_by('id')
+        ).values(*RECIPIENT_FIELDS)
+    )
+    for recipient in recipients:
+        recipient['optout'] = recipient['pk'] in optout_ids
+    return recipients
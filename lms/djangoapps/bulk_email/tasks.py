@@ -27,7 +27,6 @@ from celery import current_task, task  # pylint: disable=no-name-in-module
 from celery.exceptions import RetryTaskError  # pylint: disable=no-name-in-module, import-error
 from celery.states import FAILURE, RETRY, SUCCESS  # pylint: disable=no-name-in-module, import-error
 from django.conf import settings
-from django.contrib.auth.models import User
 from django.core.mail import EmailMultiAlternatives, get_connection
 from django.core.mail.message import forbid_multi_line_headers
 from django.core.urlresolvers import reverse
@@ -37,12 +36,13 @@ from markupsafe import escape
 
 import dogstats_wrapper as dog_stats_api
 from bulk_email.models import CourseEmail, Optout
+from bulk_email.recipients import get_optout_ids, get_recipient_ids, get_recipients
 from courseware.courses import get_course
 from lms.djangoapps.instructor_task.models import InstructorTask
 from lms.djangoapps.instructor_task.subtasks import (
     SubtaskStatus,
     check_subtask_is_valid,
-    queue_subtasks_for_query,
+    queue_subtasks_for_item_ids,
     update_subtask_status
 )
 from openedx.core.djangoapps.site_configuration import helpers as configuration_helpers
@@ -173,20 +173,11 @@ def perform_delegate_email_batches(entry_id, course_id, task_input, action_name)
     targets = email_obj.targets.all()
     global_email_context = _get_course_email_context(course)
 
-    recipient_qsets = [
-        target.get_users(course_id, user_id)
-        for target in targets
-    ]
-    combined_set = User.objects.none()
-    for qset in recipient_qsets:
-        combined_set |= qset
-    combined_set = combined_set.distinct()
-    recipient_fields = ['profile__name', 'email']
-
     log.info(u"Task %s: Preparing to queue subtasks for sending emails for course %s, email %s",
              task_id, course_id, email_id)
 
-    total_recipients = combined_set.count()
+    recipient_ids = get_recipient_ids(targets, course_id, user_id)
+    total_recipients = len(recipient_ids)
 
     routing_key = settings.BULK_EMAIL_ROUTING_KEY
     # if there are few enough emails, send them through a different queue
@@ -217,14 +208,14 @@ def perform_delegate_email_batches(entry_id, course_id, task_input, action_name)
         )
         return new_subtask
 
-    progress = queue_subtasks_for_query(
+    optout_ids = get_optout_ids(course_id)
+    progress = queue_subtasks_for_item_ids(
         entry,
         action_name,
         _create_send_email_subtask,
-        [combined_set],
-        recipient_fields,
+        recipient_ids,
+        lambda user_ids: get_recipients(user_ids, optout_ids),
         settings.BULK_EMAIL_EMAILS_PER_TASK,
-        total_recipients,
     )
 
     # We want to return progress here, as this is what will be stored in the
@@ -247,6 +238,7 @@ def send_course_email(entry_id, email_id, to_list, global_email_context, subtask
         - 'profile__name': full name of User.
         - 'email': email address of User.
         - 'pk': primary key of User model.
+        - 'optout': whether the user opted out of the course's emails, if known.
       * `global_email_context`: dict containing values that are unique for this email but the same
         for all recipients of this email.  This dict is to be used to fill in slots in email
         template.  It does not include 'name' and 'email', which will be provided by the to_list.
@@ -338,6 +330,11 @@ def _filter_optouts_from_recipients(to_list, course_id):
     Returns the filtered recipient list, as well as the number of optouts
     removed from the list.
     """
+    if all('optout' in recipient for recipient in to_list):
+        # The recipients were flagged against the course's opt-outs when this subtask was queued.
+        num_optout = len([recipient for recipient in to_list if recipient['optout']])
+        return [recipient for recipient in to_list if not recipient['optout']], num_optout
+
     optouts = Optout.objects.filter(
         course_id=course_id,
         user__in=[i['pk'] for i in to_list]
@@ -432,6 +429,7 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
         - 'profile__name': full name of User.
         - 'email': email address of User.
         - 'pk': primary key of User model.
+        - 'optout': whether the user opted out of the course's emails, if known.
       * `global_email_context`: dict containing values that are unique for this email but the same
         for all recipients of this email.  This dict is to be used to fill in slots in email
         template.  It does not include 'name' and 'email', which will be provided by the to_list.
@@ -495,12 +493,17 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
     # use the CourseEmailTemplate that was associated with the CourseEmail
     course_email_template = course_email.get_template()
     try:
+        # Send all the messages of this subtask over the same connection.
         connection = get_connection()
         connection.open()
 
+        # Compile the templates with the message bodies once, to render them for each recipient.
+        compiled_email = course_email_template.compile(course_email.text_message, course_email.html_message)
+
         # Define context values to use in all course emails:
         email_context = {'name': '', 'email': ''}
         email_context.update(global_email_context)
+        email_context['course_id'] = course_email.course_id
 
         while to_list:
             # Update context with user-specific values from the user at the end of the list.
@@ -514,11 +517,10 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
             email_context['email'] = email
             email_context['name'] = current_recipient['profile__name']
             email_context['user_id'] = current_recipient['pk']
-            email_context['course_id'] = course_email.course_id
 
             # Construct message content using templates and context:
-            plaintext_msg = course_email_template.render_plaintext(course_email.text_message, email_context)
-            html_msg = course_email_template.render_htmltext(course_email.html_message, email_context)
+            plaintext_msg = compiled_email.render_plaintext(email_context)
+            html_msg = compiled_email.render_htmltext(email_context)
 
             # Create email:
             email_msg = EmailMultiAlternatives(
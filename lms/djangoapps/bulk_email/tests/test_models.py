@@ -223,6 +223,31 @@ class CourseEmailTemplateTest(TestCase):
         self.assertIn(context['course_title'], message)
         self.assertIn(context['name'], message)
 
+    def test_compiled_email_renders_like_template(self):
+        template = CourseEmailTemplate.get_template()
+        compiled_email = template.compile(
+            "Dear %%USER_FULLNAME%%, thanks for enrolling in %%COURSE_DISPLAY_NAME%%.",
+            "<p>Dear %%USER_FULLNAME%%, thanks for enrolling in %%COURSE_DISPLAY_NAME%%.</p>",
+        )
+        context = self._add_xss_fields(self._get_sample_html_context())
+        self.assertEqual(
+            compiled_email.render_plaintext(context),
+            template.render_plaintext(compiled_email.plaintext.message_body, dict(context)),
+        )
+        self.assertEqual(
+            compiled_email.render_htmltext(context),
+            template.render_htmltext(compiled_email.htmltext.message_body, dict(context)),
+        )
+
+    def test_compiled_email_does_not_escape_context(self):
+        compiled_email = CourseEmailTemplate.get_template().compile("%%COURSE_DISPLAY_NAME%%", "")
+        context = self._add_xss_fields(self._get_sample_html_context())
+        compiled_email.render_htmltext(context)
+        # The plain text of the next recipients is not HTML-escaped either.
+        message = compiled_email.render_plaintext(context)
+        self.assertNotIn("&lt;script&gt;", message)
+        self.assertIn(context['course_title'], message)
+
 
 @attr(shard=1)
 class CourseAuthorizationTest(TestCase):
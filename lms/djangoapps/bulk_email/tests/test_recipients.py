@@ -0,0 +1,56 @@
+"""
+Unit tests for the resolution of the recipients of bulk emails.
+"""
+from django.test.utils import override_settings
+from mock import Mock, patch
+from nose.plugins.attrib import attr
+
+from bulk_email.models import SEND_TO_LEARNERS, SEND_TO_MYSELF, SEND_TO_STAFF, CourseEmail, Optout
+from bulk_email.recipients import get_optout_ids, get_recipient_ids, get_recipients
+from courseware.tests.factories import InstructorFactory, StaffFactory
+from student.tests.factories import CourseEnrollmentFactory, UserFactory
+from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
+from xmodule.modulestore.tests.factories import CourseFactory
+
+
+@attr(shard=1)
+@patch('bulk_email.models.html_to_text', Mock(return_value='Mocking CourseEmail.text_message', autospec=True))
+@override_settings(BULK_EMAIL_RECIPIENT_ID_CHUNK_SIZE=2)
+class RecipientsTest(SharedModuleStoreTestCase):
+    """
+    Tests for the resolution of the recipients of bulk emails.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super(RecipientsTest, cls).setUpClass()
+        cls.course = CourseFactory.create()
+
+    def setUp(self):
+        super(RecipientsTest, self).setUp()
+        self.instructor = InstructorFactory(course_key=self.course.id)
+        self.staff = [StaffFactory(course_key=self.course.id) for __ in range(2)]
+        self.learners = [UserFactory() for __ in range(5)]
+        for learner in self.learners:
+            CourseEnrollmentFactory(user=learner, course_id=self.course.id)
+        # Users who are not enrolled are not emailed.
+        UserFactory()
+
+    def test_recipient_ids_are_distinct(self):
+        email = CourseEmail.create(
+            self.course.id, self.instructor, [SEND_TO_MYSELF, SEND_TO_STAFF, SEND_TO_LEARNERS], 'subject', 'message',
+        )
+        recipient_ids = get_recipient_ids(email.targets.all(), self.course.id, self.instructor.id)
+        self.assertEqual(
+            recipient_ids,
+            sorted(user.id for user in [self.instructor] + self.staff + self.learners),
+        )
+
+    def test_recipients_are_flagged_with_optouts(self):
+        Optout.objects.create(user=self.learners[1], course_id=self.course.id)
+        user_ids = [learner.id for learner in self.learners[:3]]
+
+        recipients = get_recipients(user_ids, get_optout_ids(self.course.id))
+        self.assertEqual(
+            [(recipient['pk'], recipient['email'], recipient['optout']) for recipient in recipients],
+            [(learner.id, learner.email, learner == self.learners[1]) for learner in self.learners[:3]],
+        )
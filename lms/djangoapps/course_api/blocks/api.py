@@ -6,7 +6,7 @@ from lms.djangoapps.course_blocks.api import COURSE_BLOCK_ACCESS_TRANSFORMERS, g
 from lms.djangoapps.course_blocks.transformers.hidden_content import HiddenContentTransformer
 from openedx.core.djangoapps.content.block_structure.transformers import BlockStructureTransformers
 
-from .serializers import BlockDictSerializer, BlockSerializer
+from .fragments import serialize_blocks, stream_blocks
 from .transformers.blocks_api import BlocksAPITransformer
 from .transformers.milestones import MilestonesAndSpecialExamsTransformer
 
@@ -22,6 +22,7 @@ def get_blocks(
         student_view_data=None,
         return_type='dict',
         block_types_filter=None,
+        stream=False,
 ):
     """
     Return a serialized representation of the course blocks.
@@ -48,6 +49,42 @@ def get_blocks(
             the format for returning the blocks.
         block_types_filter (list): Optional list of block type names used to filter
             the final result of returned blocks.
+        stream (boolean): Whether to return an iterator over the chunks of
+            the JSON document of the blocks, rather than the blocks.
+    """
+    blocks = get_transformed_blocks(
+        usage_key,
+        user=user,
+        depth=depth,
+        nav_depth=nav_depth,
+        requested_fields=requested_fields,
+        block_counts=block_counts,
+        student_view_data=student_view_data,
+        block_types_filter=block_types_filter,
+    )
+
+    # serialize
+    if stream:
+        return stream_blocks(request, blocks, requested_fields or [], student_view_data, return_type)
+    return serialize_blocks(request, blocks, requested_fields or [], student_view_data, return_type)
+
+
+def get_transformed_blocks(
+        usage_key,
+        user=None,
+        depth=None,
+        nav_depth=None,
+        requested_fields=None,
+        block_counts=None,
+        student_view_data=None,
+        block_types_filter=None,
+):
+    """
+    Return the course blocks as transformed for get_blocks, before they
+    are serialized.  See get_blocks for a description of the arguments.
+
+    Returns:
+        BlockStructureBlockData - The transformed block structure.
     """
     # create ordered list of transformers, adding BlocksAPITransformer at end.
     transformers = BlockStructureTransformers()
@@ -79,17 +116,4 @@ def get_blocks(
         for block_key in block_keys_to_remove:
             blocks.remove_block(block_key, keep_descendants=True)
 
-    # serialize
-    serializer_context = {
-        'request': request,
-        'block_structure': blocks,
-        'requested_fields': requested_fields or [],
-    }
-
-    if return_type == 'dict':
-        serializer = BlockDictSerializer(blocks, context=serializer_context, many=False)
-    else:
-        serializer = BlockSerializer(blocks, context=serializer_context, many=True)
-
-    # return serialized data
-    return serializer.data
+    return blocks
@@ -29,6 +29,7 @@ class BlockListGetForm(Form):
         choices=[(choice, choice) for choice in ['dict', 'list']],
     )
     student_view_data = MultiValueField(required=False)
+    stream = ExtendedNullBooleanField(required=False)
     usage_key = CharField(required=True)
     username = CharField(required=False)
     block_types_filter = MultiValueField(required=False)
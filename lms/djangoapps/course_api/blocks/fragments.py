@@ -0,0 +1,200 @@
+"""
+Serialization of course blocks from cached JSON fragments.
+
+Serializing the blocks of a large course one field at a time, reversing the
+URLs of each block, costs more than transforming them.  The data of each block
+that is the same for all users (its ids and URLs, and the requested fields
+that are collected from the course content) is encoded as a JSON object once
+for each version of the course, and cached per block.  On each request, the fragments
+are merged with the user specific fields of the blocks, either into dicts or
+directly into a streamed JSON document.
+"""
+import hashlib
+import json
+
+from django.core.cache import cache
+from rest_framework.utils.encoders import JSONEncoder
+
+from .serializers import BlockSerializer
+
+# Requested fields whose values are the same for all users, since they are
+# collected from the course content rather than computed for the user.
+USER_INVARIANT_FIELDS = [
+    'type',
+    'display_name',
+    'graded',
+    'format',
+    'show_correctness',
+    'student_view_data',
+    'student_view_multi_device',
+    'lti_url',
+]
+
+# Since the fragments are keyed on the version of their course, they only
+# expire to free up space in the cache.
+FRAGMENTS_CACHE_TIMEOUT = 24 * 60 * 60
+
+# Number of blocks written by each chunk of a streamed JSON document.
+STREAM_CHUNK_SIZE = 100
+
+
+def serialize_blocks(request, block_structure, requested_fields, student_view_data=None, return_type='dict'):
+    """
+    Returns the serialized representation of the given transformed blocks,
+    as a dict of the root and blocks by id, or as a list of the blocks,
+    depending on return_type.
+    """
+    serializer, fragments, user_fields = _prepare(request, block_structure, requested_fields, student_view_data)
+
+    blocks = []
+    for block_key in block_structure:
+        block = json.loads(fragments[block_key])
+        block.update(serializer.get_requested_data(block_key, user_fields))
+        blocks.append(block)
+
+    if return_type == 'dict':
+        return {
+            'root': unicode(block_structure.root_block_usage_key),
+            'blocks': {block['id']: block for block in blocks},
+        }
+    return blocks
+
+
+def stream_blocks(request, block_structure, requested_fields, student_view_data=None, return_type='dict'):
+    """
+    Returns an iterator over the chunks of the JSON document of the given
+    transformed blocks, as serialized by serialize_blocks.
+
+    The fragments are read, and missing ones cached, before this returns, so
+    that only the user specific fields are serialized as the document is
+    streamed.
+    """
+    serializer, fragments, user_fields = _prepare(request, block_structure, requested_fields, student_view_data)
+
+    def iter_blocks():
+        """
+        Yields the JSON of each block, prefixed with its id in a dict.
+        """
+        for block_key in block_structure:
+            block_json = _merge(fragments[block_key], serializer.get_requested_data(block_key, user_fields))
+            if return_type == 'dict':
+                yield u'{}:{}'.format(_encode(unicode(block_key)), block_json)
+            else:
+                yield block_json
+
+    if return_type == 'dict':
+        start, end = u'{{"root":{},"blocks":{{'.format(_encode(unicode(block_structure.root_block_usage_key))), u'}}'
+    else:
+        start, end = u'[', u']'
+
+    def iter_chunks():
+        """
+        Yields the document in chunks of STREAM_CHUNK_SIZE blocks.
+        """
+        chunk = [start]
+        for index, block_json in enumerate(iter_blocks()):
+            if index:
+                chunk.append(u',')
+            chunk.append(block_json)
+            if len(chunk) >= 2 * STREAM_CHUNK_SIZE:
+                yield u''.join(chunk)
+                chunk = []
+        chunk.append(end)
+        yield u''.join(chunk)
+
+    return iter_chunks()
+
+
+def _prepare(request, block_structure, requested_fields, student_view_data):
+    """
+    Returns the serializer of the given blocks, their JSON fragments by block
+    key, and the requested fields that are serialized for each user.
+    """
+    serializer = BlockSerializer(context={
+        'request': request,
+        'block_structure': block_structure,
+        'requested_fields': requested_fields,
+    })
+    invariant_fields = [field for field in requested_fields if field in USER_INVARIANT_FIELDS]
+    user_fields = [field for field in requested_fields if field not in USER_INVARIANT_FIELDS]
+    fragments = _get_fragments(request, block_structure, serializer, invariant_fields, student_view_data)
+    return serializer, fragments, user_fields
+
+
+def _get_fragments(request, block_structure, serializer, invariant_fields, student_view_data):
+    """
+    Returns the JSON fragments of the user invariant data of the given
+    blocks, keyed by block key.
+
+    The fragment of each block is cached separately for the course's version,
+    so that the cached values stay small for large courses, and only the
+    blocks missing from the cache are serialized and added to it.
+    """
+    cache_keys = _get_fragments_cache_keys(request, block_structure, invariant_fields, student_view_data)
+    cached_fragments = cache.get_many(cache_keys.values()) if cache_keys else {}
+
+    fragments = {}
+    missing_fragments = {}
+    for block_key in block_structure:
+        cache_key = cache_keys.get(block_key)
+        if cache_key in cached_fragments:
+            fragments[block_key] = cached_fragments[cache_key]
+        else:
+            data = serializer.get_basic_data(block_key)
+            data.update(serializer.get_requested_data(block_key, invariant_fields))
+            fragments[block_key] = _encode(data)
+            if cache_key:
+                missing_fragments[cache_key] = fragments[block_key]
+
+    if missing_fragments:
+        cache.set_many(missing_fragments, FRAGMENTS_CACHE_TIMEOUT)
+    return fragments
+
+
+def _get_fragments_cache_keys(request, block_structure, invariant_fields, student_view_data):
+    """
+    Returns the cache keys of the fragments of the given block structure's
+    blocks for the version of its course and the given fields, keyed by block
+    key, or an empty dict if the version is unknown.
+
+    The host is part of the keys, since the fragments contain absolute URLs.
+    """
+    root_block_usage_key = block_structure.root_block_usage_key
+    course_version = block_structure.get_xblock_field(root_block_usage_key, 'course_version')
+    subtree_edited_on = block_structure.get_xblock_field(root_block_usage_key, 'subtree_edited_on')
+    if course_version is None and subtree_edited_on is None:
+        return {}
+
+    if 'student_view_data' not in invariant_fields:
+        student_view_data = None
+
+    version_key = u'{}.{}.{}.{}.{}.{}'.format(
+        root_block_usage_key.course_key,
+        course_version,
+        subtree_edited_on,
+        request.build_absolute_uri('/'),
+        u','.join(sorted(invariant_fields)),
+        u','.join(sorted(student_view_data or [])),
+    )
+    return {
+        block_key: u'course_api.blocks.fragments.{}'.format(
+            hashlib.sha1(u'{}.{}'.format(version_key, block_key).encode('utf-8')).hexdigest()
+        )
+        for block_key in block_structure
+    }
+
+
+def _encode(data):
+    """
+    Returns the compact JSON encoding of the given data.
+    """
+    return json.dumps(data, cls=JSONEncoder, separators=(',', ':'))
+
+
+def _merge(fragment, data):
+    """
+    Returns the JSON object of the given fragment, with the given fields.
+    """
+    if not data:
+        return fragment
+    return u'{},{}'.format(fragment[:-1], _encode(data)[1:])
@@ -34,8 +34,16 @@ class BlockSerializer(serializers.Serializer):  # pylint: disable=abstract-metho
         """
         Return a serializable representation of the requested block
         """
-        # create response data dict for basic fields
-        data = {
+        data = self.get_basic_data(block_key)
+        data.update(self.get_requested_data(block_key, self.context['requested_fields']))
+        return data
+
+    def get_basic_data(self, block_key):
+        """
+        Return the fields that are returned for every block, regardless of
+        the requested fields.
+        """
+        return {
             'id': unicode(block_key),
             'block_id': unicode(block_key.block_id),
             'lms_web_url': reverse(
@@ -50,7 +58,13 @@ class BlockSerializer(serializers.Serializer):  # pylint: disable=abstract-metho
             ),
         }
 
-        if settings.FEATURES.get("ENABLE_LTI_PROVIDER") and 'lti_url' in self.context['requested_fields']:
+    def get_requested_data(self, block_key, requested_fields):
+        """
+        Return the given requested fields of the block that have data.
+        """
+        data = {}
+
+        if settings.FEATURES.get("ENABLE_LTI_PROVIDER") and 'lti_url' in requested_fields:
             data['lti_url'] = reverse(
                 'lti_provider_launch',
                 kwargs={'course_id': unicode(block_key.course_key), 'usage_id': unicode(block_key)},
@@ -59,7 +73,7 @@ class BlockSerializer(serializers.Serializer):  # pylint: disable=abstract-metho
 
         # add additional requested fields that are supported by the various transformers
         for supported_field in SUPPORTED_FIELDS:
-            if supported_field.requested_field_name in self.context['requested_fields']:
+            if supported_field.requested_field_name in requested_fields:
                 field_value = self._get_field(
                     block_key,
                     supported_field.transformer,
@@ -70,7 +84,7 @@ class BlockSerializer(serializers.Serializer):  # pylint: disable=abstract-metho
                     # only return fields that have data
                     data[supported_field.serializer_field_name] = field_value
 
-        if 'children' in self.context['requested_fields']:
+        if 'children' in requested_fields:
             children = self.context['block_structure'].get_children(block_key)
             if children:
                 data['children'] = [unicode(child) for child in children]
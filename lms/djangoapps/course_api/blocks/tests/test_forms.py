@@ -57,6 +57,7 @@ class TestBlockListGetForm(FormTestMixin, SharedModuleStoreTestCase):
             'return_type': 'dict',
             'requested_fields': {'display_name', 'type'},
             'student_view_data': set(),
+            'stream': None,
             'usage_key': usage_key,
             'username': self.student.username,
             'user': self.student,
@@ -0,0 +1,115 @@
+"""
+Tests for the serialization of course blocks from cached JSON fragments.
+"""
+import json
+
+import ddt
+from django.core.cache.backends.locmem import LocMemCache
+from django.test.client import RequestFactory
+from mock import patch
+from rest_framework.renderers import JSONRenderer
+
+from student.tests.factories import UserFactory
+from xmodule.modulestore import ModuleStoreEnum
+from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
+from xmodule.modulestore.tests.factories import SampleCourseFactory
+
+from ..api import get_transformed_blocks
+from ..fragments import serialize_blocks, stream_blocks
+from ..serializers import BlockDictSerializer, BlockSerializer
+
+REQUESTED_FIELDS = ['type', 'display_name', 'graded', 'student_view_data', 'children', 'due', 'block_counts']
+
+
+def render(data):
+    """
+    Returns the given data as decoded from its rendering in JSON.
+    """
+    return json.loads(JSONRenderer().render(data))
+
+
+@ddt.ddt
+class TestFragments(SharedModuleStoreTestCase):
+    """
+    Tests for the serialization of course blocks from cached JSON fragments.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super(TestFragments, cls).setUpClass()
+        with cls.store.default_store(ModuleStoreEnum.Type.split):
+            cls.course = SampleCourseFactory.create()
+
+    def setUp(self):
+        super(TestFragments, self).setUp()
+        self.user = UserFactory.create()
+        self.request = RequestFactory().get('/dummy')
+        self.request.user = self.user
+
+        self.cache = LocMemCache('fragments', {})
+        patcher = patch('lms.djangoapps.course_api.blocks.fragments.cache', self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.blocks = get_transformed_blocks(
+            self.course.location,
+            user=self.user,
+            depth=None,
+            requested_fields=REQUESTED_FIELDS,
+            block_counts=['problem'],
+            student_view_data=['html'],
+        )
+
+    def serialize_blocks(self, return_type='dict'):
+        """
+        Returns the blocks serialized from fragments.
+        """
+        return serialize_blocks(self.request, self.blocks, REQUESTED_FIELDS, ['html'], return_type)
+
+    def get_expected_blocks(self, return_type='dict'):
+        """
+        Returns the blocks serialized by the serializers, as rendered in JSON.
+        """
+        context = {'request': self.request, 'block_structure': self.blocks, 'requested_fields': REQUESTED_FIELDS}
+        if return_type == 'dict':
+            serializer = BlockDictSerializer(self.blocks, context=context)
+        else:
+            serializer = BlockSerializer(self.blocks, context=context, many=True)
+        return render(serializer.data)
+
+    @ddt.data('dict', 'list')
+    def test_serialize_blocks(self, return_type):
+        self.assertEqual(
+            render(self.serialize_blocks(return_type)),
+            self.get_expected_blocks(return_type),
+        )
+
+    @ddt.data('dict', 'list')
+    def test_stream_blocks(self, return_type):
+        document = u''.join(stream_blocks(self.request, self.blocks, REQUESTED_FIELDS, ['html'], return_type))
+        self.assertEqual(
+            json.loads(document),
+            render(self.serialize_blocks(return_type)),
+        )
+
+    def test_fragments_are_cached(self):
+        blocks = self.serialize_blocks()
+        with patch.object(BlockSerializer, 'get_basic_data') as mock_get_basic_data:
+            self.assertEqual(self.serialize_blocks(), blocks)
+        self.assertFalse(mock_get_basic_data.called)
+
+    def test_fragments_are_cached_per_block(self):
+        with patch.object(self.cache, 'set_many', wraps=self.cache.set_many) as mock_set_many:
+            blocks = self.serialize_blocks()
+        cached_fragments = mock_set_many.call_args[0][0]
+        self.assertEqual(
+            sorted(json.loads(fragment)['id'] for fragment in cached_fragments.itervalues()),
+            sorted(blocks['blocks']),
+        )
+
+        # Only the blocks missing from the cache are serialized again.
+        self.cache.delete(next(iter(cached_fragments)))
+        with patch.object(
+            BlockSerializer, 'get_basic_data', autospec=True, side_effect=BlockSerializer.get_basic_data,
+        ) as mock_get_basic_data:
+            self.assertEqual(self.serialize_blocks(), blocks)
+        self.assertEqual(mock_get_basic_data.call_count, 1)
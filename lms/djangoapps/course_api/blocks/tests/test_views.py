@@ -1,6 +1,7 @@
 """
 Tests for Blocks Views
 """
+import json
 from datetime import datetime
 from string import join
 from urllib import urlencode
@@ -192,6 +193,12 @@ class TestBlocksView(SharedModuleStoreTestCase):
         response = self.verify_response(params={'return_type': 'list'})
         self.verify_response_block_list(response)
 
+    def test_stream_param(self):
+        response = self.verify_response(params={'stream': 'true'})
+        blocks = json.loads(''.join(response.streaming_content))
+        self.assertEquals(blocks['root'], unicode(self.course_usage_key))
+        self.assertSetEqual(set(blocks['blocks'].iterkeys()), self.non_orphaned_block_usage_keys)
+
     def test_block_counts_param(self):
         response = self.verify_response(params={'block_counts': ['course', 'chapter']})
         self.verify_response_block_dict(response)
@@ -23,8 +23,8 @@ class BlocksAPITransformer(BlockStructureTransformer):
     Note: BlockDepthTransformer must be executed before BlockNavigationTransformer.
     """
 
-    WRITE_VERSION = 1
-    READ_VERSION = 1
+    WRITE_VERSION = 2
+    READ_VERSION = 2
     STUDENT_VIEW_DATA = 'student_view_data'
     STUDENT_VIEW_MULTI_DEVICE = 'student_view_multi_device'
 
@@ -47,6 +47,9 @@ class BlocksAPITransformer(BlockStructureTransformer):
         # collect basic xblock fields
         block_structure.request_xblock_fields('graded', 'format', 'display_name', 'category', 'due', 'show_correctness')
 
+        # collect the version of the course, which the serialized blocks are cached for
+        block_structure.request_xblock_fields('course_version', 'subtree_edited_on')
+
         # collect data from containing transformers
         StudentViewTransformer.collect(block_structure)
         BlockCountsTransformer.collect(block_structure)
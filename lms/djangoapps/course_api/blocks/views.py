@@ -2,7 +2,7 @@
 CourseBlocks API views
 """
 from django.core.exceptions import ValidationError
-from django.http import Http404
+from django.http import Http404, StreamingHttpResponse
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import CourseKey
 from rest_framework.generics import ListAPIView
@@ -103,6 +103,13 @@ class BlocksView(DeveloperErrorViewMixin, ListAPIView):
 
           Example: block_types_filter=vertical,html
 
+        * stream: (boolean) Provide a value of "true" to stream the JSON
+          document of the blocks as it is serialized, which lowers the memory
+          use and the time to the first byte of the response for large
+          courses.
+
+          Example: stream=true
+
     **Response Values**
 
         The following fields are returned with a successful response.
@@ -195,23 +202,26 @@ class BlocksView(DeveloperErrorViewMixin, ListAPIView):
             raise ValidationError(params.errors)
 
         try:
-            return Response(
-                get_blocks(
-                    request,
-                    params.cleaned_data['usage_key'],
-                    params.cleaned_data['user'],
-                    params.cleaned_data['depth'],
-                    params.cleaned_data.get('nav_depth'),
-                    params.cleaned_data['requested_fields'],
-                    params.cleaned_data.get('block_counts', []),
-                    params.cleaned_data.get('student_view_data', []),
-                    params.cleaned_data['return_type'],
-                    params.cleaned_data.get('block_types_filter', None),
-                )
+            blocks = get_blocks(
+                request,
+                params.cleaned_data['usage_key'],
+                params.cleaned_data['user'],
+                params.cleaned_data['depth'],
+                params.cleaned_data.get('nav_depth'),
+                params.cleaned_data['requested_fields'],
+                params.cleaned_data.get('block_counts', []),
+                params.cleaned_data.get('student_view_data', []),
+                params.cleaned_data['return_type'],
+                params.cleaned_data.get('block_types_filter', None),
+                stream=bool(params.cleaned_data.get('stream')),
             )
         except ItemNotFoundError as exception:
             raise Http404("Block not found: {}".format(exception.message))
 
+        if params.cleaned_data.get('stream'):
+            return StreamingHttpResponse(blocks, content_type='application/json')
+        return Response(blocks)
+
 
 @view_auth_classes()
 class BlocksInCourseView(BlocksView):
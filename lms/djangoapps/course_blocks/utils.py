@@ -31,3 +31,29 @@ def get_student_module_as_dict(user, course_key, block_key):
         return json.loads(student_module.state)
     else:
         return {}
+
+
+def get_student_modules_as_dicts(user, course_key, block_keys):
+    """
+    Get the student modules as dicts for the given user for the given
+    blocks, with a single query.
+
+    Arguments:
+        user (User)
+        course_key (CourseLocator)
+        block_keys (list of BlockUsageLocator)
+
+    Returns:
+        dict: The state of each block that has a student module, keyed by
+            the unicode of the block's usage key.
+    """
+    student_modules = StudentModule.objects.filter(
+        student=user,
+        course_id=course_key,
+        module_state_key__in=block_keys,
+    ).only('module_state_key', 'state')
+
+    return {
+        unicode(student_module.module_state_key.map_into_course(course_key)): json.loads(student_module.state)
+        for student_module in student_modules
+    }
@@ -13,14 +13,18 @@ Note: The access control logic in this file does NOT check for enrollment in
 import logging
 from datetime import datetime
 
+import crum
 import pytz
 from ccx_keys.locator import CCXLocator
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.timezone import UTC
 from opaque_keys.edx.keys import CourseKey, UsageKey
 from xblock.core import XBlock
 
+import request_cache
 from courseware.access_response import MilestoneError, MobileAvailabilityError, VisibilityError
 from courseware.access_utils import (
     ACCESS_DENIED,
@@ -34,10 +38,11 @@ from courseware.masquerade import get_masquerade_role, is_masquerading_as_studen
 from lms.djangoapps.ccx.custom_exception import CCXLocatorValidationException
 from lms.djangoapps.ccx.models import CustomCourseForEdX
 from mobile_api.models import IgnoreMobileAvailableFlagConfig
+from openedx.core.djangoapps import monitoring_utils
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.core.djangoapps.external_auth.models import ExternalAuthMap
 from student import auth
-from student.models import CourseEnrollmentAllowed
+from student.models import CourseAccessRole, CourseEnrollmentAllowed
 from student.roles import (
     CourseBetaTesterRole,
     CourseCcxCoachRole,
@@ -46,6 +51,7 @@ from student.roles import (
     GlobalStaff,
     OrgInstructorRole,
     OrgStaffRole,
+    RoleCache,
     SupportStaffRole
 )
 from util import milestones_helpers as milestones_helpers
@@ -61,6 +67,9 @@ from xmodule.x_module import XModule
 
 log = logging.getLogger(__name__)
 
+# Namespace of the request cache of the access decisions made in the current request.
+ACCESS_CACHE_NAMESPACE = u'courseware.access'
+
 
 def has_ccx_coach_role(user, course_key):
     """
@@ -120,11 +129,33 @@ def has_access(user, action, obj, course_key=None):
 
     Returns an AccessResponse object.  It is up to the caller to actually
     deny access in a way that makes sense in context.
+
+    Within a request, the decisions are cached by user, action, location of
+    obj and course_key, since rendering a course checks the access to the same
+    blocks and course many times.
     """
     # Just in case user is passed in as None, make them anonymous
     if not user:
         user = AnonymousUser()
 
+    monitoring_utils.increment('courseware.access.has_access')
+    cache_key = _get_access_cache_key(user, action, obj, course_key)
+    if cache_key is None:
+        return _has_access(user, action, obj, course_key)
+
+    access_cache = request_cache.get_cache(ACCESS_CACHE_NAMESPACE)
+    if cache_key in access_cache:
+        monitoring_utils.increment('courseware.access.has_access.cached')
+    else:
+        access_cache[cache_key] = _has_access(user, action, obj, course_key)
+    return access_cache[cache_key]
+
+
+def _has_access(user, action, obj, course_key):
+    """
+    Checks whether a user has the access to do action on obj, without the
+    request cache.  See has_access.
+    """
     # Preview mode is only accessible by staff.
     if in_preview_mode() and course_key:
         if not has_staff_access_to_preview_mode(user, course_key):
@@ -163,6 +194,63 @@ def has_access(user, action, obj, course_key=None):
                     .format(type(obj)))
 
 
+def _get_access_cache_key(user, action, obj, course_key):
+    """
+    Returns the key of the access decision in the request cache, or None if
+    the decision is not cached, outside of requests or for objects without a
+    location.
+    """
+    if crum.get_current_request() is None:
+        return None
+
+    if isinstance(obj, (CourseKey, UsageKey, basestring)):
+        location = obj
+    else:
+        location = getattr(obj, 'location', None)
+        if location is None:
+            return None
+
+    return (
+        user.id,
+        action,
+        type(obj).__name__,
+        unicode(location),
+        unicode(course_key) if course_key else None,
+    )
+
+
+def clear_access_cache():
+    """
+    Forgets the access decisions made in the current request.
+    """
+    request_cache.clear_cache(ACCESS_CACHE_NAMESPACE)
+
+
+@receiver(post_save, sender=CourseAccessRole)
+@receiver(post_delete, sender=CourseAccessRole)
+def _clear_access_cache_on_role_change(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Forgets the access decisions made in the current request when a course
+    role is granted or revoked.
+    """
+    clear_access_cache()
+
+
+def prefetch_access(user, course_key):
+    """
+    Loads the course roles of the user, and the milestones the user is
+    required to fulfill to access the content of the course, so that checking
+    the access to many blocks of the course does not query them again.
+    """
+    if not user.is_authenticated():
+        return
+
+    # pylint: disable=protected-access
+    if not hasattr(user, '_roles'):
+        user._roles = RoleCache(user)
+    milestones_helpers.prefetch_course_content_milestones(course_key, 'requires', user.id)
+
+
 def has_staff_access_to_preview_mode(user, course_key):
     """
     Checks if given user can access course in preview mode.
@@ -0,0 +1,72 @@
+"""
+Command to compare the ways of reading a user's StudentModules for a course.
+"""
+from time import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+
+from courseware.models import StudentModule
+from courseware.user_state_client import DjangoXBlockUserStateClient
+from xmodule.modulestore.django import modulestore
+
+
+class Command(BaseCommand):
+    """
+    Reports the time taken to read the state of every block of a course for a
+    user, with chunked queries on the block keys and with a single query on
+    the user and course, along with the query plan of the latter.
+
+    Example usage:
+        $ ./manage.py lms benchmark_student_module_queries --course 'edX/DemoX/Demo_Course' --username staff \
+            --settings=devstack
+    """
+    help = u'Compares the chunked and the single course query for reading StudentModules.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--course', dest='course', required=True, help=u'The course to read the blocks of.')
+        parser.add_argument('--username', dest='username', required=True, help=u'The user to read the state of.')
+        parser.add_argument(
+            '--iterations',
+            help=u'Number of times to read the state with each query.',
+            default=10,
+            type=int,
+        )
+
+    def handle(self, *args, **options):
+        try:
+            course_key = CourseKey.from_string(options['course'])
+        except InvalidKeyError:
+            raise CommandError(u'Invalid course key: {}'.format(options['course']))
+        try:
+            user = User.objects.get(username=options['username'])
+        except User.DoesNotExist:
+            raise CommandError(u'Unknown user: {}'.format(options['username']))
+        if options['iterations'] < 1:
+            raise CommandError(u'iterations must be a positive integer.')
+
+        block_keys = [block.location for block in modulestore().get_items(course_key)]
+        client = DjangoXBlockUserStateClient(user)
+
+        self.stdout.write(u'blocks={}\tstudent_modules={}'.format(
+            len(block_keys),
+            StudentModule.objects.filter(student=user, course_id=course_key).count(),
+        ))
+        for query_name, min_blocks in ((u'chunked', len(block_keys) + 1), (u'course', 1)):
+            client.COURSE_QUERY_MIN_BLOCKS = min_blocks
+            start = time()
+            for _ in xrange(options['iterations']):
+                states = list(client.get_many_encoded(user.username, block_keys))
+            duration = (time() - start) / options['iterations']
+            self.stdout.write(u'{}\tstates={}\ttime={:.2f}ms'.format(query_name, len(states), duration * 1000))
+
+        sql, params = StudentModule.objects.filter(student=user, course_id=course_key).only(
+            'module_state_key', 'course_id', 'state', 'modified',
+        ).query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(u'EXPLAIN ' + sql, params)
+            for row in cursor.fetchall():
+                self.stdout.write(u'\t'.join(unicode(column) for column in row))
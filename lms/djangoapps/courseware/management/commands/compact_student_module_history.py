@@ -0,0 +1,108 @@
+"""
+Command to delete the old StudentModule history of block types whose history is not needed.
+"""
+import logging
+from itertools import groupby
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from courseware.models import StudentModule, StudentModuleHistory, chunks
+from courseware.student_module_history import HISTORY_POLICY_FULL, get_history_policy
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Deletes all but the latest history rows of each StudentModule of the given
+    module types, in batches of StudentModules.  Module types whose history
+    policy is 'full', such as problems, are refused since their history is
+    used for grading and rescoring.
+
+    Example usage:
+        $ ./manage.py lms compact_student_module_history --module-types video html --keep 1 --settings=aws
+    """
+    help = u'Deletes all but the latest history rows of StudentModules of non-graded module types.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--module-types',
+            dest='module_types',
+            nargs='+',
+            required=True,
+            help=u'The module types to compact the history of.',
+        )
+        parser.add_argument(
+            '--keep',
+            help=u'Number of the latest history rows to keep for each StudentModule.',
+            default=1,
+            type=int,
+        )
+        parser.add_argument(
+            '--batch-size',
+            help=u'Number of StudentModules to compact the history of at a time.',
+            default=1000,
+            type=int,
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help=u'Report the number of history rows that would be deleted, without deleting them.',
+        )
+
+    def handle(self, *args, **options):
+        history_classes = [StudentModuleHistory]
+        if settings.FEATURES.get('ENABLE_CSMH_EXTENDED'):
+            from coursewarehistoryextended.models import StudentModuleHistoryExtended
+            history_classes.append(StudentModuleHistoryExtended)
+
+        for module_type in options['module_types']:
+            if any(get_history_policy(cls, module_type) == HISTORY_POLICY_FULL for cls in history_classes):
+                raise CommandError(u'The history of {} modules is saved in full and cannot be compacted.'.format(
+                    module_type
+                ))
+        if options['keep'] < 0 or options['batch_size'] < 1:
+            raise CommandError(u'keep must not be negative, and batch-size must be positive.')
+
+        deleted = 0
+        last_id = 0
+        while True:
+            student_module_ids = list(
+                StudentModule.objects.filter(
+                    module_type__in=options['module_types'], id__gt=last_id,
+                ).order_by('id').values_list('id', flat=True)[:options['batch_size']]
+            )
+            if not student_module_ids:
+                break
+            last_id = student_module_ids[-1]
+
+            for history_class in history_classes:
+                deleted += _compact_history(history_class, student_module_ids, options['keep'], options['dry_run'])
+
+        log.info(
+            u'%s %d history rows of %s modules.',
+            u'Would delete' if options['dry_run'] else u'Deleted',
+            deleted,
+            u', '.join(options['module_types']),
+        )
+        self.stdout.write(unicode(deleted))
+
+
+def _compact_history(history_class, student_module_ids, keep, dry_run):
+    """
+    Deletes all but the latest `keep` history rows of the given class for
+    each of the given StudentModules, and returns the number of deleted rows.
+    """
+    history_rows = history_class.objects.filter(
+        student_module_id__in=student_module_ids,
+    ).order_by('student_module_id', '-id').values_list('student_module_id', 'id')
+
+    obsolete_ids = []
+    for _, rows in groupby(history_rows, key=lambda row: row[0]):
+        obsolete_ids.extend(history_id for _, history_id in list(rows)[keep:])
+
+    if not dry_run:
+        for obsolete_ids_chunk in chunks(obsolete_ids, 1000):
+            history_class.objects.filter(id__in=obsolete_ids_chunk).delete()
+    return len(obsolete_ids)
@@ -115,6 +115,9 @@ def setup_masquerade(request, course_key, staff_access=False, reset_masquerade_d
         return None, request.user
     if reset_masquerade_data:
         request.session.pop(MASQUERADE_DATA_KEY, None)
+    # The access decisions made before the masquerade is set up are those of the staff user.
+    from courseware.access import clear_access_cache
+    clear_access_cache()
     masquerade_settings = request.session.setdefault(MASQUERADE_SETTINGS_KEY, {})
     # Store the masquerade settings on the user so it can be accessed without the request
     request.user.masquerade_settings = masquerade_settings
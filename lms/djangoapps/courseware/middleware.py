@@ -4,6 +4,8 @@ Middleware for the courseware app
 
 from django.shortcuts import redirect
 
+from courseware.student_module_history import flush_pending_history
+from courseware.user_state_write_behind import student_state_write_buffer
 from lms.djangoapps.courseware.exceptions import Redirect
 
 
@@ -17,3 +19,28 @@ class RedirectMiddleware(object):
         """
         if isinstance(exception, Redirect):
             return redirect(exception.url)
+
+
+class StudentStateWriteBehindMiddleware(object):
+    """
+    Write the buffered user state updates that are due at the end of each request.
+    """
+    def process_response(self, _request, response):
+        """
+        Write the buffered user state updates that are older than the flush interval.
+        """
+        student_state_write_buffer.flush_expired()
+        return response
+
+
+class StudentModuleHistoryMiddleware(object):
+    """
+    Send the StudentModule history rows collected during each request to be
+    written in bulk, when writing the history asynchronously.
+    """
+    def process_response(self, _request, response):
+        """
+        Send the pending StudentModule history rows to be written.
+        """
+        flush_pending_history()
+        return response
@@ -37,6 +37,7 @@ from xblock.fields import Scope, UserScope
 from xblock.runtime import KeyValueStore
 
 from courseware.user_state_client import DjangoXBlockUserStateClient
+from courseware.user_state_write_behind import student_state_write_buffer
 from xmodule.modulestore.django import modulestore
 
 from .models import StudentModule, XModuleStudentInfoField, XModuleStudentPrefsField, XModuleUserStateSummaryField
@@ -347,6 +348,9 @@ class UserStateCache(object):
     """
     def __init__(self, user, course_id):
         self._cache = defaultdict(dict)
+        # The JSON encoded state of blocks that has not been accessed yet,
+        # which is only decoded into _cache when first accessed.
+        self._encoded_cache = {}
         self.course_id = course_id
         self.user = user
         self._client = DjangoXBlockUserStateClient(self.user)
@@ -361,12 +365,19 @@ class UserStateCache(object):
             xblocks (list of :class:`XBlock`): XBlocks to cache fields for.
             aside_types (list of str): Aside types to cache fields for.
         """
-        block_field_state = self._client.get_many(
+        usage_keys = _all_usage_keys(xblocks, aside_types)
+        encoded_block_states = self._client.get_many_encoded(
             self.user.username,
-            _all_usage_keys(xblocks, aside_types),
+            usage_keys,
         )
-        for user_state in block_field_state:
-            self._cache[user_state.block_key] = user_state.state
+        for block_key, encoded_state, _ in encoded_block_states:
+            self._cache.pop(block_key, None)
+            self._encoded_cache[block_key] = encoded_state
+
+        # Overlay the updates that are still buffered in this process.
+        if student_state_write_buffer:
+            for block_key, state in student_state_write_buffer.get_pending(self.user, usage_keys).iteritems():
+                self._decoded_state(block_key).update(state)
 
     @contract(kvs_key=DjangoKeyValueStore.Key)
     def set(self, kvs_key, value):
@@ -389,6 +400,7 @@ class UserStateCache(object):
 
         Returns: datetime if there was a modified date, or None otherwise
         """
+        self._write_buffered_state(kvs_key.block_scope_id)
         try:
             return self._client.get(
                 self.user.username,
@@ -413,15 +425,28 @@ class UserStateCache(object):
 
             pending_updates[cache_key][kvs_key.field_name] = value
 
+        written_updates = {}
+        for cache_key, state in pending_updates.iteritems():
+            if not self.user.is_anonymous() and student_state_write_buffer.is_write_behind(cache_key, state):
+                student_state_write_buffer.add(self.user, cache_key, state)
+            else:
+                # Write any buffered update of the block along with this one.
+                written_state = student_state_write_buffer.pop(self.user, cache_key)
+                written_state.update(state)
+                written_updates[cache_key] = written_state
+
         try:
-            self._client.set_many(
-                self.user.username,
-                pending_updates
-            )
+            if written_updates:
+                self._client.set_many(
+                    self.user.username,
+                    written_updates
+                )
         except DatabaseError:
             log.exception("Saving user state failed for %s", self.user.username)
             raise KeyValueMultiSaveError([])
         finally:
+            for cache_key in pending_updates:
+                self._encoded_cache.pop(cache_key, None)
             self._cache.update(pending_updates)
 
     @contract(kvs_key=DjangoKeyValueStore.Key)
@@ -436,10 +461,10 @@ class UserStateCache(object):
         Returns: A django orm object from the cache
         """
         cache_key = self._cache_key_for_kvs_key(kvs_key)
-        if cache_key not in self._cache:
+        if not self._has_state(cache_key):
             raise KeyError(kvs_key.field_name)
 
-        return self._cache[cache_key][kvs_key.field_name]
+        return self._decoded_state(cache_key)[kvs_key.field_name]
 
     @contract(kvs_key=DjangoKeyValueStore.Key)
     def delete(self, kvs_key):
@@ -452,14 +477,15 @@ class UserStateCache(object):
         Raises: KeyError if key isn't found in the cache
         """
         cache_key = self._cache_key_for_kvs_key(kvs_key)
-        if cache_key not in self._cache:
+        if not self._has_state(cache_key):
             raise KeyError(kvs_key.field_name)
 
-        field_state = self._cache[cache_key]
+        field_state = self._decoded_state(cache_key)
 
         if kvs_key.field_name not in field_state:
             raise KeyError(kvs_key.field_name)
 
+        self._write_buffered_state(cache_key)
         self._client.delete(self.user.username, cache_key, fields=[kvs_key.field_name])
         del field_state[kvs_key.field_name]
 
@@ -476,12 +502,37 @@ class UserStateCache(object):
         cache_key = self._cache_key_for_kvs_key(kvs_key)
 
         return (
-            cache_key in self._cache and
-            kvs_key.field_name in self._cache[cache_key]
+            self._has_state(cache_key) and
+            kvs_key.field_name in self._decoded_state(cache_key)
         )
 
     def __len__(self):
-        return len(self._cache)
+        return len(self._cache) + len(self._encoded_cache)
+
+    def _write_buffered_state(self, cache_key):
+        """
+        Write the update of the block with the specified key that is still
+        buffered in this process, if any.
+        """
+        buffered_state = student_state_write_buffer.pop(self.user, cache_key)
+        if buffered_state:
+            self._client.set_many(self.user.username, {cache_key: buffered_state})
+
+    def _has_state(self, cache_key):
+        """
+        Return whether the state of the block with the specified key is cached.
+        """
+        return cache_key in self._cache or cache_key in self._encoded_cache
+
+    def _decoded_state(self, cache_key):
+        """
+        Return the cached state dict of the block with the specified key, decoding
+        it first if it has not been accessed yet.
+        """
+        encoded_state = self._encoded_cache.pop(cache_key, None)
+        if encoded_state is not None:
+            self._cache[cache_key] = json.loads(encoded_state)
+        return self._cache[cache_key]
 
     def _cache_key_for_kvs_key(self, key):
         """
@@ -988,6 +1039,31 @@ class ScoresClient(object):
         client.fetch_scores(scorable_locations)
         return client
 
+    @classmethod
+    def create_for_users(cls, course_id, user_ids, scorable_locations):
+        """
+        Create ScoresClients for several users, pre-fetching all of their
+        scores for the given locations with a single query.
+
+        Returns a dict mapping each user_id to its ScoresClient.
+        """
+        clients = {user_id: cls(course_id, user_id) for user_id in user_ids}
+        scores_qset = StudentModule.objects.filter(
+            student_id__in=clients.keys(),
+            course_id=course_id,
+            module_state_key__in=set(scorable_locations),
+        )
+        # pylint: disable=protected-access
+        for user_id, location, correct, total, created in scores_qset.values_list(
+                'student_id', 'module_state_key', 'grade', 'max_grade', 'created'
+        ):
+            # See fetch_scores for why the course key is mapped back in.
+            location = UsageKey.from_string(location).map_into_course(course_id)
+            clients[user_id]._locations_to_scores[location] = cls.Score(correct, total, created)
+        for client in clients.itervalues():
+            client._has_fetched = True
+        return clients
+
 
 # @contract(user_id=int, usage_key=UsageKey, score="number|None", max_score="number|None")
 def set_score(user_id, usage_key, score, max_score):
@@ -22,6 +22,7 @@ from django.db.models.signals import post_save
 from model_utils.models import TimeStampedModel
 
 import coursewarehistoryextended
+from courseware.student_module_history import save_history
 from openedx.core.djangoapps.xmodule_django.models import BlockTypeKeyField, CourseKeyField, LocationKeyField
 
 log = logging.getLogger("edx.courseware")
@@ -213,18 +214,10 @@ class StudentModuleHistory(BaseStudentModuleHistory):
 
     def save_history(sender, instance, **kwargs):  # pylint: disable=no-self-argument, unused-argument
         """
-        Checks the instance's module_type, and creates & saves a
-        StudentModuleHistoryExtended entry if the module_type is one that
-        we save.
+        Creates & saves a StudentModuleHistory entry if the history policy
+        of the instance's module_type says so.
         """
-        if instance.module_type in StudentModuleHistory.HISTORY_SAVING_TYPES:
-            history_entry = StudentModuleHistory(student_module=instance,
-                                                 version=None,
-                                                 created=instance.modified,
-                                                 state=instance.state,
-                                                 grade=instance.grade,
-                                                 max_grade=instance.max_grade)
-            history_entry.save()
+        save_history(StudentModuleHistory, instance)
 
     # When the extended studentmodulehistory table exists, don't save
     # duplicate history into courseware_studentmodulehistory, just retain
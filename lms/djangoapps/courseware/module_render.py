@@ -14,7 +14,7 @@ from django.core.cache import cache
 from django.core.context_processors import csrf
 from django.core.exceptions import PermissionDenied
 from django.core.urlresolvers import reverse
-from django.http import Http404, HttpResponse
+from django.http import Http404, HttpResponse, QueryDict
 from django.views.decorators.csrf import csrf_exempt
 from edx_proctoring.services import ProctoringService
 from opaque_keys import InvalidKeyError
@@ -28,7 +28,7 @@ from xblock.reference.plugins import FSService
 from xblock.runtime import KvsFieldData
 
 import static_replace
-from capa.xqueue_interface import XQueueInterface
+from capa.xqueue_interface import XQUEUE_POOL_SIZE, XQueueInterface
 from courseware.access import get_user_role, has_access
 from courseware.entrance_exams import user_can_skip_entrance_exam, user_has_passed_entrance_exam
 from courseware.masquerade import (
@@ -89,6 +89,7 @@ XQUEUE_INTERFACE = XQueueInterface(
     settings.XQUEUE_INTERFACE['url'],
     settings.XQUEUE_INTERFACE['django_auth'],
     REQUESTS_AUTH,
+    pool_size=settings.XQUEUE_INTERFACE.get('pool_size', XQUEUE_POOL_SIZE),
 )
 
 # TODO: course_id and course_key are used interchangeably in this file, which is wrong.
@@ -789,13 +790,13 @@ def load_single_xblock(request, user_id, course_id, usage_key_string, course=Non
     return instance
 
 
-@csrf_exempt
-def xqueue_callback(request, course_id, userid, mod_id, dispatch):
-    '''
-    Entry point for graded results from the queueing system.
-    '''
-    data = request.POST.copy()
+def _parse_xqueue_header(data):
+    """
+    Validate an xqueue package and return its decoded header.
 
+    Raises Http404 if the package is missing its header or body, or if the header
+    does not carry the 'lms_key' needed to match it with a pending submission.
+    """
     # Test xqueue package, which we expect to be:
     #   xpackage = {'xqueue_header': json.dumps({'lms_key':'secretkey',...}),
     #               'xqueue_body'  : 'Message from grader'}
@@ -806,30 +807,105 @@ def xqueue_callback(request, course_id, userid, mod_id, dispatch):
     header = json.loads(data['xqueue_header'])
     if not isinstance(header, dict) or 'lms_key' not in header:
         raise Http404
+    return header
+
+
+def _apply_xqueue_result(request, course, course_id, userid, mod_id, dispatch, data, header):
+    """
+    Hand a single graded result from xqueue to the module it was submitted from.
+    """
+    instance = load_single_xblock(request, userid, course_id, mod_id, course=course)
+
+    # Transfer 'queuekey' from xqueue response header to the data.
+    # This is required to use the interface defined by 'handle_ajax'
+    data.update({'queuekey': header['lms_key']})
+
+    # We go through the "AJAX" path
+    # So far, the only dispatch from xqueue will be 'score_update'
+    try:
+        # Can ignore the return value--not used for xqueue_callback
+        instance.handle_ajax(dispatch, data)
+        # Save any state that has changed to the underlying KeyValueStore
+        instance.save()
+    except:
+        log.exception("error processing ajax call")
+        raise
+
+
+@csrf_exempt
+def xqueue_callback(request, course_id, userid, mod_id, dispatch):
+    '''
+    Entry point for graded results from the queueing system.
+    '''
+    data = request.POST.copy()
+    header = _parse_xqueue_header(data)
 
     course_key = CourseKey.from_string(course_id)
 
     with modulestore().bulk_operations(course_key):
         course = modulestore().get_course(course_key, depth=0)
+        _apply_xqueue_result(request, course, course_id, userid, mod_id, dispatch, data, header)
+        return HttpResponse("")
 
-        instance = load_single_xblock(request, userid, course_id, mod_id, course=course)
 
-        # Transfer 'queuekey' from xqueue response header to the data.
-        # This is required to use the interface defined by 'handle_ajax'
-        data.update({'queuekey': header['lms_key']})
+@csrf_exempt
+def xqueue_callback_bulk(request, course_id):
+    '''
+    Entry point for a batch of graded results from the queueing system.
 
-        # We go through the "AJAX" path
-        # So far, the only dispatch from xqueue will be 'score_update'
-        try:
-            # Can ignore the return value--not used for xqueue_callback
-            instance.handle_ajax(dispatch, data)
-            # Save any state that has changed to the underlying KeyValueStore
-            instance.save()
-        except:
-            log.exception("error processing ajax call")
-            raise
+    Expects a POST parameter 'xqueue_results' holding a JSON-serialized list of
+    packages, each with the same 'xqueue_header' and 'xqueue_body' keys as a
+    single callback plus the 'userid', 'mod_id' and 'dispatch' that would
+    otherwise be part of the callback url.  The course is loaded once for the
+    whole batch.
 
-        return HttpResponse("")
+    Each result is applied independently, so one bad package does not prevent
+    the others from being graded.  The response lists, in order, whether each
+    package was applied.
+    '''
+    try:
+        packages = json.loads(request.POST['xqueue_results'])
+    except (KeyError, ValueError):
+        raise Http404
+    if not isinstance(packages, list):
+        raise Http404
+
+    course_key = CourseKey.from_string(course_id)
+    results = []
+
+    with modulestore().bulk_operations(course_key):
+        course = modulestore().get_course(course_key, depth=0)
+
+        for package in packages:
+            if not isinstance(package, dict):
+                log.error("invalid xqueue result package %r", package)
+                results.append({'success': False})
+                continue
+
+            try:
+                data = QueryDict('', mutable=True)
+                data.update({
+                    'xqueue_header': package['xqueue_header'],
+                    'xqueue_body': package['xqueue_body'],
+                })
+                header = _parse_xqueue_header(data)
+                _apply_xqueue_result(
+                    request,
+                    course,
+                    course_id,
+                    package['userid'],
+                    package['mod_id'],
+                    package.get('dispatch', 'score_update'),
+                    data,
+                    header,
+                )
+            except Exception:  # pylint: disable=broad-except
+                log.exception("error processing xqueue result for module %s", package.get('mod_id'))
+                results.append({'success': False})
+            else:
+                results.append({'success': True})
+
+    return JsonResponse({'results': results})
 
 
 @csrf_exempt
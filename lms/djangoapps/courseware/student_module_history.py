@@ -0,0 +1,153 @@
+"""
+Policies for saving the history of StudentModule state, and its optional
+asynchronous, bulk persistence.
+
+The STUDENT_MODULE_HISTORY setting maps module types to one of the
+following policies, falling back to DEFAULT_POLICY for unlisted types:
+
+    * 'full': a history row is saved for every change of the state,
+    * 'sampled': a history row is saved for a random SAMPLE_RATE fraction
+      of the changes,
+    * 'none': no history is saved.
+
+Without the setting, the types in HISTORY_SAVING_TYPES use the 'full'
+policy and all others use 'none', as they always have.
+
+When ASYNC is enabled, history rows are not saved along with their
+StudentModule.  They are collected for the current request or celery task
+instead, and written in bulk by a celery task once BATCH_SIZE of them are
+pending, and at the end of the request or task.
+"""
+import logging
+import random
+import threading
+
+from celery.signals import task_postrun
+from django.conf import settings
+
+log = logging.getLogger(__name__)
+
+HISTORY_POLICY_FULL = 'full'
+HISTORY_POLICY_SAMPLED = 'sampled'
+HISTORY_POLICY_NONE = 'none'
+
+# Default fraction of the state changes saved under the 'sampled' policy.
+DEFAULT_SAMPLE_RATE = 0.1
+
+# Default number of pending history rows written by each celery task.
+DEFAULT_BATCH_SIZE = 500
+
+
+def _get_setting(name, default=None):
+    """
+    Returns the value of the given key of the STUDENT_MODULE_HISTORY setting.
+    """
+    return getattr(settings, 'STUDENT_MODULE_HISTORY', {}).get(name, default)
+
+
+def get_history_policy(history_class, module_type):
+    """
+    Returns the history policy for StudentModules of the given module type.
+    """
+    policies = _get_setting('POLICIES')
+    if policies is None:
+        return HISTORY_POLICY_FULL if module_type in history_class.HISTORY_SAVING_TYPES else HISTORY_POLICY_NONE
+    return policies.get(module_type, _get_setting('DEFAULT_POLICY', HISTORY_POLICY_NONE))
+
+
+def should_save_history(history_class, module_type):
+    """
+    Returns whether a history row should be saved for a change of the state
+    of a StudentModule of the given module type.
+    """
+    policy = get_history_policy(history_class, module_type)
+    if policy == HISTORY_POLICY_FULL:
+        return True
+    if policy == HISTORY_POLICY_SAMPLED:
+        return random.random() < _get_setting('SAMPLE_RATE', DEFAULT_SAMPLE_RATE)
+    return False
+
+
+def save_history(history_class, student_module):
+    """
+    Saves a history row of the given class for the current state of the
+    given StudentModule, if its module type's policy says so.
+    """
+    if not should_save_history(history_class, student_module.module_type):
+        return
+
+    if _get_setting('ASYNC', False):
+        _pending_history.add(history_class, student_module)
+    else:
+        history_class.objects.create(
+            student_module=student_module,
+            version=None,
+            created=student_module.modified,
+            state=student_module.state,
+            grade=student_module.grade,
+            max_grade=student_module.max_grade,
+        )
+
+
+class _PendingHistory(threading.local):
+    """
+    The history rows of the current thread that are waiting to be written,
+    by model label.
+    """
+    def __init__(self):
+        super(_PendingHistory, self).__init__()
+        self.rows = {}
+        self.count = 0
+
+    def add(self, history_class, student_module):
+        """
+        Adds a history row of the given class for the current state of the
+        given StudentModule, writing the pending rows once there are enough.
+        """
+        model_label = u'{}.{}'.format(history_class._meta.app_label, history_class._meta.object_name)
+        self.rows.setdefault(model_label, []).append({
+            'student_module_id': student_module.id,
+            'created': student_module.modified.isoformat(),
+            'state': student_module.state,
+            'grade': student_module.grade,
+            'max_grade': student_module.max_grade,
+        })
+        self.count += 1
+        if self.count >= _get_setting('BATCH_SIZE', DEFAULT_BATCH_SIZE):
+            self.flush()
+
+    def flush(self):
+        """
+        Sends the pending history rows to be written by celery tasks.
+        """
+        if not self.count:
+            return
+
+        # Imported here since the tasks depend on the models, which depend on this module.
+        from courseware.tasks import write_student_module_history
+
+        rows, self.rows, self.count = self.rows, {}, 0
+        for model_label, model_rows in rows.iteritems():
+            try:
+                write_student_module_history.delay(model_label, model_rows)
+            except Exception:  # pylint: disable=broad-except
+                log.exception(u'Failed to send %d %s rows to be written.', len(model_rows), model_label)
+
+
+_pending_history = _PendingHistory()  # pylint: disable=invalid-name
+
+
+def flush_pending_history():
+    """
+    Sends the history rows pending in the current thread to be written.
+    """
+    _pending_history.flush()
+
+
+@task_postrun.connect
+def _flush_pending_history_after_task(**kwargs):  # pylint: disable=unused-argument
+    """
+    Sends the history rows collected during a celery task to be written once
+    it completes.
+    """
+    flush_pending_history()
@@ -0,0 +1,36 @@
+"""
+Tasks for courseware.
+"""
+import logging
+
+from celery.task import task  # pylint: disable=import-error,no-name-in-module
+from django.apps import apps
+from django.utils.dateparse import parse_datetime
+
+log = logging.getLogger('edx.celery.task')
+
+
+@task(name=u'lms.djangoapps.courseware.tasks.write_student_module_history')
+def write_student_module_history(model_label, rows):
+    """
+    Writes the given StudentModule history rows in bulk.
+
+    Arguments:
+        model_label (unicode): The label of the history model, for example
+            u'courseware.StudentModuleHistory'.
+        rows (list of dict): The field values of each history row, with the
+            created date in ISO 8601 format.
+    """
+    history_class = apps.get_model(model_label)
+    history_class.objects.bulk_create([
+        history_class(
+            student_module_id=row['student_module_id'],
+            version=None,
+            created=parse_datetime(row['created']),
+            state=row['state'],
+            grade=row['grade'],
+            max_grade=row['max_grade'],
+        )
+        for row in rows
+    ])
+    log.info(u'Wrote %d %s rows.', len(rows), model_label)
@@ -727,6 +727,44 @@ class UserRoleTestCase(TestCase):
         )
 
 
+@attr(shard=1)
+class AccessCacheTestCase(TestCase):
+    """
+    Tests for the caching of the access decisions within a request.
+    """
+
+    def setUp(self):
+        super(AccessCacheTestCase, self).setUp()
+        self.course_key = SlashSeparatedCourseKey('edX', 'toy', '2012_Fall')
+        self.student = UserFactory()
+        self.course_staff = StaffFactory(course_key=self.course_key)
+        access.clear_access_cache()
+        patcher = patch('courseware.access.crum.get_current_request', return_value=RequestFactory().get('/'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_access_decisions_are_cached(self):
+        self.assertTrue(access.has_access(self.course_staff, 'staff', self.course_key))
+        with patch('courseware.access._has_access_to_course') as mock_has_access_to_course:
+            self.assertTrue(access.has_access(self.course_staff, 'staff', self.course_key))
+            self.assertFalse(access.has_access(self.student, 'staff', self.course_key))
+        mock_has_access_to_course.assert_called_once_with(self.student, 'staff', self.course_key)
+
+    def test_role_changes_clear_cache(self):
+        self.assertFalse(access.has_access(self.student, 'staff', self.course_key))
+        CourseStaffRole(self.course_key).add_users(self.student)
+        self.assertTrue(access.has_access(self.student, 'staff', self.course_key))
+        CourseStaffRole(self.course_key).remove_users(self.student)
+        self.assertFalse(access.has_access(self.student, 'staff', self.course_key))
+
+    def test_access_decisions_are_not_cached_outside_requests(self):
+        with patch('courseware.access.crum.get_current_request', return_value=None):
+            access.has_access(self.course_staff, 'staff', self.course_key)
+            with patch('courseware.access._has_access_to_course') as mock_has_access_to_course:
+                access.has_access(self.course_staff, 'staff', self.course_key)
+        mock_has_access_to_course.assert_called_once_with(self.course_staff, 'staff', self.course_key)
+
+
 @attr(shard=3)
 @ddt.ddt
 class CourseOverviewAccessTestCase(ModuleStoreTestCase):
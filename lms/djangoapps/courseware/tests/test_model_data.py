@@ -140,6 +140,20 @@ class TestStudentModuleStorage(OtherUserFailureTestMixin, TestCase):
         with self.assertNumQueries(0):
             self.assertRaises(KeyError, self.kvs.get, user_state_key('not_a_field'))
 
+    def test_state_decoded_lazily(self):
+        "Test that the state of a StudentModule is only decoded when first accessed"
+        with patch('courseware.model_data.json.loads', wraps=json.loads) as mock_loads:
+            field_data_cache = FieldDataCache(
+                [mock_descriptor([mock_field(Scope.user_state, 'a_field')])], course_id, self.user
+            )
+            kvs = DjangoKeyValueStore(field_data_cache)
+            self.assertEquals(1, len(field_data_cache))
+            self.assertFalse(mock_loads.called)
+
+            self.assertEquals('a_value', kvs.get(user_state_key('a_field')))
+            self.assertEquals('b_value', kvs.get(user_state_key('b_field')))
+            self.assertEquals(1, mock_loads.call_count)
+
     def test_set_existing_field(self):
         "Test that setting an existing user_state field changes the value"
         # We are updating a problem, so we write to courseware_studentmodulehistory
@@ -245,6 +245,46 @@ class ModuleRenderTestCase(SharedModuleStoreTestCase, LoginEnrollmentTestCase):
                     self.dispatch
                 )
 
+    def test_xqueue_callback_bulk(self):
+        """
+        Test that a batch of xqueue results is applied in one request
+        """
+        packages = [
+            {
+                'userid': self.mock_user.id,
+                'mod_id': self.mock_module.id,
+                'dispatch': self.dispatch,
+                'xqueue_header': json.dumps({'lms_key': 'key{}'.format(index)}),
+                'xqueue_body': 'result {}'.format(index),
+            }
+            for index in range(3)
+        ]
+        # The last packages are missing their lms_key or are not packages, and must not stop the others
+        packages.append(dict(packages[0], xqueue_header='{}'))
+        packages.append('not a package')
+
+        bulk_url = reverse('xqueue_callback_bulk', kwargs={'course_id': unicode(self.course_key)})
+        with patch('courseware.module_render.load_single_xblock', return_value=self.mock_module) as mock_load:
+            request = self.request_factory.post(bulk_url, {'xqueue_results': json.dumps(packages)})
+            response = render.xqueue_callback_bulk(request, unicode(self.course_key))
+
+        self.assertEqual(
+            json.loads(response.content)['results'],
+            [{'success': True}] * 3 + [{'success': False}] * 2,
+        )
+        self.assertEqual(mock_load.call_count, 3)
+        self.assertEqual(
+            [call[0][1]['queuekey'] for call in self.mock_module.handle_ajax.call_args_list],
+            ['key0', 'key1', 'key2'],
+        )
+
+    def test_xqueue_callback_bulk_malformed(self):
+        bulk_url = reverse('xqueue_callback_bulk', kwargs={'course_id': unicode(self.course_key)})
+        for data in ({}, {'xqueue_results': 'not json'}, {'xqueue_results': '{}'}):
+            request = self.request_factory.post(bulk_url, data)
+            with self.assertRaises(Http404):
+                render.xqueue_callback_bulk(request, unicode(self.course_key))
+
     def test_anonymous_handle_xblock_callback(self):
         dispatch_url = reverse(
             'xblock_handler',
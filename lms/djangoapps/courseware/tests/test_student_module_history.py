@@ -0,0 +1,128 @@
+"""
+Tests for the policies and asynchronous persistence of StudentModule history.
+"""
+import json
+
+import ddt
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.test.utils import override_settings
+from mock import patch
+from nose.plugins.attrib import attr
+
+from courseware.models import StudentModule
+from courseware.student_module_history import flush_pending_history
+from courseware.tests.factories import StudentModuleFactory, course_id, location
+from coursewarehistoryextended.models import StudentModuleHistoryExtended
+
+
+@attr(shard=1)
+@ddt.ddt
+class TestStudentModuleHistoryPolicies(TestCase):
+    """
+    Tests for saving StudentModule history according to the module type's policy.
+    """
+    # Tell Django to clean out all databases, not just default
+    multi_db = True
+
+    def save_states(self, module_type, count=4):
+        """
+        Creates a StudentModule of the given type and saves `count` states,
+        and returns the number of history rows saved for it.
+        """
+        student_module = StudentModuleFactory.create(
+            module_type=module_type,
+            module_state_key=course_id.make_usage_key(module_type, 'id'),
+            course_id=course_id,
+            state=json.dumps({'order': 0}),
+        )
+        for order in range(1, count):
+            student_module.state = json.dumps({'order': order})
+            student_module.save()
+        flush_pending_history()
+        return StudentModuleHistoryExtended.objects.filter(student_module=student_module).count()
+
+    def test_default_policies(self):
+        self.assertEqual(self.save_states('problem'), 4)
+        self.assertEqual(self.save_states('video'), 0)
+
+    @override_settings(STUDENT_MODULE_HISTORY={})
+    def test_without_policies(self):
+        self.assertEqual(self.save_states('problem'), 4)
+        self.assertEqual(self.save_states('video'), 0)
+
+    @ddt.data((0.0, 0), (1.0, 4))
+    @ddt.unpack
+    def test_sampled(self, sample_rate, expected_count):
+        with override_settings(STUDENT_MODULE_HISTORY={'POLICIES': {'video': 'sampled'}, 'SAMPLE_RATE': sample_rate}):
+            self.assertEqual(self.save_states('video'), expected_count)
+
+    @override_settings(STUDENT_MODULE_HISTORY={'POLICIES': {'problem': 'full'}, 'ASYNC': True, 'BATCH_SIZE': 100})
+    def test_async(self):
+        with patch('courseware.tasks.write_student_module_history.delay') as mock_delay:
+            student_module = StudentModuleFactory.create(module_state_key=location('usage_id'), course_id=course_id)
+            student_module.state = json.dumps({'order': 1})
+            student_module.save()
+            self.assertFalse(mock_delay.called)
+            flush_pending_history()
+        self.assertEqual(mock_delay.call_count, 1)
+
+        model_label, rows = mock_delay.call_args[0]
+        self.assertEqual(model_label, u'coursewarehistoryextended.StudentModuleHistoryExtended')
+        self.assertEqual([row['state'] for row in rows], [None, json.dumps({'order': 1})])
+
+    @override_settings(STUDENT_MODULE_HISTORY={'POLICIES': {'problem': 'full'}, 'ASYNC': True, 'BATCH_SIZE': 2})
+    def test_async_writes_batches(self):
+        self.assertEqual(self.save_states('problem', count=3), 3)
+
+
+@attr(shard=1)
+class TestCompactStudentModuleHistory(TestCase):
+    """
+    Tests for the compact_student_module_history management command.
+    """
+    # Tell Django to clean out all databases, not just default
+    multi_db = True
+
+    def setUp(self):
+        super(TestCompactStudentModuleHistory, self).setUp()
+        self.student_modules = [
+            StudentModuleFactory.create(
+                module_type='video',
+                module_state_key=course_id.make_usage_key('video', 'video_{}'.format(index)),
+                course_id=course_id,
+            )
+            for index in range(3)
+        ]
+        for student_module in self.student_modules:
+            for order in range(3):
+                StudentModuleHistoryExtended.objects.create(
+                    student_module=student_module,
+                    created=student_module.modified,
+                    state=json.dumps({'order': order}),
+                )
+
+    def history(self, student_module):
+        """
+        Returns the orders of the history states of the given StudentModule.
+        """
+        return [
+            json.loads(history.state)['order']
+            for history in StudentModuleHistoryExtended.objects.filter(student_module=student_module).order_by('id')
+        ]
+
+    def test_compact(self):
+        call_command('compact_student_module_history', '--module-types', 'video', '--batch-size', '2')
+        for student_module in self.student_modules:
+            self.assertEqual(self.history(student_module), [2])
+
+    def test_dry_run(self):
+        call_command('compact_student_module_history', '--module-types', 'video', '--dry-run')
+        for student_module in self.student_modules:
+            self.assertEqual(self.history(student_module), [0, 1, 2])
+
+    def test_full_history_refused(self):
+        with self.assertRaises(CommandError):
+            call_command('compact_student_module_history', '--module-types', 'video', 'problem')
+        self.assertEqual(StudentModule.objects.count(), 3)
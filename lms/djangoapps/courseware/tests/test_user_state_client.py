@@ -8,6 +8,7 @@ from unittest import skip
 
 from django.test import TestCase
 from edx_user_state_client.tests import UserStateClientTestBase
+from mock import patch
 
 from courseware.tests.factories import UserFactory
 from courseware.user_state_client import DjangoXBlockUserStateClient
@@ -67,3 +68,28 @@ class TestDjangoUserStateClient(UserStateClientTestBase, TestCase):
     @skip("Not supported by DjangoXBlockUserStateClient")
     def test_iter_course_many_users(self):
         pass
+
+
+class TestDjangoUserStateClientCourseQuery(TestDjangoUserStateClient):
+    """
+    Tests of the DjangoUserStateClient backend, reading all of a user's
+    StudentModules in a course with a single query.
+    """
+    __test__ = True
+
+    def setUp(self):
+        super(TestDjangoUserStateClientCourseQuery, self).setUp()
+        patcher = patch.object(DjangoXBlockUserStateClient, 'COURSE_QUERY_MIN_BLOCKS', 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_course_query(self):
+        for block_idx in range(4):
+            self.set(user=0, block=block_idx, state={'position': block_idx})
+
+        with self.assertNumQueries(1):
+            states = list(self.get_many(user=0, blocks=[1, 2]))
+        self.assertEqual(
+            sorted(state.state['position'] for state in states),
+            [1, 2],
+        )
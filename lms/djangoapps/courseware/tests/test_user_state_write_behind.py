@@ -0,0 +1,145 @@
+"""
+Tests for the write-behind buffering of user state updates.
+"""
+import json
+from functools import partial
+
+from django.test import TestCase
+from django.test.utils import override_settings
+from mock import patch
+from nose.plugins.attrib import attr
+from xblock.fields import Scope
+
+from courseware.model_data import DjangoKeyValueStore, FieldDataCache
+from courseware.models import StudentModule
+from courseware.tests.factories import course_id, location
+from courseware.tests.test_model_data import mock_descriptor, mock_field
+from courseware.user_state_client import DjangoXBlockUserStateClient
+from courseware.user_state_write_behind import StudentStateWriteBuffer
+from student.tests.factories import UserFactory
+
+video_location = partial(course_id.make_usage_key, u'video')
+
+
+@attr(shard=1)
+@override_settings(STUDENT_STATE_WRITE_BEHIND={'BLOCK_TYPES': ['video'], 'FLUSH_INTERVAL': 10})
+class TestStudentStateWriteBehind(TestCase):
+    """
+    Tests for buffering the user state updates of the configured block types.
+    """
+    # Tell Django to clean out all databases, not just default
+    multi_db = True
+
+    def setUp(self):
+        super(TestStudentStateWriteBehind, self).setUp()
+        self.buffer = StudentStateWriteBuffer()
+        patcher = patch('courseware.model_data.student_state_write_buffer', self.buffer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Don't start the background flusher.
+        patcher = patch.object(StudentStateWriteBuffer, '_start_flusher')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.user = UserFactory.create()
+        self.kvs = self.create_kvs()
+
+    def create_kvs(self):
+        """
+        Returns a key value store for the user state of a video.
+        """
+        descriptor = mock_descriptor([mock_field(Scope.user_state, 'position')])
+        descriptor.scope_ids = descriptor.scope_ids._replace(usage_id=video_location('video_id'))
+        return DjangoKeyValueStore(FieldDataCache([descriptor], course_id, self.user))
+
+    def key(self, field_name):
+        """
+        Returns the key of the given field of the video's user state.
+        """
+        return DjangoKeyValueStore.Key(Scope.user_state, self.user.id, video_location('video_id'), field_name)
+
+    def stored_state(self):
+        """
+        Returns the state of the video stored in the database, or None.
+        """
+        student_modules = StudentModule.objects.filter(student=self.user, module_state_key=video_location('video_id'))
+        return json.loads(student_modules[0].state) if student_modules else None
+
+    def test_updates_are_coalesced(self):
+        with self.assertNumQueries(0):
+            self.kvs.set(self.key('position'), 10)
+            self.kvs.set(self.key('position'), 20)
+            self.assertEqual(self.kvs.get(self.key('position')), 20)
+            self.kvs.set(self.key('speed'), 2)
+        self.assertIsNone(self.stored_state())
+
+        self.buffer.flush()
+        self.assertEqual(self.stored_state(), {'position': 20, 'speed': 2})
+        self.assertEqual(len(self.buffer), 0)
+
+    def test_flush_expired(self):
+        with patch('courseware.user_state_write_behind.time') as mock_time:
+            mock_time.time.return_value = 100
+            self.kvs.set(self.key('position'), 10)
+            mock_time.time.return_value = 109
+            self.buffer.flush_expired()
+            self.assertIsNone(self.stored_state())
+            mock_time.time.return_value = 110
+            self.buffer.flush_expired()
+        self.assertEqual(self.stored_state(), {'position': 10})
+
+    def test_write_through_fields(self):
+        self.kvs.set(self.key('position'), 10)
+        self.kvs.set(self.key('score'), 1)
+        self.assertEqual(self.stored_state(), {'position': 10, 'score': 1})
+        self.assertEqual(len(self.buffer), 0)
+
+    def test_buffered_state_is_read(self):
+        self.kvs.set(self.key('position'), 10)
+        self.assertEqual(self.create_kvs().get(self.key('position')), 10)
+
+    def test_other_block_types(self):
+        key = DjangoKeyValueStore.Key(Scope.user_state, self.user.id, location('usage_id'), 'a')
+        field_data_cache = FieldDataCache([mock_descriptor([mock_field(Scope.user_state, 'a')])], course_id, self.user)
+        DjangoKeyValueStore(field_data_cache).set(key, 'value')
+        self.assertEqual(len(self.buffer), 0)
+        self.assertEqual(StudentModule.objects.filter(student=self.user).count(), 1)
+
+    def test_failed_updates_are_buffered_again(self):
+        self.kvs.set(self.key('position'), 10)
+        self.kvs.set(self.key('speed'), 2)
+
+        def set_many_and_fail(*args):  # pylint: disable=unused-argument
+            """
+            Buffers a newer update of the video while its state is written, then fails.
+            """
+            self.kvs.set(self.key('position'), 20)
+            raise Exception('Failed to write')
+
+        with patch.object(DjangoXBlockUserStateClient, 'set_many', side_effect=set_many_and_fail):
+            self.buffer.flush()
+        self.assertIsNone(self.stored_state())
+        self.assertEqual(len(self.buffer), 1)
+
+        self.buffer.flush()
+        self.assertEqual(self.stored_state(), {'position': 20, 'speed': 2})
+
+    def test_blocks_being_written_are_skipped(self):
+        self.kvs.set(self.key('position'), 10)
+        set_many = DjangoXBlockUserStateClient.set_many
+
+        def set_many_and_flush(client, username, block_keys_to_state):
+            """
+            Buffers a newer update of the video and flushes again while its state is written.
+            """
+            self.kvs.set(self.key('position'), 20)
+            self.buffer.flush()
+            set_many(client, username, block_keys_to_state)
+
+        with patch.object(DjangoXBlockUserStateClient, 'set_many', autospec=True, side_effect=set_many_and_flush):
+            self.buffer.flush()
+        self.assertEqual(self.stored_state(), {'position': 10})
+        self.assertEqual(len(self.buffer), 1)
+
+        self.buffer.flush()
+        self.assertEqual(self.stored_state(), {'position': 20})
@@ -50,6 +50,13 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
     # Use this sample rate for DataDog events.
     API_DATADOG_SAMPLE_RATE = 0.1
 
+    # Minimum number of requested blocks of a course for which all of the
+    # user's StudentModules in the course are read with a single query.
+    COURSE_QUERY_MIN_BLOCKS = 500
+
+    # Maximum length of a JSON encoded empty dict, allowing for whitespace.
+    MAX_EMPTY_STATE_LENGTH = 8
+
     class ServiceUnavailable(XBlockUserStateClient.ServiceUnavailable):
         """
         This error is raised if the service backing this client is currently unavailable.
@@ -81,10 +88,20 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
         """
         Retrieve the :class:`~StudentModule`s for the supplied ``username`` and ``block_keys``.
 
+        For each course with at least ``COURSE_QUERY_MIN_BLOCKS`` of the requested blocks,
+        such as when rendering a whole course or chapter, all of the user's StudentModules
+        in the course are read with a single query on the (student, course) prefix of the
+        StudentModule indexes, instead of chunked queries on long lists of block keys.
+
         Arguments:
             username (str): The name of the user to load `StudentModule`s for.
             block_keys (list of :class:`~UsageKey`): The set of XBlocks to load data for.
         """
+        if self.user is not None and self.user.username == username:
+            user_filter = {'student': self.user}
+        else:
+            user_filter = {'student__username': username}
+
         course_key_func = attrgetter('course_key')
         by_course = itertools.groupby(
             sorted(block_keys, key=course_key_func),
@@ -92,16 +109,25 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
         )
 
         for course_key, usage_keys in by_course:
-            query = StudentModule.objects.chunked_filter(
-                'module_state_key__in',
-                usage_keys,
-                student__username=username,
-                course_id=course_key,
-            )
+            usage_keys = list(usage_keys)
+            if len(usage_keys) >= self.COURSE_QUERY_MIN_BLOCKS:
+                requested_keys = set(usage_keys)
+                query = StudentModule.objects.filter(course_id=course_key, **user_filter).only(
+                    'module_state_key', 'course_id', 'state', 'modified',
+                )
+            else:
+                requested_keys = None
+                query = StudentModule.objects.chunked_filter(
+                    'module_state_key__in',
+                    usage_keys,
+                    course_id=course_key,
+                    **user_filter
+                )
 
             for student_module in query:
                 usage_key = student_module.module_state_key.map_into_course(student_module.course_id)
-                yield (student_module, usage_key)
+                if requested_keys is None or usage_key in requested_keys:
+                    yield (student_module, usage_key)
 
     def _ddog_increment(self, evt_time, evt_name):
         """
@@ -186,6 +212,31 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
         if scope != Scope.user_state:
             raise ValueError("Only Scope.user_state is supported, not {}".format(scope))
 
+        for usage_key, encoded_state, modified in self.get_many_encoded(username, block_keys):
+            state = json.loads(encoded_state)
+
+            # filter state on fields
+            if fields is not None:
+                state = {
+                    field: state[field]
+                    for field in fields
+                    if field in state
+                }
+            yield XBlockUserState(username, usage_key, state, modified, scope)
+
+    def get_many_encoded(self, username, block_keys):
+        """
+        Retrieve the stored Scope.user_state of the specified XBlock usages, still encoded
+        as JSON, so that callers can defer decoding the state of each block until it is used.
+
+        Arguments:
+            username: The name of the user whose state should be retrieved
+            block_keys ([UsageKey]): A list of UsageKeys identifying which xblock states to load.
+
+        Yields:
+            (usage_key, encoded_state, modified) tuples for each specified UsageKey in
+            block_keys that has stored state.
+        """
         total_block_count = 0
         evt_time = time()
 
@@ -202,7 +253,6 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
                 self._ddog_increment(evt_time, 'get_many.empty_state')
                 continue
 
-            state = json.loads(module.state)
             state_length = len(module.state)
 
             # record this metric before the check for empty state, so that we
@@ -211,7 +261,8 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
 
             # If the state is the empty dict, then it has been deleted, and so
             # conformant UserStateClients should treat it as if it doesn't exist.
-            if state == {}:
+            # Only short states can be empty, so only those need to be decoded.
+            if state_length <= self.MAX_EMPTY_STATE_LENGTH and json.loads(module.state) == {}:
                 continue
 
             # collect statistics for metric reporting
@@ -219,14 +270,7 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
             self._nr_block_stat_accumulate('get_many', usage_key.block_type, 'size', state_length)
             total_block_count += 1
 
-            # filter state on fields
-            if fields is not None:
-                state = {
-                    field: state[field]
-                    for field in fields
-                    if field in state
-                }
-            yield XBlockUserState(username, usage_key, state, module.modified, scope)
+            yield (usage_key, module.state, module.modified)
 
         # The rest of this method exists only to report metrics.
         finish_time = time()
@@ -0,0 +1,212 @@
+"""
+Write-behind buffering of Scope.user_state updates.
+
+Some XBlocks, such as videos saving the current playback position, update
+their user state on almost every AJAX call, each of which is a write to the
+StudentModule table.  When enabled for their block types with the
+STUDENT_STATE_WRITE_BEHIND setting, these updates are held in a buffer in
+the memory of the current process instead, where later updates of the same
+user and block are coalesced with earlier ones.  Each buffered update is
+written once it is older than FLUSH_INTERVAL seconds, either at the end of
+a request, by a background thread, or when the process exits.
+
+Updates that set any of the WRITE_THROUGH_FIELDS, which are relevant to
+grading, are always written immediately, together with any buffered update
+of the same block.
+
+Since the buffer is local to a process, requests served by other processes
+may read state that is up to FLUSH_INTERVAL seconds old.  Only enable this
+for block types whose state can tolerate that, and the loss of the latest
+updates should the process be killed.
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connections
+
+log = logging.getLogger(__name__)
+
+# Default number of seconds an update is held in the buffer.
+DEFAULT_FLUSH_INTERVAL = 10
+
+# Default maximum number of buffered blocks, above which all of them are written.
+DEFAULT_MAX_PENDING = 10000
+
+# Fields of the user state that are always written immediately, since they
+# are relevant to grading.
+DEFAULT_WRITE_THROUGH_FIELDS = (
+    'attempts',
+    'correct_map',
+    'done',
+    'input_state',
+    'score',
+    'student_answers',
+)
+
+
+def _get_setting(name, default):
+    """
+    Returns the value of the given key of the STUDENT_STATE_WRITE_BEHIND setting.
+    """
+    return getattr(settings, 'STUDENT_STATE_WRITE_BEHIND', {}).get(name, default)
+
+
+class StudentStateWriteBuffer(object):
+    """
+    A thread-safe buffer of user state updates, keyed by user and block.
+
+    Each entry holds the fields set since the block's state was last
+    written, and the time of its first buffered update.
+    """
+    def __init__(self):
+        self._pending = {}
+        # Keys of the blocks being written by a flush.
+        self._writing = set()
+        self._lock = threading.Lock()
+        self._flusher = None
+
+    @staticmethod
+    def is_write_behind(usage_key, state):
+        """
+        Returns whether the given update of the user state of the given block
+        may be buffered.
+        """
+        if usage_key.block_type not in _get_setting('BLOCK_TYPES', ()):
+            return False
+        write_through_fields = _get_setting('WRITE_THROUGH_FIELDS', DEFAULT_WRITE_THROUGH_FIELDS)
+        return not any(field_name in write_through_fields for field_name in state)
+
+    def add(self, user, usage_key, state):
+        """
+        Buffers the given fields of the user state of the given block.
+        """
+        with self._lock:
+            entry = self._pending.get((user.id, usage_key))
+            if entry is None:
+                self._pending[(user.id, usage_key)] = (user, dict(state), time.time())
+            else:
+                entry[1].update(state)
+            too_many_pending = len(self._pending) > _get_setting('MAX_PENDING', DEFAULT_MAX_PENDING)
+
+        self._start_flusher()
+        if too_many_pending:
+            self.flush()
+
+    def pop(self, user, usage_key):
+        """
+        Removes and returns the buffered fields of the user state of the given
+        block, or an empty dict if there are none.
+        """
+        with self._lock:
+            entry = self._pending.pop((user.id, usage_key), None)
+        return entry[1] if entry is not None else {}
+
+    def get_pending(self, user, usage_keys):
+        """
+        Returns a dict of the buffered fields of each of the given blocks that
+        have buffered updates for the given user.
+        """
+        with self._lock:
+            return {
+                usage_key: dict(self._pending[(user.id, usage_key)][1])
+                for usage_key in usage_keys
+                if (user.id, usage_key) in self._pending
+            }
+
+    def flush(self, max_age=None):
+        """
+        Writes the buffered updates that are older than max_age seconds, or
+        all of them if max_age is None.
+
+        The blocks being written by a concurrent flush are skipped until that
+        write completes, so that an older state can't overwrite a newer one.
+        The updates that fail to be written are buffered again, under any
+        fields set since, to be retried by a later flush.
+        """
+        # Imported here to avoid a circular import.
+        from courseware.user_state_client import DjangoXBlockUserStateClient
+
+        with self._lock:
+            if max_age is None:
+                flushed_keys = [key for key in self._pending if key not in self._writing]
+            else:
+                buffered_before = time.time() - max_age
+                flushed_keys = [
+                    key for key, entry in self._pending.iteritems()
+                    if entry[2] <= buffered_before and key not in self._writing
+                ]
+            entries = [self._pending.pop(key) for key in flushed_keys]
+            self._writing.update(flushed_keys)
+
+        if not entries:
+            return
+
+        by_user = defaultdict(dict)
+        for key, entry in zip(flushed_keys, entries):
+            by_user[key[0]][key] = entry
+
+        for user_entries in by_user.itervalues():
+            user = next(user_entries.itervalues())[0]
+            block_keys_to_state = {usage_key: state for (_, usage_key), (_, state, _) in user_entries.iteritems()}
+            failed = False
+            try:
+                DjangoXBlockUserStateClient(user).set_many(user.username, block_keys_to_state)
+            except Exception:  # pylint: disable=broad-except
+                failed = True
+                log.exception(
+                    u'Failed to write the buffered state of %d blocks for user %s.',
+                    len(block_keys_to_state), user.username,
+                )
+
+            with self._lock:
+                self._writing.difference_update(user_entries)
+                if failed:
+                    for key, (_, state, buffered_at) in user_entries.iteritems():
+                        newer_entry = self._pending.get(key)
+                        if newer_entry is not None:
+                            state.update(newer_entry[1])
+                        self._pending[key] = (user, state, buffered_at)
+
+    def flush_expired(self):
+        """
+        Writes the buffered updates that are older than the flush interval.
+        """
+        self.flush(max_age=_get_setting('FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL))
+
+    def __len__(self):
+        return len(self._pending)
+
+    def _start_flusher(self):
+        """
+        Starts the background thread writing expired updates, if not started yet.
+        """
+        if self._flusher is not None:
+            return
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(name='student-state-write-behind', target=self._run_flusher)
+            self._flusher.daemon = True
+            self._flusher.start()
+
+    def _run_flusher(self):
+        """
+        Periodically writes the expired updates, until the process exits.
+        """
+        while True:
+            time.sleep(_get_setting('FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL))
+            try:
+                self.flush_expired()
+            finally:
+                # Database connections are per thread, and this one's would otherwise never be closed.
+                for connection in connections.all():
+                    connection.close()
+
+
+# The buffer shared by all UserStateCaches in this process.
+student_state_write_buffer = StudentStateWriteBuffer()  # pylint: disable=invalid-name
+atexit.register(student_state_write_buffer.flush)
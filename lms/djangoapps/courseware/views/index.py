@@ -40,7 +40,7 @@ from util.views import ensure_valid_course_key
 from xmodule.modulestore.django import modulestore
 from xmodule.x_module import STUDENT_VIEW
 
-from ..access import has_access
+from ..access import has_access, prefetch_access
 from ..access_utils import in_preview_mode, is_course_open_for_learner
 from ..courses import get_course_with_access, get_current_child, get_studio_url
 from ..entrance_exams import (
@@ -115,6 +115,7 @@ class CoursewareIndex(View):
                 )
                 self.is_staff = has_access(request.user, 'staff', self.course)
                 self._setup_masquerade_for_effective_user()
+                prefetch_access(self.effective_user, self.course_key)
                 return self._get(request)
         except Exception as exception:  # pylint: disable=broad-except
             return CourseTabView.handle_exceptions(request, self.course, exception)
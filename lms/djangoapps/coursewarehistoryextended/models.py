@@ -17,6 +17,7 @@ from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from courseware.models import BaseStudentModuleHistory, StudentModule
+from courseware.student_module_history import save_history
 from coursewarehistoryextended.fields import UnsignedBigIntAutoField
 
 
@@ -40,18 +41,10 @@ class StudentModuleHistoryExtended(BaseStudentModuleHistory):
     @receiver(post_save, sender=StudentModule)
     def save_history(sender, instance, **kwargs):  # pylint: disable=no-self-argument, unused-argument
         """
-        Checks the instance's module_type, and creates & saves a
-        StudentModuleHistoryExtended entry if the module_type is one that
-        we save.
+        Creates & saves a StudentModuleHistoryExtended entry if the history
+        policy of the instance's module_type says so.
         """
-        if instance.module_type in StudentModuleHistoryExtended.HISTORY_SAVING_TYPES:
-            history_entry = StudentModuleHistoryExtended(student_module=instance,
-                                                         version=None,
-                                                         created=instance.modified,
-                                                         state=instance.state,
-                                                         grade=instance.grade,
-                                                         max_grade=instance.max_grade)
-            history_entry.save()
+        save_history(StudentModuleHistoryExtended, instance)
 
     @receiver(post_delete, sender=StudentModule)
     def delete_history(sender, instance, **kwargs):  # pylint: disable=no-self-argument, unused-argument
@@ -4,7 +4,7 @@ Views handling read (GET) requests for the Discussion tab and inline discussions
 
 import logging
 from contextlib import contextmanager
-from functools import wraps
+from functools import partial, wraps
 from sets import Set
 
 from django.conf import settings
@@ -289,11 +289,13 @@ def single_thread(request, course_key, discussion_id, thread_id):
 
     if request.is_ajax():
         cc_user = cc.User.from_django_user(request.user)
-        user_info = cc_user.to_dict()
+        user_info, thread = cc.utils.perform_concurrently(
+            cc_user.to_dict,
+            partial(_retrieve_thread, request, thread_id),
+        )
         is_staff = has_permission(request.user, 'openclose_thread', course.id)
 
-        thread = _find_thread(request, course, discussion_id=discussion_id, thread_id=thread_id)
-        if not thread:
+        if not thread or not _can_access_thread(request, course, discussion_id, thread):
             raise Http404
 
         with newrelic_function_trace("get_annotated_content_infos"):
@@ -331,8 +333,19 @@ def _find_thread(request, course, discussion_id, thread_id):
     Returns:
         The thread in question if the user can see it, else None.
     """
+    thread = _retrieve_thread(request, thread_id)
+    if not thread or not _can_access_thread(request, course, discussion_id, thread):
+        return None
+    return thread
+
+
+def _retrieve_thread(request, thread_id):
+    """
+    Retrieves the discussion thread with the specified ID from the comments
+    service, or returns None if it does not exist.
+    """
     try:
-        thread = cc.Thread.find(thread_id).retrieve(
+        return cc.Thread.find(thread_id).retrieve(
             with_responses=request.is_ajax(),
             recursive=request.is_ajax(),
             user_id=request.user.id,
@@ -342,10 +355,15 @@ def _find_thread(request, course, discussion_id, thread_id):
     except cc.utils.CommentClientRequestError:
         return None
 
+
+def _can_access_thread(request, course, discussion_id, thread):
+    """
+    Returns whether the requesting user can see the given discussion thread.
+    """
     # Verify that the student has access to this thread if belongs to a course discussion module
     thread_context = getattr(thread, "context", "course")
     if thread_context == "course" and not utils.discussion_category_id_access(course, request.user, discussion_id):
-        return None
+        return False
 
     # verify that the thread belongs to the requesting student's group
     is_moderator = has_permission(request.user, "see_all_cohorts", course.id)
@@ -353,9 +371,9 @@ def _find_thread(request, course, discussion_id, thread_id):
     if is_commentable_divided(course.id, discussion_id, course_discussion_settings) and not is_moderator:
         user_group_id = get_group_id_for_user(request.user, course_discussion_settings)
         if getattr(thread, "group_id", None) is not None and user_group_id != thread.group_id:
-            return None
+            return False
 
-    return thread
+    return True
 
 
 def _create_base_discussion_view_context(request, course_key):
@@ -483,12 +501,14 @@ def user_profile(request, course_key, user_id):
         else:
             profiled_user = cc.User(id=user_id, course_id=course_key)
 
-        threads, page, num_pages = profiled_user.active_threads(query_params)
+        (threads, page, num_pages), user_info = cc.utils.perform_concurrently(
+            partial(profiled_user.active_threads, query_params),
+            cc.User.from_django_user(request.user).to_dict,
+        )
         query_params['page'] = page
         query_params['num_pages'] = num_pages
 
         with newrelic_function_trace("get_metadata_for_threads"):
-            user_info = cc.User.from_django_user(request.user).to_dict()
             annotated_content_info = utils.get_metadata_for_threads(course_key, threads, request.user, user_info)
 
         is_staff = has_permission(request.user, 'openclose_thread', course.id)
@@ -569,12 +589,14 @@ def followed_threads(request, course_key, user_id):
         if group_id is not None:
             query_params['group_id'] = group_id
 
-        paginated_results = profiled_user.subscribed_threads(query_params)
+        paginated_results, user_info = cc.utils.perform_concurrently(
+            partial(profiled_user.subscribed_threads, query_params),
+            cc.User.from_django_user(request.user).to_dict,
+        )
         print "\n \n \n paginated results \n \n \n "
         print paginated_results
         query_params['page'] = paginated_results.page
         query_params['num_pages'] = paginated_results.num_pages
-        user_info = cc.User.from_django_user(request.user).to_dict()
 
         with newrelic_function_trace("get_metadata_for_threads"):
             annotated_content_info = utils.get_metadata_for_threads(
@@ -1,5 +1,6 @@
 import json
 from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from SocketServer import ThreadingMixIn
 from logging import getLogger
 
 logger = getLogger(__name__)
@@ -7,9 +8,21 @@ logger = getLogger(__name__)
 
 class MockCommentServiceRequestHandler(BaseHTTPRequestHandler):
     '''
-    A handler for Comment Service POST requests.
+    A handler for Comment Service GET, POST and PUT requests, which keeps
+    connections alive between requests.
     '''
-    protocol = "HTTP/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        '''
+        Handle a GET request from the client
+        Used by the APIs for comment threads, commentables, comments,
+        subscriptions, commentables, users
+        '''
+        # Log the request
+        # pylint: disable=logging-format-interpolation
+        logger.debug("Comment Service received GET request to path {0}".format(self.path))
+        self._send_response('GET')
 
     def do_POST(self):
         '''
@@ -17,37 +30,17 @@ class MockCommentServiceRequestHandler(BaseHTTPRequestHandler):
         Used by the APIs for comment threads, commentables, comments,
         subscriptions, commentables, users
         '''
-        # Retrieve the POST data into a dict.
-        # It should have been sent in json format
+        # Retrieve the POST data, which the comment client sends form encoded
         length = int(self.headers.getheader('content-length'))
         data_string = self.rfile.read(length)
-        post_dict = json.loads(data_string)
 
         # Log the request
         # pylint: disable=logging-format-interpolation
         logger.debug(
             "Comment Service received POST request {0} to path {1}"
-            .format(json.dumps(post_dict), self.path)
+            .format(data_string, self.path)
         )
-
-        # Every good post has at least an API key
-        if 'X-Edx-Api-Key' in self.headers:
-            response = self.server._response_str
-            # Log the response
-            logger.debug("Comment Service: sending response %s", json.dumps(response))
-
-            # Send a response back to the client
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(response)
-
-        else:
-            # Respond with failure
-            self.send_response(500, 'Bad Request: does not contain API key')
-            self.send_header('Content-type', 'text/plain')
-            self.end_headers()
-            return False
+        self._send_response('POST')
 
     def do_PUT(self):
         '''
@@ -55,28 +48,34 @@ class MockCommentServiceRequestHandler(BaseHTTPRequestHandler):
         Used by the APIs for comment threads, commentables, comments,
         subscriptions, commentables, users
         '''
-        # Retrieve the PUT data into a dict.
-        # It should have been sent in json format
+        # Retrieve the PUT data, which the comment client sends form encoded
         length = int(self.headers.getheader('content-length'))
         data_string = self.rfile.read(length)
-        post_dict = json.loads(data_string)
 
         # Log the request
         # pylint: disable=logging-format-interpolation
         logger.debug(
             "Comment Service received PUT request {0} to path {1}"
-            .format(json.dumps(post_dict), self.path)
+            .format(data_string, self.path)
         )
+        self._send_response('PUT')
 
-        # Every good post has at least an API key
+    def _send_response(self, method):
+        '''
+        Record the request, and send the server's response to it
+        '''
+        self.server.requests.append((method, self.path))
+
+        # Every good request has at least an API key
         if 'X-Edx-Api-Key' in self.headers:
             response = self.server._response_str
             # Log the response
-            logger.debug("Comment Service: sending response %s", json.dumps(response))
+            logger.debug("Comment Service: sending response %s", response)
 
             # Send a response back to the client
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
+            self.send_header('Content-Length', str(len(response)))
             self.end_headers()
             self.wfile.write(response)
 
@@ -84,29 +83,44 @@ class MockCommentServiceRequestHandler(BaseHTTPRequestHandler):
             # Respond with failure
             self.send_response(500, 'Bad Request: does not contain API key')
             self.send_header('Content-type', 'text/plain')
+            self.send_header('Content-Length', '0')
             self.end_headers()
             return False
 
 
-class MockCommentServiceServer(HTTPServer):
+class MockCommentServiceServer(ThreadingMixIn, HTTPServer):
     '''
     A mock Comment Service server that responds
-    to POST requests to localhost.
+    to GET, POST and PUT requests to localhost.
     '''
-    def __init__(self, port_num,
+    daemon_threads = True
+
+    def __init__(self, port_num=0,
                  response={'username': 'new', 'external_id': 1}):
         '''
         Initialize the mock Comment Service server instance.
-        *port_num* is the localhost port to listen to
+        *port_num* is the localhost port to listen to, or 0 to
+            listen to any free port, available as *server_port*
         *response* is a dictionary that will be JSON-serialized
             and sent in response to comment service requests.
         '''
         self._response_str = json.dumps(response)
 
+        # The (method, path) of the requests received, and the number of connections accepted.
+        self.requests = []
+        self.connection_count = 0
+
         handler = MockCommentServiceRequestHandler
         address = ('', port_num)
         HTTPServer.__init__(self, address, handler)
 
+    def verify_request(self, request, client_address):
+        '''
+        Count the connections accepted by the server
+        '''
+        self.connection_count += 1
+        return HTTPServer.verify_request(self, request, client_address)
+
     def shutdown(self):
         '''
         Stop the server and free up the port
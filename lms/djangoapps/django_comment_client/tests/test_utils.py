@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
 import datetime
 import json
+import threading
+from functools import partial
 
 import ddt
 import mock
+from django.core.cache.backends.locmem import LocMemCache
 from django.core.urlresolvers import reverse
 from django.test import RequestFactory, TestCase
+from django.test.utils import override_settings
 from django.utils.timezone import UTC as django_utc
 from mock import Mock, patch
 from nose.plugins.attrib import attr
@@ -18,18 +22,22 @@ from courseware.tabs import get_course_tab_list
 from courseware.tests.factories import InstructorFactory
 from django_comment_client.constants import TYPE_ENTRY, TYPE_SUBCATEGORY
 from django_comment_client.tests.factories import RoleFactory
+from django_comment_client.tests.mock_cs_server.mock_cs_server import MockCommentServiceServer
 from django_comment_client.tests.unicode import UnicodeTestMixin
 from django_comment_client.tests.utils import config_course_discussions, topic_name_to_id
 from django_comment_common.models import CourseDiscussionSettings, ForumsConfig
 from django_comment_common.utils import get_course_discussion_settings, set_course_discussion_settings
 from edxmako import add_lookup
 from lms.djangoapps.teams.tests.factories import CourseTeamFactory
-from lms.lib.comment_client.utils import CommentClientMaintenanceError, perform_request
+from lms.lib.comment_client import settings as comment_client_settings
+from lms.lib.comment_client.thread import Thread
+from lms.lib.comment_client.utils import CommentClientMaintenanceError, perform_concurrently, perform_request
 from openedx.core.djangoapps.content.course_structures.models import CourseStructure
 from openedx.core.djangoapps.course_groups import cohorts
 from openedx.core.djangoapps.course_groups.cohorts import set_course_cohorted
 from openedx.core.djangoapps.course_groups.tests.helpers import CohortFactory, config_course_cohorts
 from openedx.core.djangoapps.util.testing import ContentGroupTestCase
+from request_cache.middleware import RequestCache
 from student.roles import CourseStaffRole
 from student.tests.factories import AdminFactory, CourseEnrollmentFactory, UserFactory
 from xmodule.modulestore import ModuleStoreEnum
@@ -1693,7 +1701,7 @@ class ClientConfigurationTestCase(TestCase):
         with self.assertRaises(CommentClientMaintenanceError):
             perform_request('GET', 'http://www.google.com')
 
-    @patch('requests.request')
+    @patch('lms.lib.comment_client.utils.send_request')
     def test_enabled(self, mock_request):
         """Ensures that requests proceed normally when forums are enabled."""
         config = ForumsConfig.current()
@@ -1710,6 +1718,147 @@ class ClientConfigurationTestCase(TestCase):
         self.assertEqual(result, {})
 
 
+class MockCommentServiceTestCase(TestCase):
+    """
+    Base class of the tests of the comment client against a local stub of the comments service,
+    which responds with RESPONSE.
+    """
+    RESPONSE = {'username': 'user100', 'external_id': '4'}
+
+    def setUp(self):
+        super(MockCommentServiceTestCase, self).setUp()
+        config = ForumsConfig.current()
+        config.enabled = True
+        config.save()
+
+        self.server = MockCommentServiceServer(response=self.RESPONSE)
+        self.addCleanup(self.server.shutdown)
+        server_thread = threading.Thread(target=self.server.serve_forever)
+        server_thread.daemon = True
+        server_thread.start()
+        self.server_url = 'http://127.0.0.1:{}/api/v1'.format(self.server.server_port)
+
+        RequestCache.clear_request_cache()
+        self.addCleanup(RequestCache.clear_request_cache)
+
+
+@ddt.ddt
+class PooledClientTestCase(MockCommentServiceTestCase):
+    """
+    Tests of the connection pooling, concurrency and coalescing of the requests to the comments service.
+    """
+    def test_connections_are_kept_alive(self):
+        for user_id in range(3):
+            self.assertEqual(perform_request('get', '{}/users/{}'.format(self.server_url, user_id)), self.RESPONSE)
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(self.server.connection_count, 1)
+
+    def test_config_is_read_once_per_request(self):
+        with patch.object(ForumsConfig, 'current', wraps=ForumsConfig.current) as mock_current:
+            perform_request('get', self.server_url + '/users/1')
+            perform_request('get', self.server_url + '/users/2')
+            self.assertEqual(mock_current.call_count, 1)
+
+            # Saving the configuration makes the next requests read it again.
+            ForumsConfig(enabled=False).save()
+            with self.assertRaises(CommentClientMaintenanceError):
+                perform_request('get', self.server_url + '/users/3')
+            self.assertEqual(mock_current.call_count, 2)
+
+    @override_settings(COMMENTS_SERVICE_CLIENT={'COALESCE_GETS': True})
+    def test_identical_gets_are_coalesced(self):
+        user_url = self.server_url + '/users/1'
+        first_response = perform_request('get', user_url, {'complete': True})
+        first_response['username'] = 'changed'
+        self.assertEqual(perform_request('get', user_url, {'complete': True}), self.RESPONSE)
+        perform_request('get', user_url, {'complete': False})
+        self.assertEqual(len(self.server.requests), 2)
+
+        # Any change to the comments service makes the earlier responses obsolete.
+        perform_request('post', self.server_url + '/users/1/read', {'source_id': 'thread'})
+        perform_request('get', user_url, {'complete': True})
+        self.assertEqual([method for method, __ in self.server.requests], ['GET', 'GET', 'POST', 'GET'])
+
+    @ddt.data(1, 4)
+    def test_perform_concurrently(self, max_workers):
+        with override_settings(COMMENTS_SERVICE_CLIENT={'MAX_WORKERS': max_workers}):
+            results = perform_concurrently(*[
+                partial(perform_request, 'get', '{}/users/{}'.format(self.server_url, user_id))
+                for user_id in range(5)
+            ])
+        self.assertEqual(results, [self.RESPONSE] * 5)
+        self.assertItemsEqual(
+            [path.split('?')[0] for __, path in self.server.requests],
+            ['/api/v1/users/{}'.format(user_id) for user_id in range(5)],
+        )
+
+    @override_settings(COMMENTS_SERVICE_CLIENT={'MAX_WORKERS': 4})
+    def test_perform_concurrently_raises_errors(self):
+        ForumsConfig(enabled=False).save()
+        with self.assertRaises(CommentClientMaintenanceError):
+            perform_concurrently(
+                lambda: perform_request('get', self.server_url + '/users/1'),
+                lambda: perform_request('get', self.server_url + '/users/2'),
+            )
+
+
+@override_settings(COMMENTS_SERVICE_CLIENT={'CACHE_TIMEOUTS': {'thread': 60, 'thread_list': 60}})
+class CommentsServiceCacheTestCase(MockCommentServiceTestCase):
+    """
+    Tests of the cache of the responses of the comments service.
+    """
+    COURSE_ID = 'course-v1:edX+DemoX+Demo_Course'
+    RESPONSE = {'title': 'Thread', 'course_id': COURSE_ID}
+
+    def setUp(self):
+        super(CommentsServiceCacheTestCase, self).setUp()
+        for patcher in [
+                patch('lms.lib.comment_client.cache.cache', LocMemCache('comment_client', {})),
+                patch.object(comment_client_settings, 'PREFIX', self.server_url),
+                patch.object(Thread, 'base_url', self.server_url + '/threads'),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def assert_requests(self, *methods):
+        """
+        Asserts that the stub of the comments service received requests of the given methods.
+        """
+        self.assertEqual([method for method, __ in self.server.requests], list(methods))
+
+    def test_thread_is_cached(self):
+        Thread(id='thread').retrieve(mark_as_read=False)
+        thread = Thread(id='thread').retrieve(mark_as_read=False)
+        self.assertEqual(thread.title, 'Thread')
+        self.assert_requests('GET')
+
+    def test_thread_marked_as_read_is_not_cached(self):
+        Thread(id='thread').retrieve()
+        Thread(id='thread').retrieve()
+        self.assert_requests('GET', 'GET')
+
+    @override_settings(COMMENTS_SERVICE_CLIENT={'CACHE_TIMEOUTS': {'thread_list': 60}})
+    def test_endpoint_without_timeout_is_not_cached(self):
+        Thread(id='thread').retrieve(mark_as_read=False)
+        Thread(id='thread').retrieve(mark_as_read=False)
+        self.assert_requests('GET', 'GET')
+
+    def test_saving_thread_invalidates_it(self):
+        Thread(id='thread').retrieve(mark_as_read=False)
+        Thread(id='thread', course_id=self.COURSE_ID, title='Changed').save()
+        Thread(id='thread').retrieve(mark_as_read=False)
+        self.assert_requests('GET', 'PUT', 'GET')
+
+    def test_new_thread_invalidates_thread_list(self):
+        Thread.search({'course_id': self.COURSE_ID, 'user_id': '1'})
+        Thread.search({'course_id': self.COURSE_ID, 'user_id': '1'})
+        self.assert_requests('GET')
+
+        Thread(course_id=self.COURSE_ID, commentable_id='topic', title='New').save()
+        Thread.search({'course_id': self.COURSE_ID, 'user_id': '1'})
+        self.assert_requests('GET', 'POST', 'GET')
+
+
 def set_discussion_division_settings(
         course_key, enable_cohorts=False, always_divide_inline_discussions=False,
         divided_discussions=[], division_scheme=CourseDiscussionSettings.COHORT
@@ -400,6 +400,22 @@ class PersistentSubsectionGrade(DeleteGradesMixin, TimeStampedModel):
             course_id=course_key,
         )
 
+    @classmethod
+    def bulk_read_grades_for_users(cls, user_ids, course_key, usage_keys):
+        """
+        Reads the grades for the given subsections of several users in one query.
+
+        Arguments:
+            user_ids: The users associated with the desired grades
+            course_key: The course identifier for the desired grades
+            usage_keys: The locations of the subsections associated with the desired grades
+        """
+        return cls.objects.select_related('visible_blocks').filter(
+            user_id__in=user_ids,
+            course_id=course_key,
+            usage_key__in=usage_keys,
+        )
+
     @classmethod
     def update_or_create_grade(cls, **params):
         """
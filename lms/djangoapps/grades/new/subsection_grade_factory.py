@@ -21,9 +21,12 @@ class SubsectionGradeFactory(object):
     """
     Factory for Subsection Grades.
     """
-    def __init__(self, student, course=None, course_structure=None, course_data=None):
+    def __init__(self, student, course=None, course_structure=None, course_data=None, csm_scores=None):
         self.student = student
         self.course_data = course_data or CourseData(student, course=course, structure=course_structure)
+        if csm_scores is not None:
+            # Scores prefetched by the caller, e.g. in bulk for several students.
+            self._csm_scores = csm_scores
 
         self._cached_subsection_grades = None
         self._unsaved_subsection_grades = OrderedDict()
@@ -71,32 +74,51 @@ class SubsectionGradeFactory(object):
         # subsection grades.
         self._log_event(log.warning, u"update, subsection: {}".format(subsection.location), subsection)
 
+        saved_grade_model = None
+        if only_if_higher and should_persist_grades(self.course_data.course_key):
+            try:
+                saved_grade_model = PersistentSubsectionGrade.read_grade(self.student.id, subsection.location)
+            except PersistentSubsectionGrade.DoesNotExist:
+                pass
+
+        subsection_grade, needs_save = self.calculate_update(subsection, only_if_higher, saved_grade_model)
+        if needs_save:
+            grade_model = subsection_grade.update_or_create_model(self.student)
+            self._update_saved_subsection_grade(subsection.location, grade_model)
+
+        return subsection_grade
+
+    def calculate_update(self, subsection, only_if_higher=None, saved_grade_model=None):
+        """
+        Recalculates the SubsectionGrade object for the student and subsection,
+        without saving it.
+
+        saved_grade_model is the student's currently persisted grade for the
+        subsection, if any; it is only consulted when only_if_higher is set.
+
+        Returns a (subsection_grade, needs_save) tuple, where needs_save
+        indicates whether the returned grade should be persisted.
+        """
         calculated_grade = SubsectionGrade(subsection).init_from_structure(
             self.student, self.course_data.structure, self._submissions_scores, self._csm_scores,
         )
 
-        if should_persist_grades(self.course_data.course_key):
-            if only_if_higher:
-                try:
-                    grade_model = PersistentSubsectionGrade.read_grade(self.student.id, subsection.location)
-                except PersistentSubsectionGrade.DoesNotExist:
-                    pass
-                else:
-                    orig_subsection_grade = SubsectionGrade(subsection).init_from_model(
-                        self.student, grade_model, self.course_data.structure, self._submissions_scores, self._csm_scores,
-                    )
-                    if not is_score_higher_or_equal(
-                            orig_subsection_grade.graded_total.earned,
-                            orig_subsection_grade.graded_total.possible,
-                            calculated_grade.graded_total.earned,
-                            calculated_grade.graded_total.possible,
-                    ):
-                        return orig_subsection_grade
-
-            grade_model = calculated_grade.update_or_create_model(self.student)
-            self._update_saved_subsection_grade(subsection.location, grade_model)
-
-        return calculated_grade
+        if not should_persist_grades(self.course_data.course_key):
+            return calculated_grade, False
+
+        if only_if_higher and saved_grade_model is not None:
+            orig_subsection_grade = SubsectionGrade(subsection).init_from_model(
+                self.student, saved_grade_model, self.course_data.structure, self._submissions_scores, self._csm_scores,
+            )
+            if not is_score_higher_or_equal(
+                    orig_subsection_grade.graded_total.earned,
+                    orig_subsection_grade.graded_total.possible,
+                    calculated_grade.graded_total.earned,
+                    calculated_grade.graded_total.possible,
+            ):
+                return orig_subsection_grade, False
+
+        return calculated_grade, True
 
     @lazy
     def _csm_scores(self):
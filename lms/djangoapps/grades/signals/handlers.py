@@ -1,6 +1,8 @@
 """
 Grades related signals.
 """
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 from logging import getLogger
 
@@ -24,7 +26,11 @@ from util.date_utils import to_timestamp
 from ..constants import ScoreDatabaseTableEnum
 from ..new.course_grade_factory import CourseGradeFactory
 from ..scores import weighted_score
-from ..tasks import RECALCULATE_GRADE_DELAY, recalculate_subsection_grade_v3
+from ..tasks import (
+    RECALCULATE_GRADE_DELAY,
+    recalculate_subsection_grade_v3,
+    recalculate_subsection_grades_for_course
+)
 from .signals import (
     PROBLEM_RAW_SCORE_CHANGED,
     PROBLEM_WEIGHTED_SCORE_CHANGED,
@@ -38,6 +44,13 @@ log = getLogger(__name__)
 GRADES_RESCORE_EVENT_TYPE = 'edx.grades.problem.rescored'
 PROBLEM_SUBMITTED_EVENT_TYPE = 'edx.grades.problem.submitted'
 
+# Maximum number of users whose coalesced subsection updates share a task.
+SUBSECTION_UPDATE_BATCH_SIZE = 100
+
+# Pending subsection updates collected by coalesce_subsection_updates,
+# local to the thread that opened the context.
+_coalesced_updates = threading.local()  # pylint: disable=invalid-name
+
 
 @receiver(score_set)
 def submissions_score_set_handler(sender, **kwargs):  # pylint: disable=unused-argument
@@ -132,6 +145,64 @@ def disconnect_submissions_signal_receiver(signal):
         signal.connect(handler)
 
 
+@contextmanager
+def coalesce_subsection_updates(batch_size=SUBSECTION_UPDATE_BATCH_SIZE):
+    """
+    Context manager for callers that change many scores at once, such as
+    rescoring or overriding a problem for every learner in a course.
+
+    Within the context, PROBLEM_WEIGHTED_SCORE_CHANGED no longer enqueues one
+    recalculate_subsection_grade_v3 task per score.  The pending updates are
+    instead grouped by course, de-duplicated per (user, scored block) and, when
+    the context exits, enqueued as recalculate_subsection_grades_for_course
+    tasks covering at most batch_size users each.  Score changes made within
+    the context must be committed by the time it exits.
+
+    Nested uses join the outermost context.
+    """
+    if getattr(_coalesced_updates, 'pending', None) is not None:
+        yield
+        return
+
+    _coalesced_updates.pending = OrderedDict()
+    try:
+        yield
+    finally:
+        pending, _coalesced_updates.pending = _coalesced_updates.pending, None
+        _enqueue_coalesced_updates(pending, batch_size)
+
+
+def _enqueue_coalesced_updates(pending, batch_size):
+    """
+    Enqueues the bulk subsection update tasks for the given pending updates,
+    nested as {course_id: {user_id: {usage_id: only_if_higher}}}.
+    """
+    for course_id, updates_by_user in pending.iteritems():
+        user_ids = updates_by_user.keys()
+        for offset in range(0, len(user_ids), batch_size):
+            updates = [
+                dict(user_id=user_id, usage_id=usage_id, only_if_higher=only_if_higher)
+                for user_id in user_ids[offset:offset + batch_size]
+                for usage_id, only_if_higher in updates_by_user[user_id].iteritems()
+            ]
+            result = recalculate_subsection_grades_for_course.apply_async(
+                kwargs=dict(
+                    course_id=course_id,
+                    updates=updates,
+                    event_transaction_id=unicode(get_event_transaction_id()),
+                    event_transaction_type=unicode(get_event_transaction_type()),
+                ),
+                countdown=RECALCULATE_GRADE_DELAY,
+            )
+            log.info(
+                u'Grades: Request async bulk calculation of {} subsection updates for course {}. Task [{}]'.format(
+                    len(updates),
+                    course_id,
+                    getattr(result, 'id', 'N/A'),
+                )
+            )
+
+
 @receiver(SCORE_PUBLISHED)
 def score_published_handler(sender, block, user, raw_earned, raw_possible, only_if_higher, **kwargs):  # pylint: disable=unused-argument
     """
@@ -214,6 +285,17 @@ def enqueue_subsection_update(sender, **kwargs):  # pylint: disable=unused-argum
     enqueueing a subsection update operation to occur asynchronously.
     """
     _emit_event(kwargs)
+
+    pending = getattr(_coalesced_updates, 'pending', None)
+    if pending is not None:
+        user_updates = pending.setdefault(
+            unicode(kwargs['course_id']), OrderedDict()
+        ).setdefault(kwargs['user_id'], OrderedDict())
+        usage_id = unicode(kwargs['usage_id'])
+        # A score change that is not only_if_higher wins over one that is.
+        user_updates[usage_id] = bool(user_updates.get(usage_id, True) and kwargs.get('only_if_higher'))
+        return
+
     result = recalculate_subsection_grade_v3.apply_async(
         kwargs=dict(
             user_id=kwargs['user_id'],
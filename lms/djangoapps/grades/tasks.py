@@ -2,6 +2,7 @@
 This module contains tasks for asynchronous execution of grade updates.
 """
 
+from collections import OrderedDict
 from logging import getLogger
 
 import six
@@ -15,10 +16,11 @@ from django.db.utils import DatabaseError
 from opaque_keys.edx.keys import CourseKey, UsageKey
 from opaque_keys.edx.locator import CourseLocator
 
-from courseware.model_data import get_score
+from courseware.model_data import ScoresClient, get_score
 from lms.djangoapps.course_blocks.api import get_course_blocks
 from lms.djangoapps.courseware import courses
 from lms.djangoapps.grades.config.models import ComputeGradesSetting
+from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
 from openedx.core.djangoapps.monitoring_utils import set_custom_metric, set_custom_metrics_for_course_key
 from student.models import CourseEnrollment
 from submissions import api as sub_api
@@ -29,8 +31,11 @@ from xmodule.modulestore.django import modulestore
 from .config.waffle import ESTIMATE_FIRST_ATTEMPTED, waffle
 from .constants import ScoreDatabaseTableEnum
 from .exceptions import DatabaseNotReadyError
+from .models import PersistentSubsectionGrade
 from .new.course_grade_factory import CourseGradeFactory
+from .new.subsection_grade import SubsectionGrade
 from .new.subsection_grade_factory import SubsectionGradeFactory
+from .scores import possibly_scored
 from .signals.signals import SUBSECTION_SCORE_CHANGED
 from .transformer import GradesTransformer
 
@@ -194,6 +199,57 @@ def _recalculate_subsection_grade(self, **kwargs):
         raise self.retry(kwargs=kwargs, exc=exc)
 
 
+@task(bind=True, base=_BaseTask, default_retry_delay=30, routing_key=settings.RECALCULATE_GRADES_ROUTING_KEY)
+def recalculate_subsection_grades_for_course(self, **kwargs):
+    """
+    Updates the saved subsection grades affected by a batch of score
+    changes within a single course.
+
+    Unlike recalculate_subsection_grade_v3, the course structure is
+    collected once for the whole batch, the students' scores are
+    prefetched in bulk and newly created grades are inserted together.
+    These tasks are queued by grades.signals.handlers.coalesce_subsection_updates,
+    after the score changes have been committed, so the database is not
+    re-checked for each score.
+
+    Keyword Arguments:
+        course_id (string): identifying the course
+        updates (list): of dicts with the user_id (int), usage_id (string)
+            and only_if_higher (boolean) of each changed score.
+        event_transaction_id (string): uuid identifying the current
+            event transaction.
+        event_transaction_type (string): human-readable type of the
+            event at the root of the current event transaction.
+    """
+    try:
+        course_key = CourseLocator.from_string(kwargs['course_id'])
+        set_custom_metrics_for_course_key(course_key)
+        set_custom_metric('num_subsection_updates', len(kwargs['updates']))
+
+        set_event_transaction_id(kwargs.get('event_transaction_id'))
+        set_event_transaction_type(kwargs.get('event_transaction_type'))
+
+        _update_subsection_grades_in_bulk(
+            course_key,
+            [
+                (
+                    update['user_id'],
+                    UsageKey.from_string(update['usage_id']).replace(course_key=course_key),
+                    update['only_if_higher'],
+                )
+                for update in kwargs['updates']
+            ],
+        )
+    except Exception as exc:   # pylint: disable=broad-except
+        if not isinstance(exc, KNOWN_RETRY_ERRORS):
+            log.info("Grades: unexpected failure in bulk subsection update: {}. task id: {}. course: {}".format(
+                repr(exc),
+                self.request.id,
+                kwargs.get('course_id'),
+            ))
+        raise self.retry(kwargs=kwargs, exc=exc)
+
+
 def _has_db_updated_with_new_score(self, scored_block_usage_key, **kwargs):
     """
     Returns whether the database has been updated with the
@@ -270,6 +326,104 @@ def _update_subsection_grades(course_key, scored_block_usage_key, only_if_higher
                 )
 
 
+def _update_subsection_grades_in_bulk(course_key, updates):
+    """
+    A helper function to update, for several users at once, the
+    subsection grades in the database for each subsection containing
+    a changed scored block, and to signal that those subsection grades
+    were updated.
+
+    Arguments:
+        course_key (CourseKey): the course of every update.
+        updates (list): of (user_id, scored_block_usage_key, only_if_higher)
+            tuples.
+    """
+    # Coalesce the updates per user and scored block.  A score change
+    # that is not only_if_higher wins over one that is.
+    updates_by_user = OrderedDict()
+    for user_id, scored_block_usage_key, only_if_higher in updates:
+        user_updates = updates_by_user.setdefault(user_id, OrderedDict())
+        user_updates[scored_block_usage_key] = bool(
+            user_updates.get(scored_block_usage_key, True) and only_if_higher
+        )
+
+    students = User.objects.in_bulk(updates_by_user.keys())
+    store = modulestore()
+    with store.bulk_operations(course_key):
+        course = store.get_course(course_key, depth=0)
+        course_usage_key = store.make_course_usage_key(course_key)
+        collected_block_structure = get_block_structure_manager(course_key).get_collected()
+
+        scorable_locations = [
+            block_key for block_key in collected_block_structure if possibly_scored(block_key)
+        ]
+        csm_scores = ScoresClient.create_for_users(course_key, students.keys(), scorable_locations)
+        subsection_usage_keys = set().union(*(
+            collected_block_structure.get_transformer_block_field(
+                scored_block_usage_key, GradesTransformer, 'subsections', set(),
+            )
+            for user_updates in updates_by_user.itervalues()
+            for scored_block_usage_key in user_updates
+        ))
+        saved_grades = {
+            (grade.user_id, grade.full_usage_key): grade
+            for grade in PersistentSubsectionGrade.bulk_read_grades_for_users(
+                students.keys(), course_key, subsection_usage_keys,
+            )
+        }
+
+        grades_to_create = []
+        changed_grades = []
+        for user_id, user_updates in updates_by_user.iteritems():
+            student = students.get(user_id)
+            if student is None:
+                log.warning(u"Grades: skipping bulk subsection update for unknown user {}".format(user_id))
+                continue
+
+            course_structure = get_course_blocks(
+                student, course_usage_key, collected_block_structure=collected_block_structure,
+            )
+            subsection_grade_factory = SubsectionGradeFactory(
+                student, course, course_structure, csm_scores=csm_scores[user_id],
+            )
+
+            subsections_to_update = OrderedDict()
+            for scored_block_usage_key, only_if_higher in user_updates.iteritems():
+                for subsection_usage_key in course_structure.get_transformer_block_field(
+                        scored_block_usage_key, GradesTransformer, 'subsections', set(),
+                ):
+                    subsections_to_update[subsection_usage_key] = (
+                        subsections_to_update.get(subsection_usage_key, True) and only_if_higher
+                    )
+
+            for subsection_usage_key, only_if_higher in subsections_to_update.iteritems():
+                if subsection_usage_key not in course_structure:
+                    continue
+                saved_grade = saved_grades.get((user_id, subsection_usage_key))
+                subsection_grade, needs_save = subsection_grade_factory.calculate_update(
+                    course_structure[subsection_usage_key],
+                    only_if_higher,
+                    saved_grade,
+                )
+                if needs_save:
+                    if saved_grade is None:
+                        grades_to_create.append((student, subsection_grade))
+                    else:
+                        subsection_grade.update_or_create_model(student)
+                changed_grades.append((student, course_structure, subsection_grade))
+
+        SubsectionGrade.bulk_create_models_for_students(grades_to_create, course_key)
+
+        for student, course_structure, subsection_grade in changed_grades:
+            SUBSECTION_SCORE_CHANGED.send(
+                sender=None,
+                course=course,
+                course_structure=course_structure,
+                user=student,
+                subsection_grade=subsection_grade,
+            )
+
+
 def _course_task_args(course_key, **kwargs):
     """
     Helper function to generate course-grade task args.
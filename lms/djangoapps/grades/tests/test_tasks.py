@@ -14,17 +14,21 @@ from django.conf import settings
 from django.db.utils import IntegrityError
 from mock import MagicMock, patch
 
+from courseware.model_data import set_score
 from lms.djangoapps.grades.config.models import PersistentGradesEnabledFlag
 from lms.djangoapps.grades.constants import ScoreDatabaseTableEnum
 from lms.djangoapps.grades.models import PersistentCourseGrade, PersistentSubsectionGrade
+from lms.djangoapps.grades.signals.handlers import coalesce_subsection_updates
 from lms.djangoapps.grades.signals.signals import PROBLEM_WEIGHTED_SCORE_CHANGED
 from lms.djangoapps.grades.tasks import (
     RECALCULATE_GRADE_DELAY,
     _course_task_args,
     compute_all_grades_for_course,
     compute_grades_for_course_v2,
-    recalculate_subsection_grade_v3
+    recalculate_subsection_grade_v3,
+    recalculate_subsection_grades_for_course
 )
+from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
 from openedx.core.djangoapps.content.block_structure.exceptions import BlockStructureNotFound
 from student.models import CourseEnrollment, anonymous_id_for_user
 from student.tests.factories import UserFactory
@@ -374,6 +378,112 @@ class RecalculateSubsectionGradeTest(HasCourseWithProblemsMixin, ModuleStoreTest
         self.assertFalse(mock_retry.called)
 
 
+@patch.dict(settings.FEATURES, {'PERSISTENT_GRADES_ENABLED_FOR_ALL_TESTS': False})
+class RecalculateSubsectionGradesForCourseTest(HasCourseWithProblemsMixin, ModuleStoreTestCase):
+    """
+    Ensures that coalesced subsection grade updates are queued and applied in bulk.
+    """
+    ENABLED_SIGNALS = ['course_published', 'pre_publish']
+
+    def setUp(self):
+        super(RecalculateSubsectionGradesForCourseTest, self).setUp()
+        self.user = UserFactory()
+        self.other_user = UserFactory()
+        PersistentGradesEnabledFlag.objects.create(enabled_for_all_courses=True, enabled=True)
+        self.set_up_course()
+
+    def _send_score_changed(self, user, only_if_higher=None):
+        """
+        Sends the PROBLEM_WEIGHTED_SCORE_CHANGED signal for the given user.
+        """
+        send_args = dict(self.problem_weighted_score_changed_kwargs)
+        send_args.update(user_id=user.id, only_if_higher=only_if_higher)
+        PROBLEM_WEIGHTED_SCORE_CHANGED.send(sender=None, **send_args)
+
+    def _apply_bulk_update(self, users, only_if_higher=False):
+        """
+        Runs the bulk recalculation task for the problem and the given users.
+        """
+        recalculate_subsection_grades_for_course.apply(kwargs=dict(
+            course_id=unicode(self.course.id),
+            updates=[
+                dict(user_id=user.id, usage_id=unicode(self.problem.location), only_if_higher=only_if_higher)
+                for user in users
+            ],
+        ))
+
+    def _saved_grade(self, user):
+        """
+        Returns the persisted grade of the user for the sequential.
+        """
+        return PersistentSubsectionGrade.read_grade(user.id, self.sequential.location)
+
+    @patch('lms.djangoapps.grades.tasks.recalculate_subsection_grade_v3.apply_async')
+    @patch('lms.djangoapps.grades.tasks.recalculate_subsection_grades_for_course.apply_async')
+    def test_coalesced_updates_are_queued_in_bulk(self, mock_bulk_apply, mock_single_apply):
+        with coalesce_subsection_updates():
+            self._send_score_changed(self.user, only_if_higher=True)
+            self._send_score_changed(self.user, only_if_higher=False)
+            self._send_score_changed(self.other_user, only_if_higher=True)
+            with coalesce_subsection_updates():
+                self._send_score_changed(self.other_user, only_if_higher=True)
+            self.assertFalse(mock_bulk_apply.called)
+
+        self.assertFalse(mock_single_apply.called)
+        self.assertEqual(mock_bulk_apply.call_count, 1)
+        self.assertEqual(mock_bulk_apply.call_args[1]['countdown'], RECALCULATE_GRADE_DELAY)
+        task_kwargs = mock_bulk_apply.call_args[1]['kwargs']
+        self.assertEqual(task_kwargs['course_id'], unicode(self.course.id))
+        self.assertEqual(task_kwargs['updates'], [
+            dict(user_id=self.user.id, usage_id=unicode(self.problem.location), only_if_higher=False),
+            dict(user_id=self.other_user.id, usage_id=unicode(self.problem.location), only_if_higher=True),
+        ])
+
+    @patch('lms.djangoapps.grades.tasks.recalculate_subsection_grades_for_course.apply_async')
+    def test_coalesced_updates_are_batched_by_user(self, mock_bulk_apply):
+        with coalesce_subsection_updates(batch_size=1):
+            self._send_score_changed(self.user)
+            self._send_score_changed(self.other_user)
+
+        self.assertEqual(mock_bulk_apply.call_count, 2)
+        self.assertEqual(
+            [call[1]['kwargs']['updates'][0]['user_id'] for call in mock_bulk_apply.call_args_list],
+            [self.user.id, self.other_user.id],
+        )
+
+    def test_grades_are_persisted_for_all_users(self):
+        set_score(self.user.id, self.problem.location, 1, 2)
+        set_score(self.other_user.id, self.problem.location, 2, 2)
+
+        self._apply_bulk_update([self.user, self.other_user])
+
+        self.assertEqual(self._saved_grade(self.user).earned_all, 1.0)
+        self.assertEqual(self._saved_grade(self.other_user).earned_all, 2.0)
+
+        # Existing grades are updated in place
+        set_score(self.user.id, self.problem.location, 2, 2)
+        self._apply_bulk_update([self.user])
+        self.assertEqual(self._saved_grade(self.user).earned_all, 2.0)
+
+    def test_only_if_higher(self):
+        set_score(self.user.id, self.problem.location, 2, 2)
+        self._apply_bulk_update([self.user])
+
+        set_score(self.user.id, self.problem.location, 1, 2)
+        self._apply_bulk_update([self.user], only_if_higher=True)
+        self.assertEqual(self._saved_grade(self.user).earned_all, 2.0)
+
+    @patch('lms.djangoapps.grades.signals.signals.SUBSECTION_SCORE_CHANGED.send')
+    def test_collected_structure_shared_across_users(self, mock_subsection_signal):
+        with patch(
+            'lms.djangoapps.grades.tasks.get_block_structure_manager',
+            wraps=get_block_structure_manager,
+        ) as mock_get_manager:
+            self._apply_bulk_update([self.user, self.other_user])
+        self.assertEqual(mock_get_manager.call_count, 1)
+        self.assertEqual(mock_subsection_signal.call_count, 2)
+
+
 @ddt.ddt
 class ComputeGradesForCourseTest(HasCourseWithProblemsMixin, ModuleStoreTestCase):
     """
@@ -6,6 +6,7 @@ Does not include any access control, be sure to check access before calling.
 
 import json
 import logging
+from collections import OrderedDict
 from datetime import datetime
 
 import pytz
@@ -43,8 +44,35 @@ class EmailEnrollmentState(object):
     """ Store the complete enrollment state of an email in a class """
     def __init__(self, course_id, email):
         exists_user = User.objects.filter(email=email).exists()
-        if exists_user:
-            user = User.objects.get(email=email)
+        user = User.objects.get(email=email) if exists_user else None
+        ceas = CourseEnrollmentAllowed.objects.filter(course_id=course_id, email=email).all()
+        cea = ceas[0] if ceas.exists() else None
+        self._set_state(course_id, user, cea)
+
+    @classmethod
+    def bulk_get(cls, course_id, emails):
+        """
+        Returns the enrollment states of the given emails, by email, reading
+        the users, enrollments and allowed enrollments of all of them at once.
+        """
+        users = _get_users_by_email(emails)
+        ceas = _get_allowed_enrollments_by_email(course_id, emails)
+        CourseEnrollment.bulk_fetch_enrollment_states(users.values(), course_id)
+        states = {}
+        for email in emails:
+            state = cls.__new__(cls)
+            state._set_state(  # pylint: disable=protected-access
+                course_id, users.get(email.lower()), ceas.get(email.lower())
+            )
+            states[email] = state
+        return states
+
+    def _set_state(self, course_id, user, cea):
+        """
+        Sets the state from the user of the email and the CourseEnrollmentAllowed
+        of the email in the course, which are None if they do not exist.
+        """
+        if user is not None:
             mode, is_active = CourseEnrollment.enrollment_mode_for_user(user, course_id)
             # is_active is `None` if the user is not enrolled in the course
             exists_ce = is_active is not None and is_active
@@ -53,11 +81,10 @@ class EmailEnrollmentState(object):
             mode = None
             exists_ce = False
             full_name = None
-        ceas = CourseEnrollmentAllowed.objects.filter(course_id=course_id, email=email).all()
-        exists_allowed = ceas.exists()
-        state_auto_enroll = exists_allowed and ceas[0].auto_enroll
+        exists_allowed = cea is not None
+        state_auto_enroll = exists_allowed and cea.auto_enroll
 
-        self.user = exists_user
+        self.user = user is not None
         self.enrollment = exists_ce
         self.allowed = exists_allowed
         self.auto_enroll = bool(state_auto_enroll)
@@ -100,6 +127,24 @@ def get_user_email_language(user):
     return UserPreference.get_value(user, LANGUAGE_KEY)
 
 
+def _get_users_by_email(emails):
+    """
+    Returns the users with the given emails, with their profiles, by lowercased
+    email.
+    """
+    users = User.objects.filter(email__in=emails).select_related('profile')
+    return {user.email.lower(): user for user in users}
+
+
+def _get_allowed_enrollments_by_email(course_id, emails):
+    """
+    Returns the CourseEnrollmentAllowed of the given emails in the course, by
+    lowercased email.
+    """
+    ceas = CourseEnrollmentAllowed.objects.filter(course_id=course_id, email__in=emails)
+    return {cea.email.lower(): cea for cea in ceas}
+
+
 def enroll_email(course_id, student_email, auto_enroll=False, email_students=False, email_params=None, language=None):
     """
     Enroll a student by email.
@@ -134,25 +179,107 @@ def enroll_email(course_id, student_email, auto_enroll=False, email_students=Fal
             course_mode = previous_state.mode
 
         enrollment_obj = CourseEnrollment.enroll_by_email(student_email, course_id, course_mode)
-        if email_students:
-            email_params['message'] = 'enrolled_enroll'
-            email_params['email_address'] = student_email
-            email_params['full_name'] = previous_state.full_name
-            send_mail_to_student(student_email, email_params, language=language)
     else:
         cea, _ = CourseEnrollmentAllowed.objects.get_or_create(course_id=course_id, email=student_email)
         cea.auto_enroll = auto_enroll
         cea.save()
-        if email_students:
-            email_params['message'] = 'allowed_enroll'
-            email_params['email_address'] = student_email
-            send_mail_to_student(student_email, email_params, language=language)
+    if email_students:
+        send_enroll_email(student_email, previous_state, email_params, language=language)
 
     after_state = EmailEnrollmentState(course_id, student_email)
 
     return previous_state, after_state, enrollment_obj
 
 
+def enroll_emails(course_id, student_emails, auto_enroll=False):
+    """
+    Enroll students by email, as `enroll_email` does for each of them in
+    turn, reading and changing the enrollments of all of them at once.
+    Students are not notified; see `send_enroll_email`.
+
+    `student_emails` is a list of student's emails e.g. ["foo@bar.com"]
+    `auto_enroll` determines what is put in CourseEnrollmentAllowed.auto_enroll
+        of the emails that are not registered.
+
+    returns a list of (previous state, after state, enrollment) tuples,
+        as returned by `enroll_email`, for the emails in order.
+    """
+    emails = list(OrderedDict.fromkeys(student_emails))
+    previous_states = EmailEnrollmentState.bulk_get(course_id, emails)
+    users = _get_users_by_email([email for email in emails if previous_states[email].user])
+
+    # See `enroll_email`: students keep the mode they are enrolled in, and
+    # White Labels use the 'shoppingcart' mode rather than the default one.
+    enrolled_users = []
+    unenrolled_users = []
+    unregistered_emails = []
+    for email in emails:
+        if not previous_states[email].user:
+            unregistered_emails.append(email)
+        elif previous_states[email].enrollment:
+            enrolled_users.append(users[email.lower()])
+        else:
+            unenrolled_users.append(users[email.lower()])
+    course_mode = CourseMode.DEFAULT_SHOPPINGCART_MODE_SLUG if CourseMode.is_white_label(course_id) else None
+
+    enrollments = {}
+    for users_to_enroll, mode in ((enrolled_users, None), (unenrolled_users, course_mode)):
+        for enrollment in CourseEnrollment.bulk_enroll(users_to_enroll, course_id, mode):
+            enrollments[enrollment.user.email.lower()] = enrollment
+    _allow_enrollments(course_id, unregistered_emails, auto_enroll)
+
+    after_states = EmailEnrollmentState.bulk_get(course_id, emails)
+
+    results = []
+    seen_emails = set()
+    for email in student_emails:
+        # As when enrolling students in turn, the previous state of an email
+        # listed more than once is the state left by its first enrollment.
+        previous_state = after_states[email] if email in seen_emails else previous_states[email]
+        results.append((previous_state, after_states[email], enrollments.get(email.lower())))
+        seen_emails.add(email)
+    return results
+
+
+def _allow_enrollments(course_id, student_emails, auto_enroll):
+    """
+    Creates or updates the CourseEnrollmentAllowed of the given emails in the
+    course, with the given `auto_enroll`.
+    """
+    if not student_emails:
+        return
+    ceas = _get_allowed_enrollments_by_email(course_id, student_emails)
+    if ceas:
+        CourseEnrollmentAllowed.objects.filter(id__in=[cea.id for cea in ceas.itervalues()]).update(
+            auto_enroll=auto_enroll
+        )
+
+    new_emails = OrderedDict((email.lower(), email) for email in student_emails if email.lower() not in ceas)
+    CourseEnrollmentAllowed.objects.bulk_create([
+        CourseEnrollmentAllowed(course_id=course_id, email=email, auto_enroll=auto_enroll)
+        for email in new_emails.itervalues()
+    ])
+
+
+def send_enroll_email(student_email, previous_state, email_params, language=None):
+    """
+    Notify a student enrolled by email, or allowed to enroll if they are not
+    registered.
+
+    `previous_state` is the EmailEnrollmentState of the email before enrolling it.
+    `email_params` parameters used while parsing email templates (a `dict`).
+    `language` is the language used to render the email.
+    """
+    if previous_state.user:
+        email_params['message'] = 'enrolled_enroll'
+        email_params['email_address'] = student_email
+        email_params['full_name'] = previous_state.full_name
+    else:
+        email_params['message'] = 'allowed_enroll'
+        email_params['email_address'] = student_email
+    send_mail_to_student(student_email, email_params, language=language)
+
+
 def unenroll_email(course_id, student_email, email_students=False, email_params=None, language=None):
     """
     Unenroll a student by email.
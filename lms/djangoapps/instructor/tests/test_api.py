@@ -45,6 +45,7 @@ from courseware.tests.factories import (
 from courseware.tests.helpers import LoginEnrollmentTestCase
 from django_comment_common.models import FORUM_ROLE_COMMUNITY_TA
 from django_comment_common.utils import seed_permissions_roles
+from lms.djangoapps.instructor.enrollment import enroll_email
 from lms.djangoapps.instructor.tests.utils import FakeContentTask, FakeEmail, FakeEmailInfo
 from lms.djangoapps.instructor.views.api import (
     _split_input_list,
@@ -1098,6 +1099,98 @@ class TestInstructorAPIEnrollment(SharedModuleStoreTestCase, LoginEnrollmentTest
         res_json = json.loads(response.content)
         self.assertEqual(res_json, expected)
 
+    def test_enroll_many_identifiers(self):
+        url = reverse('students_update_enrollment', kwargs={'course_id': self.course.id.to_deprecated_string()})
+        identifiers = [
+            self.notenrolled_student.username,
+            'percivaloctavius@',
+            self.enrolled_student.email,
+            self.allowed_email,
+            self.notregistered_email,
+            self.notenrolled_student.email,
+        ]
+        response = self.client.post(url, {'identifiers': ','.join(identifiers), 'action': 'enroll',
+                                          'email_students': False})
+        self.assertEqual(response.status_code, 200)
+
+        def state(user, enrollment, allowed):
+            """
+            Returns the expected dict of an enrollment state.
+            """
+            return {'user': user, 'enrollment': enrollment, 'allowed': allowed, 'auto_enroll': False}
+
+        # test the response data, in which the state of an identifier listed
+        # twice is the state left by its first enrollment
+        expected_results = [
+            {
+                'identifier': self.notenrolled_student.username,
+                'before': state(user=True, enrollment=False, allowed=False),
+                'after': state(user=True, enrollment=True, allowed=False),
+            },
+            {'identifier': 'percivaloctavius@', 'invalidIdentifier': True},
+            {
+                'identifier': self.enrolled_student.email,
+                'before': state(user=True, enrollment=True, allowed=False),
+                'after': state(user=True, enrollment=True, allowed=False),
+            },
+            {
+                'identifier': self.allowed_email,
+                'before': state(user=False, enrollment=False, allowed=True),
+                'after': state(user=False, enrollment=False, allowed=True),
+            },
+            {
+                'identifier': self.notregistered_email,
+                'before': state(user=False, enrollment=False, allowed=False),
+                'after': state(user=False, enrollment=False, allowed=True),
+            },
+            {
+                'identifier': self.notenrolled_student.email,
+                'before': state(user=True, enrollment=True, allowed=False),
+                'after': state(user=True, enrollment=True, allowed=False),
+            },
+        ]
+        self.assertEqual(json.loads(response.content)['results'], expected_results)
+        self.assertTrue(CourseEnrollment.is_enrolled(self.notenrolled_student, self.course.id))
+        self.assertEqual(
+            list(ManualEnrollmentAudit.objects.order_by('id').values_list('enrolled_email', 'state_transition')),
+            [
+                (self.notenrolled_student.email, UNENROLLED_TO_ENROLLED),
+                (self.enrolled_student.email, ENROLLED_TO_ENROLLED),
+                (self.allowed_email, UNENROLLED_TO_ALLOWEDTOENROLL),
+                (self.notregistered_email, UNENROLLED_TO_ALLOWEDTOENROLL),
+                (self.notenrolled_student.email, ENROLLED_TO_ENROLLED),
+            ]
+        )
+
+    @patch('lms.djangoapps.instructor.views.api.enroll_emails', side_effect=Exception)
+    def test_enroll_many_identifiers_failure(self, __):
+        url = reverse('students_update_enrollment', kwargs={'course_id': self.course.id.to_deprecated_string()})
+        identifiers = [self.notenrolled_student.email, 'percivaloctavius@', self.notregistered_email]
+
+        def enroll_email_or_fail(course_id, email, *args, **kwargs):
+            """
+            Fails to enroll the first student, and enrolls the others.
+            """
+            if email == self.notenrolled_student.email:
+                raise Exception
+            return enroll_email(course_id, email, *args, **kwargs)
+
+        with patch('lms.djangoapps.instructor.views.api.enroll_email', side_effect=enroll_email_or_fail):
+            response = self.client.post(url, {'identifiers': ','.join(identifiers), 'action': 'enroll',
+                                              'email_students': False})
+        self.assertEqual(response.status_code, 200)
+
+        # the students are enrolled one at a time, so that a failure only affects its own student
+        results = json.loads(response.content)['results']
+        self.assertEqual(results[0], {'identifier': self.notenrolled_student.email, 'error': True})
+        self.assertEqual(results[1], {'identifier': 'percivaloctavius@', 'invalidIdentifier': True})
+        self.assertEqual(results[2]['identifier'], self.notregistered_email)
+        self.assertTrue(results[2]['after']['allowed'])
+        self.assertEqual(
+            list(ManualEnrollmentAudit.objects.values_list('enrolled_email', 'state_transition')),
+            [(self.notregistered_email, UNENROLLED_TO_ALLOWEDTOENROLL)]
+        )
+
     def test_enroll_without_email(self):
         url = reverse('students_update_enrollment', kwargs={'course_id': self.course.id.to_deprecated_string()})
         response = self.client.post(url, {'identifiers': self.notenrolled_student.email, 'action': 'enroll',
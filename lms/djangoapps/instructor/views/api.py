@@ -51,9 +51,11 @@ from edxmako.shortcuts import render_to_string
 from lms.djangoapps.instructor.access import ROLES, allow_access, list_with_level, revoke_access, update_forum_role
 from lms.djangoapps.instructor.enrollment import (
     enroll_email,
+    enroll_emails,
     get_email_params,
     get_user_email_language,
     send_beta_role_email,
+    send_enroll_email,
     send_mail_to_student,
     unenroll_email
 )
@@ -627,7 +629,7 @@ def students_update_enrollment(request, course_id):
         course = get_course_by_id(course_id)
         email_params = get_email_params(course, auto_enroll, secure=request.is_secure())
 
-    results = []
+    students = []
     for identifier in identifiers:
         # First try to get a user object from the identifer
         user = None
@@ -640,36 +642,24 @@ def students_update_enrollment(request, course_id):
         else:
             email = user.email
             language = get_user_email_language(user)
+        students.append((identifier, user, email, language))
 
+    if action == 'enroll':
+        results = _enroll_students(request.user, course_id, students, auto_enroll, email_students, email_params, reason)
+        return JsonResponse({
+            'action': action,
+            'results': results,
+            'auto_enroll': auto_enroll,
+        })
+
+    results = []
+    for identifier, user, email, language in students:
         try:
             # Use django.core.validators.validate_email to check email address
             # validity (obviously, cannot check if email actually /exists/,
             # simply that it is plausibly valid)
             validate_email(email)  # Raises ValidationError if invalid
-            if action == 'enroll':
-                before, after, enrollment_obj = enroll_email(
-                    course_id, email, auto_enroll, email_students, email_params, language=language
-                )
-                before_enrollment = before.to_dict()['enrollment']
-                before_user_registered = before.to_dict()['user']
-                before_allowed = before.to_dict()['allowed']
-                after_enrollment = after.to_dict()['enrollment']
-                after_allowed = after.to_dict()['allowed']
-
-                if before_user_registered:
-                    if after_enrollment:
-                        if before_enrollment:
-                            state_transition = ENROLLED_TO_ENROLLED
-                        else:
-                            if before_allowed:
-                                state_transition = ALLOWEDTOENROLL_TO_ENROLLED
-                            else:
-                                state_transition = UNENROLLED_TO_ENROLLED
-                else:
-                    if after_allowed:
-                        state_transition = UNENROLLED_TO_ALLOWEDTOENROLL
-
-            elif action == 'unenroll':
+            if action == 'unenroll':
                 before, after = unenroll_email(
                     course_id, email, email_students, email_params, language=language
                 )
@@ -726,6 +716,92 @@ def students_update_enrollment(request, course_id):
     return JsonResponse(response_payload)
 
 
+def _enroll_students(enrolled_by, course_id, students, auto_enroll, email_students, email_params, reason):
+    """
+    Enroll students by email for `students_update_enrollment`, enrolling all
+    the valid emails at once and auditing them with a single insert.  If
+    enrolling them at once fails, they are enrolled one at a time, so that
+    each of them gets their own result and audit.
+
+    `students` is a list of (identifier, user, email, language) tuples.
+
+    Returns the results of the identifiers, in order.
+    """
+    results = [None] * len(students)
+    valid_students = []
+    for index, (identifier, __, email, language) in enumerate(students):
+        try:
+            # Use django.core.validators.validate_email to check email address
+            # validity (obviously, cannot check if email actually /exists/,
+            # simply that it is plausibly valid)
+            validate_email(email)  # Raises ValidationError if invalid
+        except ValidationError:
+            # Flag this email as an error if invalid, but continue checking
+            # the remaining in the list
+            results[index] = {
+                'identifier': identifier,
+                'invalidIdentifier': True,
+            }
+        else:
+            valid_students.append((index, identifier, email, language))
+
+    try:
+        # Roll back the enrollments of the batch if it fails part way, so that its
+        # students can be enrolled one at a time instead.
+        with transaction.atomic():
+            enrollment_results = enroll_emails(
+                course_id, [email for __, __, email, __ in valid_students], auto_enroll
+            )
+    except Exception as exc:  # pylint: disable=broad-except
+        log.exception(u"Error while enrolling students at once, enrolling them one at a time")
+        log.exception(exc)
+        enrollment_results = None
+
+    audits = []
+    state_transition = DEFAULT_TRANSITION_STATE
+    for position, (index, identifier, email, language) in enumerate(valid_students):
+        try:
+            if enrollment_results is None:
+                before, after, enrollment_obj = enroll_email(
+                    course_id, email, auto_enroll, email_students, email_params, language=language
+                )
+            else:
+                before, after, enrollment_obj = enrollment_results[position]
+                if email_students:
+                    send_enroll_email(email, before, email_params, language=language)
+        except Exception as exc:  # pylint: disable=broad-except
+            # catch and log any exceptions
+            # so that one error doesn't cause a 500.
+            log.exception(u"Error while enrolling student")
+            log.exception(exc)
+            results[index] = {
+                'identifier': identifier,
+                'error': True,
+            }
+            continue
+
+        if before.user:
+            if after.enrollment:
+                if before.enrollment:
+                    state_transition = ENROLLED_TO_ENROLLED
+                elif before.allowed:
+                    state_transition = ALLOWEDTOENROLL_TO_ENROLLED
+                else:
+                    state_transition = UNENROLLED_TO_ENROLLED
+        elif after.allowed:
+            state_transition = UNENROLLED_TO_ALLOWEDTOENROLL
+
+        audits.append((email, state_transition, enrollment_obj))
+        results[index] = {
+            'identifier': identifier,
+            'before': before.to_dict(),
+            'after': after.to_dict(),
+        }
+
+    ManualEnrollmentAudit.bulk_create_manual_enrollment_audits(enrolled_by, audits, reason)
+    return results
+
+
 @require_POST
 @ensure_csrf_cookie
 @cache_control(no_cache=True, no_store=True, must_revalidate=True)
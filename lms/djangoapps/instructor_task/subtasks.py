@@ -29,13 +29,10 @@ MAX_DATABASE_LOCK_RETRIES = 5
 
 def _get_number_of_subtasks(total_num_items, items_per_task):
     """
-    Determines number of subtasks that would be generated by _generate_items_for_subtask.
+    Determines number of subtasks needed to process the given number of items.
 
-    This needs to be calculated before the query is executed so that the list of all subtasks can be
+    This needs to be calculated before the subtasks are created so that the list of all subtasks can be
     stored in the InstructorTask before any subtasks are started.
-
-    The number of subtask_id values returned by this should match the number of chunks returned
-    by the generate_items_for_subtask generator.
     """
     num_subtasks, remainder = divmod(total_num_items, items_per_task)
     if remainder:
@@ -66,62 +63,6 @@ def track_memory_usage(metric, course_id):
         )
 
 
-def _generate_items_for_subtask(
-    item_querysets,  # pylint: disable=bad-continuation
-    item_fields,
-    total_num_items,
-    items_per_task,
-    total_num_subtasks,
-    course_id,
-):
-    """
-    Generates a chunk of "items" that should be passed into a subtask.
-
-    Arguments:
-        `item_querysets` : a list of query sets, each of which defines the "items" that should be passed to subtasks.
-        `item_fields` : the fields that should be included in the dict that is returned.
-            These are in addition to the 'pk' field.
-        `total_num_items` : the result of summing the count of each queryset in `item_querysets`.
-        `items_per_query` : size of chunks to break the query operation into.
-        `items_per_task` : maximum size of chunks to break each query chunk into for use by a subtask.
-        `course_id` : course_id of the course. Only needed for the track_memory_usage context manager.
-
-    Returns:  yields a list of dicts, where each dict contains the fields in `item_fields`, plus the 'pk' field.
-
-    Warning:  if the algorithm here changes, the _get_number_of_subtasks() method should similarly be changed.
-    """
-    num_items_queued = 0
-    all_item_fields = list(item_fields)
-    all_item_fields.append('pk')
-    num_subtasks = 0
-
-    items_for_task = []
-
-    with track_memory_usage('course_email.subtask_generation.memory', course_id):
-        for queryset in item_querysets:
-            for item in queryset.values(*all_item_fields).iterator():
-                if len(items_for_task) == items_per_task and num_subtasks < total_num_subtasks - 1:
-                    yield items_for_task
-                    num_items_queued += items_per_task
-                    items_for_task = []
-                    num_subtasks += 1
-                items_for_task.append(item)
-
-        # yield remainder items for task, if any
-        if items_for_task:
-            yield items_for_task
-            num_items_queued += len(items_for_task)
-
-    # Note, depending on what kind of DB is used, it's possible for the queryset
-    # we iterate over to change in the course of the query. Therefore it's
-    # possible that there are more (or fewer) items queued than were initially
-    # calculated. It also means it's possible that the last task contains
-    # more items than items_per_task allows. We expect this to be a small enough
-    # number as to be negligible.
-    if num_items_queued != total_num_items:
-        TASK_LOG.info("Number of items generated by chunking %s not equal to original total %s", num_items_queued, total_num_items)
-
-
 class SubtaskStatus(object):
     """
     Create and return a dict for tracking the status of a subtask.
@@ -272,18 +213,19 @@ def initialize_subtask_info(entry, action_name, total_num, subtask_id_list):
     return task_progress
 
 
-# pylint: disable=bad-continuation
-def queue_subtasks_for_query(
+def queue_subtasks_for_item_ids(
     entry,
     action_name,
     create_subtask_fcn,
-    item_querysets,
-    item_fields,
+    item_ids,
+    get_items_fcn,
     items_per_task,
-    total_num_items,
 ):
     """
-    Generates and queues subtasks to each execute a chunk of "items" generated by a queryset.
+    Generates and queues subtasks to each execute a chunk of "items" with the given ids.
+
+    The items of each subtask are only loaded when the subtask is created, so that the
+    subtasks start running while the later ones are created.
 
     Arguments:
         `entry` : the InstructorTask object for which subtasks are being queued.
@@ -291,22 +233,17 @@ def queue_subtasks_for_query(
         `create_subtask_fcn` : a function of two arguments that constructs the desired kind of subtask object.
             Arguments are the list of items to be processed by this subtask, and a SubtaskStatus
             object reflecting initial status (and containing the subtask's id).
-        `item_querysets` : a list of query sets that define the "items" that should be passed to subtasks.
-        `item_fields` : the fields that should be included in the dict that is returned.
-            These are in addition to the 'pk' field.
-        `items_per_task` : maximum size of chunks to break each query chunk into for use by a subtask.
-        `total_num_items` : total amount of items that will be put into subtasks
+        `item_ids` : the list of the ids of the "items" that should be passed to subtasks.
+        `get_items_fcn` : a function of one argument that returns the list of items with the given ids.
+        `items_per_task` : maximum number of items passed to each subtask.
 
     Returns:  the task progress as stored in the InstructorTask object.
-
     """
     task_id = entry.task_id
-
-    # Calculate the number of tasks that will be created, and create a list of ids for each task.
+    total_num_items = len(item_ids)
     total_num_subtasks = _get_number_of_subtasks(total_num_items, items_per_task)
     subtask_id_list = [str(uuid4()) for _ in range(total_num_subtasks)]
 
-    # Update the InstructorTask  with information about the subtasks we've defined.
     TASK_LOG.info(
         "Task %s: updating InstructorTask %s with subtask info for %s subtasks to process %s items.",
         task_id,
@@ -318,31 +255,18 @@ def queue_subtasks_for_query(
     with outer_atomic():
         progress = initialize_subtask_info(entry, action_name, total_num_items, subtask_id_list)
 
-    # Construct a generator that will return the recipients to use for each subtask.
-    # Pass in the desired fields to fetch for each recipient.
-    item_list_generator = _generate_items_for_subtask(
-        item_querysets,
-        item_fields,
-        total_num_items,
-        items_per_task,
-        total_num_subtasks,
-        entry.course_id,
-    )
-
-    # Now create the subtasks, and start them running.
     TASK_LOG.info(
         "Task %s: creating %s subtasks to process %s items.",
         task_id,
         total_num_subtasks,
         total_num_items,
     )
-    num_subtasks = 0
-    for item_list in item_list_generator:
-        subtask_id = subtask_id_list[num_subtasks]
-        num_subtasks += 1
-        subtask_status = SubtaskStatus.create(subtask_id)
-        new_subtask = create_subtask_fcn(item_list, subtask_status)
-        new_subtask.apply_async()
+    with track_memory_usage('course_email.subtask_generation.memory', entry.course_id):
+        for subtask_num, subtask_id in enumerate(subtask_id_list):
+            ids_for_task = item_ids[subtask_num * items_per_task:(subtask_num + 1) * items_per_task]
+            subtask_status = SubtaskStatus.create(subtask_id)
+            new_subtask = create_subtask_fcn(get_items_fcn(ids_for_task), subtask_status)
+            new_subtask.apply_async()
 
     # Subtasks have been queued so no exceptions should be raised after this point.
 
@@ -5,10 +5,9 @@ from uuid import uuid4
 
 from mock import Mock, patch
 
-from lms.djangoapps.instructor_task.subtasks import queue_subtasks_for_query
+from lms.djangoapps.instructor_task.subtasks import queue_subtasks_for_item_ids
 from lms.djangoapps.instructor_task.tests.factories import InstructorTaskFactory
 from lms.djangoapps.instructor_task.tests.test_base import InstructorTaskCourseTestCase
-from student.models import CourseEnrollment
 
 
 class TestSubtasks(InstructorTaskCourseTestCase):
@@ -18,64 +17,38 @@ class TestSubtasks(InstructorTaskCourseTestCase):
         super(TestSubtasks, self).setUp()
         self.initialize_course()
 
-    def _enroll_students_in_course(self, course_id, num_students):
-        """Create and enroll some students in the course."""
+    def test_queue_subtasks_for_item_ids(self):
+        """Test queue_subtasks_for_item_ids() only gets the items of each subtask when creating it."""
 
-        for _ in range(num_students):
-            random_id = uuid4().hex[:8]
-            self.create_student(username='student{0}'.format(random_id))
-
-    def _queue_subtasks(self, create_subtask_fcn, items_per_task, initial_count, extra_count):
-        """Queue subtasks while enrolling more students into course in the middle of the process."""
-
-        task_id = str(uuid4())
         instructor_task = InstructorTaskFactory.create(
             course_id=self.course.id,
-            task_id=task_id,
+            task_id=str(uuid4()),
             task_key='dummy_task_key',
             task_type='bulk_course_email',
         )
+        mock_create_subtask_fcn = Mock()
+        get_items_fcn = Mock(side_effect=lambda item_ids: [{'pk': item_id} for item_id in item_ids])
 
-        self._enroll_students_in_course(self.course.id, initial_count)
-        task_querysets = [CourseEnrollment.objects.filter(course_id=self.course.id)]
-
-        def initialize_subtask_info(*args):  # pylint: disable=unused-argument
-            """Instead of initializing subtask info enroll some more students into course."""
-            self._enroll_students_in_course(self.course.id, extra_count)
-            return {}
+        def create_subtask_fcn(items, subtask_status):
+            """Checks that the items of the previous subtasks were not fetched yet."""
+            self.assertEqual(get_items_fcn.call_count, mock_create_subtask_fcn.call_count + 1)
+            return mock_create_subtask_fcn(items, subtask_status)
 
         with patch('lms.djangoapps.instructor_task.subtasks.initialize_subtask_info') as mock_initialize_subtask_info:
-            mock_initialize_subtask_info.side_effect = initialize_subtask_info
-            queue_subtasks_for_query(
+            mock_initialize_subtask_info.return_value = {}
+            queue_subtasks_for_item_ids(
                 entry=instructor_task,
                 action_name='action_name',
                 create_subtask_fcn=create_subtask_fcn,
-                item_querysets=task_querysets,
-                item_fields=[],
-                items_per_task=items_per_task,
-                total_num_items=initial_count,
+                item_ids=range(1, 8),
+                get_items_fcn=get_items_fcn,
+                items_per_task=3,
             )
 
-    def test_queue_subtasks_for_query1(self):
-        """Test queue_subtasks_for_query() if the last subtask only needs to accommodate < items_per_tasks items."""
-
-        mock_create_subtask_fcn = Mock()
-        self._queue_subtasks(mock_create_subtask_fcn, 3, 7, 1)
-
-        # Check number of items for each subtask
-        mock_create_subtask_fcn_args = mock_create_subtask_fcn.call_args_list
-        self.assertEqual(len(mock_create_subtask_fcn_args[0][0][0]), 3)
-        self.assertEqual(len(mock_create_subtask_fcn_args[1][0][0]), 3)
-        self.assertEqual(len(mock_create_subtask_fcn_args[2][0][0]), 2)
-
-    def test_queue_subtasks_for_query2(self):
-        """Test queue_subtasks_for_query() if the last subtask needs to accommodate > items_per_task items."""
-
-        mock_create_subtask_fcn = Mock()
-        self._queue_subtasks(mock_create_subtask_fcn, 3, 8, 3)
-
-        # Check number of items for each subtask
-        mock_create_subtask_fcn_args = mock_create_subtask_fcn.call_args_list
-        self.assertEqual(len(mock_create_subtask_fcn_args[0][0][0]), 3)
-        self.assertEqual(len(mock_create_subtask_fcn_args[1][0][0]), 3)
-        self.assertEqual(len(mock_create_subtask_fcn_args[2][0][0]), 5)
+        self.assertEqual(mock_initialize_subtask_info.call_args[0][2], 7)
+        self.assertEqual(len(mock_initialize_subtask_info.call_args[0][3]), 3)
+        self.assertEqual(
+            [call[0][0] for call in get_items_fcn.call_args_list],
+            [[1, 2, 3], [4, 5, 6], [7]],
+        )
+        self.assertEqual(mock_create_subtask_fcn.return_value.apply_async.call_count, 3)
@@ -8,8 +8,10 @@ from collections import namedtuple
 from uuid import uuid4
 
 import ddt
+from django.core.cache.backends.locmem import LocMemCache
 from edxval import api
 from milestones.tests.utils import MilestonesTestCaseMixin
+from mock import patch
 from nose.plugins.attrib import attr
 
 from mobile_api.models import MobileApiConfig
@@ -20,7 +22,7 @@ from openedx.core.djangoapps.course_groups.tests.helpers import CohortFactory
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.tests.factories import ItemFactory
 from xmodule.partitions.partitions import Group, UserPartition
-from xmodule.video_module import transcripts_utils
+from xmodule.video_module import VideoDescriptor, transcripts_utils
 
 
 class TestVideoAPITestCase(MobileAPITestCase):
@@ -605,6 +607,17 @@ class TestVideoSummaryList(TestVideoAPITestCase, MobileAuthTestMixin, MobileCour
         self.assertEqual(course_outline[2]['summary']['size'], 0)
         self.assertFalse(course_outline[2]['summary']['only_on_web'])
 
+    def test_outline_from_collected_block_structure(self):
+        self.login_and_enroll()
+        self._create_video_with_subs()
+        with patch('openedx.core.djangoapps.content.block_structure.api.cache', LocMemCache('block_structures', {})):
+            course_outline = self.api_response().data
+            with patch.object(VideoDescriptor, 'get_transcripts_info') as mock_get_transcripts_info:
+                self.assertEqual(self.api_response().data, course_outline)
+        self.assertFalse(mock_get_transcripts_info.called)
+        self.assertEqual(len(course_outline), 1)
+        self.assertIn('en', course_outline[0]['summary']['transcripts'])
+
     def test_with_nameless_unit(self):
         self.login_and_enroll()
         ItemFactory.create(
@@ -0,0 +1,213 @@
+"""
+Video Outline Transformer
+"""
+from openedx.core.djangoapps.content.block_structure.transformer import BlockStructureTransformer
+
+
+class VideoOutlineTransformer(BlockStructureTransformer):
+    """
+    The VideoOutlineTransformer collects an index of the videos of a course
+    for the mobile video outline, so that the outline can be served from
+    the collected block structure rather than by walking the modulestore.
+
+    The following values are collected:
+
+        video_keys: (list) transformer data with the usage keys of the
+            videos, in the order of the course outline.  Videos within
+            blocks that are hidden from the table of contents are left out.
+
+        outline: (dict) transformer block field on each of these videos,
+            with the path to the video, the components of its courseware
+            urls, and the fields of its summary that do not depend on the
+            user or the request.
+
+        split_test_group: (tuple) transformer block field on each child of
+            a split_test module, with the id of the module's user partition
+            and the id of the group the child is shown to, or None.
+
+    The transform method removes the children of split_test modules that
+    are not shown to the user's group, for users with staff access.  All
+    other access checks are left to the course block access transformers,
+    which staff users bypass.
+    """
+    WRITE_VERSION = 1
+    READ_VERSION = 1
+    VIDEO_KEYS = 'video_keys'
+    OUTLINE = 'outline'
+    SPLIT_TEST_GROUP = 'split_test_group'
+
+    @classmethod
+    def name(cls):
+        """
+        Unique identifier for the transformer's class;
+        same identifier used in setup.py.
+        """
+        return "video_outlines"
+
+    @classmethod
+    def collect(cls, block_structure):
+        """
+        Collects any information that's necessary to execute this
+        transformer's transform method.
+        """
+        cls._collect_split_test_groups(block_structure)
+        cls._collect_video_outlines(block_structure)
+
+    @classmethod
+    def _collect_split_test_groups(cls, block_structure):
+        """
+        Collects the partition and group each child of a split_test module
+        is shown to.
+        """
+        root_block = block_structure.get_xblock(block_structure.root_block_usage_key)
+        user_partitions = getattr(root_block, 'user_partitions', [])
+        block_structure.set_transformer_data(cls, 'user_partitions', user_partitions)
+
+        for block_key in block_structure.topological_traversal(
+                filter_func=lambda block_key: block_key.block_type == 'split_test',
+                yield_descendants_of_unyielded=True,
+        ):
+            xblock = block_structure.get_xblock(block_key)
+            partition = next(
+                (partition for partition in user_partitions if partition.id == xblock.user_partition_id),
+                None
+            )
+            if not partition:
+                continue
+
+            child_to_group = {
+                xblock.group_id_to_child.get(unicode(group.id), None): group.id
+                for group in partition.groups
+            }
+            for child_key in block_structure.get_children(block_key):
+                block_structure.set_transformer_block_field(
+                    child_key, cls, cls.SPLIT_TEST_GROUP, (partition.id, child_to_group.get(child_key)),
+                )
+
+    @classmethod
+    def _collect_video_outlines(cls, block_structure):
+        """
+        Collects the outline of each video of the course, walking the
+        course in the order of its outline.
+        """
+        video_keys = []
+        visited = set()
+        stack = [(block_structure.root_block_usage_key, [])]
+        while stack:
+            block_key, ancestor_keys = stack.pop()
+            if block_key in visited:
+                continue
+            visited.add(block_key)
+
+            xblock = block_structure.get_xblock(block_key)
+            if getattr(xblock, 'hide_from_toc', False):
+                # As in the courseware navigation, do not traverse down the hierarchy of these blocks,
+                # since they may not have human-readable names to display on the mobile clients.
+                continue
+
+            if block_key.block_type == 'video':
+                block_structure.set_transformer_block_field(block_key, cls, cls.OUTLINE, {
+                    'path': [cls._get_path_entry(block_structure, key) for key in ancestor_keys[1:]],
+                    'url_kwargs': cls._get_url_kwargs(block_structure, ancestor_keys),
+                    'summary': cls._get_summary(xblock),
+                })
+                video_keys.append(block_key)
+
+            for child_key in reversed(block_structure.get_children(block_key)):
+                stack.append((child_key, ancestor_keys + [block_key]))
+
+        block_structure.set_transformer_data(cls, cls.VIDEO_KEYS, video_keys)
+
+    @staticmethod
+    def _get_path_entry(block_structure, block_key):
+        """
+        Returns the entry of the given ancestor in the path to a video.
+        """
+        xblock = block_structure.get_xblock(block_key)
+        return {
+            # to be consistent with other edx-platform clients, return the defaulted display name
+            'name': xblock.display_name_with_default_escaped,
+            'category': xblock.category,
+            'id': unicode(block_key),
+        }
+
+    @staticmethod
+    def _get_url_kwargs(block_structure, ancestor_keys):
+        """
+        Returns the chapter, section and position of the unit of a video
+        with the given ancestors, starting from the course, each of which
+        is None if the video is not within such a block.
+        """
+        chapter = ancestor_keys[1].block_id if len(ancestor_keys) > 1 else None
+        section = ancestor_keys[2].block_id if len(ancestor_keys) > 2 else None
+        position = None
+
+        if len(ancestor_keys) > 3:
+            position = 1
+            for child_key in block_structure.get_children(ancestor_keys[2]):
+                if child_key.block_id == ancestor_keys[3].block_id:
+                    break
+                position += 1
+
+        return {'chapter': chapter, 'section': section, 'position': position}
+
+    @staticmethod
+    def _get_summary(video_descriptor):
+        """
+        Returns the fields of a video's summary that do not depend on the
+        user or the request.
+        """
+        summary = {
+            'name': video_descriptor.display_name,
+            'category': video_descriptor.category,
+            'id': unicode(video_descriptor.scope_ids.usage_id),
+            'block_id': video_descriptor.scope_ids.usage_id.block_id,
+            'only_on_web': video_descriptor.only_on_web,
+        }
+        if video_descriptor.only_on_web:
+            return summary
+
+        if video_descriptor.html5_sources:
+            video_url = video_descriptor.html5_sources[0]
+        else:
+            video_url = video_descriptor.source
+
+        transcripts_info = video_descriptor.get_transcripts_info()
+        summary.update({
+            'edx_video_id': video_descriptor.edx_video_id,
+            'video_url': video_url,
+            'transcript_languages': video_descriptor.available_translations(transcripts_info, verify_assets=False),
+            'language': video_descriptor.get_default_transcript_language(transcripts_info),
+        })
+        return summary
+
+    def transform(self, usage_info, block_structure):
+        """
+        Mutates block_structure based on the given usage_info.
+        """
+        if not usage_info.has_staff_access:
+            return
+
+        user_partitions = {
+            partition.id: partition
+            for partition in block_structure.get_transformer_data(self, 'user_partitions', [])
+        }
+        user_group_ids = {}
+
+        def is_hidden_from_user_group(block_key):
+            """
+            Returns whether the given block is a child of a split_test module
+            that is not shown to the user's group.
+            """
+            split_test_group = block_structure.get_transformer_block_field(block_key, self, self.SPLIT_TEST_GROUP)
+            if split_test_group is None:
+                return False
+
+            partition_id, group_id = split_test_group
+            if partition_id not in user_group_ids:
+                partition = user_partitions[partition_id]
+                group = partition.scheme.get_group_for_user(usage_info.course_key, usage_info.user, partition)
+                user_group_ids[partition_id] = group.id if group is not None else None
+            return group_id is None or group_id != user_group_ids[partition_id]
+
+        block_structure.remove_block_traversal(is_hidden_from_user_group)
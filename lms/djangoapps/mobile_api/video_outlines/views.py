@@ -6,19 +6,22 @@ only displayed at the course level. This is because it makes it a lot easier to
 optimize and reason about, and it avoids having to tackle the bigger problem of
 general XBlock representation in this rather specialized formatting.
 """
-from functools import partial
-
 from django.http import Http404, HttpResponse
 from opaque_keys.edx.locator import BlockUsageLocator
 from rest_framework import generics
 from rest_framework.response import Response
 
+from courseware.access import has_access
+from lms.djangoapps.course_blocks.api import COURSE_BLOCK_ACCESS_TRANSFORMERS, get_course_blocks
+from lms.djangoapps.course_blocks.transformers.library_content import ContentLibraryTransformer
 from mobile_api.models import MobileApiConfig
+from openedx.core.djangoapps.content.block_structure.transformers import BlockStructureTransformers
 from xmodule.exceptions import NotFoundError
 from xmodule.modulestore.django import modulestore
 
 from ..decorators import mobile_course_access, mobile_view
-from .serializers import BlockOutline, video_summary
+from .serializers import VideoOutline
+from .transformer import VideoOutlineTransformer
 
 
 @mobile_view()
@@ -73,18 +76,23 @@ class VideoSummaryList(generics.ListAPIView):
               Management System.
     """
 
-    @mobile_course_access(depth=None)
+    @mobile_course_access()
     def list(self, request, course, *args, **kwargs):
         video_profiles = MobileApiConfig.get_video_profiles()
-        video_outline = list(
-            BlockOutline(
-                course.id,
-                course,
-                {"video": partial(video_summary, video_profiles)},
-                request,
-                video_profiles,
-            )
+        if has_access(request.user, 'staff', course):
+            # Staff have access to all of the videos, but are still only shown the videos
+            # of the library content and split_test modules they have been assigned to.
+            transformers = [ContentLibraryTransformer()]
+        else:
+            transformers = list(COURSE_BLOCK_ACCESS_TRANSFORMERS)
+        transformers.append(VideoOutlineTransformer())
+
+        block_structure = get_course_blocks(
+            request.user,
+            course.location,
+            BlockStructureTransformers(transformers),
         )
+        video_outline = list(VideoOutline(course.id, block_structure, request, video_profiles))
         return Response(video_outline)
 
 
@@ -45,6 +45,7 @@ from openedx.core.djangoapps.site_configuration import helpers as configuration_
 from openedx.core.djangoapps.xmodule_django.models import CourseKeyField
 from openedx.core.djangolib.model_mixins import DeprecatedModelMixin
 from openedx.core.storage import get_storage
+from student.dashboard_data import invalidate_dashboard_data
 
 log = logging.getLogger(__name__)
 
@@ -1113,6 +1114,13 @@ class VerificationDeadline(TimeStampedModel):
             return None
 
 
+@receiver(models.signals.post_save, sender=SoftwareSecurePhotoVerification)
+@receiver(models.signals.post_delete, sender=SoftwareSecurePhotoVerification)
+def invalidate_dashboard_data_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Invalidate the cached dashboard data of the user of a photo verification. """
+    invalidate_dashboard_data(instance.user_id)
+
+
 @receiver(models.signals.post_save, sender=VerificationDeadline)
 @receiver(models.signals.post_delete, sender=VerificationDeadline)
 def invalidate_deadline_caches(sender, **kwargs):  # pylint: disable=unused-argument
@@ -260,6 +260,10 @@ BULK_EMAIL_RETRY_DELAY_BETWEEN_SENDS = ENV_TOKENS.get(
     'BULK_EMAIL_RETRY_DELAY_BETWEEN_SENDS',
     BULK_EMAIL_RETRY_DELAY_BETWEEN_SENDS
 )
+BULK_EMAIL_RECIPIENT_ID_CHUNK_SIZE = ENV_TOKENS.get(
+    'BULK_EMAIL_RECIPIENT_ID_CHUNK_SIZE',
+    BULK_EMAIL_RECIPIENT_ID_CHUNK_SIZE
+)
 # We want Bulk Email running on the high-priority queue, so we define the
 # routing key that points to it. At the moment, the name is the same.
 # We have to reset the value here, since we have changed the value of the queue name.
@@ -475,6 +479,13 @@ if FEATURES.get('ENABLE_CORS_HEADERS') or FEATURES.get('ENABLE_CROSS_DOMAIN_CSRF
 # 'courseware.student_field_overrides.IndividualStudentOverrideProvider'.
 FIELD_OVERRIDE_PROVIDERS = tuple(ENV_TOKENS.get('FIELD_OVERRIDE_PROVIDERS', []))
 
+STUDENT_STATE_WRITE_BEHIND.update(ENV_TOKENS.get('STUDENT_STATE_WRITE_BEHIND', {}))
+STUDENT_MODULE_HISTORY.update(ENV_TOKENS.get('STUDENT_MODULE_HISTORY', {}))
+DASHBOARD_DATA_CACHE_TIMEOUT = ENV_TOKENS.get('DASHBOARD_DATA_CACHE_TIMEOUT', DASHBOARD_DATA_CACHE_TIMEOUT)
+ENROLLMENT_STATES_CACHE_TIMEOUT = ENV_TOKENS.get('ENROLLMENT_STATES_CACHE_TIMEOUT', ENROLLMENT_STATES_CACHE_TIMEOUT)
+BULK_ENROLLMENT_BATCH_SIZE = ENV_TOKENS.get('BULK_ENROLLMENT_BATCH_SIZE', BULK_ENROLLMENT_BATCH_SIZE)
+COMMENTS_SERVICE_CLIENT.update(ENV_TOKENS.get('COMMENTS_SERVICE_CLIENT', {}))
+
 ############################## SECURE AUTH ITEMS ###############
 # Secret things: passwords, access keys, etc.
 
@@ -563,6 +574,7 @@ XQUEUE_INTERFACE = AUTH_TOKENS['XQUEUE_INTERFACE']
 # use the one from common.py
 MODULESTORE = convert_module_store_setting_if_needed(AUTH_TOKENS.get('MODULESTORE', MODULESTORE))
 CONTENTSTORE = AUTH_TOKENS.get('CONTENTSTORE', CONTENTSTORE)
+CONTENTSERVER_DISK_CACHE = ENV_TOKENS.get('CONTENTSERVER_DISK_CACHE', CONTENTSERVER_DISK_CACHE)
 DOC_STORE_CONFIG = AUTH_TOKENS.get('DOC_STORE_CONFIG', DOC_STORE_CONFIG)
 MONGODB_LOG = AUTH_TOKENS.get('MONGODB_LOG', {})
 
@@ -778,6 +778,14 @@ XBLOCK_FIELD_DATA_WRAPPERS = ()
 
 MODULESTORE_BRANCH = 'published-only'
 CONTENTSTORE = None
+
+# Cache of course assets too large for the Django cache, in files on the local
+# disk of each app server.  Disabled unless DIRECTORY is set.
+CONTENTSERVER_DISK_CACHE = {
+    'DIRECTORY': None,
+    'MAX_BYTES': 10 * 1024 * 1024 * 1024,
+    'MAX_ASSET_BYTES': 1024 * 1024 * 1024,
+}
 DOC_STORE_CONFIG = {
     'host': 'localhost',
     'db': 'xmodule',
@@ -1158,6 +1166,11 @@ MIDDLEWARE_CLASSES = (
     'request_cache.middleware.RequestCache',
     'openedx.core.djangoapps.monitoring_utils.middleware.MonitoringCustomMetrics',
 
+    # Writes the buffered user state updates that are due
+    'courseware.middleware.StudentStateWriteBehindMiddleware',
+    # Sends the StudentModule history collected during the request to be written
+    'courseware.middleware.StudentModuleHistoryMiddleware',
+
     'mobile_api.middleware.AppVersionUpgrade',
     'openedx.core.djangoapps.header_control.middleware.HeaderControlMiddleware',
     'microsite_configuration.middleware.MicrositeMiddleware',
@@ -1874,6 +1887,14 @@ BLOCK_STRUCTURES_SETTINGS = dict(
     # Maximum number of retries per task.
     TASK_MAX_RETRIES=5,
 
+    # Bounds for the in-process cache of deserialized, collected block
+    # structures, shared by grades, course_api and reporting in each
+    # process.  The size is an estimate of the memory used by the
+    # deserialized structures.
+    # Set IN_PROCESS_CACHE_MAX_BYTES to 0 to disable the cache.
+    IN_PROCESS_CACHE_MAX_BYTES=100 * 1024 * 1024,
+    IN_PROCESS_CACHE_MAX_ENTRIES=20,
+
     # Backend storage
     # STORAGE_CLASS='storages.backends.s3boto.S3BotoStorage',
     # STORAGE_KWARGS=dict(bucket='nim-beryl-test'),
@@ -1924,6 +1945,10 @@ BULK_EMAIL_LOG_SENT_EMAILS = False
 # parallel, and what the SES rate is.
 BULK_EMAIL_RETRY_DELAY_BETWEEN_SENDS = 0.02
 
+# Number of user ids read by each query of the recipients of a bulk email,
+# which are read by ranges of ids rather than with offsets.
+BULK_EMAIL_RECIPIENT_ID_CHUNK_SIZE = 10000
+
 ############################# Persistent Grades ####################################
 
 # Queue to use for updating persistent grades
@@ -2954,6 +2979,57 @@ FIELD_OVERRIDE_PROVIDERS = ()
 # require student context.
 MODULESTORE_FIELD_OVERRIDE_PROVIDERS = ()
 
+# Write-behind of Scope.user_state updates, for the block types listed in
+# BLOCK_TYPES (none by default).  Updates of these blocks are buffered in
+# the memory of each process and written once FLUSH_INTERVAL seconds old,
+# unless they set any of WRITE_THROUGH_FIELDS.  See
+# courseware.user_state_write_behind for the trade-offs.
+STUDENT_STATE_WRITE_BEHIND = {
+    'BLOCK_TYPES': [],
+    'FLUSH_INTERVAL': 10,
+    'MAX_PENDING': 10000,
+    'WRITE_THROUGH_FIELDS': ['attempts', 'correct_map', 'done', 'input_state', 'score', 'student_answers'],
+}
+
+# History of StudentModule state, by module type: 'full' saves every change,
+# 'sampled' a SAMPLE_RATE fraction of them and 'none' none.  Module types that
+# are not listed use DEFAULT_POLICY.  With ASYNC, history rows are written in
+# bulk by celery tasks at the end of each request.  See
+# courseware.student_module_history.
+STUDENT_MODULE_HISTORY = {
+    'POLICIES': {'problem': 'full'},
+    'DEFAULT_POLICY': 'none',
+    'SAMPLE_RATE': 0.1,
+    'ASYNC': False,
+    'BATCH_SIZE': 500,
+}
+
+# Number of seconds the per-enrollment data of a learner's dashboard is
+# cached, or 0 not to cache it.  See student.dashboard_data.
+DASHBOARD_DATA_CACHE_TIMEOUT = 5 * 60
+
+# Number of seconds the enrollment states of a user are cached across
+# requests, or 0 not to cache them.  See student.enrollment_cache.
+ENROLLMENT_STATES_CACHE_TIMEOUT = 5 * 60
+
+# Number of users enrolled, or audited, at a time by bulk enrollments.  See
+# student.models.CourseEnrollment.bulk_enroll.
+BULK_ENROLLMENT_BATCH_SIZE = 500
+
+# Client of the comments service.  See lms.lib.comment_client.utils.
+COMMENTS_SERVICE_CLIENT = {
+    # Maximum number of connections to the comments service kept alive by each process.
+    'POOL_MAXSIZE': 10,
+    # Number of threads of each process making independent requests to the
+    # comments service concurrently, or 1 to make them one after the other.
+    'MAX_WORKERS': 1,
+    # Whether identical GET requests to the comments service are only sent once per request.
+    'COALESCE_GETS': False,
+    # Number of seconds the responses of read-heavy endpoints of the comments service are
+    # cached across requests, by endpoint.  See lms.lib.comment_client.cache.
+    'CACHE_TIMEOUTS': {},
+}
+
 # PROFILE IMAGE CONFIG
 # WARNING: Certain django storage backends do not support atomic
 # file overwrites (including the default, OverwriteStorage) - instead
@@ -605,3 +605,9 @@ ECOMMERCE_API_URL = 'https://ecommerce.example.com/api/v2/'
 ENTERPRISE_API_URL = 'http://enterprise.example.com/enterprise/api/v1/'
 
 ACTIVATION_EMAIL_FROM_ADDRESS = 'test_activate@edx.org'
+
+# Don't share deserialized block structures across tests.
+BLOCK_STRUCTURES_SETTINGS = dict(BLOCK_STRUCTURES_SETTINGS, IN_PROCESS_CACHE_MAX_BYTES=0)
+
+# Don't cache the learner dashboard's data across requests, nor across tests.
+DASHBOARD_DATA_CACHE_TIMEOUT = 0
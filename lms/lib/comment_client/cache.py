@@ -0,0 +1,122 @@
+"""
+Opt-in cache, shared across requests, of the responses of read-heavy GET
+endpoints of the comments service.
+
+The CACHE_TIMEOUTS key of the COMMENTS_SERVICE_CLIENT setting maps the names
+of the cached endpoints to the number of seconds their responses are cached:
+
+    * 'thread': a thread, when it is not marked as read by retrieving it,
+    * 'thread_list': a page of the threads of a course or commentable,
+    * 'comment': a comment,
+    * 'user': the profile and stats of a user,
+    * 'user_threads': a page of the threads a user is active in or follows.
+
+Endpoints that are not listed are not cached.
+
+Each cached response depends on scopes, such as its thread, course or user.
+The write paths of the comment client models invalidate the scopes they
+change, which makes all the cached responses depending on them obsolete.
+Changes made outside of this client are only seen once the responses
+expire, so the timeouts should be kept short.
+"""
+import hashlib
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+
+import dogstats_wrapper as dog_stats_api
+
+# Number of seconds the versions of the scopes are cached.  A scope whose
+# version is evicted gets a new version, so this only bounds the hit rate.
+SCOPE_VERSION_TIMEOUT = 24 * 60 * 60
+
+
+def scope(kind, key):
+    """
+    Returns the scope of the cached responses depending on the content of the
+    given kind ('thread', 'comment', 'course' or 'user') and key, or None if
+    the key is unknown.
+    """
+    if key is None:
+        return None
+    return u'{}.{}'.format(kind, key)
+
+
+def get_cache_timeout(endpoint):
+    """
+    Returns the number of seconds the responses of the given endpoint are
+    cached, or 0 if they are not.
+    """
+    return _get_cache_timeouts().get(endpoint, 0)
+
+
+def _get_cache_timeouts():
+    """
+    Returns the CACHE_TIMEOUTS key of the COMMENTS_SERVICE_CLIENT setting.
+    """
+    return getattr(settings, 'COMMENTS_SERVICE_CLIENT', {}).get('CACHE_TIMEOUTS', {})
+
+
+def get_or_perform(endpoint, scopes, request_key, perform_request):
+    """
+    Returns the cached response of the given endpoint for the given request,
+    if it does not depend on scopes changed since it was cached.  Otherwise,
+    calls perform_request, and caches and returns its response.
+    """
+    timeout = get_cache_timeout(endpoint)
+    if not timeout:
+        return perform_request()
+
+    key = _cache_key(endpoint, scopes, request_key)
+    response = cache.get(key)
+    if response is not None:
+        dog_stats_api.increment('comment_client.cache.hit', tags=[u'endpoint:{}'.format(endpoint)])
+        return response
+
+    dog_stats_api.increment('comment_client.cache.miss', tags=[u'endpoint:{}'.format(endpoint)])
+    response = perform_request()
+    cache.set(key, response, timeout)
+    return response
+
+
+def invalidate(*scopes):
+    """
+    Makes the cached responses depending on any of the given scopes obsolete.
+    """
+    if not _get_cache_timeouts():
+        return
+    versions = {_version_key(scope_): uuid4().hex for scope_ in scopes if scope_ is not None}
+    if versions:
+        cache.set_many(versions, SCOPE_VERSION_TIMEOUT)
+
+
+def _cache_key(endpoint, scopes, request_key):
+    """
+    Returns the cache key of the response to the given request, for the
+    current versions of the given scopes.
+    """
+    digest = hashlib.sha1(repr(request_key))
+    for version in _get_versions(scopes):
+        digest.update(version)
+    return u'comment_client.cache.{}.{}'.format(endpoint, digest.hexdigest())
+
+
+def _get_versions(scopes):
+    """
+    Returns the current versions of the given scopes, in order.
+    """
+    version_keys = [_version_key(scope_) for scope_ in scopes if scope_ is not None]
+    versions = cache.get_many(version_keys)
+    missing_versions = {key: uuid4().hex for key in version_keys if key not in versions}
+    if missing_versions:
+        cache.set_many(missing_versions, SCOPE_VERSION_TIMEOUT)
+        versions.update(missing_versions)
+    return [versions[key] for key in version_keys]
+
+
+def _version_key(scope_):
+    """
+    Returns the cache key of the version of the given scope.
+    """
+    return u'comment_client.cache.version.{}'.format(hashlib.sha1(scope_.encode('utf-8')).hexdigest())
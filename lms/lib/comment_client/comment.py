@@ -1,4 +1,4 @@
-from lms.lib.comment_client import models, settings
+from lms.lib.comment_client import cache, models, settings
 
 from .thread import Thread, _url_for_flag_abuse_thread, _url_for_unflag_abuse_thread
 from .utils import CommentClientRequestError, perform_request
@@ -25,6 +25,7 @@ class Comment(models.Model):
 
     base_url = "{prefix}/comments".format(prefix=settings.PREFIX)
     type = 'comment'
+    cache_endpoint = 'comment'
 
     def __init__(self, *args, **kwargs):
         super(Comment, self).__init__(*args, **kwargs)
@@ -41,6 +42,15 @@ class Comment(models.Model):
         """Return the context of the thread which this comment belongs to."""
         return self.thread.context
 
+    def _cache_scopes(self):
+        return [
+            cache.scope('comment', self.attributes.get('id')),
+            cache.scope('comment', self.attributes.get('parent_id')),
+            cache.scope('thread', self.attributes.get('thread_id')),
+            cache.scope('course', self.attributes.get('course_id')),
+            cache.scope('user', self.attributes.get('user_id')),
+        ]
+
     @classmethod
     def url_for_comments(cls, params={}):
         if params.get('parent_id'):
@@ -71,6 +81,7 @@ class Comment(models.Model):
             metric_action='comment.abuse.flagged'
         )
         voteable._update_from_response(response)
+        voteable._invalidate_cache()
 
     def unFlagAbuse(self, user, voteable, removeAll):
         if voteable.type == 'thread':
@@ -92,6 +103,7 @@ class Comment(models.Model):
             metric_action='comment.abuse.unflagged'
         )
         voteable._update_from_response(response)
+        voteable._invalidate_cache()
 
 
 def _url_for_thread_comments(thread_id):
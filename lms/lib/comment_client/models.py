@@ -1,5 +1,6 @@
 import logging
 
+from . import cache
 from .utils import CommentClientRequestError, extract, perform_request
 
 log = logging.getLogger(__name__)
@@ -14,6 +15,9 @@ class Model(object):
     default_retrieve_params = {}
     metric_tag_fields = []
 
+    # The endpoint of lms.lib.comment_client.cache whose timeout applies to the retrieval of this model.
+    cache_endpoint = None
+
     DEFAULT_ACTIONS_WITH_ID = ['get', 'put', 'delete']
     DEFAULT_ACTIONS_WITHOUT_ID = ['get_all', 'post']
     DEFAULT_ACTIONS = DEFAULT_ACTIONS_WITH_ID + DEFAULT_ACTIONS_WITHOUT_ID
@@ -72,10 +76,25 @@ class Model(object):
             url,
             self.default_retrieve_params,
             metric_tags=self._metric_tags,
-            metric_action='model.retrieve'
+            metric_action='model.retrieve',
+            cache_endpoint=self.cache_endpoint,
+            cache_scopes=[cache.scope(self.type, self.id)],
         )
         self._update_from_response(response)
 
+    def _cache_scopes(self):
+        """
+        Returns the scopes of the cached responses that a change of this
+        content makes obsolete.  See lms.lib.comment_client.cache.
+        """
+        return []
+
+    def _invalidate_cache(self):
+        """
+        Makes the cached responses that depend on this content obsolete.
+        """
+        cache.invalidate(*self._cache_scopes())
+
     @property
     def _metric_tags(self):
         """
@@ -151,6 +170,7 @@ class Model(object):
             )
         self.retrieved = True
         self._update_from_response(response)
+        self._invalidate_cache()
         self.after_save(self)
 
     def delete(self):
@@ -158,6 +178,7 @@ class Model(object):
         response = perform_request('delete', url, metric_tags=self._metric_tags, metric_action='model.delete')
         self.retrieved = True
         self._update_from_response(response)
+        self._invalidate_cache()
 
     @classmethod
     def url_with_id(cls, params={}):
@@ -5,6 +5,7 @@ import settings
 import models
 from eventtracking import tracker
 
+from . import cache
 from .utils import (
     CommentClientPaginatedResult,
     CommentClientRequestError,
@@ -50,6 +51,7 @@ class Thread(models.Model):
     base_url = "{prefix}/threads".format(prefix=settings.PREFIX)
     default_retrieve_params = {'recursive': False}
     type = 'thread'
+    cache_endpoint = 'thread'
 
     @classmethod
     def search(cls, query_params):
@@ -75,7 +77,9 @@ class Thread(models.Model):
             params,
             metric_tags=[u'course_id:{}'.format(query_params['course_id'])],
             metric_action='thread.search',
-            paged_results=True
+            paged_results=True,
+            cache_endpoint='thread_list',
+            cache_scopes=[cache.scope('course', query_params['course_id']), cache.scope('user', params.get('user_id'))],
         )
         if query_params.get('text'):
             search_query = query_params['text']
@@ -156,10 +160,20 @@ class Thread(models.Model):
             url,
             request_params,
             metric_action='model.retrieve',
-            metric_tags=self._metric_tags
+            metric_tags=self._metric_tags,
+            # Retrieving a thread marks it as read, unless told otherwise.
+            cache_endpoint=None if request_params['mark_as_read'] else self.cache_endpoint,
+            cache_scopes=[cache.scope('thread', self.id)],
         )
         self._update_from_response(response)
 
+    def _cache_scopes(self):
+        return [
+            cache.scope('thread', self.attributes.get('id')),
+            cache.scope('course', self.attributes.get('course_id')),
+            cache.scope('user', self.attributes.get('user_id')),
+        ]
+
     def flagAbuse(self, user, voteable):
         if voteable.type == 'thread':
             url = _url_for_flag_abuse_thread(voteable.id)
@@ -176,6 +190,7 @@ class Thread(models.Model):
             metric_tags=self._metric_tags
         )
         voteable._update_from_response(response)
+        voteable._invalidate_cache()
 
     def unFlagAbuse(self, user, voteable, removeAll):
         if voteable.type == 'thread':
@@ -197,6 +212,7 @@ class Thread(models.Model):
             metric_action='thread.abuse.unflagged'
         )
         voteable._update_from_response(response)
+        voteable._invalidate_cache()
 
     def pin(self, user, thread_id):
         url = _url_for_pin_thread(thread_id)
@@ -209,6 +225,7 @@ class Thread(models.Model):
             metric_action='thread.pin'
         )
         self._update_from_response(response)
+        self._invalidate_cache()
 
     def un_pin(self, user, thread_id):
         url = _url_for_un_pin_thread(thread_id)
@@ -221,6 +238,7 @@ class Thread(models.Model):
             metric_action='thread.unpin'
         )
         self._update_from_response(response)
+        self._invalidate_cache()
 
 
 def _url_for_flag_abuse_thread(thread_id):
@@ -3,6 +3,7 @@ import settings
 
 import models
 
+from . import cache
 from .utils import CommentClientPaginatedResult, CommentClientRequestError, merge_dict, perform_request
 
 
@@ -24,6 +25,7 @@ class User(models.Model):
     base_url = "{prefix}/users".format(prefix=settings.PREFIX)
     default_retrieve_params = {'complete': True}
     type = 'user'
+    cache_endpoint = 'user'
 
     @classmethod
     def from_django_user(cls, user):
@@ -43,6 +45,7 @@ class User(models.Model):
             metric_action='user.read',
             metric_tags=self._metric_tags + ['target.type:{}'.format(source.type)],
         )
+        cache.invalidate(cache.scope('user', self.id), cache.scope(source.type, source.id))
 
     def follow(self, source):
         params = {'source_type': source.type, 'source_id': source.id}
@@ -53,6 +56,7 @@ class User(models.Model):
             metric_action='user.follow',
             metric_tags=self._metric_tags + ['target.type:{}'.format(source.type)],
         )
+        cache.invalidate(cache.scope('user', self.id), cache.scope(source.type, source.id))
 
     def unfollow(self, source):
         params = {'source_type': source.type, 'source_id': source.id}
@@ -63,6 +67,7 @@ class User(models.Model):
             metric_action='user.unfollow',
             metric_tags=self._metric_tags + ['target.type:{}'.format(source.type)],
         )
+        cache.invalidate(cache.scope('user', self.id), cache.scope(source.type, source.id))
 
     def vote(self, voteable, value):
         if voteable.type == 'thread':
@@ -80,6 +85,7 @@ class User(models.Model):
             metric_tags=self._metric_tags + ['target.type:{}'.format(voteable.type)],
         )
         voteable._update_from_response(response)
+        cache.invalidate(cache.scope('user', self.id), *voteable._cache_scopes())
 
     def unvote(self, voteable):
         if voteable.type == 'thread':
@@ -97,6 +103,7 @@ class User(models.Model):
             metric_tags=self._metric_tags + ['target.type:{}'.format(voteable.type)],
         )
         voteable._update_from_response(response)
+        cache.invalidate(cache.scope('user', self.id), *voteable._cache_scopes())
 
     def active_threads(self, query_params={}):
         if not self.course_id:
@@ -111,6 +118,8 @@ class User(models.Model):
             metric_action='user.active_threads',
             metric_tags=self._metric_tags,
             paged_results=True,
+            cache_endpoint='user_threads',
+            cache_scopes=self._threads_cache_scopes(),
         )
         return response.get('collection', []), response.get('page', 1), response.get('num_pages', 1)
 
@@ -126,7 +135,9 @@ class User(models.Model):
             params,
             metric_action='user.subscribed_threads',
             metric_tags=self._metric_tags,
-            paged_results=True
+            paged_results=True,
+            cache_endpoint='user_threads',
+            cache_scopes=self._threads_cache_scopes(),
         )
         return CommentClientPaginatedResult(
             collection=response.get('collection', []),
@@ -135,6 +146,15 @@ class User(models.Model):
             thread_count=response.get('thread_count', 0)
         )
 
+    def _threads_cache_scopes(self):
+        """
+        Returns the scopes of the cached pages of the threads of the user in its course.
+        """
+        return [cache.scope('user', self.id), cache.scope('course', self.course_id)]
+
+    def _cache_scopes(self):
+        return [cache.scope('user', self.attributes.get('id'))]
+
     def _retrieve(self, *args, **kwargs):
         url = self.url(action='get', params=self.attributes)
         retrieve_params = self.default_retrieve_params.copy()
@@ -150,6 +170,8 @@ class User(models.Model):
                 retrieve_params,
                 metric_action='model.retrieve',
                 metric_tags=self._metric_tags,
+                cache_endpoint=self.cache_endpoint,
+                cache_scopes=[cache.scope('user', self.id)],
             )
         except CommentClientRequestError as e:
             if e.status_code == 404:
@@ -162,6 +184,8 @@ class User(models.Model):
                     retrieve_params,
                     metric_action='model.retrieve',
                     metric_tags=self._metric_tags,
+                    cache_endpoint=self.cache_endpoint,
+                    cache_scopes=[cache.scope('user', self.id)],
                 )
             else:
                 raise
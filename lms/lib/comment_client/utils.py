@@ -1,17 +1,35 @@
 """" Common utilities for comment client wrapper """
+import copy
+import cookielib
 import logging
+import os
+import threading
+from collections import namedtuple
 from contextlib import contextmanager
+from functools import partial
+from multiprocessing.pool import ThreadPool
 from time import time
 from uuid import uuid4
 
 import requests
 from django.conf import settings
+from django.db import close_old_connections
+from django.utils import translation
 from django.utils.translation import get_language
 
 import dogstats_wrapper as dog_stats_api
+import request_cache
+
+from . import cache
 
 log = logging.getLogger(__name__)
 
+# Defaults of the keys of the COMMENTS_SERVICE_CLIENT setting.
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_WORKERS = 1
+
+COALESCED_RESPONSES_CACHE_NAME = 'comment_client.coalesced_responses'
+
 
 def strip_none(dic):
     return dict([(k, v) for k, v in dic.iteritems() if v is not None])
@@ -53,15 +71,215 @@ def request_timer(request_id, method, url, tags=None):
     )
 
 
-def perform_request(method, url, data_or_params=None, raw=False,
-                    metric_action=None, metric_tags=None, paged_results=False):
+def _get_setting(name, default=None):
+    """
+    Returns the value of the given key of the COMMENTS_SERVICE_CLIENT setting.
+    """
+    return getattr(settings, 'COMMENTS_SERVICE_CLIENT', {}).get(name, default)
+
+
+class _ProcessResources(object):
+    """
+    The HTTP session and the thread pool shared by the threads of the current
+    process, which are created again after a fork since neither its sockets
+    nor its threads can be shared with the parent process.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid = None
+        self._session = None
+        self._thread_pool = None
+
+    def _check_pid(self):
+        """
+        Forgets the resources inherited from a parent process.
+        """
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._session = None
+            self._thread_pool = None
+
+    def get_session(self):
+        """
+        Returns the session keeping alive up to POOL_MAXSIZE connections to
+        the comments service.  Cookies are not kept, since the session is
+        shared by the requests of all users.
+        """
+        with self._lock:
+            self._check_pid()
+            if self._session is None:
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_maxsize=_get_setting('POOL_MAXSIZE', DEFAULT_POOL_MAXSIZE),
+                )
+                session = requests.Session()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.cookies.set_policy(cookielib.DefaultCookiePolicy(allowed_domains=[]))
+                self._session = session
+            return self._session
+
+    def get_thread_pool(self):
+        """
+        Returns the pool of MAX_WORKERS threads calling functions concurrently.
+        """
+        with self._lock:
+            self._check_pid()
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPool(_get_setting('MAX_WORKERS', DEFAULT_MAX_WORKERS))
+            return self._thread_pool
+
+
+_process_resources = _ProcessResources()  # pylint: disable=invalid-name
+
+
+# The state of the calling thread with which a function is called by perform_concurrently.
+_CallerContext = namedtuple('_CallerContext', ['language', 'config', 'coalesced_responses'])
+
+
+class _ThreadContext(threading.local):
+    """
+    The state of the calling thread of the function being called by the
+    current thread of the pool, if any.
+    """
+    def __init__(self):
+        super(_ThreadContext, self).__init__()
+        self.caller_context = None
+
+
+_thread_context = _ThreadContext()  # pylint: disable=invalid-name
+
+
+def send_request(method, url, data=None, params=None, headers=None, timeout=None):
+    """
+    Sends a request to the comments service over one of the connections kept
+    alive by the shared session, and returns its response.
+    """
+    return _process_resources.get_session().request(
+        method,
+        url,
+        data=data,
+        params=params,
+        headers=headers,
+        timeout=timeout,
+    )
+
+
+def perform_concurrently(*functions):
+    """
+    Calls the given functions, which make independent requests to the
+    comments service, and returns the list of their results.
+
+    The functions are called concurrently by the MAX_WORKERS threads of the
+    COMMENTS_SERVICE_CLIENT setting, with the language, forums configuration
+    and coalesced responses of the calling thread.  They are called one after
+    the other when MAX_WORKERS is 1, and when called from one of these
+    threads.  The exception raised by any function is raised again.
+    """
+    if (
+            len(functions) < 2 or
+            _thread_context.caller_context is not None or
+            _get_setting('MAX_WORKERS', DEFAULT_MAX_WORKERS) < 2
+    ):
+        return [function() for function in functions]
+
+    caller_context = _CallerContext(get_language(), _get_forums_config(), _get_coalesced_responses())
+    return _process_resources.get_thread_pool().map(
+        partial(_call_with_caller_context, caller_context),
+        functions,
+        chunksize=1,
+    )
+
+
+def _call_with_caller_context(caller_context, function):
+    """
+    Calls the given function from a thread of the pool, with the given state
+    of its calling thread.
+    """
+    _thread_context.caller_context = caller_context
+    try:
+        with translation.override(caller_context.language):
+            return function()
+    finally:
+        _thread_context.caller_context = None
+        close_old_connections()
+
+
+def _get_forums_config():
+    """
+    Returns the current ForumsConfig, which is read once per request.
+    """
+    if _thread_context.caller_context is not None:
+        return _thread_context.caller_context.config
+
     # To avoid dependency conflict
     from django_comment_common.models import ForumsConfig
-    config = ForumsConfig.current()
+    return ForumsConfig.current_for_request()
+
+
+def _get_coalesced_responses():
+    """
+    Returns the responses to the GET requests made so far in the current
+    request, by request, or None if identical GET requests are not coalesced.
+    """
+    if _thread_context.caller_context is not None:
+        return _thread_context.caller_context.coalesced_responses
+    if not _get_setting('COALESCE_GETS', False):
+        return None
+    return request_cache.get_cache(COALESCED_RESPONSES_CACHE_NAME)
+
 
+def perform_request(method, url, data_or_params=None, raw=False,
+                    metric_action=None, metric_tags=None, paged_results=False,
+                    cache_endpoint=None, cache_scopes=None):
+    """
+    Performs the given request to the comments service, and returns its
+    response, decoded from JSON unless raw is set.
+
+    When the COALESCE_GETS key of the COMMENTS_SERVICE_CLIENT setting is set,
+    identical GET requests are only sent once per request, until a request of
+    another method is made.
+
+    The responses to GET requests of the given cache_endpoint are cached
+    across requests if its CACHE_TIMEOUTS are set, until any of the given
+    cache_scopes are invalidated.  See lms.lib.comment_client.cache.
+    """
+    config = _get_forums_config()
     if not config.enabled:
         raise CommentClientMaintenanceError('service disabled')
 
+    is_get = method.lower() == 'get'
+    perform = partial(
+        _perform_request, config, method, url, data_or_params, raw, metric_action, metric_tags, paged_results
+    )
+    request_key = (url, repr(sorted((data_or_params or {}).items())), get_language(), raw)
+    if is_get and cache_endpoint is not None:
+        perform = partial(cache.get_or_perform, cache_endpoint, cache_scopes or [], request_key, perform)
+
+    coalesced_responses = _get_coalesced_responses()
+    if coalesced_responses is None:
+        return perform()
+
+    if not is_get:
+        # Any change may make the responses to earlier GET requests obsolete.
+        coalesced_responses.clear()
+        try:
+            return perform()
+        finally:
+            coalesced_responses.clear()
+
+    if request_key in coalesced_responses:
+        dog_stats_api.increment('comment_client.request.coalesced', tags=[u'action:{}'.format(metric_action)])
+    else:
+        coalesced_responses[request_key] = perform()
+    # The callers may change the responses they are given.
+    return copy.deepcopy(coalesced_responses[request_key])
+
+
+def _perform_request(config, method, url, data_or_params, raw, metric_action, metric_tags, paged_results):
+    """
+    Sends the given request to the comments service, and returns its
+    response, decoded from JSON unless raw is set.
+    """
     if metric_tags is None:
         metric_tags = []
 
@@ -85,7 +303,7 @@ def perform_request(method, url, data_or_params=None, raw=False,
         data = None
         params = merge_dict(data_or_params, request_id_dict)
     with request_timer(request_id, method, url, metric_tags):
-        response = requests.request(
+        response = send_request(
             method,
             url,
             data=data,
@@ -278,6 +278,14 @@ urlpatterns += (
         name='xqueue_callback',
     ),
 
+    url(
+        r'^courses/{}/xqueue_bulk$'.format(
+            settings.COURSE_ID_PATTERN,
+        ),
+        'courseware.module_render.xqueue_callback_bulk',
+        name='xqueue_callback_bulk',
+    ),
+
     # TODO: These views need to be updated before they work
     url(r'^calculate$', 'util.views.calculate'),
 
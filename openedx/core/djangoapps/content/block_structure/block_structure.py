@@ -7,6 +7,8 @@ Module with family of classes for block structures.
 The following internal data structures are implemented:
     _BlockRelations - Data structure for a single block's relations.
     _BlockData - Data structure for a single block's data.
+    LazyTransformerDataMap - Transformer data of a single block,
+        loaded on first access.
 """
 from copy import deepcopy
 from functools import partial
@@ -28,7 +30,11 @@ class _BlockRelations(object):
     """
     Data structure to encapsulate relationships for a single block,
     including its children and parents.
+
+    Uses __slots__ since a structure holds one instance per block.
     """
+    __slots__ = ('parents', 'children')
+
     def __init__(self):
 
         # List of usage keys of this block's parents.
@@ -39,6 +45,15 @@ class _BlockRelations(object):
         # list [UsageKey]
         self.children = []
 
+    def __getstate__(self):
+        return {'parents': self.parents, 'children': self.children}
+
+    def __setstate__(self, state):
+        # The state is a dict, as it was before __slots__ were used,
+        # so that previously pickled instances can still be loaded.
+        self.parents = state['parents']
+        self.children = state['children']
+
 
 class BlockStructure(object):
     """
@@ -91,7 +106,10 @@ class BlockStructure(object):
         Returns:
             [UsageKey] - A list of usage keys of the block's parents.
         """
-        return self._block_relations[usage_key].parents if usage_key in self else []
+        try:
+            return self._block_relations[usage_key].parents
+        except KeyError:
+            return []
 
     def get_children(self, usage_key):
         """
@@ -105,7 +123,10 @@ class BlockStructure(object):
         Returns:
             [UsageKey] - A list of usage keys of the block's children.
         """
-        return self._block_relations[usage_key].children if usage_key in self else []
+        try:
+            return self._block_relations[usage_key].children
+        except KeyError:
+            return []
 
     def set_root_block(self, usage_key):
         """
@@ -277,10 +298,21 @@ class BlockStructure(object):
             block_relations[usage_key] = _BlockRelations()
 
 
+# Cache of each FieldData class to the frozenset of its class_field_names.
+_CLASS_FIELD_NAMES = {}
+
+
 class FieldData(object):
     """
     Data structure to encapsulate collected fields.
+
+    The fields defined directly on the class are stored in __slots__,
+    rather than in a per-instance __dict__, since a structure holds
+    several instances per block.  Subclasses adding such fields must
+    declare them in both __slots__ and class_field_names.
     """
+    __slots__ = ('fields',)
+
     def class_field_names(self):
         """
         Returns list of names of fields that are defined directly
@@ -295,8 +327,10 @@ class FieldData(object):
         self.fields = {}
 
     def __getattr__(self, field_name):
+        # Only called when field_name is not found on the instance or
+        # its class, so an own field here has not been set yet.
         if self._is_own_field(field_name):
-            return super(FieldData, self).__getattr__(field_name)
+            raise AttributeError("Field {0} is not set".format(field_name))
         try:
             return self.fields[field_name]
         except KeyError:
@@ -314,19 +348,36 @@ class FieldData(object):
         else:
             delattr(self.fields, field_name)
 
+    def __getstate__(self):
+        return {
+            field_name: getattr(self, field_name)
+            for field_name in self.class_field_names()
+            if hasattr(self, field_name)
+        }
+
+    def __setstate__(self, state):
+        # The state is a dict, as it was before __slots__ were used,
+        # so that previously pickled instances can still be loaded.
+        for field_name, field_value in state.iteritems():
+            setattr(self, field_name, field_value)
+
     def _is_own_field(self, field_name):
         """
         Returns whether the given field_name is the name of an
         actual field of this class.
         """
-        return field_name in self.class_field_names()
+        try:
+            own_field_names = _CLASS_FIELD_NAMES[type(self)]
+        except KeyError:
+            own_field_names = _CLASS_FIELD_NAMES[type(self)] = frozenset(self.class_field_names())
+        return field_name in own_field_names
 
 
 class TransformerData(FieldData):
     """
     Data structure to encapsulate collected data for a transformer.
     """
-    pass
+    __slots__ = ()
 
 
 class TransformerDataMap(dict):
@@ -360,6 +411,23 @@ class TransformerDataMap(dict):
             self[key] = new_transformer_data
             return new_transformer_data
 
+    def copy_for_transform(self):
+        """
+        Returns a new TransformerDataMap with a copy of each transformer's
+        fields map.  The field values themselves are shared.
+        """
+        new_map = self._new_empty_map()
+        for transformer_name, transformer_data in self.iteritems():
+            new_map[transformer_name] = new_transformer_data = TransformerData()
+            new_transformer_data.fields = dict(transformer_data.fields)
+        return new_map
+
+    def _new_empty_map(self):
+        """
+        Returns a new, empty map of the same kind as this one.
+        """
+        return TransformerDataMap()
+
     def _translate_key(self, key):
         """
         Allows the given key to be either the transformer's class or name,
@@ -375,10 +443,48 @@ class TransformerDataMap(dict):
             return key
 
 
+class LazyTransformerDataMap(TransformerDataMap):
+    """
+    A TransformerDataMap for a single block of a deserialized block
+    structure, whose transformers' data is loaded on first access.
+
+    The given loader's load(transformer_name, block_index) method returns
+    the block's TransformerData for the transformer, or None if it has
+    none.  Iterating over the map only yields the transformers' data
+    loaded so far; call load_all first to iterate over all of it.
+    """
+    def __init__(self, loader, block_index):
+        super(LazyTransformerDataMap, self).__init__()
+        self._loader = loader
+        self._block_index = block_index
+
+    def __missing__(self, key):
+        transformer_data = self._loader.load(key, self._block_index)
+        if transformer_data is None:
+            raise KeyError(key)
+        dict.__setitem__(self, key, transformer_data)
+        return transformer_data
+
+    def load_all(self):
+        """
+        Loads the data of all of the block's transformers.
+        """
+        for transformer_name in self._loader.transformer_names():
+            try:
+                self[transformer_name]
+            except KeyError:
+                pass
+
+    def _new_empty_map(self):
+        return LazyTransformerDataMap(self._loader, self._block_index)
+
+
 class BlockData(FieldData):
     """
     Data structure to encapsulate collected data for a single block.
     """
+    __slots__ = ('location', 'transformer_data')
+
     def class_field_names(self):
         return super(BlockData, self).class_field_names() + ['location', 'transformer_data']
 
@@ -427,6 +533,38 @@ class BlockStructureBlockData(BlockStructure):
             deepcopy(self._block_data_map),
         )
 
+    def copy_for_transform(self):
+        """
+        Returns a new instance of BlockStructureBlockData that can be
+        transformed without affecting this instance.
+
+        Unlike copy, only the containers that transformers modify are
+        copied: the block relations and the field and transformer data
+        maps.  The collected values themselves are shared, since
+        transformers re-assign collected values rather than mutating them.
+        This makes it much cheaper than copy for large structures.
+        """
+        from .factory import BlockStructureFactory
+
+        block_relations = {}
+        for usage_key, relations in self._block_relations.iteritems():
+            block_relations[usage_key] = new_relations = _BlockRelations()
+            new_relations.parents = list(relations.parents)
+            new_relations.children = list(relations.children)
+
+        block_data_map = {}
+        for usage_key, block_data in self._block_data_map.iteritems():
+            block_data_map[usage_key] = new_block_data = BlockData(usage_key)
+            new_block_data.fields = dict(block_data.fields)
+            new_block_data.transformer_data = block_data.transformer_data.copy_for_transform()
+
+        return BlockStructureFactory.create_new(
+            self.root_block_usage_key,
+            block_relations,
+            self.transformer_data.copy_for_transform(),
+            block_data_map,
+        )
+
     def iteritems(self):
         """
         Returns iterator of (UsageKey, BlockData) pairs for all
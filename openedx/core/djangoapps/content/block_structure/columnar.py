@@ -0,0 +1,255 @@
+"""
+Module for the columnar serialization of collected BlockStructures.
+
+Compared to pickling the structure's objects as-is, this format:
+
+    * interns the usage keys of the blocks to integer indices, storing
+      each key only once, as a (block_type, block_id) pair when it can be
+      rebuilt from the root's course key,
+    * stores the parent/child relations as flat arrays of indices,
+    * stores the collected xBlock fields and each transformer's block
+      fields as columns, rather than as one dict per block, and
+    * compresses each transformer's block data separately, so that it is
+      only decompressed and unpickled when a caller first accesses it.
+
+Serialized data is prefixed with FORMAT_MARKER so that it can be told
+apart from the legacy format at read time, regardless of which format is
+currently configured for writes.
+"""
+import cPickle as pickle
+from array import array
+
+from openedx.core.lib.cache_utils import zpickle, zunpickle
+
+from .block_structure import (
+    BlockData,
+    BlockStructureBlockData,
+    LazyTransformerDataMap,
+    TransformerData,
+    _BlockRelations,
+)
+
+
+FORMAT_MARKER = 'BSCOL1:'
+
+# Array typecode for block indices.
+_INDEX_TYPECODE = 'l'
+
+
+def is_columnar(serialized_data):
+    """
+    Returns whether the given serialized data is in the columnar format.
+    """
+    return serialized_data.startswith(FORMAT_MARKER)
+
+
+def serialize(block_structure):
+    """
+    Returns the columnar serialization of the given block structure.
+    """
+    block_keys = list(block_structure._block_relations)  # pylint: disable=protected-access
+    for block_key in block_structure._block_data_map:  # pylint: disable=protected-access
+        if block_key not in block_structure._block_relations:  # pylint: disable=protected-access
+            block_keys.append(block_key)
+    index_of = {block_key: index for index, block_key in enumerate(block_keys)}
+
+    structure = dict(
+        keys=_encode_keys(block_structure.root_block_usage_key, block_keys),
+        num_related=len(block_structure._block_relations),  # pylint: disable=protected-access
+        children=_encode_relations(block_structure, block_keys, index_of, 'children'),
+        parents=_encode_relations(block_structure, block_keys, index_of, 'parents'),
+        block_data=array(_INDEX_TYPECODE, sorted(
+            index_of[block_key] for block_key in block_structure._block_data_map  # pylint: disable=protected-access
+        )),
+        fields=_encode_columns(
+            (index_of[block_key], block_data.fields)
+            for block_key, block_data in block_structure._block_data_map.iteritems()  # pylint: disable=protected-access
+        ),
+    )
+
+    transformer_sections = {}
+    for block_key, block_data in block_structure._block_data_map.iteritems():  # pylint: disable=protected-access
+        if isinstance(block_data.transformer_data, LazyTransformerDataMap):
+            block_data.transformer_data.load_all()
+        for transformer_name, transformer_data in block_data.transformer_data.iteritems():
+            transformer_sections.setdefault(transformer_name, []).append(
+                (index_of[block_key], transformer_data.fields)
+            )
+
+    return FORMAT_MARKER + pickle.dumps(
+        dict(
+            structure=zpickle(structure),
+            transformer_data=zpickle(
+                {name: data.fields for name, data in block_structure.transformer_data.iteritems()}
+            ),
+            transformer_block_data={
+                transformer_name: zpickle(_encode_columns(block_fields))
+                for transformer_name, block_fields in transformer_sections.iteritems()
+            },
+        ),
+        pickle.HIGHEST_PROTOCOL,
+    )
+
+
+def deserialize(serialized_data, root_block_usage_key):
+    """
+    Returns the block structure for the given columnar serialization.
+
+    The xBlock fields and relations are loaded immediately, while each
+    transformer's block data is loaded on first access.
+    """
+    sections = pickle.loads(serialized_data[len(FORMAT_MARKER):])
+    structure = zunpickle(sections['structure'])
+
+    block_keys = _decode_keys(root_block_usage_key, structure['keys'])
+
+    block_structure = BlockStructureBlockData(root_block_usage_key)
+    block_structure._block_relations = block_relations = {}  # pylint: disable=protected-access
+    for index in xrange(structure['num_related']):
+        block_relations[block_keys[index]] = _BlockRelations()
+    _decode_relations(block_relations, block_keys, structure['children'], 'children')
+    _decode_relations(block_relations, block_keys, structure['parents'], 'parents')
+
+    loader = _TransformerBlockDataLoader(sections['transformer_block_data'])
+    block_data_map = block_structure._block_data_map  # pylint: disable=protected-access
+    block_data_by_index = {}
+    for index in structure['block_data']:
+        block_data = BlockData(block_keys[index])
+        block_data.transformer_data = LazyTransformerDataMap(loader, index)
+        block_data_map[block_keys[index]] = block_data_by_index[index] = block_data
+    for index, fields in _decode_columns(structure['fields']).iteritems():
+        block_data_by_index[index].fields = fields
+
+    for transformer_name, fields in zunpickle(sections['transformer_data']).iteritems():
+        block_structure.transformer_data[transformer_name] = transformer_data = TransformerData()
+        transformer_data.fields = fields
+
+    return block_structure
+
+
+class _TransformerBlockDataLoader(object):
+    """
+    Loads the block data of each transformer from its compressed section
+    on first access, shared by all blocks of a deserialized structure.
+    """
+    def __init__(self, compressed_sections):
+        self._compressed_sections = compressed_sections
+        self._decoded_sections = {}
+
+    def transformer_names(self):
+        """
+        Returns the names of the transformers with block data.
+        """
+        return self._compressed_sections.keys()
+
+    def load(self, transformer_name, block_index):
+        """
+        Returns a new TransformerData with the given transformer's data for
+        the block with the given index, or None if there is none.
+        """
+        try:
+            decoded = self._decoded_sections[transformer_name]
+        except KeyError:
+            compressed = self._compressed_sections.get(transformer_name)
+            decoded = _decode_columns(zunpickle(compressed)) if compressed is not None else {}
+            self._decoded_sections[transformer_name] = decoded
+
+        fields = decoded.get(block_index)
+        if fields is None:
+            return None
+        transformer_data = TransformerData()
+        transformer_data.fields = dict(fields)
+        return transformer_data
+
+
+def _encode_keys(root_block_usage_key, block_keys):
+    """
+    Returns the interned representation of the given block keys: a list of
+    (block_type, block_id) pairs if all the keys can be rebuilt from the
+    root's course key, or else the list of keys themselves.
+    """
+    try:
+        course_key = root_block_usage_key.course_key
+        pairs = [(block_key.block_type, block_key.block_id) for block_key in block_keys]
+    except AttributeError:
+        return ('keys', block_keys)
+
+    if all(
+            course_key.make_usage_key(block_type, block_id) == block_key
+            for (block_type, block_id), block_key in zip(pairs, block_keys)
+    ):
+        return ('pairs', pairs)
+    return ('keys', block_keys)
+
+
+def _decode_keys(root_block_usage_key, encoded_keys):
+    """
+    Returns the list of block keys for the given interned representation.
+    """
+    encoding, values = encoded_keys
+    if encoding == 'pairs':
+        make_usage_key = root_block_usage_key.course_key.make_usage_key
+        return [make_usage_key(block_type, block_id) for block_type, block_id in values]
+    return values
+
+
+def _encode_relations(block_structure, block_keys, index_of, relation_name):
+    """
+    Returns the given relation of all related blocks as an (offsets, indices)
+    pair of arrays, where the related indices of block i are found at
+    indices[offsets[i]:offsets[i + 1]].
+    """
+    block_relations = block_structure._block_relations  # pylint: disable=protected-access
+    offsets = array(_INDEX_TYPECODE, [0])
+    indices = array(_INDEX_TYPECODE)
+    for block_key in block_keys[:len(block_relations)]:
+        indices.extend(index_of[related_key] for related_key in getattr(block_relations[block_key], relation_name))
+        offsets.append(len(indices))
+    return offsets, indices
+
+
+def _decode_relations(block_relations, block_keys, encoded_relations, relation_name):
+    """
+    Sets the given relation on each of the given block relations, from
+    its encoded (offsets, indices) pair.
+    """
+    offsets, indices = encoded_relations
+    for index in xrange(len(offsets) - 1):
+        setattr(
+            block_relations[block_keys[index]],
+            relation_name,
+            [block_keys[related] for related in indices[offsets[index]:offsets[index + 1]]],
+        )
+
+
+def _encode_columns(indexed_fields):
+    """
+    Returns the given (block index, fields dict) pairs as a map of each field
+    name to an (indices, values) pair of columns, holding the field's value
+    for each block that has it.
+    """
+    columns = {}
+    for index, fields in indexed_fields:
+        for field_name, value in fields.iteritems():
+            try:
+                indices, values = columns[field_name]
+            except KeyError:
+                indices, values = columns[field_name] = (array(_INDEX_TYPECODE), [])
+            indices.append(index)
+            values.append(value)
+    return columns
+
+
+def _decode_columns(columns):
+    """
+    Returns a map of each block index to its fields dict, for the given
+    field columns.
+    """
+    fields_by_index = {}
+    for field_name, (indices, values) in columns.iteritems():
+        for index, value in zip(indices, values):
+            try:
+                fields_by_index[index][field_name] = value
+            except KeyError:
+                fields_by_index[index] = {field_name: value}
+    return fields_by_index
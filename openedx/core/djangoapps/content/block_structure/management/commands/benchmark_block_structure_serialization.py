@@ -0,0 +1,92 @@
+"""
+Command to compare the serialization formats of collected block structures.
+"""
+import logging
+from time import time
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from openedx.core.djangoapps.content.block_structure import columnar
+from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
+from openedx.core.lib.cache_utils import zpickle, zunpickle
+from openedx.core.lib.command_utils import parse_course_keys
+
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Example usage:
+        $ ./manage.py lms benchmark_block_structure_serialization 'edX/DemoX/Demo_Course' --settings=devstack
+    """
+    args = u'<course_id course_id ...>'
+    help = u'Reports the size and (de)serialization times of collected course blocks in each storage format.'
+
+    def add_arguments(self, parser):
+        """
+        Entry point for subclassed commands to add custom arguments.
+        """
+        parser.add_argument(
+            '--courses',
+            dest='courses',
+            nargs='+',
+            required=True,
+            help=u'Benchmark the collected course blocks of the list of courses provided.',
+        )
+        parser.add_argument(
+            '--iterations',
+            help=u'Number of times to serialize and deserialize each course.',
+            default=10,
+            type=int,
+        )
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError(u'iterations must be a positive integer.')
+
+        for course_key in parse_course_keys(options['courses']):
+            block_structure = get_block_structure_manager(course_key).get_collected()
+            root_block_usage_key = block_structure.root_block_usage_key
+            for format_name, serialize, deserialize in (
+                    (u'pickle', _legacy_serialize, lambda data, _: zunpickle(data)),
+                    (u'columnar', columnar.serialize, columnar.deserialize),
+            ):
+                serialize_time = _time_it(options['iterations'], serialize, block_structure)
+                serialized_data = serialize(block_structure)
+                deserialize_time = _time_it(options['iterations'], deserialize, serialized_data, root_block_usage_key)
+                self.stdout.write(
+                    u'{course}\t{format}\tblocks={blocks}\tsize={size}\tserialize={serialize:.2f}ms\t'
+                    u'deserialize={deserialize:.2f}ms'.format(
+                        course=unicode(course_key),
+                        format=format_name,
+                        blocks=len(block_structure),
+                        size=len(serialized_data),
+                        serialize=serialize_time * 1000,
+                        deserialize=deserialize_time * 1000,
+                    )
+                )
+
+
+def _legacy_serialize(block_structure):
+    """
+    Returns the serialization of the given block structure in the
+    format of BlockStructureStore._serialize.
+    """
+    return zpickle((
+        block_structure._block_relations,  # pylint: disable=protected-access
+        block_structure.transformer_data,
+        block_structure._block_data_map,  # pylint: disable=protected-access
+    ))
+
+
+def _time_it(iterations, func, *args):
+    """
+    Returns the average wall-clock time, in seconds, of calling func
+    with the given args.
+    """
+    start = time()
+    for _ in xrange(iterations):
+        func(*args)
+    return (time() - start) / iterations
@@ -60,7 +60,9 @@ class BlockStructureManager(object):
             BlockStructureBlockData - A transformed block structure,
                 starting at starting_block_usage_key.
         """
-        block_structure = collected_block_structure.copy() if collected_block_structure else self.get_collected()
+        # Collected structures may be shared with other callers through the
+        # in-process cache, so always transform a copy.
+        block_structure = (collected_block_structure or self.get_collected()).copy_for_transform()
 
         if starting_block_usage_key:
             # Override the root_block_usage_key so traversals start at the
@@ -88,7 +90,9 @@ class BlockStructureManager(object):
         Returns:
             BlockStructureBlockData - A collected block structure,
                 starting at root_block_usage_key, with collected data
-                from each registered transformer.
+                from each registered transformer.  The structure may be
+                shared with other callers in this process and must not
+                be mutated; use get_transformed to transform it.
         """
         try:
             block_structure = BlockStructureFactory.create_from_store(
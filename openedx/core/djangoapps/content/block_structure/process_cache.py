@@ -0,0 +1,177 @@
+"""
+Module for the in-process cache of deserialized, collected BlockStructures.
+
+Deserializing a collected block structure (zlib + unpickle) is costly for
+large courses, and batch jobs such as grading and reporting do it over and
+over for the same course version.  This cache keeps the most recently used
+deserialized structures in the memory of the current process, keyed by the
+version of the stored data.
+
+Structures returned from this cache are shared between callers and must
+not be mutated.  BlockStructureManager.get_transformed copies them before
+applying any transformers.
+"""
+import sys
+import threading
+import types
+from collections import OrderedDict
+from logging import getLogger
+
+from django.conf import settings
+
+
+logger = getLogger(__name__)  # pylint: disable=C0103
+
+# Default upper bound for the estimated memory used by the cached structures.
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+# Default upper bound for the number of cached structures.
+DEFAULT_MAX_ENTRIES = 20
+
+
+class CollectedBlockStructureCache(object):
+    """
+    A thread-safe, memory-bounded LRU cache of collected block structures.
+
+    Each entry is keyed by the root block's usage key and a version key
+    identifying the stored data, so a new version of a course never hits
+    a structure deserialized from an older one.  The memory used by an
+    entry is estimated by the caller with estimate_size.
+    """
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._total_size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def max_bytes():
+        """
+        Returns the configured bound on the total estimated memory used by
+        the cached structures; 0 disables the cache.
+        """
+        return settings.BLOCK_STRUCTURES_SETTINGS.get('IN_PROCESS_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES)
+
+    @staticmethod
+    def max_entries():
+        """
+        Returns the configured maximum number of entries.
+        """
+        return settings.BLOCK_STRUCTURES_SETTINGS.get('IN_PROCESS_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES)
+
+    def is_enabled(self):
+        """
+        Returns whether the cache is enabled.
+        """
+        return self.max_bytes() > 0 and self.max_entries() > 0
+
+    def get(self, root_block_usage_key, version_key):
+        """
+        Returns the cached block structure for the given root and version,
+        or None if not found.
+        """
+        if not self.is_enabled():
+            return None
+
+        key = (unicode(root_block_usage_key), version_key)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            # Re-insert to mark as the most recently used.
+            self._entries[key] = entry
+
+        logger.debug("BlockStructure: Read from process cache; %s.", root_block_usage_key)
+        return entry[0]
+
+    def set(self, root_block_usage_key, version_key, block_structure, size):
+        """
+        Caches the given block structure for the given root and version,
+        evicting the least recently used entries as needed to stay within
+        the configured bounds.  Structures larger than the memory bound
+        are not cached.
+        """
+        max_bytes = self.max_bytes()
+        max_entries = self.max_entries()
+        if max_bytes <= 0 or max_entries <= 0 or size > max_bytes:
+            return
+
+        key = (unicode(root_block_usage_key), version_key)
+        with self._lock:
+            self._remove(key)
+            # Only the latest version of a root is worth keeping.
+            for stale_key in [k for k in self._entries if k[0] == key[0]]:
+                self._remove(stale_key)
+
+            self._entries[key] = (block_structure, size)
+            self._total_size += size
+
+            while self._total_size > max_bytes or len(self._entries) > max_entries:
+                evicted_key, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_size -= evicted_size
+                logger.debug("BlockStructure: Evicted from process cache; %s.", evicted_key[0])
+
+    def delete(self, root_block_usage_key):
+        """
+        Removes every cached version of the given root's block structure.
+        """
+        root = unicode(root_block_usage_key)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == root]:
+                self._remove(key)
+
+    def clear(self):
+        """
+        Removes all cached block structures.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._total_size = 0
+
+    def _remove(self, key):
+        """
+        Removes the entry for the given key, if any.  The lock must be held.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_size -= entry[1]
+
+
+def estimate_size(block_structure):
+    """
+    Returns an estimate, in bytes, of the memory used by the given
+    deserialized block structure, by summing the sizes of the objects it
+    references.  Objects shared with the rest of the process, such as
+    interned strings and small integers, are counted as well, so the
+    estimate errs on the high side.
+    """
+    size = 0
+    seen = set()
+    pending = [block_structure]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, _UNSIZED_TYPES):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            pending.extend(obj.iterkeys())
+            pending.extend(obj.itervalues())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+        else:
+            if hasattr(obj, '__dict__'):
+                pending.append(obj.__dict__)
+            for cls in type(obj).__mro__:
+                for slot in getattr(cls, '__slots__', ()):
+                    if hasattr(obj, slot):
+                        pending.append(getattr(obj, slot))
+    return size
+
+
+# Types whose instances are not part of any block structure's own memory.
+_UNSIZED_TYPES = (type, types.ClassType, types.ModuleType, types.FunctionType, types.MethodType)
+
+
+# The cache shared by all BlockStructureStores in this process.
+collected_block_structure_cache = CollectedBlockStructureCache()  # pylint: disable=invalid-name
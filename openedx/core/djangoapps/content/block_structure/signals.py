@@ -18,11 +18,16 @@ def _update_block_structure_on_course_publish(sender, course_key, **kwargs):  #
     """
     Catches the signal that a course has been published in the module
     store and creates/updates the corresponding cache entry.
-    Ignores publish signals from content libraries.
+    Ignores publish signals from content libraries, and publishes
+    which did not change any blocks.
     """
     if isinstance(course_key, LibraryLocator):
         return
 
+    changed_block_keys = kwargs.get('changed_block_keys')
+    if changed_block_keys is not None and not changed_block_keys:
+        return
+
     if config.waffle().is_enabled(config.INVALIDATE_CACHE_ON_PUBLISH):
         clear_course_from_cache(course_key)
 
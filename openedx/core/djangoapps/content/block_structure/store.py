@@ -2,15 +2,17 @@
 Module for the Storage of BlockStructure objects.
 """
 # pylint: disable=protected-access
+from hashlib import sha1
 from logging import getLogger
 
 from openedx.core.lib.cache_utils import zpickle, zunpickle
 
-from . import config
+from . import columnar, config
 from .block_structure import BlockStructureBlockData
 from .exceptions import BlockStructureNotFound
 from .factory import BlockStructureFactory
 from .models import BlockStructureModel
+from .process_cache import collected_block_structure_cache, estimate_size
 from .transformer_registry import TransformerRegistry
 
 
@@ -63,6 +65,7 @@ class BlockStructureStore(object):
         """
         serialized_data = self._serialize(block_structure)
 
+        collected_block_structure_cache.delete(block_structure.root_block_usage_key)
         bs_model = self._update_or_create_model(block_structure, serialized_data)
         self._add_to_cache(serialized_data, bs_model)
 
@@ -81,7 +84,8 @@ class BlockStructureStore(object):
 
         Returns:
             BlockStructure - The deserialized block structure starting
-            at root_block_usage_key, if found.
+            at root_block_usage_key, if found.  It may be shared through
+            the in-process cache and must not be mutated.
 
         Raises:
             BlockStructureNotFound if the root_block_usage_key is not
@@ -89,12 +93,36 @@ class BlockStructureStore(object):
         """
         bs_model = self._get_model(root_block_usage_key)
 
+        # With storage backing, the model identifies the version of the
+        # data, so a process cache hit avoids fetching it altogether.
+        # Otherwise, the fetched data itself identifies the version.
+        process_cache_enabled = collected_block_structure_cache.is_enabled()
+        version_key = None
+        if process_cache_enabled and _is_storage_backing_enabled():
+            version_key = self._encode_root_cache_key(bs_model)
+            block_structure = collected_block_structure_cache.get(root_block_usage_key, version_key)
+            if block_structure is not None:
+                return block_structure
+
         try:
             serialized_data = self._get_from_cache(bs_model)
         except BlockStructureNotFound:
             serialized_data = self._get_from_store(bs_model)
 
-        return self._deserialize(serialized_data, root_block_usage_key)
+        if not process_cache_enabled:
+            return self._deserialize(serialized_data, root_block_usage_key)
+
+        if version_key is None:
+            version_key = sha1(serialized_data).hexdigest()
+            block_structure = collected_block_structure_cache.get(root_block_usage_key, version_key)
+            if block_structure is not None:
+                return block_structure
+
+        block_structure = self._deserialize(serialized_data, root_block_usage_key)
+        collected_block_structure_cache.set(
+            root_block_usage_key, version_key, block_structure, estimate_size(block_structure),
+        )
+        return block_structure
 
     def delete(self, root_block_usage_key):
         """
@@ -105,6 +133,7 @@ class BlockStructureStore(object):
             root_block_usage_key (UsageKey) - The usage_key for the root
                 of the block structure that is to be removed.
         """
+        collected_block_structure_cache.delete(root_block_usage_key)
         bs_model = self._get_model(root_block_usage_key)
         self._cache.delete(self._encode_root_cache_key(bs_model))
         bs_model.delete()
@@ -190,8 +219,12 @@ class BlockStructureStore(object):
 
     def _serialize(self, block_structure):
         """
-        Serializes the data for the given block_structure.
+        Serializes the data for the given block_structure, in the
+        columnar format if its waffle switch is enabled.
         """
+        if config.waffle().is_enabled(config.COLUMNAR_SERIALIZATION):
+            return columnar.serialize(block_structure)
+
         data_to_cache = (
             block_structure._block_relations,
             block_structure.transformer_data,
@@ -203,6 +236,9 @@ class BlockStructureStore(object):
         """
         Deserializes the given data and returns the parsed block_structure.
         """
+        if columnar.is_columnar(serialized_data):
+            return columnar.deserialize(serialized_data, root_block_usage_key)
+
         block_relations, transformer_data, block_data_map = zunpickle(serialized_data)
         return BlockStructureFactory.create_new(
             root_block_usage_key,
@@ -2,6 +2,7 @@
 Tests for block_structure.py
 """
 # pylint: disable=protected-access
+import cPickle as pickle
 from collections import namedtuple
 from copy import deepcopy
 import ddt
@@ -224,7 +225,8 @@ class TestBlockStructureData(TestCase, ChildrenMapTestMixin):
         block_structure.remove_block_traversal(lambda block: block == 2)
         self.assert_block_structure(block_structure, [[1], [], [], []], missing_blocks=[2])
 
-    def test_copy(self):
+    @ddt.data('copy', 'copy_for_transform')
+    def test_copy(self, copy_method):
         def _set_value(structure, value):
             """
             Sets a test transformer block field to the given value in the given structure.
@@ -243,7 +245,7 @@ class TestBlockStructureData(TestCase, ChildrenMapTestMixin):
         _set_value(block_structure, 'original_value')
 
         # create a new copy of the structure and verify they are equivalent
-        new_copy = block_structure.copy()
+        new_copy = getattr(block_structure, copy_method)()
         self.assertEquals(block_structure.root_block_usage_key, new_copy.root_block_usage_key)
         for block in block_structure:
             self.assertIn(block, new_copy)
@@ -268,3 +270,27 @@ class TestBlockStructureData(TestCase, ChildrenMapTestMixin):
         _set_value(new_copy, 'edit2')
         self.assertEquals(_get_value(block_structure), 'edit1')
         self.assertEquals(_get_value(new_copy), 'edit2')
+
+    def test_pickle(self):
+        block_structure = self.create_block_structure(ChildrenMapTestMixin.SIMPLE_CHILDREN_MAP)
+        block_structure.set_transformer_block_field(1, 'transformer', 'test_key', 'test_value')
+        block_structure._get_or_create_block(1).display_name = 'Block 1'
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            relations, block_data_map = pickle.loads(
+                pickle.dumps((block_structure._block_relations, block_structure._block_data_map), protocol)
+            )
+            self.assertEquals(relations[1].children, block_structure.get_children(1))
+            self.assertEquals(relations[1].parents, block_structure.get_parents(1))
+            self.assertEquals(block_data_map[1].location, 1)
+            self.assertEquals(block_data_map[1].display_name, 'Block 1')
+            self.assertEquals(block_data_map[1].transformer_data['transformer'].test_key, 'test_value')
+
+    def test_slots(self):
+        block_structure = self.create_block_structure(ChildrenMapTestMixin.SIMPLE_CHILDREN_MAP)
+        block_structure.set_transformer_block_field(1, 'transformer', 'test_key', 'test_value')
+        block_data = block_structure[1]
+        for instance in (block_structure._block_relations[1], block_data, block_data.transformer_data['transformer']):
+            self.assertFalse(hasattr(instance, '__dict__'))
+        with self.assertRaises(AttributeError):
+            block_data.undefined_field  # pylint: disable=pointless-statement
@@ -0,0 +1,113 @@
+"""
+Tests for block_structure/columnar.py
+"""
+# pylint: disable=protected-access
+import ddt
+from mock import patch
+from nose.plugins.attrib import attr
+from unittest import TestCase
+
+from openedx.core.lib.cache_utils import zpickle
+
+from .. import columnar
+from .helpers import ChildrenMapTestMixin, UsageKeyFactoryMixin, MockTransformer
+
+
+@attr(shard=2)
+@ddt.ddt
+class TestColumnarSerialization(UsageKeyFactoryMixin, ChildrenMapTestMixin, TestCase):
+    """
+    Tests for the columnar serialization of block structures
+    """
+    def create_collected_block_structure(self, children_map):
+        """
+        Returns a block structure for the given children map, with
+        collected xBlock fields and transformer data.
+        """
+        block_structure = self.create_block_structure(children_map)
+        block_structure._add_transformer(MockTransformer)
+        for block_id in range(len(children_map)):
+            block_key = self.block_key_factory(block_id)
+            block_structure._get_or_create_block(block_key).display_name = 'Block {}'.format(block_id)
+            if block_id % 2:
+                block_structure.set_transformer_block_field(block_key, MockTransformer, 'odd', block_id)
+        return block_structure
+
+    def assert_collected_data(self, block_structure, children_map):
+        """
+        Verifies the xBlock fields and transformer data set by
+        create_collected_block_structure.
+        """
+        self.assertEquals(block_structure._get_transformer_data_version(MockTransformer), MockTransformer.WRITE_VERSION)
+        for block_id in range(len(children_map)):
+            block_key = self.block_key_factory(block_id)
+            self.assertEquals(block_structure.get_xblock_field(block_key, 'display_name'), 'Block {}'.format(block_id))
+            self.assertEquals(
+                block_structure.get_transformer_block_field(block_key, MockTransformer, 'odd'),
+                block_id if block_id % 2 else None,
+            )
+
+    @ddt.data(
+        [],
+        ChildrenMapTestMixin.SIMPLE_CHILDREN_MAP,
+        ChildrenMapTestMixin.LINEAR_CHILDREN_MAP,
+        ChildrenMapTestMixin.DAG_CHILDREN_MAP,
+    )
+    def test_round_trip(self, children_map):
+        block_structure = self.create_collected_block_structure(children_map)
+        serialized = columnar.serialize(block_structure)
+        self.assertTrue(columnar.is_columnar(serialized))
+
+        deserialized = columnar.deserialize(serialized, block_structure.root_block_usage_key)
+        self.assert_block_structure(deserialized, children_map)
+        self.assert_collected_data(deserialized, children_map)
+
+    def test_reserialize_deserialized(self):
+        children_map = self.SIMPLE_CHILDREN_MAP
+        block_structure = self.create_collected_block_structure(children_map)
+        root_block_usage_key = block_structure.root_block_usage_key
+        deserialized = columnar.deserialize(columnar.serialize(block_structure), root_block_usage_key)
+
+        reserialized = columnar.deserialize(columnar.serialize(deserialized), root_block_usage_key)
+        self.assert_block_structure(reserialized, children_map)
+        self.assert_collected_data(reserialized, children_map)
+
+    def test_interned_keys(self):
+        children_map = self.SIMPLE_CHILDREN_MAP
+        block_structure = self.create_collected_block_structure(children_map)
+        encoding, _ = columnar._encode_keys(
+            block_structure.root_block_usage_key, list(block_structure._block_relations)
+        )
+        self.assertEquals(encoding, 'pairs')
+
+    def test_transformer_data_loaded_lazily(self):
+        children_map = self.SIMPLE_CHILDREN_MAP
+        block_structure = self.create_collected_block_structure(children_map)
+        serialized = columnar.serialize(block_structure)
+
+        with patch.object(columnar, 'zunpickle', wraps=columnar.zunpickle) as mock_zunpickle:
+            deserialized = columnar.deserialize(serialized, block_structure.root_block_usage_key)
+            self.assertEquals(mock_zunpickle.call_count, 2)
+
+            for block_id in range(len(children_map)):
+                deserialized.get_transformer_block_field(self.block_key_factory(block_id), MockTransformer, 'odd')
+            self.assertEquals(mock_zunpickle.call_count, 3)
+
+    def test_copy_for_transform(self):
+        children_map = self.SIMPLE_CHILDREN_MAP
+        block_structure = self.create_collected_block_structure(children_map)
+        deserialized = columnar.deserialize(
+            columnar.serialize(block_structure), block_structure.root_block_usage_key
+        )
+
+        block_key = self.block_key_factory(1)
+        transformed = deserialized.copy_for_transform()
+        transformed.set_transformer_block_field(block_key, MockTransformer, 'odd', 'changed')
+        self.assert_collected_data(deserialized, children_map)
+        self.assertEquals(transformed.get_transformer_block_field(block_key, MockTransformer, 'odd'), 'changed')
+        self.assertEquals(
+            transformed.get_transformer_block_field(self.block_key_factory(3), MockTransformer, 'odd'), 3,
+        )
+
+    def test_legacy_format_detected(self):
+        self.assertFalse(columnar.is_columnar(zpickle(({}, {}, {}))))
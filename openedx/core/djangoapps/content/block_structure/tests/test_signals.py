@@ -80,3 +80,16 @@ class CourseBlocksSignalTest(ModuleStoreTestCase):
     def test_update_only_for_courses(self, key, expect_update_called, mock_update):
         _update_block_structure_on_course_publish(sender=None, course_key=key)
         self.assertEqual(mock_update.called, expect_update_called)
+
+    @ddt.data(
+        (None, True),
+        ([], False),
+        ([CourseLocator(org='org', course='course', run='run').make_usage_key('html', 'html_id')], True),
+    )
+    @ddt.unpack
+    @patch('openedx.core.djangoapps.content.block_structure.tasks.update_course_in_cache_v2.apply_async')
+    def test_update_only_for_changed_blocks(self, changed_block_keys, expect_update_called, mock_update):
+        _update_block_structure_on_course_publish(
+            sender=None, course_key=self.course.id, changed_block_keys=changed_block_keys,
+        )
+        self.assertEqual(mock_update.called, expect_update_called)
@@ -2,13 +2,17 @@
 Tests for block_structure/cache.py
 """
 import ddt
+from django.conf import settings
+from django.test.utils import override_settings
+from mock import patch
 from nose.plugins.attrib import attr
 
 from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
 
-from ..config import STORAGE_BACKING_FOR_CACHE, waffle
+from ..config import COLUMNAR_SERIALIZATION, STORAGE_BACKING_FOR_CACHE, waffle
 from ..config.models import BlockStructureConfiguration
 from ..exceptions import BlockStructureNotFound
+from ..process_cache import collected_block_structure_cache, estimate_size
 from ..store import BlockStructureStore
 from .helpers import ChildrenMapTestMixin, UsageKeyFactoryMixin, MockCache, MockTransformer
 
@@ -67,6 +71,24 @@ class TestBlockStructureStore(UsageKeyFactoryMixin, ChildrenMapTestMixin, CacheI
             with self.assertRaises(BlockStructureNotFound):
                 self.store.get(self.block_structure.root_block_usage_key)
 
+    @ddt.data(
+        (True, True),
+        (True, False),
+        (False, True),
+        (False, False),
+    )
+    @ddt.unpack
+    def test_serialization_format(self, columnar_on_write, columnar_on_read):
+        with waffle().override(COLUMNAR_SERIALIZATION, active=columnar_on_write):
+            self.store.add(self.block_structure)
+        with waffle().override(COLUMNAR_SERIALIZATION, active=columnar_on_read):
+            stored_value = self.store.get(self.block_structure.root_block_usage_key)
+        self.assert_block_structure(stored_value, self.children_map)
+        self.assertEquals(
+            stored_value.get_transformer_block_field(self.block_key_factory(0), MockTransformer, 'test'),
+            '{} val'.format(MockTransformer.name()),
+        )
+
     def test_uncached_without_storage(self):
         self.store.add(self.block_structure)
         self.mock_cache.map.clear()
@@ -90,3 +112,116 @@ class TestBlockStructureStore(UsageKeyFactoryMixin, ChildrenMapTestMixin, CacheI
         self.assertEquals(self.mock_cache.timeout_from_last_call, 0)
         self.store.add(self.block_structure)
         self.assertEquals(self.mock_cache.timeout_from_last_call, timeout)
+
+
+@attr(shard=2)
+@ddt.ddt
+@override_settings(BLOCK_STRUCTURES_SETTINGS=dict(
+    settings.BLOCK_STRUCTURES_SETTINGS,
+    IN_PROCESS_CACHE_MAX_BYTES=1024 * 1024,
+    IN_PROCESS_CACHE_MAX_ENTRIES=2,
+))
+class TestBlockStructureStoreProcessCache(UsageKeyFactoryMixin, ChildrenMapTestMixin, CacheIsolationTestCase):
+    """
+    Tests for the in-process cache of deserialized block structures used by BlockStructureStore
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(TestBlockStructureStoreProcessCache, self).setUp()
+        collected_block_structure_cache.clear()
+        self.addCleanup(collected_block_structure_cache.clear)
+
+        self.children_map = self.SIMPLE_CHILDREN_MAP
+        self.block_structure = self.create_block_structure(self.children_map)
+        self.root_key = self.block_structure.root_block_usage_key
+
+        self.mock_cache = MockCache()
+        self.store = BlockStructureStore(self.mock_cache)
+
+    @ddt.data(True, False)
+    def test_deserialized_once(self, with_storage_backing):
+        with waffle().override(STORAGE_BACKING_FOR_CACHE, active=with_storage_backing):
+            self.store.add(self.block_structure)
+            with patch.object(self.store, '_deserialize', wraps=self.store._deserialize) as mock_deserialize:
+                first = self.store.get(self.root_key)
+                second = self.store.get(self.root_key)
+            self.assertEquals(mock_deserialize.call_count, 1)
+            self.assertIs(first, second)
+            self.assert_block_structure(first, self.children_map)
+
+    @ddt.data(True, False)
+    def test_add_invalidates(self, with_storage_backing):
+        with waffle().override(STORAGE_BACKING_FOR_CACHE, active=with_storage_backing):
+            self.store.add(self.block_structure)
+            first = self.store.get(self.root_key)
+            self.store.add(self.block_structure)
+            self.assertIsNot(self.store.get(self.root_key), first)
+
+    @ddt.data(True, False)
+    def test_delete_invalidates(self, with_storage_backing):
+        with waffle().override(STORAGE_BACKING_FOR_CACHE, active=with_storage_backing):
+            self.store.add(self.block_structure)
+            self.store.get(self.root_key)
+            self.store.delete(self.root_key)
+            with self.assertRaises(BlockStructureNotFound):
+                self.store.get(self.root_key)
+
+    def test_new_data_version_misses(self):
+        self.store.add(self.block_structure)
+        first = self.store.get(self.root_key)
+
+        # Replace the cached data behind the store's back, as another
+        # process collecting a new version of the course would.
+        self.block_structure._add_relation(self.block_key_factory(1), self.block_key_factory(5))
+        cache_key = self.mock_cache.map.keys()[0]
+        self.mock_cache.map[cache_key] = self.store._serialize(self.block_structure)
+
+        second = self.store.get(self.root_key)
+        self.assertIsNot(first, second)
+        self.assertIn(self.block_key_factory(5), second.get_children(self.block_key_factory(1)))
+
+    def test_bounded_entries(self):
+        roots = [self.block_key_factory(index) for index in range(3)]
+        for root in roots:
+            collected_block_structure_cache.set(root, 'v1', self.block_structure, 1)
+        self.assertIsNone(collected_block_structure_cache.get(roots[0], 'v1'))
+        self.assertIsNotNone(collected_block_structure_cache.get(roots[1], 'v1'))
+        self.assertIsNotNone(collected_block_structure_cache.get(roots[2], 'v1'))
+
+    def test_bounded_size(self):
+        collected_block_structure_cache.set(self.block_key_factory(0), 'v1', self.block_structure, 600 * 1024)
+        collected_block_structure_cache.set(self.block_key_factory(1), 'v1', self.block_structure, 600 * 1024)
+        self.assertIsNone(collected_block_structure_cache.get(self.block_key_factory(0), 'v1'))
+        self.assertIsNotNone(collected_block_structure_cache.get(self.block_key_factory(1), 'v1'))
+
+        # Too large to be cached at all
+        collected_block_structure_cache.set(self.block_key_factory(2), 'v1', self.block_structure, 1100 * 1024)
+        self.assertIsNone(collected_block_structure_cache.get(self.block_key_factory(2), 'v1'))
+
+    def test_size_is_estimated_in_memory(self):
+        self.store.add(self.block_structure)
+        with patch.object(
+            collected_block_structure_cache, 'set', wraps=collected_block_structure_cache.set,
+        ) as mock_set:
+            block_structure = self.store.get(self.root_key)
+        size = mock_set.call_args[0][3]
+        self.assertEquals(size, estimate_size(block_structure))
+        self.assertGreater(size, len(self.store._serialize(block_structure)))
+
+    @ddt.data(True, False)
+    def test_disabled(self, with_storage_backing):
+        with waffle().override(STORAGE_BACKING_FOR_CACHE, active=with_storage_backing):
+            self.store.add(self.block_structure)
+            with override_settings(BLOCK_STRUCTURES_SETTINGS=dict(
+                settings.BLOCK_STRUCTURES_SETTINGS,
+                IN_PROCESS_CACHE_MAX_BYTES=0,
+            )):
+                with patch.object(collected_block_structure_cache, 'get') as mock_get:
+                    with patch.object(collected_block_structure_cache, 'set') as mock_set:
+                        with patch('openedx.core.djangoapps.content.block_structure.store.sha1') as mock_sha1:
+                            block_structure = self.store.get(self.root_key)
+            mock_get.assert_not_called()
+            mock_set.assert_not_called()
+            mock_sha1.assert_not_called()
+            self.assert_block_structure(block_structure, self.children_map)
@@ -10,6 +10,11 @@ from opaque_keys.edx.keys import CourseKey
 from xmodule.modulestore.django import modulestore
 
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+from openedx.core.djangoapps.content.course_overviews.tasks import (
+    DEFAULT_CHUNK_SIZE,
+    enqueue_async_course_overview_update_tasks
+)
+from openedx.core.lib.command_utils import validate_dependent_option, validate_mutually_exclusive_option
 
 
 log = logging.getLogger(__name__)
@@ -20,6 +25,8 @@ class Command(BaseCommand):
     Example usage:
         $ ./manage.py lms generate_course_overview --all --settings=devstack
         $ ./manage.py lms generate_course_overview 'edX/DemoX/Demo_Course' --settings=devstack
+        $ ./manage.py lms generate_course_overview --all --dry_run --settings=devstack
+        $ ./manage.py lms generate_course_overview --all --force_update --enqueue_task --settings=devstack
     """
     args = '<course_id course_id ...>'
     help = 'Generates and stores course overview for one or more courses.'
@@ -35,8 +42,39 @@ class Command(BaseCommand):
             default=False,
             help='Generate course overview for all courses.',
         )
+        parser.add_argument(
+            '--force_update',
+            help='Regenerate the course overviews that are up to date too.',
+            action='store_true',
+            default=False,
+        )
+        parser.add_argument(
+            '--dry_run',
+            help='Only report the course overviews that are missing or outdated.',
+            action='store_true',
+            default=False,
+        )
+        parser.add_argument(
+            '--chunk_size',
+            help='Number of courses whose overviews are generated, and written, at a time.',
+            default=DEFAULT_CHUNK_SIZE,
+            type=int,
+        )
+        parser.add_argument(
+            '--enqueue_task',
+            help='Enqueue a task per chunk of courses, for workers to generate their overviews in parallel.',
+            action='store_true',
+            default=False,
+        )
+        parser.add_argument(
+            '--routing_key',
+            dest='routing_key',
+            help='Routing key to use for asynchronous computation.',
+        )
 
     def handle(self, *args, **options):
+        validate_dependent_option(options, 'routing_key', 'enqueue_task')
+        validate_mutually_exclusive_option(options, 'dry_run', 'enqueue_task')
 
         if options['all']:
             course_keys = [course.id for course in modulestore().get_course_summaries()]
@@ -48,4 +86,40 @@ class Command(BaseCommand):
             except InvalidKeyError:
                 raise CommandError('Invalid key specified.')
 
-        CourseOverview.get_select_courses(course_keys)
+        if options.get('dry_run'):
+            self._report_outdated_overviews(course_keys)
+            return
+
+        chunk_size = options.get('chunk_size') or DEFAULT_CHUNK_SIZE
+        if options.get('enqueue_task'):
+            enqueue_async_course_overview_update_tasks(
+                course_keys,
+                force_update=options.get('force_update', False),
+                chunk_size=chunk_size,
+                routing_key=options.get('routing_key'),
+            )
+        else:
+            for start in xrange(0, len(course_keys), chunk_size):
+                CourseOverview.update_select_courses(
+                    course_keys[start:start + chunk_size],
+                    force_update=options.get('force_update', False),
+                )
+
+    def _report_outdated_overviews(self, course_keys):
+        """
+        Writes the courses whose overviews are missing or outdated, without
+        loading the courses.
+        """
+        versions = CourseOverview.get_versions(course_keys)
+        outdated_count = 0
+        for course_key in course_keys:
+            version = versions[course_key]
+            if CourseOverview.is_outdated_version(version):
+                outdated_count += 1
+                self.stdout.write(u'{}: {}'.format(
+                    course_key,
+                    'missing' if version is None else 'version {} < {}'.format(version, CourseOverview.VERSION),
+                ))
+        self.stdout.write(u'{} of {} course overviews are missing or outdated.'.format(
+            outdated_count, len(course_keys)
+        ))
@@ -1,4 +1,6 @@
 # pylint: disable=missing-docstring
+from StringIO import StringIO
+
 from django.core.management.base import CommandError
 from mock import patch
 from nose.plugins.attrib import attr
@@ -79,3 +81,42 @@ class TestGenerateCourseOverview(ModuleStoreTestCase):
         """
         with self.assertRaises(CommandError):
             self.command.handle(all=False)
+
+    def test_generate_with_tasks(self):
+        """
+        Test that the course overviews are generated by enqueued tasks.
+        """
+        self.command.handle(all=True, enqueue_task=True, chunk_size=1)
+        self._assert_courses_in_overview(self.course_key_1, self.course_key_2)
+
+    def test_force_update(self):
+        """
+        Test that up-to-date course overviews are only regenerated when forced.
+        """
+        self.command.handle(all=True)
+        CourseOverview.objects.filter(id=self.course_key_1).update(display_name='Outdated name')
+
+        self.command.handle(all=True)
+        self.assertEqual(CourseOverview.objects.get(id=self.course_key_1).display_name, 'Outdated name')
+
+        self.command.handle(all=True, force_update=True)
+        self.assertNotEqual(CourseOverview.objects.get(id=self.course_key_1).display_name, 'Outdated name')
+
+    def test_dry_run(self):
+        """
+        Test that missing and outdated course overviews are reported, but not generated.
+        """
+        self.command.handle(unicode(self.course_key_1), all=False)
+        CourseOverview.objects.filter(id=self.course_key_1).update(version=CourseOverview.VERSION - 1)
+
+        self.command.stdout = StringIO()
+        self.command.handle(unicode(self.course_key_1), unicode(self.course_key_2), all=False, dry_run=True)
+        self.assertEqual(
+            self.command.stdout.getvalue().splitlines(),
+            [
+                u'{}: version {} < {}'.format(self.course_key_1, CourseOverview.VERSION - 1, CourseOverview.VERSION),
+                u'{}: missing'.format(self.course_key_2),
+                u'2 of 2 course overviews are missing or outdated.',
+            ]
+        )
+        self._assert_courses_not_in_overview(self.course_key_2)
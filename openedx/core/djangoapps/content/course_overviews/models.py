@@ -104,7 +104,7 @@ class CourseOverview(TimeStampedModel):
     language = TextField(null=True)
 
     @classmethod
-    def _create_or_update(cls, course):
+    def _create_or_update(cls, course, course_overview=None):
         """
         Creates or updates a CourseOverview object from a CourseDescriptor.
 
@@ -113,6 +113,8 @@ class CourseOverview(TimeStampedModel):
 
         Arguments:
             course (CourseDescriptor): any course descriptor object
+            course_overview (CourseOverview): optional overview to update, when
+                it is already known, rather than reading it from the database
 
         Returns:
             CourseOverview: created or updated overview extracted from the given course
@@ -142,13 +144,12 @@ class CourseOverview(TimeStampedModel):
             end = ccx.due
             max_student_enrollments_allowed = ccx.max_student_enrollments_allowed
 
-        course_overview = cls.objects.filter(id=course.id)
-        if course_overview.exists():
+        if course_overview is None:
+            course_overview = cls.objects.filter(id=course.id).first() or cls()
+        if course_overview.id is not None:
             log.info('Updating course overview for %s.', unicode(course.id))
-            course_overview = course_overview.first()
         else:
             log.info('Creating course overview for %s.', unicode(course.id))
-            course_overview = cls()
 
         course_overview.version = cls.VERSION
         course_overview.id = course.id
@@ -510,6 +511,112 @@ class CourseOverview(TimeStampedModel):
 
         return course_overviews
 
+    @classmethod
+    def update_select_courses(cls, course_keys, force_update=False):
+        """
+        Creates or updates the CourseOverview objects of the given course_keys.
+
+        Unlike get_select_courses, the existing overviews are read with a single
+        query, and the overviews and their tabs are written in one transaction
+        for all the courses.  Unless force_update is True, only the overviews
+        that are missing or outdated are generated; up-to-date overviews are
+        left as they are, without loading their courses.
+
+        Returns the generated CourseOverview objects.
+        """
+        existing_overviews = {unicode(overview.id): overview for overview in cls.objects.filter(id__in=course_keys)}
+        if not force_update:
+            course_keys = [
+                course_key for course_key in course_keys
+                if cls.is_outdated_version(getattr(existing_overviews.get(unicode(course_key)), 'version', None))
+            ]
+
+        log.info('Generating course overview for %d courses.', len(course_keys))
+        log.debug('Generating course overview(s) for the following courses: %s', course_keys)
+
+        store = modulestore()
+        overviews_and_courses = []
+        for course_key in course_keys:
+            try:
+                with store.bulk_operations(course_key):
+                    course = store.get_course(course_key)
+                    if not isinstance(course, CourseDescriptor):
+                        raise IOError(u'Course {} could not be loaded from the module store.'.format(course_key))
+                    course_overview = existing_overviews.get(unicode(course_key)) or cls()
+                    course_overview = cls._create_or_update(course, course_overview)
+                overviews_and_courses.append((course_overview, course))
+            except Exception as ex:  # pylint: disable=broad-except
+                log.exception(
+                    'An error occurred while generating course overview for %s: %s',
+                    unicode(course_key),
+                    ex.message,
+                )
+
+        try:
+            cls._save_in_bulk(overviews_and_courses)
+        except Exception:  # pylint: disable=broad-except
+            # Save the overviews one by one, so that a single failing overview
+            # does not prevent the others from being saved.
+            log.exception('Saving %d course overviews at once failed.', len(overviews_and_courses))
+            for course_overview, course in overviews_and_courses:
+                try:
+                    cls._save_in_bulk([(course_overview, course)])
+                except IntegrityError:
+                    # See load_from_module_store.
+                    pass
+                except Exception:  # pylint: disable=broad-except
+                    log.exception('CourseOverview for course %s failed!', unicode(course_overview.id))
+
+        log.info('Finished generating course overviews.')
+
+        return [course_overview for course_overview, __ in overviews_and_courses]
+
+    @classmethod
+    def _save_in_bulk(cls, overviews_and_courses):
+        """
+        Saves the given CourseOverview objects, recreating their tabs and
+        images from the courses they were generated from.
+
+        Arguments:
+            overviews_and_courses (list): (CourseOverview, CourseDescriptor) tuples
+        """
+        course_overviews = [course_overview for course_overview, __ in overviews_and_courses]
+        with transaction.atomic():
+            for course_overview in course_overviews:
+                course_overview.save()
+            # Remove and recreate all the course tabs
+            CourseOverviewTab.objects.filter(course_overview__in=course_overviews).delete()
+            CourseOverviewTab.objects.bulk_create([
+                CourseOverviewTab(tab_id=tab.tab_id, course_overview=course_overview)
+                for course_overview, course in overviews_and_courses
+                for tab in course.tabs
+            ])
+            # Remove the course images, which are recreated outside of the
+            # transaction, so that it is not held while creating thumbnails.
+            CourseOverviewImageSet.objects.filter(course_overview__in=course_overviews).delete()
+
+        for course_overview, course in overviews_and_courses:
+            CourseOverviewImageSet.create(course_overview, course)
+
+    @classmethod
+    def get_versions(cls, course_keys):
+        """
+        Returns the versions of the CourseOverview objects of the given
+        course_keys, by course key, or None for the courses without overviews.
+        """
+        overviews = cls.objects.filter(id__in=course_keys).only('version')
+        versions = {unicode(overview.id): overview.version for overview in overviews}
+        return {course_key: versions.get(unicode(course_key)) for course_key in course_keys}
+
+    @classmethod
+    def is_outdated_version(cls, version):
+        """
+        Returns whether an overview of the given version, or None if there is
+        no overview, needs to be generated.  Overviews of versions higher than
+        VERSION are not outdated, as they were written by newer code.
+        """
+        return version is None or version < cls.VERSION
+
     @classmethod
     def get_all_courses(cls, orgs=None, filter_=None):
         """
@@ -6,13 +6,22 @@ from django.dispatch.dispatcher import receiver
 from .models import CourseOverview
 from xmodule.modulestore.django import SignalHandler
 
+# Types of the blocks whose fields are copied into CourseOverviews.
+COURSE_OVERVIEW_BLOCK_TYPES = ('course', 'about')
+
 
 @receiver(SignalHandler.course_published)
 def _listen_for_course_publish(sender, course_key, **kwargs):  # pylint: disable=unused-argument
     """
     Catches the signal that a course has been published in Studio and
-    updates the corresponding CourseOverview cache entry.
+    updates the corresponding CourseOverview cache entry, unless the
+    publish is known not to have changed any of the blocks it is made from.
     """
+    changed_block_keys = kwargs.get('changed_block_keys')
+    if changed_block_keys is not None and not any(
+            key.block_type in COURSE_OVERVIEW_BLOCK_TYPES for key in changed_block_keys
+    ):
+        return
     CourseOverview.load_from_module_store(course_key)
 
 
@@ -0,0 +1,49 @@
+"""
+Asynchronous tasks related to the CourseOverview model.
+"""
+import logging
+
+from celery.task import task
+from opaque_keys.edx.keys import CourseKey
+
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+
+log = logging.getLogger('edx.celery.task')
+
+# Default number of courses whose overviews are generated by each task.
+DEFAULT_CHUNK_SIZE = 50
+
+
+def enqueue_async_course_overview_update_tasks(course_keys, force_update=False, chunk_size=DEFAULT_CHUNK_SIZE,
+                                               routing_key=None):
+    """
+    Enqueues tasks generating the CourseOverviews of the given course_keys,
+    chunk_size courses per task, so that workers generate them in parallel.
+
+    Returns the AsyncResults of the enqueued tasks.
+    """
+    task_options = {'routing_key': routing_key} if routing_key else {}
+    results = []
+    for start in xrange(0, len(course_keys), chunk_size):
+        course_ids = [unicode(course_key) for course_key in course_keys[start:start + chunk_size]]
+        result = async_course_overview_update.apply_async(
+            args=course_ids,
+            kwargs={'force_update': force_update},
+            **task_options
+        )
+        log.info(u'CourseOverview: ENQUEUED generating for %d courses, task_id: %s.', len(course_ids), result.id)
+        results.append(result)
+    return results
+
+
+@task(name=u'openedx.core.djangoapps.content.course_overviews.tasks.async_course_overview_update')
+def async_course_overview_update(*course_ids, **kwargs):
+    """
+    Generates the CourseOverviews of the courses with the given ids.
+
+    Keyword Arguments:
+        force_update (boolean) - Whether to regenerate the overviews that are
+            up to date.
+    """
+    course_keys = [CourseKey.from_string(course_id) for course_id in course_ids]
+    CourseOverview.update_select_courses(course_keys, force_update=kwargs.get('force_update', False))
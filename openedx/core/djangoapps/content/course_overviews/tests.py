@@ -458,6 +458,27 @@ class CourseOverviewTestCase(ModuleStoreTestCase):
             set(select_course_ids),
         )
 
+    def test_update_select_courses(self):
+        courses = [CourseFactory.create() for __ in range(3)]
+        course_ids = [course.id for course in courses]
+        CourseOverview.get_from_id(course_ids[0])
+
+        # Only the missing overviews are generated, unless forced.
+        self.assertEqual(
+            [course_overview.id for course_overview in CourseOverview.update_select_courses(course_ids)],
+            course_ids[1:],
+        )
+        self.assertEqual(
+            [course_overview.id for course_overview in CourseOverview.update_select_courses(course_ids, True)],
+            course_ids,
+        )
+        for course in courses:
+            course_overview = CourseOverview.get_from_id(course.id)
+            self.assertEqual(
+                sorted(tab.tab_id for tab in course_overview.tabs.all()),
+                sorted(tab.tab_id for tab in course.tabs),
+            )
+
     def test_get_all_courses(self):
         course_ids = [CourseFactory.create(emit_signals=True).id for __ in range(3)]
         self.assertEqual(
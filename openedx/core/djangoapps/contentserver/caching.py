@@ -1,11 +1,21 @@
 """
 Helper functions for caching course assets.
 """
+import glob
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+
+from django.conf import settings
 from django.core.cache import caches
 from django.core.cache.backends.base import InvalidCacheBackendError
 from opaque_keys import InvalidKeyError
 
-from xmodule.contentstore.content import STATIC_CONTENT_VERSION
+from xmodule.contentstore.content import STATIC_CONTENT_VERSION, StaticContentStream
+
+log = logging.getLogger(__name__)
 
 # See if there's a "course_assets" cache configured, and if not, fallback to the default cache.
 CONTENT_CACHE = caches['default']
@@ -14,6 +24,13 @@ try:
 except InvalidCacheBackendError:
     pass
 
+# Defaults for the bounds of the disk cache, configured in CONTENTSERVER_DISK_CACHE.
+DISK_CACHE_DEFAULT_MAX_BYTES = 10 * 1024 * 1024 * 1024
+DISK_CACHE_DEFAULT_MAX_ASSET_BYTES = 1024 * 1024 * 1024
+
+# Prefix of the temporary files being written to the disk cache.
+DISK_CACHE_TEMP_PREFIX = '.tmp-'
+
 
 def set_cached_content(content):
     """
@@ -40,11 +57,309 @@ def del_cached_content(location):
         """Force the location to a Unicode string."""
         return unicode(loc).encode("utf-8")
 
-    locations = [location_str(location)]
+    location_keys = [location]
     try:
-        locations.append(location_str(location.replace(run=None)))
+        location_keys.append(location.replace(run=None))
     except InvalidKeyError:
         # although deprecated keys allowed run=None, new keys don't if there is no version.
         pass
 
-    CONTENT_CACHE.delete_many(locations, version=STATIC_CONTENT_VERSION)
+    CONTENT_CACHE.delete_many(
+        [location_str(loc) for loc in location_keys] + [_disk_metadata_key(loc) for loc in location_keys],
+        version=STATIC_CONTENT_VERSION,
+    )
+    asset_disk_cache.delete(location_keys)
+
+
+class AssetDiskCache(object):
+    """
+    A bounded cache of course assets in files on the local disk of the app
+    server, for assets too large to be stored in the Django cache.
+
+    Each asset is stored in a file named after both its location and its
+    content digest, so that a new version of an asset never hits the file
+    of a previous one.  The metadata needed to find and serve the file,
+    including the digest, is kept in CONTENT_CACHE, so that it is shared
+    by all app servers and invalidated by del_cached_content.
+
+    Files are written while the asset is streamed to the client, and
+    stored atomically, by renaming the completed temporary file, so
+    concurrent processes sharing the directory never read a partial
+    file.  The least recently used files are evicted once the total size
+    of the cached files exceeds the configured bound; recency is tracked
+    in the files' modification times so that it is shared as well.
+    """
+    # Name of the metadata attributes of cached content.
+    METADATA_ATTRS = (
+        'name', 'content_type', 'length', 'last_modified_at', 'thumbnail_location', 'import_path', 'locked',
+        'content_digest',
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _settings():
+        """
+        Returns the configuration of the cache.
+        """
+        return getattr(settings, 'CONTENTSERVER_DISK_CACHE', None) or {}
+
+    def directory(self):
+        """
+        Returns the directory of the cached files, or None if the cache is disabled.
+        """
+        return self._settings().get('DIRECTORY')
+
+    def can_cache(self, content):
+        """
+        Returns whether the given content can be stored in this cache.
+        """
+        max_asset_bytes = self._settings().get('MAX_ASSET_BYTES', DISK_CACHE_DEFAULT_MAX_ASSET_BYTES)
+        return (
+            self.directory() is not None and
+            content.length is not None and
+            content.length <= max_asset_bytes and
+            getattr(content, 'content_digest', None) is not None
+        )
+
+    def get(self, location):
+        """
+        Returns a StaticContentStream reading the cached file of the given
+        location's content, or None if it is not cached.
+        """
+        directory = self.directory()
+        if directory is None:
+            return None
+
+        metadata = CONTENT_CACHE.get(_disk_metadata_key(location), version=STATIC_CONTENT_VERSION)
+        if metadata is None:
+            return None
+
+        path = self._path(directory, location, metadata['content_digest'])
+        try:
+            stream = open(path, 'rb')
+        except IOError:
+            return None
+
+        try:
+            # Mark the file as the most recently used.
+            os.utime(path, None)
+        except OSError:
+            pass
+        return StaticContentStream(location, stream=stream, **metadata)
+
+    def set(self, content):
+        """
+        Stores the data of the given content, which must be a
+        StaticContentStream, in this cache as it is read.
+
+        Returns a StaticContentStream reading the given content's stream,
+        which copies the data read to a file of this cache, or the given
+        content itself if it cannot be stored in this cache.  The file is
+        only stored once all of the data has been read in order.
+        """
+        if not self.can_cache(content):
+            return content
+
+        return StaticContentStream(
+            content.location,
+            stream=DiskCachingStream(self, content),
+            **{attr: getattr(content, attr) for attr in self.METADATA_ATTRS}
+        )
+
+    def store(self, content, temp_path):
+        """
+        Stores the completed temporary file at the given path as the cached
+        file of the given content.
+        """
+        directory = os.path.dirname(temp_path)
+        try:
+            os.rename(temp_path, self._path(directory, content.location, content.content_digest))
+        except OSError:
+            log.exception(u"Failed to store content in the disk cache: %s", unicode(content.location))
+            _remove_file(temp_path)
+            return
+
+        CONTENT_CACHE.set(
+            _disk_metadata_key(content.location),
+            {attr: getattr(content, attr) for attr in self.METADATA_ATTRS},
+            version=STATIC_CONTENT_VERSION,
+        )
+        self._evict(directory)
+
+    def delete(self, locations):
+        """
+        Removes the cached files of all versions of the given locations'
+        content from this server's disk.
+        """
+        directory = self.directory()
+        if directory is None:
+            return
+        for location in locations:
+            for path in glob.glob(os.path.join(directory, _location_hash(location) + '-*')):
+                _remove_file(path)
+
+    def _evict(self, directory):
+        """
+        Removes the least recently used files until the total size of the
+        files in the given directory is within the configured bound.
+        """
+        max_bytes = self._settings().get('MAX_BYTES', DISK_CACHE_DEFAULT_MAX_BYTES)
+        with self._lock:
+            entries = []
+            for file_name in os.listdir(directory):
+                if file_name.startswith(DISK_CACHE_TEMP_PREFIX):
+                    continue
+                path = os.path.join(directory, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total_size = sum(size for _, size, _ in entries)
+            if total_size <= max_bytes:
+                return
+            for _, size, path in sorted(entries):
+                _remove_file(path)
+                total_size -= size
+                if total_size <= max_bytes:
+                    break
+
+    @staticmethod
+    def _path(directory, location, content_digest):
+        """
+        Returns the path of the cached file of the given location's content
+        with the given digest.
+        """
+        return os.path.join(directory, u'{}-{}'.format(_location_hash(location), content_digest))
+
+
+class DiskCachingStream(object):
+    """
+    A file-like object reading the stream of the given content, which
+    copies the data read to a temporary file of the given AssetDiskCache
+    and stores that file once all of the data has been read.
+
+    The temporary file is only created on the first read, so that no file
+    is left behind by responses which never read the content.  Copying is
+    abandoned if the stream is read out of order, e.g. to serve a range of
+    the content, or if writing the file fails.
+    """
+    def __init__(self, disk_cache, content):
+        self._disk_cache = disk_cache
+        self._content = content
+        self._stream = content._stream  # pylint: disable=protected-access
+        self._position = 0
+        self._copying = True
+        self._temp_file = None
+        self._temp_path = None
+
+    def read(self, size=-1):
+        """
+        Reads data from the content's stream, copying it to the cache.
+        """
+        data = self._stream.read(size)
+        if self._copying:
+            self._copy(data)
+        return data
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """
+        Moves within the content's stream, abandoning the copy unless it
+        is to the current position.
+        """
+        if whence != os.SEEK_SET or offset != self._position:
+            self._abandon()
+        self._stream.seek(offset, whence)
+
+    def close(self):
+        """
+        Closes the content's stream, abandoning an incomplete copy.
+        """
+        self._abandon()
+        self._stream.close()
+
+    def _copy(self, data):
+        """
+        Writes the given data read from the content's stream to the
+        temporary file, storing the file once it is complete.
+        """
+        try:
+            if self._temp_file is None:
+                directory = self._disk_cache.directory()
+                if not os.path.isdir(directory):
+                    os.makedirs(directory)
+                file_descriptor, self._temp_path = tempfile.mkstemp(dir=directory, prefix=DISK_CACHE_TEMP_PREFIX)
+                self._temp_file = os.fdopen(file_descriptor, 'wb')
+            self._temp_file.write(data)
+        except (IOError, OSError):
+            log.exception(u"Failed to store content in the disk cache: %s", unicode(self._content.location))
+            self._abandon()
+            return
+
+        self._position += len(data)
+        if self._position == self._content.length:
+            self._copying = False
+            self._temp_file.close()
+            self._disk_cache.store(self._content, self._temp_path)
+        elif not data:
+            # The stream ended before the expected length of the content.
+            self._abandon()
+
+    def _abandon(self):
+        """
+        Stops copying the content, removing the incomplete temporary file.
+        """
+        if not self._copying:
+            return
+        self._copying = False
+        if self._temp_file is not None:
+            self._temp_file.close()
+            _remove_file(self._temp_path)
+
+
+def _location_hash(location):
+    """
+    Returns a file-name-safe hash of the given location.
+    """
+    return hashlib.sha1(unicode(location).encode('utf-8')).hexdigest()
+
+
+def _disk_metadata_key(location):
+    """
+    Returns the CONTENT_CACHE key of the metadata of the disk cached
+    content of the given location.
+    """
+    return u'disk:{}'.format(location).encode('utf-8')
+
+
+def _remove_file(path):
+    """
+    Removes the file at the given path, if it still exists.
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+# The disk cache of the assets served by this app server.
+asset_disk_cache = AssetDiskCache()  # pylint: disable=invalid-name
+
+
+def get_disk_cached_content(location):
+    """
+    Retrieves the given piece of content by its location if cached on the local disk.
+    """
+    return asset_disk_cache.get(location)
+
+
+def set_disk_cached_content(content):
+    """
+    Stores the given piece of content on the local disk as it is read, if
+    it can be.  Returns the piece of content to serve instead; see
+    AssetDiskCache.set.
+    """
+    return asset_disk_cache.set(content)
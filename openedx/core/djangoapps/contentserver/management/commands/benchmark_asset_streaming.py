@@ -0,0 +1,83 @@
+"""
+Command to measure the memory used by concurrent downloads of a course asset.
+"""
+import resource
+import threading
+from time import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+
+from openedx.core.djangoapps.contentserver.middleware import StaticContentServer
+
+
+class Command(BaseCommand):
+    """
+    Example usage:
+        $ ./manage.py lms benchmark_asset_streaming '/asset-v1:edX+DemoX+Demo_Course+type@asset+block@video.mp4' \
+            --concurrency 20 --settings=devstack
+    """
+    args = u'<asset_path>'
+    help = u'Downloads a course asset through the contentserver concurrently and reports the memory used.'
+
+    def add_arguments(self, parser):
+        """
+        Entry point for subclassed commands to add custom arguments.
+        """
+        parser.add_argument('asset_path', help=u'Path of the asset, as requested from the contentserver.')
+        parser.add_argument(
+            '--concurrency',
+            help=u'Number of concurrent downloads.',
+            default=10,
+            type=int,
+        )
+        parser.add_argument(
+            '--range',
+            dest='range',
+            help=u'Value of the Range header to send, e.g. "bytes=0-1048575".',
+        )
+
+    def handle(self, *args, **options):
+        if options['concurrency'] < 1:
+            raise CommandError(u'concurrency must be a positive integer.')
+
+        request_factory = RequestFactory()
+        headers = {'HTTP_RANGE': options['range']} if options.get('range') else {}
+        results = []
+
+        def download():
+            """
+            Downloads the asset, recording the response status, the number
+            of bytes received and the size of the largest chunk.
+            """
+            response = StaticContentServer().process_request(request_factory.get(options['asset_path'], **headers))
+            if response is None:
+                results.append((None, 0, 0))
+                return
+            chunks = response.streaming_content if response.streaming else [response.content]
+            received = largest_chunk = 0
+            for chunk in chunks:
+                received += len(chunk)
+                largest_chunk = max(largest_chunk, len(chunk))
+            results.append((response.status_code, received, largest_chunk))
+
+        max_rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time()
+        threads = [threading.Thread(target=download) for _ in xrange(options['concurrency'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time() - start
+        max_rss_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - max_rss_before
+
+        for status_code, received, largest_chunk in results:
+            self.stdout.write(u'status={}\tbytes={}\tlargest_chunk={}'.format(status_code, received, largest_chunk))
+        self.stdout.write(
+            u'downloads={downloads}\ttime={time:.2f}s\tmax_rss_growth={growth}KB\tper_download={per:.1f}KB'.format(
+                downloads=len(results),
+                time=elapsed,
+                growth=max_rss_growth,
+                per=float(max_rss_growth) / len(results),
+            )
+        )
@@ -2,8 +2,10 @@
 Middleware to serve assets.
 """
 
+import calendar
 import logging
 import datetime
+from uuid import uuid4
 log = logging.getLogger(__name__)
 try:
     import newrelic.agent
@@ -11,16 +13,18 @@ except ImportError:
     newrelic = None  # pylint: disable=invalid-name
 from django.http import (
     HttpResponse, HttpResponseNotModified, HttpResponseForbidden,
-    HttpResponseBadRequest, HttpResponseNotFound, HttpResponsePermanentRedirect)
+    HttpResponseBadRequest, HttpResponseNotFound, HttpResponsePermanentRedirect,
+    StreamingHttpResponse)
+from django.utils.http import parse_etags, parse_http_date_safe, quote_etag
 from student.models import CourseEnrollment
 
 from xmodule.assetstore.assetmgr import AssetManager
-from xmodule.contentstore.content import StaticContent, XASSET_LOCATION_TAG
+from xmodule.contentstore.content import StaticContent, StaticContentStream, XASSET_LOCATION_TAG
 from xmodule.modulestore import InvalidLocationError
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.locator import AssetLocator
 from openedx.core.djangoapps.header_control import force_header_for_response
-from .caching import get_cached_content, set_cached_content
+from .caching import get_cached_content, get_disk_cached_content, set_cached_content, set_disk_cached_content
 from xmodule.modulestore.exceptions import ItemNotFoundError
 from xmodule.exceptions import NotFoundError
 
@@ -31,6 +35,14 @@ from .models import CourseAssetCacheTtlConfig, CdnUserAgentsConfig
 
 HTTP_DATE_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
 
+# Size of the chunks in which asset data is read from the contentstore and
+# streamed to the client.  This bounds the memory used per download.
+STREAMING_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of ranges served as a multipart/byteranges response.
+# Requests for more ranges are served the full content instead.
+MAX_BYTE_RANGES = 20
+
 
 class StaticContentServer(object):
     """
@@ -80,6 +92,7 @@ class StaticContentServer(object):
             # them to the actual version.
             if requested_digest is not None and actual_digest is not None and (actual_digest != requested_digest):
                 actual_asset_path = StaticContent.add_version_to_asset_path(asset_path, actual_digest)
+                close_content(content)
                 return HttpResponsePermanentRedirect(actual_asset_path)
 
             # Set the basics for this request. Make sure that the course key for this
@@ -104,15 +117,17 @@ class StaticContentServer(object):
 
             # Check that user has access to the content.
             if not self.is_user_authorized(request, content, loc):
+                close_content(content)
                 return HttpResponseForbidden('Unauthorized')
 
             # Figure out if the client sent us a conditional request, and let them know
             # if this asset has changed since then.
-            last_modified_at_str = content.last_modified_at.strftime(HTTP_DATE_FORMAT)
-            if 'HTTP_IF_MODIFIED_SINCE' in request.META:
-                if_modified_since = request.META['HTTP_IF_MODIFIED_SINCE']
-                if if_modified_since == last_modified_at_str:
-                    return HttpResponseNotModified()
+            if self.is_not_modified(request, content, actual_digest):
+                close_content(content)
+                response = HttpResponseNotModified()
+                if actual_digest is not None:
+                    response['ETag'] = quote_etag(actual_digest)
+                return response
 
             # *** File streaming within a byte range ***
             # If a Range is provided, parse Range attribute of the request
@@ -122,10 +137,6 @@ class StaticContentServer(object):
             # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.35
             response = None
             if request.META.get('HTTP_RANGE'):
-                # If we have a StaticContent, get a StaticContentStream.  Can't manipulate the bytes otherwise.
-                if isinstance(content, StaticContent):
-                    content = AssetManager.find(loc, as_stream=True)
-
                 header_value = request.META['HTTP_RANGE']
                 try:
                     unit, ranges = parse_range_header(header_value, content.length)
@@ -138,36 +149,37 @@ class StaticContentServer(object):
                     if unit != 'bytes':
                         # Only accept ranges in bytes
                         log.warning(u"Unknown unit in Range header: %s for content: %s", header_value, unicode(loc))
-                    elif len(ranges) > 1:
-                        # According to Http/1.1 spec content for multiple ranges should be sent as a multipart message.
-                        # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.16
-                        # But we send back the full content.
+                    elif len(ranges) > MAX_BYTE_RANGES:
+                        # Serving many small ranges costs more than the full content, so send that back.
                         log.warning(
-                            u"More than 1 ranges in Range header: %s for content: %s", header_value, unicode(loc)
+                            u"Too many ranges in Range header: %s for content: %s", header_value, unicode(loc)
                         )
                     else:
-                        first, last = ranges[0]
-
-                        if 0 <= first <= last < content.length:
-                            # If the byte range is satisfiable
-                            response = HttpResponse(content.stream_data_in_range(first, last))
-                            response['Content-Range'] = 'bytes {first}-{last}/{length}'.format(
-                                first=first, last=last, length=content.length
-                            )
-                            response['Content-Length'] = str(last - first + 1)
-                            response.status_code = 206  # Partial Content
-
-                            if newrelic:
-                                newrelic.agent.add_custom_parameter('contentserver.ranged', True)
-                        else:
+                        # Ignore the ranges that cannot be satisfied, as long as any other range can be.
+                        ranges = [(first, last) for first, last in ranges if 0 <= first <= last < content.length]
+                        if not ranges:
                             log.warning(
                                 u"Cannot satisfy ranges in Range header: %s for content: %s", header_value, unicode(loc)
                             )
+                            close_content(content)
                             return HttpResponse(status=416)  # Requested Range Not Satisfiable
 
+                        if len(ranges) == 1:
+                            response = self.single_range_response(content, *ranges[0])
+                        else:
+                            # According to Http/1.1 spec content for multiple ranges should be sent as a multipart
+                            # message.  https://tools.ietf.org/html/rfc7233#section-4.1
+                            response = self.multiple_ranges_response(content, ranges)
+
+                        if newrelic:
+                            newrelic.agent.add_custom_parameter('contentserver.ranged', True)
+
             # If Range header is absent or syntactically invalid return a full content response.
             if response is None:
-                response = HttpResponse(content.stream_data())
+                response = StreamingHttpResponse(
+                    ClosingIterator(content, content.stream_data(chunk_size=STREAMING_CHUNK_SIZE)),
+                    content_type=content.content_type,
+                )
                 response['Content-Length'] = content.length
 
             if newrelic:
@@ -176,7 +188,8 @@ class StaticContentServer(object):
 
             # "Accept-Ranges: bytes" tells the user that only "bytes" ranges are allowed
             response['Accept-Ranges'] = 'bytes'
-            response['Content-Type'] = content.content_type
+            if actual_digest is not None:
+                response['ETag'] = quote_etag(actual_digest)
 
             # Set any caching headers, and do any response cleanup needed.  Based on how much
             # middleware we have in place, there's no easy way to use the built-in Django
@@ -186,6 +199,90 @@ class StaticContentServer(object):
 
             return response
 
+    @staticmethod
+    def is_not_modified(request, content, content_digest):
+        """
+        Returns whether the given request is a conditional request for the
+        given content that can be answered with a 304 Not Modified.
+
+        As per https://tools.ietf.org/html/rfc7232#section-6, If-None-Match
+        takes precedence over If-Modified-Since when both are present.
+        """
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match is not None:
+            if content_digest is None:
+                return False
+            return if_none_match.strip() == '*' or content_digest in parse_etags(if_none_match)
+
+        if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+        if if_modified_since is None:
+            return False
+        return calendar.timegm(content.last_modified_at.utctimetuple()) <= if_modified_since
+
+    @staticmethod
+    def single_range_response(content, first, last):
+        """
+        Returns a streaming 206 Partial Content response for the given
+        satisfiable byte range of the given content.
+        """
+        response = StreamingHttpResponse(
+            ClosingIterator(content, content.stream_data_in_range(first, last, chunk_size=STREAMING_CHUNK_SIZE)),
+            content_type=content.content_type,
+            status=206,
+        )
+        response['Content-Range'] = 'bytes {first}-{last}/{length}'.format(
+            first=first, last=last, length=content.length
+        )
+        response['Content-Length'] = str(last - first + 1)
+        return response
+
+    @staticmethod
+    def multiple_ranges_response(content, ranges):
+        """
+        Returns a streaming 206 Partial Content response with a
+        multipart/byteranges body for the given satisfiable byte ranges
+        of the given content.
+        """
+        boundary = uuid4().hex
+        part_headers = [
+            (
+                u'--{boundary}\r\n'
+                u'Content-Type: {content_type}\r\n'
+                u'Content-Range: bytes {first}-{last}/{length}\r\n'
+                u'\r\n'
+            ).format(
+                boundary=boundary,
+                content_type=content.content_type or 'application/octet-stream',
+                first=first,
+                last=last,
+                length=content.length,
+            ).encode('utf-8')
+            for first, last in ranges
+        ]
+        closing_delimiter = '--{boundary}--\r\n'.format(boundary=boundary)
+
+        def stream_parts():
+            """
+            Yields the multipart body, streaming the data of each range in turn.
+            """
+            for part_header, (first, last) in zip(part_headers, ranges):
+                yield part_header
+                for chunk in content.stream_data_in_range(first, last, chunk_size=STREAMING_CHUNK_SIZE):
+                    yield chunk
+                yield '\r\n'
+            yield closing_delimiter
+
+        response = StreamingHttpResponse(
+            ClosingIterator(content, stream_parts()),
+            content_type='multipart/byteranges; boundary={}'.format(boundary),
+            status=206,
+        )
+        response['Content-Length'] = str(
+            sum(len(part_header) + (last - first + 1) + 2 for part_header, (first, last) in zip(part_headers, ranges))
+            + len(closing_delimiter)
+        )
+        return response
+
     def set_caching_headers(self, content, response):
         """
         Sets caching headers based on whether or not the asset is locked.
@@ -273,6 +370,9 @@ class StaticContentServer(object):
 
         # See if we can load this item from cache.
         content = get_cached_content(location)
+        if content is None:
+            # Larger items may be cached on the local disk instead.
+            content = get_disk_cached_content(location)
         if content is None:
             # Not in cache, so just try and load it from the asset manager.
             try:
@@ -286,10 +386,41 @@ class StaticContentServer(object):
             if content.length is not None and content.length < 1048576:
                 content = content.copy_to_in_mem()
                 set_cached_content(content)
+            else:
+                # Larger items are copied to the local disk as they're streamed, to be served
+                # from there next time.
+                content = set_disk_cached_content(content)
 
         return content
 
 
+class ClosingIterator(object):
+    """
+    Iterates over the given chunks of the given content, and closes the
+    content's stream, if any, once the response streaming them is closed.
+    """
+    def __init__(self, content, chunks):
+        self.content = content
+        self.chunks = chunks
+
+    def __iter__(self):
+        return iter(self.chunks)
+
+    def close(self):
+        """
+        Closes the content's stream.
+        """
+        close_content(self.content)
+
+
+def close_content(content):
+    """
+    Closes the stream of the given content, if it has one.
+    """
+    if isinstance(content, StaticContentStream):
+        content.close()
+
+
 def parse_range_header(header_value, content_length):
     """
     Returns the unit and a list of (start, end) tuples of ranges.
@@ -0,0 +1,155 @@
+"""
+Tests for the disk cache of course assets.
+"""
+import datetime
+import os
+import shutil
+import tempfile
+from StringIO import StringIO
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import TestCase
+from django.test.utils import override_settings
+from mock import patch
+from opaque_keys.edx.locator import CourseLocator
+
+from xmodule.contentstore.content import StaticContentStream
+
+from ..caching import del_cached_content, get_disk_cached_content, set_disk_cached_content
+
+
+class AssetDiskCacheTestCase(TestCase):
+    """
+    Tests for AssetDiskCache, through the caching module's functions.
+    """
+    def setUp(self):
+        super(AssetDiskCacheTestCase, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        patcher = patch('openedx.core.djangoapps.contentserver.caching.CONTENT_CACHE', LocMemCache('disk', {}))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        override = override_settings(CONTENTSERVER_DISK_CACHE={
+            'DIRECTORY': self.directory,
+            'MAX_BYTES': 100,
+            'MAX_ASSET_BYTES': 60,
+        })
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.course_key = CourseLocator('org', 'course', 'run')
+
+    def create_content(self, name, data, content_digest='digest'):
+        """
+        Returns a StaticContentStream with the given data.
+        """
+        return StaticContentStream(
+            self.course_key.make_asset_key('asset', name), name, 'text/plain', StringIO(data),
+            last_modified_at=datetime.datetime(2017, 1, 1), length=len(data), content_digest=content_digest,
+        )
+
+    def cached_files(self):
+        """
+        Returns the number of files in the cache directory.
+        """
+        return len(os.listdir(self.directory))
+
+    def cache_content(self, content):
+        """
+        Stores the given content in the cache by streaming all of its data,
+        as it is when served.  Returns the data streamed.
+        """
+        cached_content = set_disk_cached_content(content)
+        data = ''.join(cached_content.stream_data())
+        cached_content.close()
+        return data
+
+    def test_set_and_get(self):
+        content = self.create_content('asset.txt', 'x' * 50)
+        cached_content = set_disk_cached_content(content)
+        self.assertIsNone(get_disk_cached_content(content.location))
+        self.assertEqual(''.join(cached_content.stream_data()), 'x' * 50)
+        cached_content.close()
+
+        cached_content = get_disk_cached_content(content.location)
+        self.assertEqual(''.join(cached_content.stream_data()), 'x' * 50)
+        self.assertEqual(''.join(cached_content.stream_data_in_range(10, 19)), 'x' * 10)
+        for attr in ('name', 'content_type', 'length', 'last_modified_at', 'content_digest'):
+            self.assertEqual(getattr(cached_content, attr), getattr(content, attr))
+        cached_content.close()
+
+    def test_get_missing(self):
+        self.assertIsNone(get_disk_cached_content(self.course_key.make_asset_key('asset', 'missing.txt')))
+
+    def test_too_large(self):
+        content = self.create_content('asset.txt', 'x' * 61)
+        self.assertIs(set_disk_cached_content(content), content)
+        self.assertIsNone(get_disk_cached_content(content.location))
+        self.assertEqual(self.cached_files(), 0)
+
+    def test_disabled(self):
+        content = self.create_content('asset.txt', 'x' * 50)
+        with override_settings(CONTENTSERVER_DISK_CACHE={'DIRECTORY': None}):
+            self.assertIs(set_disk_cached_content(content), content)
+            self.assertIsNone(get_disk_cached_content(content.location))
+
+    def test_new_version(self):
+        self.cache_content(self.create_content('asset.txt', 'old', content_digest='old'))
+        self.cache_content(self.create_content('asset.txt', 'new', content_digest='new'))
+        cached_content = get_disk_cached_content(self.course_key.make_asset_key('asset', 'asset.txt'))
+        self.assertEqual(''.join(cached_content.stream_data()), 'new')
+        cached_content.close()
+
+    def test_delete(self):
+        content = self.create_content('asset.txt', 'x' * 50)
+        self.cache_content(content)
+        del_cached_content(content.location)
+        self.assertIsNone(get_disk_cached_content(content.location))
+        self.assertEqual(self.cached_files(), 0)
+
+    def test_evicts_least_recently_used(self):
+        first = self.create_content('first.txt', 'x' * 40)
+        second = self.create_content('second.txt', 'x' * 40)
+        self.cache_content(first)
+        self.cache_content(second)
+
+        # Make the first asset the most recently used.
+        for file_name in os.listdir(self.directory):
+            os.utime(os.path.join(self.directory, file_name), (0, 0))
+        get_disk_cached_content(first.location).close()
+
+        self.cache_content(self.create_content('third.txt', 'x' * 40))
+        self.assertEqual(self.cached_files(), 2)
+        self.assertIsNotNone(get_disk_cached_content(first.location))
+        self.assertIsNone(get_disk_cached_content(second.location))
+
+    def test_unread_content_is_not_cached(self):
+        content = self.create_content('asset.txt', 'x' * 50)
+        set_disk_cached_content(content).close()
+        self.assertIsNone(get_disk_cached_content(content.location))
+        self.assertEqual(self.cached_files(), 0)
+
+    def test_range_is_not_cached(self):
+        content = self.create_content('asset.txt', 'x' * 50)
+        cached_content = set_disk_cached_content(content)
+        self.assertEqual(''.join(cached_content.stream_data_in_range(10, 19)), 'x' * 10)
+        cached_content.close()
+        self.assertIsNone(get_disk_cached_content(content.location))
+        self.assertEqual(self.cached_files(), 0)
+
+    def test_partly_read_content_is_not_cached(self):
+        content = self.create_content('asset.txt', 'x' * 50)
+        cached_content = set_disk_cached_content(content)
+        next(cached_content.stream_data(chunk_size=10))
+        cached_content.close()
+        self.assertIsNone(get_disk_cached_content(content.location))
+        self.assertEqual(self.cached_files(), 0)
+
+    def test_failed_write(self):
+        content = self.create_content('asset.txt', 'x' * 50)
+        with patch('openedx.core.djangoapps.contentserver.caching.tempfile.mkstemp', side_effect=OSError):
+            self.assertEqual(self.cache_content(content), 'x' * 50)
+        self.assertIsNone(get_disk_cached_content(content.location))
+        self.assertEqual(self.cached_files(), 0)
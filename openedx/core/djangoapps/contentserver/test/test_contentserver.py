@@ -242,16 +242,113 @@ class ContentStoreToyCourseTest(SharedModuleStoreTestCase):
 
     def test_range_request_multiple_ranges(self):
         """
-        Test that multiple ranges in request outputs the full content.
+        Test that multiple ranges in request outputs a multipart/byteranges response with each range.
         """
         first_byte = self.length_unlocked / 4
         last_byte = self.length_unlocked / 2
         resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes={first}-{last}, -100'.format(
             first=first_byte, last=last_byte))
 
-        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.status_code, 206)  # HTTP_206_PARTIAL_CONTENT
         self.assertNotIn('Content-Range', resp)
-        self.assertEqual(resp['Content-Length'], str(self.length_unlocked))
+        content_type, boundary = resp['Content-Type'].split('; boundary=')
+        self.assertEqual(content_type, 'multipart/byteranges')
+
+        body = ''.join(resp.streaming_content)
+        self.assertEqual(resp['Content-Length'], str(len(body)))
+        parts = body.split('--{}'.format(boundary))
+        self.assertEqual(parts[0], '')
+        self.assertEqual(parts[-1], '--\r\n')
+
+        full_content = ''.join(self.client.get(self.url_unlocked).streaming_content)
+        expected_ranges = [(first_byte, last_byte), (self.length_unlocked - 100, self.length_unlocked - 1)]
+        for part, (first, last) in zip(parts[1:-1], expected_ranges):
+            headers, data = part.split('\r\n\r\n', 1)
+            self.assertIn('Content-Range: bytes {}-{}/{}'.format(first, last, self.length_unlocked), headers)
+            self.assertEqual(data, full_content[first:last + 1] + '\r\n')
+
+    def test_range_request_multiple_ranges_without_content_type(self):
+        """
+        Test that the parts of a multipart/byteranges response fall back to a generic content type.
+        """
+        content = StaticContent(self.unlocked_asset, 'another_static.txt', None, 'abcdefghij', length=10)
+        resp = StaticContentServer.multiple_ranges_response(content, [(0, 1), (5, 9)])
+
+        body = ''.join(resp.streaming_content)
+        self.assertNotIn('Content-Type: None', body)
+        self.assertEqual(body.count('Content-Type: application/octet-stream\r\n'), 2)
+
+    def test_range_request_multiple_ranges_partly_satisfiable(self):
+        """
+        Test that unsatisfiable ranges are ignored when another range in the request can be satisfied.
+        """
+        resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes=0-9, {first}-'.format(
+            first=self.length_unlocked))
+
+        self.assertEqual(resp.status_code, 206)  # HTTP_206_PARTIAL_CONTENT
+        self.assertEqual(resp['Content-Range'], 'bytes 0-9/{}'.format(self.length_unlocked))
+
+    def test_full_content_is_streamed(self):
+        """
+        Test that the full content of an asset is streamed in bounded chunks.
+        """
+        with patch('openedx.core.djangoapps.contentserver.middleware.STREAMING_CHUNK_SIZE', 100):
+            with patch('openedx.core.djangoapps.contentserver.middleware.get_cached_content', return_value=None):
+                with patch('openedx.core.djangoapps.contentserver.middleware.set_cached_content'):
+                    resp = self.client.get(self.url_unlocked)
+                    chunks = list(resp.streaming_content)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.streaming)
+        self.assertEqual(sum(len(chunk) for chunk in chunks), self.length_unlocked)
+        self.assertLessEqual(max(len(chunk) for chunk in chunks), 100)
+
+    def test_etag(self):
+        """
+        Test that the asset's digest is sent as its ETag, and honored in If-None-Match.
+        """
+        resp = self.client.get(self.url_unlocked)
+        self.assertEqual(resp.status_code, 200)
+        etag = resp['ETag']
+
+        resp = self.client.get(self.url_unlocked, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp['ETag'], etag)
+
+        resp = self.client.get(self.url_unlocked, HTTP_IF_NONE_MATCH='"{}", {}'.format(FAKE_MD5_HASH, etag))
+        self.assertEqual(resp.status_code, 304)
+
+        resp = self.client.get(self.url_unlocked, HTTP_IF_NONE_MATCH='"{}"'.format(FAKE_MD5_HASH))
+        self.assertEqual(resp.status_code, 200)
+
+    def test_if_none_match_takes_precedence(self):
+        """
+        Test that If-Modified-Since is ignored when If-None-Match is present.
+        """
+        resp = self.client.get(self.url_unlocked)
+        resp = self.client.get(
+            self.url_unlocked,
+            HTTP_IF_NONE_MATCH='"{}"'.format(FAKE_MD5_HASH),
+            HTTP_IF_MODIFIED_SINCE=resp['Last-Modified'],
+        )
+        self.assertEqual(resp.status_code, 200)
+
+    @ddt.data(
+        (datetime.timedelta(0), 304),
+        (datetime.timedelta(days=1), 304),
+        (datetime.timedelta(days=-1), 200),
+    )
+    @ddt.unpack
+    def test_if_modified_since(self, offset, expected_status_code):
+        """
+        Test that If-Modified-Since is compared as a date to the asset's last modification.
+        """
+        last_modified_at = self.contentstore.find(self.unlocked_asset).last_modified_at
+        resp = self.client.get(
+            self.url_unlocked,
+            HTTP_IF_MODIFIED_SINCE=(last_modified_at + offset).strftime(HTTP_DATE_FORMAT),
+        )
+        self.assertEqual(resp.status_code, expected_status_code)
 
     @ddt.data(
         'bytes 0-',
@@ -4,6 +4,9 @@ Utilities related to caching.
 import collections
 import cPickle as pickle
 import functools
+import threading
+import time
+import weakref
 import zlib
 
 from xblock.core import XBlock
@@ -42,34 +45,88 @@ def memoize_in_request_cache(request_cache_attr_name=None):
     return _decorator
 
 
-class memoized(object):  # pylint: disable=invalid-name
+# Default maximum number of entries of an LRU or TTL memoized function.
+DEFAULT_MEMOIZED_MAXSIZE = 128
+
+# Separates the positional from the keyword arguments in a cache key.
+_KWARGS_MARK = object()
+
+# The caches of all the memoized functions in this process.
+_MEMOIZED_CACHES = weakref.WeakSet()
+_MEMOIZED_CACHES_LOCK = threading.Lock()
+
+
+def get_memoized_caches_info():
     """
-    Decorator. Caches a function's return value each time it is called.
-    If called later with the same arguments, the cached value is returned
-    (not reevaluated).
-    https://wiki.python.org/moin/PythonDecoratorLibrary#Memoize
+    Returns the name, size and hit/miss/eviction counters of the cache of
+    every memoized function in this process, as a list of dicts.
+    """
+    with _MEMOIZED_CACHES_LOCK:
+        memoized_caches = list(_MEMOIZED_CACHES)
+    return [memoized_cache.cache_info() for memoized_cache in memoized_caches]
 
-    WARNING: Only use this memoized decorator for caching data that
-    is constant throughout the lifetime of a gunicorn worker process,
-    is costly to compute, and is required often.  Otherwise, it can lead to
-    unwanted memory leakage.
+
+def clear_memoized_caches():
     """
+    Clears the cache of every memoized function in this process.
+    """
+    with _MEMOIZED_CACHES_LOCK:
+        memoized_caches = list(_MEMOIZED_CACHES)
+    for memoized_cache in memoized_caches:
+        memoized_cache.clear()
+
 
+def _make_key(args, kwargs):
+    """
+    Returns the cache key for the given call arguments, or None if they
+    are not hashable.
+    """
+    key = args
+    if kwargs:
+        key += (_KWARGS_MARK,) + tuple(sorted(kwargs.iteritems()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class MemoizedFunction(object):
+    """
+    Base class for the memoizing decorators below.  Calls are cached by
+    their arguments in the storage provided by subclasses, and counted as
+    hits or misses.  Calls with unhashable arguments are not cached.
+
+    Each memoized function is registered, so that the caches of all of
+    them can be inspected with get_memoized_caches_info and cleared with
+    clear_memoized_caches.
+    """
     def __init__(self, func):
+        functools.update_wrapper(self, func)
         self.func = func
-        self.cache = {}
+        self.name = u'{}.{}'.format(func.__module__, func.__name__)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        with _MEMOIZED_CACHES_LOCK:
+            _MEMOIZED_CACHES.add(self)
 
-    def __call__(self, *args):
-        if not isinstance(args, collections.Hashable):
+    def __call__(self, *args, **kwargs):
+        key = _make_key(args, kwargs)
+        if key is None:
             # uncacheable. a list, for instance.
             # better to not cache than blow up.
-            return self.func(*args)
-        if args in self.cache:
-            return self.cache[args]
+            return self.func(*args, **kwargs)
+
+        try:
+            value = self.get_cached(key)
+        except KeyError:
+            self.misses += 1
+            value = self.func(*args, **kwargs)
+            self.set_cached(key, value)
         else:
-            value = self.func(*args)
-            self.cache[args] = value
-            return value
+            self.hits += 1
+        return value
 
     def __repr__(self):
         """
@@ -83,6 +140,198 @@ class memoized(object):  # pylint: disable=invalid-name
         """
         return functools.partial(self.__call__, obj)
 
+    def cache_info(self):
+        """
+        Returns the name, size and counters of this function's cache.
+        """
+        return {
+            'name': self.name,
+            'type': self.__class__.__name__,
+            'size': self.cache_size(),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def get_cached(self, key):
+        """
+        Returns the cached value for the given key, or raises KeyError.
+        """
+        raise NotImplementedError
+
+    def set_cached(self, key, value):
+        """
+        Caches the given value for the given key.
+        """
+        raise NotImplementedError
+
+    def cache_size(self):
+        """
+        Returns the number of cached values.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """
+        Removes all cached values.
+        """
+        raise NotImplementedError
+
+
+class memoized(MemoizedFunction):  # pylint: disable=invalid-name
+    """
+    Decorator. Caches a function's return value each time it is called.
+    If called later with the same arguments, the cached value is returned
+    (not reevaluated).
+    https://wiki.python.org/moin/PythonDecoratorLibrary#Memoize
+
+    WARNING: Only use this memoized decorator for caching data that
+    is constant throughout the lifetime of a gunicorn worker process,
+    is costly to compute, and is required often.  Otherwise, it can lead to
+    unwanted memory leakage.  Use lru_memoized, ttl_memoized or
+    request_memoized for anything else.
+    """
+    def __init__(self, func):
+        super(memoized, self).__init__(func)
+        self.cache = {}
+
+    def get_cached(self, key):
+        return self.cache[key]
+
+    def set_cached(self, key, value):
+        self.cache[key] = value
+
+    def cache_size(self):
+        return len(self.cache)
+
+    def clear(self):
+        self.cache.clear()
+
+
+class LRUMemoizedFunction(MemoizedFunction):
+    """
+    A memoized function that keeps at most maxsize values, evicting the
+    least recently used ones.
+    """
+    def __init__(self, func, maxsize):
+        super(LRUMemoizedFunction, self).__init__(func)
+        self.maxsize = maxsize
+        self.cache = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_cached(self, key):
+        with self.lock:
+            value = self.cache.pop(key)
+            # Re-insert to mark as the most recently used.
+            self.cache[key] = value
+        return value
+
+    def set_cached(self, key, value):
+        with self.lock:
+            self.cache.pop(key, None)
+            self.cache[key] = value
+            while len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+                self.evictions += 1
+
+    def cache_size(self):
+        return len(self.cache)
+
+    def clear(self):
+        with self.lock:
+            self.cache.clear()
+
+
+class TTLMemoizedFunction(LRUMemoizedFunction):
+    """
+    An LRU memoized function whose values also expire timeout seconds
+    after they are cached.
+    """
+    def __init__(self, func, timeout, maxsize):
+        super(TTLMemoizedFunction, self).__init__(func, maxsize)
+        self.timeout = timeout
+
+    def get_cached(self, key):
+        expires_at, value = super(TTLMemoizedFunction, self).get_cached(key)
+        if expires_at <= time.time():
+            with self.lock:
+                self.cache.pop(key, None)
+            self.evictions += 1
+            raise KeyError(key)
+        return value
+
+    def set_cached(self, key, value):
+        super(TTLMemoizedFunction, self).set_cached(key, (time.time() + self.timeout, value))
+
+
+class RequestMemoizedFunction(MemoizedFunction):
+    """
+    A memoized function whose values are cached in a named request cache,
+    and so are dropped at the end of each request or celery task.
+    """
+    def __init__(self, func, namespace):
+        super(RequestMemoizedFunction, self).__init__(func)
+        self.namespace = namespace or u'memoized.{}'.format(self.name)
+
+    def _request_cache(self):
+        """
+        Returns the request cache of this function's values.
+        """
+        # Imported here since xmodule, which does not depend on
+        # request_cache, imports this module.
+        import request_cache
+        return request_cache.get_cache(self.namespace)
+
+    def get_cached(self, key):
+        return self._request_cache()[key]
+
+    def set_cached(self, key, value):
+        self._request_cache()[key] = value
+
+    def cache_size(self):
+        return len(self._request_cache())
+
+    def clear(self):
+        import request_cache
+        request_cache.clear_cache(self.namespace)
+
+
+def lru_memoized(maxsize=DEFAULT_MEMOIZED_MAXSIZE):
+    """
+    Decorator. Like memoized, but keeps at most maxsize return values,
+    evicting the least recently used ones.
+    """
+    def _decorator(func):
+        """Memoizes the given function."""
+        return LRUMemoizedFunction(func, maxsize)
+    return _decorator
+
+
+def ttl_memoized(timeout, maxsize=DEFAULT_MEMOIZED_MAXSIZE):
+    """
+    Decorator. Like lru_memoized, but return values are also recomputed
+    once they are older than timeout seconds.
+    """
+    def _decorator(func):
+        """Memoizes the given function."""
+        return TTLMemoizedFunction(func, timeout, maxsize)
+    return _decorator
+
+
+def request_memoized(namespace=None):
+    """
+    Decorator. Like memoized, but return values are only cached for the
+    rest of the current request, in the request cache with the given
+    namespace (by default, one named after the function).
+
+    Unlike request_cache.middleware.request_cached, arguments are not
+    converted to strings, so they only need to be hashable.
+    """
+    def _decorator(func):
+        """Memoizes the given function."""
+        return RequestMemoizedFunction(func, namespace)
+    return _decorator
+
 
 def hashvalue(arg):
     """
@@ -304,25 +304,22 @@ def _traverse_generic(
             # not supported.
             # JIRA ticket for optimizing pre-order: MA-1560
 
+            # Add the node's unvisited children to the stack in reverse
+            # order so they are traversed in their original order.
             if get_parents:
                 # For a topological sort, add all the children since
                 # they would not have been visited.
-                unvisited_children = list(get_children(current_node))
+                stack.extend(reversed(get_children(current_node)))
 
             else:
                 # For a pre-order sort, filter out already visited
                 # children.
-                unvisited_children = list(
+                stack.extend(
                     child
-                    for child in get_children(current_node)
+                    for child in reversed(get_children(current_node))
                     if child not in yield_results
                 )
 
-            # Add the node's unvisited children to the stack in reverse
-            # order so they are traversed in their original order.
-            unvisited_children.reverse()
-            stack.extend(unvisited_children)
-
             # Yield the result of the node if the node satisfies the
             # filter_func.
             should_yield_node = filter_func(current_node)
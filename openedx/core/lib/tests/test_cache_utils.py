@@ -4,9 +4,18 @@ Tests for cache_utils.py
 from unittest import TestCase
 
 import ddt
-from mock import MagicMock
+from mock import MagicMock, patch
+from request_cache.middleware import RequestCache
 
-from openedx.core.lib.cache_utils import memoize_in_request_cache
+from openedx.core.lib.cache_utils import (
+    clear_memoized_caches,
+    get_memoized_caches_info,
+    lru_memoized,
+    memoize_in_request_cache,
+    memoized,
+    request_memoized,
+    ttl_memoized,
+)
 
 
 @ddt.ddt
@@ -63,3 +72,88 @@ class TestMemoizeInRequestCache(TestCase):
                 func_to_memoize(*arg_list2)
 
             self.assertEquals(self.func_to_count.call_count, 2)
+
+
+class TestMemoizers(TestCase):
+    """
+    Test the memoized, lru_memoized, ttl_memoized and request_memoized decorators.
+    """
+    def setUp(self):
+        super(TestMemoizers, self).setUp()
+        RequestCache.clear_request_cache()
+        self.addCleanup(RequestCache.clear_request_cache)
+        self.func_to_count = MagicMock(side_effect=lambda *args, **kwargs: (args, kwargs))
+
+    def memoize(self, decorator):
+        """
+        Returns func_to_count memoized with the given decorator.
+        """
+        def func_to_memoize(*args, **kwargs):
+            """
+            A test function whose results are to be memoized.
+            """
+            return self.func_to_count(*args, **kwargs)
+        return decorator(func_to_memoize)
+
+    def test_memoized(self):
+        func = self.memoize(memoized)
+        self.assertEqual(func(1, key='value'), ((1,), {'key': 'value'}))
+        func(1, key='value')
+        func(1, key='other')
+        self.assertEqual(self.func_to_count.call_count, 2)
+        self.assertEqual(func.cache_info()['hits'], 1)
+        self.assertEqual(func.cache_info()['misses'], 2)
+        self.assertEqual(func.__doc__.strip(), 'A test function whose results are to be memoized.')
+
+    def test_unhashable_arguments(self):
+        func = self.memoize(lru_memoized())
+        func([1])
+        func([1])
+        self.assertEqual(self.func_to_count.call_count, 2)
+        self.assertEqual(func.cache_info()['size'], 0)
+
+    def test_lru_memoized(self):
+        func = self.memoize(lru_memoized(maxsize=2))
+        func(1)
+        func(2)
+        func(1)
+        func(3)  # evicts 2, the least recently used
+        func(1)
+        self.assertEqual(self.func_to_count.call_count, 3)
+        func(2)
+        self.assertEqual(self.func_to_count.call_count, 4)
+        self.assertDictContainsSubset({'size': 2, 'hits': 2, 'misses': 4, 'evictions': 2}, func.cache_info())
+
+    @patch('openedx.core.lib.cache_utils.time')
+    def test_ttl_memoized(self, mock_time):
+        mock_time.time.return_value = 100
+        func = self.memoize(ttl_memoized(timeout=10))
+        func(1)
+        mock_time.time.return_value = 109
+        func(1)
+        self.assertEqual(self.func_to_count.call_count, 1)
+        mock_time.time.return_value = 110
+        func(1)
+        self.assertEqual(self.func_to_count.call_count, 2)
+        self.assertDictContainsSubset({'size': 1, 'hits': 1, 'misses': 2, 'evictions': 1}, func.cache_info())
+
+    def test_request_memoized(self):
+        func = self.memoize(request_memoized())
+        func(1)
+        func(1)
+        self.assertEqual(self.func_to_count.call_count, 1)
+        RequestCache.clear_request_cache()
+        func(1)
+        self.assertEqual(self.func_to_count.call_count, 2)
+
+    def test_registry(self):
+        funcs = [self.memoize(decorator) for decorator in (memoized, lru_memoized(), request_memoized())]
+        for func in funcs:
+            func(1)
+        caches_info = get_memoized_caches_info()
+        for func in funcs:
+            self.assertIn(func.cache_info(), caches_info)
+
+        clear_memoized_caches()
+        for func in funcs:
+            self.assertEqual(func.cache_info()['size'], 0)
@@ -0,0 +1,125 @@
+"""
+Tests for the course experience utilities.
+"""
+import json
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import RequestFactory
+from mock import patch
+
+from courseware.models import StudentModule
+from lms.djangoapps.course_api.blocks.serializers import BlockSerializer
+from lms.djangoapps.course_blocks.utils import get_student_modules_as_dicts
+from request_cache.middleware import RequestCache
+from student.models import CourseEnrollment
+from student.tests.factories import UserFactory
+from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
+from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
+
+from ..utils import get_course_outline_block_tree
+
+
+class TestGetCourseOutlineBlockTree(SharedModuleStoreTestCase):
+    """
+    Tests for get_course_outline_block_tree.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super(TestGetCourseOutlineBlockTree, cls).setUpClass()
+        cls.course = CourseFactory.create()
+        with cls.store.bulk_operations(cls.course.id):
+            cls.chapter = ItemFactory.create(category='chapter', parent_location=cls.course.location)
+            cls.sequentials = [
+                ItemFactory.create(category='sequential', parent_location=cls.chapter.location, display_name=name)
+                for name in ('First', 'Second')
+            ]
+            ItemFactory.create(category='vertical', parent_location=cls.sequentials[0].location)
+
+    def setUp(self):
+        super(TestGetCourseOutlineBlockTree, self).setUp()
+        self.user = UserFactory()
+        CourseEnrollment.enroll(self.user, self.course.id)
+
+        patcher = patch('openedx.features.course_experience.utils.cache', LocMemCache('outline', {}))
+        self.cache = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_outline(self, user=None):
+        """
+        Returns the course outline for the given user, in a new request.
+        """
+        RequestCache.clear_request_cache()
+        request = RequestFactory().get('/')
+        request.user = user or self.user
+        return get_course_outline_block_tree(request, unicode(self.course.id))
+
+    def set_position(self, block, position):
+        """
+        Saves the given position as the user's state of the given block.
+        """
+        StudentModule.objects.create(
+            student=self.user,
+            course_id=self.course.id,
+            module_state_key=block.location,
+            state=json.dumps({'position': position}),
+        )
+
+    def test_outline(self):
+        outline = self.get_outline()
+        self.assertEqual(outline['id'], unicode(self.course.location))
+        self.assertEqual(outline['display_name'], self.course.display_name)
+        chapter = outline['children'][0]
+        self.assertEqual(chapter['id'], unicode(self.chapter.location))
+        self.assertEqual([child['display_name'] for child in chapter['children']], ['First', 'Second'])
+        self.assertNotIn('children', chapter['children'][0])
+        self.assertFalse(outline['last_accessed'])
+
+    def test_cached_in_request(self):
+        request = RequestFactory().get('/')
+        request.user = self.user
+        outline = get_course_outline_block_tree(request, unicode(self.course.id))
+        self.assertIs(get_course_outline_block_tree(request, unicode(self.course.id)), outline)
+
+    def test_skeleton_shared_across_requests(self):
+        self.get_outline()
+        with patch(
+            'lms.djangoapps.course_api.blocks.serializers.BlockSerializer.get_basic_data'
+        ) as mock_get_basic_data:
+            outline = self.get_outline(UserFactory())
+        self.assertFalse(mock_get_basic_data.called)
+        self.assertEqual(outline['display_name'], self.course.display_name)
+
+    def test_skeleton_cached_per_block(self):
+        with patch.object(self.cache, 'set_many', wraps=self.cache.set_many) as mock_set_many:
+            self.get_outline()
+        cached_blocks = mock_set_many.call_args[0][0]
+        self.assertEqual(
+            sorted(block['id'] for block in cached_blocks.itervalues()),
+            sorted(unicode(block.location) for block in [self.course, self.chapter] + self.sequentials),
+        )
+
+        # Only the blocks missing from the cache are serialized again.
+        self.cache.delete(next(iter(cached_blocks)))
+        with patch.object(
+            BlockSerializer, 'get_basic_data', autospec=True, side_effect=BlockSerializer.get_basic_data,
+        ) as mock_get_basic_data:
+            self.get_outline(UserFactory())
+        self.assertEqual(mock_get_basic_data.call_count, 1)
+
+    def test_last_accessed(self):
+        self.set_position(self.course, 1)
+        self.set_position(self.chapter, 2)
+        with patch(
+            'openedx.features.course_experience.utils.get_student_modules_as_dicts',
+            wraps=get_student_modules_as_dicts,
+        ) as mock_get_student_modules:
+            outline = self.get_outline()
+        self.assertEqual(mock_get_student_modules.call_count, 1)
+
+        chapter = outline['children'][0]
+        self.assertTrue(outline['last_accessed'])
+        self.assertTrue(chapter['last_accessed'])
+        self.assertEqual(
+            [child['last_accessed'] for child in chapter['children']],
+            [False, True],
+        )
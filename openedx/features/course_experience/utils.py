@@ -1,18 +1,43 @@
 """
 Common utilities for the course experience, including course outline.
 """
+import hashlib
+
+from django.core.cache import cache
 from opaque_keys.edx.keys import CourseKey
 
-from lms.djangoapps.course_api.blocks.api import get_blocks
-from lms.djangoapps.course_blocks.utils import get_student_module_as_dict
-from openedx.core.lib.cache_utils import memoized
+from lms.djangoapps.course_api.blocks.api import get_transformed_blocks
+from lms.djangoapps.course_api.blocks.serializers import BlockSerializer
+from lms.djangoapps.course_blocks.utils import get_student_modules_as_dicts
+from openedx.core.lib.cache_utils import request_memoized
 from xmodule.modulestore.django import modulestore
 
+# Fields requested for each block of the course outline.
+OUTLINE_REQUESTED_FIELDS = ['children', 'display_name', 'type', 'due', 'graded', 'special_exam_info', 'format']
+
+# Requested fields whose values may differ from one user to another, and
+# therefore are never read from the outline skeleton cache.
+OUTLINE_USER_FIELDS = ['children', 'due', 'special_exam_info']
+
+# Types of the blocks in the course outline.
+OUTLINE_BLOCK_TYPES = ['course', 'chapter', 'sequential']
 
-@memoized
+# Since each skeleton is keyed on the version of its course, it only
+# expires to free up space in the cache.
+OUTLINE_SKELETON_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+@request_memoized()
 def get_course_outline_block_tree(request, course_id):
     """
-    Returns the root block of the course outline, with children as blocks.
+    Returns the root block of the course outline for the requesting user,
+    with children as blocks.
+
+    The blocks are transformed for the user on every call, so that the
+    outline only contains the blocks visible to the user.  The user
+    independent data of each block is read from a skeleton of the outline
+    cached for the course's version, and only the user specific fields
+    are serialized again.
     """
 
     def populate_children(block, all_blocks):
@@ -41,19 +66,17 @@ def get_course_outline_block_tree(request, course_id):
         for child in block.get('children', []):
             set_last_accessed_default(child)
 
-    def mark_last_accessed(user, course_key, block):
+    def mark_last_accessed(student_modules, block):
         """
         Recursively marks the branch to the last accessed block.
         """
-        block_key = block.serializer.instance
-        student_module_dict = get_student_module_as_dict(user, course_key, block_key)
-        last_accessed_child_position = student_module_dict.get('position')
+        last_accessed_child_position = student_modules.get(block['id'], {}).get('position')
         if last_accessed_child_position and block.get('children'):
             block['last_accessed'] = True
             if last_accessed_child_position <= len(block['children']):
                 last_accessed_child_block = block['children'][last_accessed_child_position - 1]
                 last_accessed_child_block['last_accessed'] = True
-                mark_last_accessed(user, course_key, last_accessed_child_block)
+                mark_last_accessed(student_modules, last_accessed_child_block)
             else:
                 # We should be using an id in place of position for last accessed. However, while using position, if
                 # the child block is no longer accessible we'll use the last child.
@@ -62,18 +85,88 @@ def get_course_outline_block_tree(request, course_id):
     course_key = CourseKey.from_string(course_id)
     course_usage_key = modulestore().make_course_usage_key(course_key)
 
-    all_blocks = get_blocks(
-        request,
+    block_structure = get_transformed_blocks(
         course_usage_key,
         user=request.user,
         nav_depth=3,
-        requested_fields=['children', 'display_name', 'type', 'due', 'graded', 'special_exam_info', 'format'],
-        block_types_filter=['course', 'chapter', 'sequential']
+        requested_fields=OUTLINE_REQUESTED_FIELDS,
+        block_types_filter=OUTLINE_BLOCK_TYPES,
     )
+    serializer = BlockSerializer(context={
+        'request': request,
+        'block_structure': block_structure,
+        'requested_fields': OUTLINE_REQUESTED_FIELDS,
+    })
 
-    course_outline_root_block = all_blocks['blocks'][all_blocks['root']]
-    populate_children(course_outline_root_block, all_blocks['blocks'])
+    all_blocks = {}
+    for block_key, skeleton_block in _get_outline_skeleton(request, block_structure, serializer).iteritems():
+        block = dict(skeleton_block)
+        block.update(serializer.get_requested_data(block_key, OUTLINE_USER_FIELDS))
+        all_blocks[block['id']] = block
+
+    course_outline_root_block = all_blocks[unicode(block_structure.root_block_usage_key)]
+    populate_children(course_outline_root_block, all_blocks)
     set_last_accessed_default(course_outline_root_block)
-    mark_last_accessed(request.user, course_key, course_outline_root_block)
+    student_modules = get_student_modules_as_dicts(request.user, course_key, list(block_structure))
+    mark_last_accessed(student_modules, course_outline_root_block)
 
     return course_outline_root_block
+
+
+def _get_outline_skeleton(request, block_structure, serializer):
+    """
+    Returns a dict of the user independent data of each block in the given
+    transformed block structure, keyed by block key.
+
+    The data of each block is cached separately for the course's version, so
+    that the cached values stay small for large courses, and only the blocks
+    missing from the cache are serialized and added to it.
+    """
+    skeleton_fields = [field for field in OUTLINE_REQUESTED_FIELDS if field not in OUTLINE_USER_FIELDS]
+    cache_keys = _get_outline_skeleton_cache_keys(request, block_structure)
+    cached_blocks = cache.get_many(cache_keys.values()) if cache_keys else {}
+
+    skeleton = {}
+    missing_blocks = {}
+    for block_key in block_structure:
+        cache_key = cache_keys.get(block_key)
+        if cache_key in cached_blocks:
+            skeleton[block_key] = cached_blocks[cache_key]
+        else:
+            block = serializer.get_basic_data(block_key)
+            block.update(serializer.get_requested_data(block_key, skeleton_fields))
+            skeleton[block_key] = block
+            if cache_key:
+                missing_blocks[cache_key] = block
+
+    if missing_blocks:
+        cache.set_many(missing_blocks, OUTLINE_SKELETON_CACHE_TIMEOUT)
+    return skeleton
+
+
+def _get_outline_skeleton_cache_keys(request, block_structure):
+    """
+    Returns the cache keys of the skeletons of the given block structure's
+    blocks for the version of its course, keyed by block key, or an empty dict
+    if the version is unknown.
+
+    The host is part of the keys, since the skeletons contain absolute URLs.
+    """
+    root_block_usage_key = block_structure.root_block_usage_key
+    course_version = block_structure.get_xblock_field(root_block_usage_key, 'course_version')
+    subtree_edited_on = block_structure.get_xblock_field(root_block_usage_key, 'subtree_edited_on')
+    if course_version is None and subtree_edited_on is None:
+        return {}
+
+    version_key = u'{}.{}.{}.{}'.format(
+        root_block_usage_key.course_key,
+        course_version,
+        subtree_edited_on,
+        request.build_absolute_uri('/'),
+    )
+    return {
+        block_key: u'course_experience.outline_skeleton.{}'.format(
+            hashlib.sha1(u'{}.{}'.format(version_key, block_key).encode('utf-8')).hexdigest()
+        )
+        for block_key in block_structure
+    }
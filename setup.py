@@ -57,6 +57,7 @@ setup(
             "course_blocks_api = lms.djangoapps.course_api.blocks.transformers.blocks_api:BlocksAPITransformer",
             "milestones = lms.djangoapps.course_api.blocks.transformers.milestones:MilestonesAndSpecialExamsTransformer",
             "grades = lms.djangoapps.grades.transformer:GradesTransformer",
+            "video_outlines = lms.djangoapps.mobile_api.video_outlines.transformer:VideoOutlineTransformer",
         ],
     }
 )